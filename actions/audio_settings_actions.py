@@ -1,9 +1,11 @@
-from threading import Thread
 import logging
 import time
 
 from gi.repository import Gtk, GLib
 
+import app_executor
+from app_executor import LANE_AUDIO
+
 logger = logging.getLogger(__name__)
 
 
@@ -129,7 +131,7 @@ def _refresh_devices_for_current_driver_ui_only(app, reason="hotplug-watch"):
                                     )
                                 GLib.idle_add(lambda: update_output_status_ui(app) or False)
 
-                            Thread(target=_apply_auto_rebind, daemon=True).start()
+                            app_executor.submit(LANE_AUDIO, _apply_auto_rebind)
                             app.show_output_notice(
                                 f"Your previous device is back: {remembered_name}. Switched back automatically.",
                                 "ok",
@@ -173,7 +175,7 @@ def _refresh_devices_for_current_driver_ui_only(app, reason="hotplug-watch"):
 
         GLib.idle_add(apply_devices)
 
-    Thread(target=worker, daemon=True).start()
+    app_executor.submit(LANE_AUDIO, worker)
 
 
 def start_output_hotplug_watch(app, seconds=60, interval_ms=1000, slow_interval_ms=5000):
@@ -278,12 +280,12 @@ def refresh_devices_keep_driver_select_first(app, reason="device-refresh"):
                     )
                 GLib.idle_add(lambda: update_output_status_ui(app) or False)
 
-            Thread(target=apply_output_async, daemon=True).start()
+            app_executor.submit(LANE_AUDIO, apply_output_async)
             return False
 
         GLib.idle_add(apply_devices)
 
-    Thread(target=worker, daemon=True).start()
+    app_executor.submit(LANE_AUDIO, worker)
 
 
 def _monitor_selected_device_presence(app):
@@ -347,7 +349,7 @@ def _monitor_selected_device_presence(app):
             except Exception:
                 app._device_presence_probe_running = False
 
-        Thread(target=worker, daemon=True).start()
+        app_executor.submit(LANE_AUDIO, worker)
     except Exception:
         pass
 
@@ -414,7 +416,7 @@ def _passive_sync_device_list(app):
             except Exception:
                 app._device_list_sync_running = False
 
-        Thread(target=worker, daemon=True).start()
+        app_executor.submit(LANE_AUDIO, worker)
     except Exception:
         pass
 
@@ -570,12 +572,12 @@ def on_driver_changed(app, dd, p):
                     )
                 GLib.idle_add(lambda: update_output_status_ui(app) or False)
 
-            Thread(target=apply_output_async, daemon=True).start()
+            app_executor.submit(LANE_AUDIO, apply_output_async)
             return False
 
         GLib.idle_add(apply_devices)
 
-    Thread(target=worker, daemon=True).start()
+    app_executor.submit(LANE_AUDIO, worker)
 
 
 def on_device_changed(app, dd, p):
@@ -1,9 +1,16 @@
-from threading import Thread
 import logging
 
 from gi.repository import Gtk, GLib
+import app_executor
+import app_metrics
+import app_ui_queue
 from app_errors import classify_exception, user_message
-from actions import audio_settings_actions
+from app_executor import LANE_NETWORK
+from app_lazy import lazy_module
+from actions import audio_settings_actions, playback_actions
+from lyrics_manager import KaraokeLine, timeline_index
+
+app_async = lazy_module("app_async")
 
 logger = logging.getLogger(__name__)
 MAX_PREFETCH_CACHE = 6
@@ -29,56 +36,55 @@ def _split_bilingual_line(text):
     return line, ""
 
 
-def _karaoke_markup(words, active_idx, active_color="#FFFFFF", inactive_color="#AEB8C8"):
-    chunks = []
-    for i, (_, token) in enumerate(words):
-        txt = GLib.markup_escape_text(token)
-        if i <= active_idx:
-            chunks.append(f'<span foreground="{active_color}" weight="700">{txt}</span>')
-        else:
-            chunks.append(f'<span foreground="{inactive_color}">{txt}</span>')
-    return "".join(chunks)
-
-
-def _karaoke_active_idx(words, current_time):
-    idx = -1
-    for i, (t, _token) in enumerate(words):
-        if t <= current_time:
-            idx = i
-        else:
-            break
-    return idx
-
-
-def _prefetch_next_track(app, current_index):
+def _next_track_to_prefetch(app, queue, current_index):
+    # Main thread only: the shuffle order is not thread-safe, and its
+    # read-ahead can reset or extend it.
     try:
         next_idx = app.get_next_index(direction=1)
-        if next_idx < 0 or next_idx == current_index:
-            return
-        queue = app._get_active_queue() if hasattr(app, "_get_active_queue") else list(getattr(app, "current_track_list", []) or [])
-        if next_idx >= len(queue):
-            return
-
-        next_track = queue[next_idx]
+    except Exception as e:
+        logger.debug("Next-track lookup failed: %s", e)
+        return None
+    if next_idx < 0 or next_idx == current_index or next_idx >= len(queue):
+        return None
+    return queue[next_idx]
+
+
+async def _prefetch_next_track(app, next_track):
+    """
+    Warm the lyrics store and the stream URL of the upcoming track
+    concurrently, on the app_async bridge.
+    """
+    try:
         track_id = getattr(next_track, "id", None)
         if track_id is None:
             return
+        backend = app.backend
 
-        quality_key = str(getattr(app.backend, "quality", "unknown"))
+        quality_key = str(getattr(backend, "quality", "unknown"))
         cache = getattr(app, "stream_prefetch_cache", {})
         cached = cache.get(track_id)
-        if cached and cached.get("quality") == quality_key and cached.get("url"):
+        url_cached = bool(cached and cached.get("quality") == quality_key and cached.get("url"))
+
+        # Lyrics first so the pane fills instantly on track change.
+        warm = [backend.get_lyrics_async(track_id)]
+        if not url_cached:
+            warm.append(backend.get_stream_url_async(next_track))
+        results = await app_async.get_bridge().gather_limited(warm, limit=len(warm))
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.debug("Next-track prefetch step failed: %s", result)
+        if url_cached:
             return
 
-        prefetch_url = app.backend.get_stream_url(next_track)
-        if not prefetch_url:
+        prefetch_url = results[1]
+        if not prefetch_url or isinstance(prefetch_url, BaseException):
             return
 
         meta = {
             "name": getattr(next_track, "name", ""),
             "artist": getattr(getattr(next_track, "artist", None), "name", ""),
             "album": getattr(getattr(next_track, "album", None), "name", ""),
-            "artwork_url": app.backend.get_artwork_url(next_track, 320),
+            "artwork_url": await app_async.call(backend.get_artwork_url, next_track, 320),
         }
 
         cache[track_id] = {"url": prefetch_url, "quality": quality_key, "meta": meta}
@@ -115,6 +121,7 @@ def render_lyrics_list(app, lyrics_obj=None, status_msg=None):
     while child := app.lyrics_vbox.get_first_child():
         app.lyrics_vbox.remove(child)
     app.lyric_widgets = []
+    app.lyric_widget_times = []
     app.current_lyric_index = -1
 
     if status_msg:
@@ -149,18 +156,18 @@ def render_lyrics_list(app, lyrics_obj=None, status_msg=None):
             if not text:
                 text = " "
 
-            karaoke_words = []
-            if lyrics_obj.has_synced and hasattr(lyrics_obj, "karaoke_map"):
-                karaoke_words = list(lyrics_obj.karaoke_map.get(t, []))
+            karaoke = None
+            if lyrics_obj.has_synced and hasattr(lyrics_obj, "karaoke_map") and lyrics_obj.karaoke_map.get(t):
+                karaoke = KaraokeLine(lyrics_obj.karaoke_map[t])
 
             # Karaoke line: keep as a single main line and update words progressively.
-            if karaoke_words:
+            if karaoke is not None:
                 row = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2, css_classes=["lyric-row"])
                 row.set_halign(Gtk.Align.CENTER)
                 main_lbl = Gtk.Label(css_classes=["lyric-line"], wrap=True, max_width_chars=40)
                 main_lbl.set_justify(Gtk.Justification.CENTER)
                 main_lbl.set_use_markup(True)
-                main_lbl.set_markup(_karaoke_markup(karaoke_words, -1))
+                main_lbl.set_markup(karaoke.markup(-1))
                 row.append(main_lbl)
                 app.lyrics_vbox.append(row)
 
@@ -171,10 +178,11 @@ def render_lyrics_list(app, lyrics_obj=None, status_msg=None):
                             "widget": row,
                             "main": main_lbl,
                             "sub": None,
-                            "karaoke_words": karaoke_words,
+                            "karaoke": karaoke,
                             "karaoke_last_idx": -2,
                         }
                     )
+                    app.lyric_widget_times.append(t)
                 continue
 
             primary, secondary = _split_bilingual_line(text)
@@ -208,10 +216,38 @@ def render_lyrics_list(app, lyrics_obj=None, status_msg=None):
                         "widget": row,
                         "main": main_lbl,
                         "sub": sub_lbl,
-                        "karaoke_words": [],
+                        "karaoke": None,
                         "karaoke_last_idx": -2,
                     }
                 )
+                app.lyric_widget_times.append(t)
+
+
+def _show_lyrics(app, request_id, raw_lyrics):
+    """
+    Load fetched (or cached) lyrics text and render it for the given play request.
+    """
+    if raw_lyrics:
+        logger.debug("Got lyrics data. length=%s", len(raw_lyrics))
+        app.lyrics_mgr.load_lyrics(raw_lyrics)
+
+        def apply_lyrics():
+            if request_id != getattr(app, "_play_request_id", 0):
+                return False
+            app.render_lyrics_list(app.lyrics_mgr, None)
+            return False
+
+        GLib.idle_add(apply_lyrics)
+    else:
+        logger.debug("No lyrics returned")
+
+        def apply_no_lyrics():
+            if request_id != getattr(app, "_play_request_id", 0):
+                return False
+            app.render_lyrics_list(None, NO_LYRICS_BOTTOM_HINT)
+            return False
+
+        GLib.idle_add(apply_no_lyrics)
 
 
 def play_track(app, index):
@@ -230,7 +266,7 @@ def play_track(app, index):
     app.playing_track = track
     app.playing_track_id = track.id
     if hasattr(app, "refresh_current_track_favorite_state"):
-        GLib.idle_add(app.refresh_current_track_favorite_state)
+        app_ui_queue.post(app.refresh_current_track_favorite_state, key="current_track_favorite")
 
     logger.info("Playing: %s", track.name)
 
@@ -249,28 +285,46 @@ def play_track(app, index):
         app.lbl_title.set_label(fallback)
         app.lbl_title.set_tooltip_text(fallback)
 
-    GLib.idle_add(lambda: app._update_list_ui(index))
-    GLib.idle_add(lambda: app._update_track_list_icon())
+    # Coalesced: skipping through tracks quickly repaints these once per frame.
+    app_ui_queue.post(app._update_list_ui, index, key="list_ui")
+    app_ui_queue.post(app._update_track_list_icon, key="track_list_icon")
     if hasattr(app, "render_queue_drawer"):
-        GLib.idle_add(app.render_queue_drawer)
+        app_ui_queue.post(app.render_queue_drawer, key="queue_drawer")
 
     cover_id = getattr(track, "cover", None) or getattr(track.album, "cover", None)
     cover_url = app._get_tidal_image_url(cover_id) if cover_id else None
-    if hasattr(app, "bg_viz"):
+    # Remembered for the lyrics background, which is only built once the Lyrics page is opened.
+    app._lyrics_bg_cover_url = cover_url
+    if getattr(app, "bg_viz", None) is not None:
         if cover_url:
             app.bg_viz.set_colors_from_cover(cover_url, app.cache_dir)
         else:
             app.bg_viz.randomize_colors()
 
     if cover_id:
-        Thread(target=lambda: app._load_cover_art(cover_id), daemon=True).start()
+        app_executor.submit(LANE_NETWORK, lambda: app._load_cover_art(cover_id))
         if hasattr(app, "history_mgr"):
-            app.history_mgr.add(track, cover_id)
+            playback_actions.record_play(app, app.history_mgr.add(track, cover_id))
 
-    Thread(target=lambda: _prefetch_next_track(app, index), daemon=True).start()
+    # Lyrics prefetched with the previous track are painted right away.
+    lyrics_hit = False
+    if hasattr(app.backend, "peek_lyrics"):
+        lyrics_hit, cached_lyrics = app.backend.peek_lyrics(track.id, disk=False)
+        if lyrics_hit:
+            _show_lyrics(app, request_id, cached_lyrics)
+
+    next_track = _next_track_to_prefetch(app, queue, index)
+    if next_track is not None:
+        app_async.run(_prefetch_next_track(app, next_track))
 
     def task():
         logger.debug("Playback background task started")
+        shown = lyrics_hit
+        if not shown and hasattr(app.backend, "peek_lyrics"):
+            shown, cached = app.backend.peek_lyrics(track.id)
+            if shown:
+                _show_lyrics(app, request_id, cached)
+        app_metrics.cache_lookup("lyrics", shown)
 
         try:
             quality_key = str(getattr(app.backend, "quality", "unknown"))
@@ -278,7 +332,9 @@ def play_track(app, index):
             cached = cache.get(track.id)
             url = None
             max_tracks = int(getattr(app, "audio_cache_tracks", 0) or 0)
-            if cached and cached.get("quality") == quality_key and cached.get("url"):
+            stream_hit = bool(cached and cached.get("quality") == quality_key and cached.get("url"))
+            app_metrics.cache_lookup("stream_url", stream_hit)
+            if stream_hit:
                 url = cached.get("url")
                 cache.pop(track.id, None)
                 logger.debug("Using prefetched stream url for track: %s", track.id)
@@ -286,11 +342,7 @@ def play_track(app, index):
                 url = app.backend.get_stream_url(track)
 
             if url and max_tracks > 0 and str(url).startswith("http"):
-                Thread(
-                    target=_cache_current_track_audio,
-                    args=(app, track.id, quality_key, url),
-                    daemon=True,
-                ).start()
+                app_executor.submit(LANE_NETWORK, _cache_current_track_audio, app, track.id, quality_key, url)
             if url:
                 logger.debug("Stream URL resolved. Loading player")
                 if hasattr(app, "set_diag_health"):
@@ -357,6 +409,8 @@ def play_track(app, index):
 
             GLib.idle_add(apply_playback_error)
 
+        if shown:
+            return
         try:
             logger.debug("Starting lyrics sequence")
 
@@ -368,29 +422,7 @@ def play_track(app, index):
 
             GLib.idle_add(apply_loading_lyrics)
 
-            raw_lyrics = app.backend.get_lyrics(track.id)
-
-            if raw_lyrics:
-                logger.debug("Got lyrics data. length=%s", len(raw_lyrics))
-                app.lyrics_mgr.load_lyrics(raw_lyrics)
-
-                def apply_lyrics():
-                    if request_id != getattr(app, "_play_request_id", 0):
-                        return False
-                    app.render_lyrics_list(app.lyrics_mgr, None)
-                    return False
-
-                GLib.idle_add(apply_lyrics)
-            else:
-                logger.debug("No lyrics returned")
-
-                def apply_no_lyrics():
-                    if request_id != getattr(app, "_play_request_id", 0):
-                        return False
-                    app.render_lyrics_list(None, NO_LYRICS_BOTTOM_HINT)
-                    return False
-
-                GLib.idle_add(apply_no_lyrics)
+            _show_lyrics(app, request_id, app.backend.get_lyrics(track.id))
 
         except Exception as e:
             kind = classify_exception(e)
@@ -415,7 +447,7 @@ def play_track(app, index):
 
             GLib.idle_add(apply_lyrics_error)
 
-    Thread(target=task, daemon=True).start()
+    app_executor.submit(LANE_NETWORK, task)
 
 
 def scroll_to_lyric(app, widget):
@@ -520,15 +552,12 @@ def update_ui_loop(app):
     if lyrics_live and hasattr(app, "lyrics_mgr") and app.lyrics_mgr.has_synced and hasattr(app, "lyric_widgets") and app.lyric_widgets:
         offset_ms = int(getattr(app, "lyrics_user_offset_ms", 0) or 0)
         current_time = p + 0.3 + (offset_ms / 1000.0)
-        active_idx = -1
-
-        for i, item in enumerate(app.lyric_widgets):
-            if item["time"] <= current_time:
-                active_idx = i
-            else:
-                break
-
         current_idx = getattr(app, "current_lyric_index", -1)
+        times = getattr(app, "lyric_widget_times", None)
+        if times is None or len(times) != len(app.lyric_widgets):
+            times = app.lyric_widget_times = [item["time"] for item in app.lyric_widgets]
+        active_idx = timeline_index(times, current_time, current_idx)
+
         if active_idx != current_idx:
             if current_idx != -1 and current_idx < len(app.lyric_widgets):
                 prev = app.lyric_widgets[current_idx]
@@ -536,8 +565,8 @@ def update_ui_loop(app):
                 prev["main"].remove_css_class("active")
                 if prev.get("sub") is not None:
                     prev["sub"].remove_css_class("active")
-                if prev.get("karaoke_words"):
-                    prev["main"].set_markup(_karaoke_markup(prev["karaoke_words"], -1))
+                if prev.get("karaoke") is not None:
+                    prev["main"].set_markup(prev["karaoke"].markup(-1))
                     prev["karaoke_last_idx"] = -1
 
             if active_idx != -1:
@@ -547,21 +576,19 @@ def update_ui_loop(app):
                 cur["main"].add_css_class("active")
                 if cur.get("sub") is not None:
                     cur["sub"].add_css_class("active")
-                if cur.get("karaoke_words"):
-                    k_idx = _karaoke_active_idx(cur["karaoke_words"], current_time)
-                    cur["main"].set_markup(_karaoke_markup(cur["karaoke_words"], k_idx))
-                    cur["karaoke_last_idx"] = k_idx
                 app._scroll_to_lyric(w)
 
             app.current_lyric_index = active_idx
 
-        # Update karaoke progression while staying on the same active line.
+        # Update karaoke progression; markup strings are cached per word index.
         if active_idx != -1 and active_idx < len(app.lyric_widgets):
             cur = app.lyric_widgets[active_idx]
-            if cur.get("karaoke_words"):
-                k_idx = _karaoke_active_idx(cur["karaoke_words"], current_time)
-                if k_idx != cur.get("karaoke_last_idx", -2):
-                    cur["main"].set_markup(_karaoke_markup(cur["karaoke_words"], k_idx))
+            karaoke = cur.get("karaoke")
+            if karaoke is not None:
+                last_idx = cur.get("karaoke_last_idx", -2)
+                k_idx = karaoke.word_index_at(current_time, last_idx if last_idx >= -1 else -1)
+                if k_idx != last_idx:
+                    cur["main"].set_markup(karaoke.markup(k_idx))
                     cur["karaoke_last_idx"] = k_idx
 
     if lyrics_live and hasattr(app, "target_scroll_y") and hasattr(app, "lyrics_scroller"):
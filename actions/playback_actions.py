@@ -1,6 +1,89 @@
-import random
+import logging
+import threading
 
 from actions import audio_settings_actions
+from listening_stats import HISTORY_WINDOW, ListeningScores, track_keys
+from shuffle_order import ShuffleOrder, SmartShuffleOrder
+
+logger = logging.getLogger(__name__)
+
+
+def listening_scores(app):
+    """
+    The app's ListeningScores, built from the play history on first use and
+    then kept current by record_play().
+    """
+    scores = getattr(app, "listening_scores", None)
+    if scores is None:
+        entries = []
+        history_mgr = getattr(app, "history_mgr", None)
+        if history_mgr is not None:
+            entries = history_mgr.get_recent_track_entries(limit=HISTORY_WINDOW)
+            if len(entries) < HISTORY_WINDOW and hasattr(history_mgr, "load_backfill"):
+                # Tracks derived from a legacy album-only history count as the oldest plays.
+                entries += (history_mgr.load_backfill() or [])[: HISTORY_WINDOW - len(entries)]
+        scores = ListeningScores.from_entries(entries)
+        app.listening_scores = scores
+    return scores
+
+
+def record_play(app, entry):
+    """
+    Fold a history entry that was just logged into the listening scores.
+    """
+    scores = getattr(app, "listening_scores", None)
+    if scores is None or not entry:
+        # Built lazily from history, which already holds this play.
+        return
+    scores.record_entry(entry)
+
+
+def reset_shuffle_order(app, total=None, current=None):
+    """
+    Start a new shuffle cycle of the active queue: a Smart Shuffle order in
+    MODE_SMART, a uniform one otherwise.
+    """
+    queue = app._get_active_queue() if hasattr(app, "_get_active_queue") else list(getattr(app, "current_track_list", []) or [])
+    if total is None:
+        total = len(queue)
+    if current is not None and not 0 <= current < total:
+        current = None
+    if getattr(app, "play_mode", None) == getattr(app, "MODE_SMART", object()):
+        keys = [track_keys(t) for t in queue] if len(queue) == total else None
+        order = getattr(app, "shuffle_order", None)
+        if not isinstance(order, SmartShuffleOrder):
+            order = SmartShuffleOrder()
+            app.shuffle_order = order
+        order.reset(total, current, keys=keys, scores=listening_scores(app))
+        return order
+    order = getattr(app, "shuffle_order", None)
+    if order is None or isinstance(order, SmartShuffleOrder):
+        order = ShuffleOrder()
+        app.shuffle_order = order
+    order.reset(total, current)
+    return order
+
+
+def shuffle_order(app, total=None, current=None):
+    """
+    The app's shuffle order, kept in step with the active queue. A size change
+    the queue code did not report (or a mode switch) rebuilds it; a current
+    track that differs from the cursor (picked directly by the user) becomes
+    the new cursor. Main thread only: peeks and resets mutate the order and
+    rebuild ListeningScores from history.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        logger.warning("shuffle_order() called off the main thread; order may be corrupted")
+    order = getattr(app, "shuffle_order", None)
+    if total is None:
+        queue = app._get_active_queue() if hasattr(app, "_get_active_queue") else list(getattr(app, "current_track_list", []) or [])
+        total = len(queue)
+    smart = getattr(app, "play_mode", None) == getattr(app, "MODE_SMART", object())
+    if order is None or len(order) != total or isinstance(order, SmartShuffleOrder) != smart:
+        order = reset_shuffle_order(app, total, current)
+    elif current is not None and 0 <= current < total and order.current != current:
+        order.jump(current)
+    return order
 
 
 def on_play_pause(app, btn):
@@ -48,11 +131,8 @@ def on_next_track(app, btn=None):
         if total <= 1:
             next_idx = 0
         else:
-            if not hasattr(app, "shuffle_indices") or not app.shuffle_indices:
-                app._generate_shuffle_list()
-            if app.shuffle_indices:
-                next_idx = random.choice(app.shuffle_indices)
-            else:
+            next_idx = shuffle_order(app, total, current).next()
+            if next_idx is None:
                 next_idx = (current + 1) % total
     else:
         next_idx = (current + 1) % total
@@ -74,7 +154,11 @@ def on_prev_track(app, btn=None):
     if current is None:
         current = 0
 
-    prev_idx = (current - 1) % total
+    prev_idx = None
+    if app.play_mode in [app.MODE_SHUFFLE, app.MODE_SMART] and total > 1:
+        prev_idx = shuffle_order(app, total, current).prev()
+    if prev_idx is None:
+        prev_idx = (current - 1) % total
     if 0 <= prev_idx < total:
         app.play_track(prev_idx)
 
@@ -96,18 +180,13 @@ def get_next_index(app, direction=1):
         pass
 
     if app.play_mode in [app.MODE_SHUFFLE, app.MODE_SMART]:
+        if total <= 1:
+            return current
+        order = shuffle_order(app, total, current)
         if direction == 1:
-            if not app.shuffle_indices:
-                app._generate_shuffle_list()
-
-            if not app.shuffle_indices:
-                return current
-
-            next_idx = random.randint(0, total - 1)
-            if total > 1:
-                while next_idx == current:
-                    next_idx = random.randint(0, total - 1)
-            return next_idx
-        return (current - 1) % total
+            # Read-ahead only: prefetch must see what on_next_track will play.
+            return order.upcoming()
+        history = order.history
+        return history[-1] if history else (current - 1) % total
 
     return (current + direction) % total
@@ -1,8 +1,8 @@
-from threading import Thread
-
 from gi.repository import GLib
 
+import app_executor
 import utils
+from app_executor import LANE_NETWORK
 
 
 def on_quality_changed(app, dd, p):
@@ -22,7 +22,7 @@ def on_quality_changed(app, dd, p):
             new_url = app.backend.get_stream_url(track)
             GLib.idle_add(lambda: app._restart_player_with_url(new_url, pos))
 
-        Thread(target=refresh, daemon=True).start()
+        app_executor.submit(LANE_NETWORK, refresh)
 
 
 def restart_player_with_url(app, url, pos):
@@ -1,9 +1,9 @@
-from threading import Thread
 import logging
 import os
 import random
 from datetime import datetime
 import subprocess
+import time
 from hashlib import blake2b
 
 import gi
@@ -14,9 +14,20 @@ from gi.repository import Gtk, GLib, Pango, Gdk, GObject
 import utils
 from rust_viz import RustVizCore
 from ui.track_table import LAYOUT, build_tracks_header, append_header_action_spacers
+from ui.progressive_render import ProgressiveRenderer, next_render_token, viewport_distance
+import app_executor
+import app_ui_queue
 from app_errors import classify_exception, user_message
+from app_executor import LANE_NETWORK
+from app_lazy import lazy_module
+from app_logging import rate_limited
+from app_scheduler import PRIORITY_VISIBLE
+
+app_async = lazy_module("app_async")
 
 logger = logging.getLogger(__name__)
+# Per-sort / per-page messages.
+hot_logger = rate_limited(logger)
 MAX_SEARCH_HISTORY = 10
 _RUST_COLLECTION_CORE = None
 
@@ -69,31 +80,36 @@ def sort_objects_by_name_fast(items, context="items"):
                 artist_filter_key=0,
                 use_artist_filter=False,
             )
-            logger.info("Collection name sort path: Rust (%s, total=%s)", context, n)
+            hot_logger.info("Collection name sort path: Rust (%s, total=%s)", context, n)
         except Exception:
             indices = None
             logger.exception("Rust name sort failed; fallback to Python (%s)", context)
 
     if indices is None:
-        logger.info("Collection name sort path: Python-fallback (%s, total=%s)", context, n)
+        hot_logger.info("Collection name sort path: Python-fallback (%s, total=%s)", context, n)
         indices = sorted(range(n), key=lambda i: (names_lc[i], i))
 
     return [objs[i] for i in indices if 0 <= int(i) < n]
 
-try:
-    from opencc import OpenCC
-except Exception:
-    OpenCC = None
+# OpenCC loads its dictionaries on construction; only pay for that on the
+# first CJK search instead of at import time.
+_OPENCC_CONVERTERS = None
+
+
+def _get_opencc_converters():
+    global _OPENCC_CONVERTERS
+    if _OPENCC_CONVERTERS is None:
+        s2t = t2s = None
+        try:
+            from opencc import OpenCC
+
+            s2t = OpenCC("s2t")
+            t2s = OpenCC("t2s")
+        except Exception:
+            s2t = t2s = None
+        _OPENCC_CONVERTERS = (s2t, t2s)
+    return _OPENCC_CONVERTERS
 
-_OPENCC_S2T = None
-_OPENCC_T2S = None
-if OpenCC is not None:
-    try:
-        _OPENCC_S2T = OpenCC("s2t")
-        _OPENCC_T2S = OpenCC("t2s")
-    except Exception:
-        _OPENCC_S2T = None
-        _OPENCC_T2S = None
 
 # Built-in fallback map for common Simplified/Traditional conversion.
 # This keeps zh search usable even when OpenCC is unavailable.
@@ -220,8 +236,17 @@ _S2T_PHRASE_MAP = {
     "乐坛": "樂壇",
     "乐迷": "樂迷",
 }
-_T2S_CHAR_MAP = {v: k for k, v in _S2T_CHAR_MAP.items()}
-_T2S_PHRASE_MAP = {v: k for k, v in _S2T_PHRASE_MAP.items()}
+_T2S_MAPS = None
+
+
+def _get_t2s_maps():
+    global _T2S_MAPS
+    if _T2S_MAPS is None:
+        _T2S_MAPS = (
+            {v: k for k, v in _S2T_PHRASE_MAP.items()},
+            {v: k for k, v in _S2T_CHAR_MAP.items()},
+        )
+    return _T2S_MAPS
 
 def set_search_status(app, message=None):
     if not hasattr(app, "search_status_label"):
@@ -291,14 +316,15 @@ def _generate_search_variants(query):
         return variants
 
     conv_candidates = []
-    if _OPENCC_S2T is not None:
+    opencc_s2t, opencc_t2s = _get_opencc_converters()
+    if opencc_s2t is not None:
         try:
-            conv_candidates.append(_OPENCC_S2T.convert(base))
+            conv_candidates.append(opencc_s2t.convert(base))
         except Exception:
             pass
-    if _OPENCC_T2S is not None:
+    if opencc_t2s is not None:
         try:
-            conv_candidates.append(_OPENCC_T2S.convert(base))
+            conv_candidates.append(opencc_t2s.convert(base))
         except Exception:
             pass
     if not conv_candidates:
@@ -311,7 +337,7 @@ def _generate_search_variants(query):
     conv_candidates.extend(
         [
             _convert_by_builtin_map(base, _S2T_PHRASE_MAP, _S2T_CHAR_MAP),
-            _convert_by_builtin_map(base, _T2S_PHRASE_MAP, _T2S_CHAR_MAP),
+            _convert_by_builtin_map(base, *_get_t2s_maps()),
         ]
     )
 
@@ -643,65 +669,60 @@ def _run_search(app, q):
     app.res_hist_box.set_visible(False)
     app.res_trk_box.set_visible(False)
 
-    def do_search():
-        logger.debug("Background search thread started: variants=%s", query_variants)
-        try:
-            remote_hits = []
-            for query in query_variants:
-                remote_hits.append(app.backend.search_items(query))
-            results = _merge_remote_results(remote_hits)
-            merged = {
+    async def do_search():
+        logger.debug("Background search started: variants=%s", query_variants)
+        # Variants are searched concurrently; a superseded search is cancelled.
+        remote_hits = await app.backend.search_many_async(query_variants)
+        return _merge_remote_results(remote_hits)
+
+    def apply_results(results):
+        if request_id != getattr(app, "_search_request_id", 0):
+            return
+        if hasattr(app, "set_diag_health"):
+            app.set_diag_health("network", "ok")
+        app.render_search_results(
+            {
                 "artists": results.get("artists", []),
                 "albums": results.get("albums", []),
                 "tracks": results.get("tracks", []),
                 "playlists": local_results.get("playlists", []),
                 "history_tracks": local_results.get("history_tracks", []),
             }
-            if hasattr(app, "set_diag_health"):
-                app.set_diag_health("network", "ok")
-
-            def apply_results():
-                if request_id != getattr(app, "_search_request_id", 0):
-                    return False
-                app.render_search_results(merged)
-                return False
-
-            GLib.idle_add(apply_results)
-        except Exception as e:
-            kind = classify_exception(e)
-            logger.warning("Search error [%s]: %s", kind, e)
-            if hasattr(app, "record_diag_event"):
-                app.record_diag_event(f"Search error [{kind}]: {e}")
-            if hasattr(app, "set_diag_health"):
-                if kind in ("network", "server", "auth"):
-                    app.set_diag_health("network", "error", kind)
-                elif kind == "parse":
-                    app.set_diag_health("decoder", "warn", "search-parse")
-                else:
-                    app.set_diag_health("network", "warn", kind)
-
-            def apply_error():
-                if request_id != getattr(app, "_search_request_id", 0):
-                    return False
-                app.render_search_results(
-                    {
-                        "artists": [],
-                        "albums": [],
-                        "tracks": [],
-                        "playlists": local_results.get("playlists", []),
-                        "history_tracks": local_results.get("history_tracks", []),
-                    }
-                )
-                local_any = bool(local_results.get("playlists")) or bool(local_results.get("history_tracks"))
-                if local_any:
-                    set_search_status(app, f"{user_message(kind, 'search')} Showing local results.")
-                else:
-                    set_search_status(app, user_message(kind, "search"))
-                return False
+        )
 
-            GLib.idle_add(apply_error)
+    def apply_error(e):
+        kind = classify_exception(e)
+        logger.warning("Search error [%s]: %s", kind, e)
+        if hasattr(app, "record_diag_event"):
+            app.record_diag_event(f"Search error [{kind}]: {e}")
+        if hasattr(app, "set_diag_health"):
+            if kind in ("network", "server", "auth"):
+                app.set_diag_health("network", "error", kind)
+            elif kind == "parse":
+                app.set_diag_health("decoder", "warn", "search-parse")
+            else:
+                app.set_diag_health("network", "warn", kind)
+        if request_id != getattr(app, "_search_request_id", 0):
+            return
+        app.render_search_results(
+            {
+                "artists": [],
+                "albums": [],
+                "tracks": [],
+                "playlists": local_results.get("playlists", []),
+                "history_tracks": local_results.get("history_tracks", []),
+            }
+        )
+        local_any = bool(local_results.get("playlists")) or bool(local_results.get("history_tracks"))
+        if local_any:
+            set_search_status(app, f"{user_message(kind, 'search')} Showing local results.")
+        else:
+            set_search_status(app, user_message(kind, "search"))
 
-    Thread(target=do_search, daemon=True).start()
+    previous = getattr(app, "_search_task", None)
+    if previous is not None:
+        previous.cancel()
+    app._search_task = app_async.run(do_search(), on_done=apply_results, on_error=apply_error)
 
 
 def render_search_results(app, res):
@@ -773,20 +794,17 @@ def render_search_results(app, res):
         img.set_size_request(110, 110)
         refs = app.playlist_mgr.get_cover_refs(p, limit=4) if hasattr(app, "playlist_mgr") else []
         collage_dir = os.path.join(app.cache_dir, "playlist_covers")
-        collage = utils.generate_auto_collage_cover(
+        utils.load_collage_img(
+            img,
             refs,
-            image_cache_dir=app.cache_dir,
-            collage_cache_dir=collage_dir,
+            app.cache_dir,
+            collage_dir,
+            110,
             key_prefix=f"playlist_search_{p.get('id', 'x')}_{p.get('updated_at', 0)}",
             size=256,
             overlay_alpha=0.34,
             overlay_style="mix",
         )
-        if collage:
-            utils.load_img(img, collage, app.cache_dir, 110)
-        else:
-            img.set_pixel_size(110)
-            img.set_from_icon_name("audio-x-generic-symbolic")
         card.append(img)
         card.append(
             Gtk.Label(
@@ -923,7 +941,7 @@ def render_search_tracks_page(app):
     tracks = list(getattr(app, "search_track_data", []) or [])
     order = list(getattr(app, "search_track_order_indices", []) or [])
     if order:
-        logger.info(
+        hot_logger.info(
             "Search tracks page render: Rust-order active (page=%s, page_size=%s, ordered_total=%s)",
             int(getattr(app, "search_tracks_page", 0) or 0) + 1,
             int(getattr(app, "search_tracks_page_size", 50) or 50),
@@ -931,7 +949,7 @@ def render_search_tracks_page(app):
         )
         ordered_pairs = [(int(i), tracks[int(i)]) for i in order if 0 <= int(i) < len(tracks)]
     else:
-        logger.info(
+        hot_logger.info(
             "Search tracks page render: Python-order active (page=%s, page_size=%s, total=%s)",
             int(getattr(app, "search_tracks_page", 0) or 0) + 1,
             int(getattr(app, "search_tracks_page_size", 50) or 50),
@@ -1067,7 +1085,7 @@ def show_album_details(app, alb):
         GLib.idle_add(lambda: app.header_meta.set_text(desc.strip(" • ")))
         GLib.idle_add(app.load_album_tracks, ts)
 
-    Thread(target=detail_task, daemon=True).start()
+    app_executor.submit(LANE_NETWORK, detail_task)
 
 
 def populate_tracks(app, tracks):
@@ -1160,11 +1178,38 @@ def populate_tracks(app, tracks):
         app._update_track_list_icon()
 
 
+def _start_flow_render(app, items, build_card, initial_chunk, name):
+    flow = getattr(app, "main_flow", None)
+    if flow is None or not items:
+        return None
+    render_token = next_render_token(app, "_grid_render_token")
+
+    def _is_current():
+        return (
+            int(getattr(app, "_grid_render_token", 0) or 0) == render_token
+            and getattr(app, "main_flow", None) is flow
+        )
+
+    def _build(obj):
+        c = Gtk.FlowBoxChild()
+        c.set_child(build_card(obj))
+        c.data_item = {"obj": obj, "type": name}
+        flow.append(c)
+
+    # FlowBox children are appended in order, so the top of the grid (what
+    # the freshly opened view shows) is always built first.
+    return ProgressiveRenderer(
+        flow,
+        list(items),
+        _build,
+        is_current=_is_current,
+        initial_chunk=initial_chunk,
+        name=name.lower(),
+    ).start()
+
+
 def batch_load_albums(app, albs, batch=6):
-    if not albs:
-        return False
-    curr, rem = albs[:batch], albs[batch:]
-    for alb in curr:
+    def _card(alb):
         v = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6, css_classes=["card", "home-card"])
         img = Gtk.Image(css_classes=["album-cover-img"])
         utils.load_img(img, lambda a=alb: app.backend.get_artwork_url(a, 640), app.cache_dir, 130)
@@ -1179,20 +1224,14 @@ def batch_load_albums(app, albs, batch=6):
                 css_classes=["home-card-title"],
             )
         )
-        c = Gtk.FlowBoxChild()
-        c.set_child(v)
-        c.data_item = {"obj": alb, "type": "Album"}
-        app.main_flow.append(c)
-    if rem:
-        GLib.timeout_add(50, app.batch_load_albums, rem, batch)
+        return v
+
+    _start_flow_render(app, albs, _card, batch, "Album")
     return False
 
 
 def batch_load_artists(app, artists, batch=10):
-    if not artists:
-        return False
-    curr, rem = artists[:batch], artists[batch:]
-    for art in curr:
+    def _card(art):
         v = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8, css_classes=["card", "home-card"])
         img = Gtk.Image(pixel_size=120, css_classes=["circular-avatar"])
         utils.load_img(img, lambda a=art: app.backend.get_artist_artwork_url(a, 320), app.cache_dir, 120)
@@ -1207,39 +1246,35 @@ def batch_load_artists(app, artists, batch=10):
                 css_classes=["heading", "home-card-title"],
             )
         )
-        c = Gtk.FlowBoxChild()
-        c.set_child(v)
-        c.data_item = {"obj": art, "type": "Artist"}
-        app.main_flow.append(c)
-    if rem:
-        GLib.timeout_add(50, app.batch_load_artists, rem, batch)
+        return v
+
+    _start_flow_render(app, artists, _card, batch, "Artist")
     return False
 
 
-def batch_load_home(app, sections):
-    if not sections:
-        return
-    render_token = int(getattr(app, "_home_render_token", 0) or 0) + 1
-    app._home_render_token = render_token
+HOME_REVALIDATE_TTL_SEC = 300.0
 
-    def _scroll_h(scroller, direction=1):
-        adj = scroller.get_hadjustment()
-        if adj is None:
-            return
-        page = max(120.0, float(adj.get_page_size()) * 0.85)
-        target = adj.get_value() + (page * direction)
-        lower = float(adj.get_lower())
-        upper = float(adj.get_upper()) - float(adj.get_page_size())
-        if target < lower:
-            target = lower
-        if target > upper:
-            target = upper
-        adj.set_value(target)
 
-    def _open_item(item_data):
-        if not item_data:
-            return
-        obj = item_data.get("obj")
+def _scroll_home_row(scroller, direction=1):
+    adj = scroller.get_hadjustment()
+    if adj is None:
+        return
+    page = max(120.0, float(adj.get_page_size()) * 0.85)
+    target = adj.get_value() + (page * direction)
+    lower = float(adj.get_lower())
+    upper = float(adj.get_upper()) - float(adj.get_page_size())
+    if target < lower:
+        target = lower
+    if target > upper:
+        target = upper
+    adj.set_value(target)
+
+
+def _open_home_item(app, item_data):
+    if not item_data:
+        return
+
+    def _open(obj):
         typ = item_data.get("type")
         if typ == "Track":
             app._play_single_track(obj)
@@ -1249,99 +1284,311 @@ def batch_load_home(app, sections):
             return
         app.show_album_details(obj)
 
-    def _build_home_item_button(item_data):
-        v = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6, css_classes=["card", "home-card"])
-        img_size = 130
-        img_cls = "album-cover-img"
-        if item_data["type"] == "Track":
-            img_size = 88
-            v.add_css_class("home-track-card")
-        elif item_data["type"] == "Artist" or "Radio" in item_data["name"]:
-            img_size = 120
-            img_cls = "circular-avatar"
-        img = Gtk.Image(pixel_size=img_size, css_classes=[img_cls])
-        if item_data["image_url"]:
-            utils.load_img(img, item_data["image_url"], app.cache_dir, img_size)
-        else:
-            img.set_from_icon_name("audio-x-generic-symbolic")
-        v.append(img)
+    if not item_data.get("snapshot"):
+        _open(item_data.get("obj"))
+        return
+
+    # Snapshot items only carry ids; fetch the live object before opening it.
+    def task():
+        obj = app.backend.resolve_home_item(item_data)
+
+        def apply():
+            if obj is None:
+                app.show_output_notice("This item is no longer available.", "warn", 2400)
+            else:
+                _open(obj)
+            return False
+
+        GLib.idle_add(apply)
+
+    app_executor.submit(LANE_NETWORK, task)
+
+
+def _set_home_item_image(img, image_url, cache_dir, img_size):
+    if image_url:
+        utils.load_img(img, image_url, cache_dir, img_size)
+    else:
+        img.set_from_icon_name("audio-x-generic-symbolic")
+
+
+def _build_home_item_button(app, item_data):
+    v = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6, css_classes=["card", "home-card"])
+    img_size = 130
+    img_cls = "album-cover-img"
+    if item_data["type"] == "Track":
+        img_size = 88
+        v.add_css_class("home-track-card")
+    elif item_data["type"] == "Artist" or "Radio" in item_data["name"]:
+        img_size = 120
+        img_cls = "circular-avatar"
+    img = Gtk.Image(pixel_size=img_size, css_classes=[img_cls])
+    _set_home_item_image(img, item_data["image_url"], app.cache_dir, img_size)
+    v.append(img)
+    v.append(
+        Gtk.Label(
+            label=item_data["name"],
+            ellipsize=2,
+            halign=Gtk.Align.CENTER,
+            wrap=True,
+            max_width_chars=16,
+            css_classes=["heading", "home-card-title"],
+        )
+    )
+    if item_data["sub_title"]:
         v.append(
             Gtk.Label(
-                label=item_data["name"],
-                ellipsize=2,
+                label=item_data["sub_title"],
+                ellipsize=1,
                 halign=Gtk.Align.CENTER,
-                wrap=True,
-                max_width_chars=16,
-                css_classes=["heading", "home-card-title"],
+                css_classes=["caption", "dim-label", "home-card-subtitle"],
             )
         )
-        if item_data["sub_title"]:
-            v.append(
-                Gtk.Label(
-                    label=item_data["sub_title"],
-                    ellipsize=1,
-                    halign=Gtk.Align.CENTER,
-                    css_classes=["caption", "dim-label", "home-card-subtitle"],
-                )
-            )
-        btn = Gtk.Button(css_classes=["flat", "history-card-btn"])
-        btn.set_child(v)
-        btn.connect("clicked", lambda _b, d=item_data: _open_item(d))
-        return btn
-
+    btn = Gtk.Button(css_classes=["flat", "history-card-btn"])
+    btn.set_child(v)
+    # Read the item at click time so a revalidated Home can swap in live objects.
+    btn.home_item = item_data
+    btn.home_img = img
+    btn.home_img_size = img_size
+    btn.connect("clicked", lambda b: _open_home_item(app, b.home_item))
+    return btn
+
+
+def _home_section_signature(app, sec):
+    return (str(sec.get("title") or ""), tuple(app.backend.home_item_key(it) for it in sec.get("items") or []))
+
+
+def _build_home_section(app, sec):
+    section_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, css_classes=["home-section"])
+    section_head = Gtk.Box(spacing=8, css_classes=["home-section-head"])
+    section_title = Gtk.Label(label=sec["title"], xalign=0, hexpand=True, css_classes=["home-section-title"])
+    section_count = Gtk.Label(label=f"{len(sec['items'])} items", css_classes=["home-section-count"])
+    left_btn = Gtk.Button(icon_name="go-previous-symbolic", css_classes=["flat", "circular", "home-scroll-btn"])
+    right_btn = Gtk.Button(icon_name="go-next-symbolic", css_classes=["flat", "circular", "home-scroll-btn"])
+    section_head.append(section_title)
+    section_head.append(section_count)
+    section_head.append(left_btn)
+    section_head.append(right_btn)
+    section_box.append(section_head)
+
+    scroller = Gtk.ScrolledWindow(hexpand=True, vexpand=False, css_classes=["home-row-scroller"])
+    scroller.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.NEVER)
+    grid = Gtk.Grid(column_spacing=20, row_spacing=20)
+    scroller.set_child(grid)
+    left_btn.connect("clicked", lambda _b: _scroll_home_row(scroller, -1))
+    right_btn.connect("clicked", lambda _b: _scroll_home_row(scroller, 1))
+    _bind_horizontal_scroll_buttons(scroller, left_btn, right_btn)
+    section_box.append(scroller)
+    return {
+        "signature": _home_section_signature(app, sec),
+        "items": list(sec["items"]),
+        "box": section_box,
+        "scroller": scroller,
+        "grid": grid,
+        "buttons": {},
+    }
+
+
+def _start_home_render(app, views):
+    """
+    Progressively build the not-yet-built cards of the given section views.
+    Supersedes any Home render that is still running.
+    """
+    render_token = next_render_token(app, "_home_render_token")
     render_queue = []
-    for sec in sections:
-        section_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, css_classes=["home-section"])
-        section_head = Gtk.Box(spacing=8, css_classes=["home-section-head"])
-        section_title = Gtk.Label(label=sec["title"], xalign=0, hexpand=True, css_classes=["home-section-title"])
-        section_count = Gtk.Label(label=f"{len(sec['items'])} items", css_classes=["home-section-count"])
-        left_btn = Gtk.Button(icon_name="go-previous-symbolic", css_classes=["flat", "circular", "home-scroll-btn"])
-        right_btn = Gtk.Button(icon_name="go-next-symbolic", css_classes=["flat", "circular", "home-scroll-btn"])
-        section_head.append(section_title)
-        section_head.append(section_count)
-        section_head.append(left_btn)
-        section_head.append(right_btn)
-        section_box.append(section_head)
-
-        scroller = Gtk.ScrolledWindow(hexpand=True, vexpand=False, css_classes=["home-row-scroller"])
-        scroller.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.NEVER)
-        grid = Gtk.Grid(column_spacing=20, row_spacing=20)
-        scroller.set_child(grid)
-        left_btn.connect("clicked", lambda _b: _scroll_h(scroller, -1))
-        right_btn.connect("clicked", lambda _b: _scroll_h(scroller, 1))
-        _bind_horizontal_scroll_buttons(scroller, left_btn, right_btn)
-        section_box.append(scroller)
-        app.collection_content_box.append(section_box)
-        render_queue.append({"grid": grid, "items": list(sec["items"]), "index": 0})
+    for sec_idx, view in enumerate(views):
+        for i in range(len(view["items"])):
+            if i not in view["buttons"]:
+                render_queue.append({"section": sec_idx, "view": view, "index": i})
+    if not render_queue:
+        return None
 
     # Render cards progressively to avoid one long UI stall on Home.
-    def _render_home_chunk():
+    def _is_current():
         # Stop rendering immediately when Home is no longer active or this render got superseded.
-        current_token = int(getattr(app, "_home_render_token", 0) or 0)
-        if current_token != render_token:
+        if int(getattr(app, "_home_render_token", 0) or 0) != render_token:
             return False
-        row = app.nav_list.get_selected_row() if getattr(app, "nav_list", None) is not None else None
-        if not row or getattr(row, "nav_id", None) != "home":
-            return False
-        budget = 10  # number of cards per tick
-        while budget > 0 and render_queue:
-            ctx = render_queue[0]
-            i = int(ctx["index"])
-            items = ctx["items"]
-            if i >= len(items):
-                render_queue.pop(0)
-                continue
-            item_data = items[i]
-            btn = _build_home_item_button(item_data)
-            ctx["grid"].attach(btn, i // 2, i % 2, 1, 1)
-            ctx["index"] = i + 1
-            budget -= 1
-
-        if render_queue:
-            GLib.timeout_add(12, _render_home_chunk)
+        return _home_is_visible(app)
+
+    outer_scroll = getattr(app, "alb_scroll", None)
+
+    def _priority(entry):
+        # Cards of sections inside the viewport, within the first horizontal
+        # page of their row (2 rows per column), are built first.
+        view = entry["view"]
+        dist = viewport_distance(view["box"], outer_scroll) if outer_scroll is not None else 0
+        visible_cols = max(4, int(view["scroller"].get_width() or 0) // 150 + 1)
+        offscreen = dist > 0 or entry["index"] >= visible_cols * 2
+        return (1 if offscreen else 0, dist, entry["section"], entry["index"])
+
+    def _build(entry):
+        view = entry["view"]
+        i = entry["index"]
+        if i in view["buttons"] or i >= len(view["items"]):
+            return
+        btn = _build_home_item_button(app, view["items"][i])
+        view["buttons"][i] = btn
+        view["grid"].attach(btn, i // 2, i % 2, 1, 1)
+
+    v_adj = outer_scroll.get_vadjustment() if outer_scroll is not None else None
+    scroll_handler = {"id": 0}
+
+    def _on_done(_cancelled):
+        if v_adj is not None and scroll_handler["id"]:
+            v_adj.disconnect(scroll_handler["id"])
+            scroll_handler["id"] = 0
+
+    renderer = ProgressiveRenderer(
+        app.collection_content_box,
+        render_queue,
+        _build,
+        is_current=_is_current,
+        priority=_priority,
+        on_done=_on_done,
+        initial_chunk=10,
+        name="home",
+    )
+    if v_adj is not None:
+        scroll_handler["id"] = v_adj.connect("value-changed", lambda *_a: renderer.request_reprioritize())
+    return renderer.start()
+
+
+def run_view_task(app, name, fn):
+    """
+    Fetch for the page being shown. Goes through the app's startup scheduler
+    so favorites sync and prefetch wait for it; network lane otherwise.
+    """
+    scheduler = getattr(app, "startup_scheduler", None)
+    if scheduler is None:
+        app_executor.submit(LANE_NETWORK, fn)
+        return
+    scheduler.submit(name, fn, PRIORITY_VISIBLE)
+
+
+def _home_is_visible(app):
+    row = app.nav_list.get_selected_row() if getattr(app, "nav_list", None) is not None else None
+    if not (row and getattr(row, "nav_id", None) == "home"):
         return False
+    stack = getattr(app, "right_stack", None)
+    return stack is None or stack.get_visible_child_name() == "grid_view"
+
+
+def batch_load_home(app, sections):
+    if not sections:
+        return
+    views = []
+    for sec in sections:
+        view = _build_home_section(app, sec)
+        app.collection_content_box.append(view["box"])
+        views.append(view)
+    app._home_section_views = views
+    _start_home_render(app, views)
+
+
+def update_home_sections(app, sections):
+    """
+    Apply fresh Home sections to the rendered page without a full rebuild.
+
+    Sections whose title and item ids are unchanged keep their widgets; only
+    the item data behind each card is swapped (live objects replace snapshot
+    placeholders) and changed artwork is reloaded. New or changed sections
+    are built, stale ones removed, and the order is fixed in place.
+    """
+    if not sections:
+        return
+    box = app.collection_content_box
+    views = list(getattr(app, "_home_section_views", None) or [])
+    if not views or any(v["box"].get_parent() is not box for v in views):
+        # Nothing of ours is on screen (e.g. the loading label); paint from scratch.
+        _clear_container(box)
+        batch_load_home(app, sections)
+        return
+
+    reusable = {}
+    for view in views:
+        reusable.setdefault(view["signature"], []).append(view)
+
+    new_views = []
+    reused = 0
+    for sec in sections:
+        candidates = reusable.get(_home_section_signature(app, sec))
+        if candidates:
+            view = candidates.pop(0)
+            view["items"] = list(sec["items"])
+            for i, btn in view["buttons"].items():
+                item_data = view["items"][i]
+                old_url = (btn.home_item or {}).get("image_url")
+                btn.home_item = item_data
+                if item_data.get("image_url") != old_url:
+                    _set_home_item_image(btn.home_img, item_data.get("image_url"), app.cache_dir, btn.home_img_size)
+            reused += 1
+        else:
+            view = _build_home_section(app, sec)
+        new_views.append(view)
+
+    keep = {id(v["box"]) for v in new_views}
+    for view in views:
+        if id(view["box"]) not in keep:
+            box.remove(view["box"])
+    prev = None
+    for view in new_views:
+        if view["box"].get_parent() is None:
+            box.insert_child_after(view["box"], prev)
+        else:
+            box.reorder_child_after(view["box"], prev)
+        prev = view["box"]
+
+    app._home_section_views = new_views
+    logger.debug("Home revalidated: sections=%s reused=%s", len(new_views), reused)
+    _start_home_render(app, new_views)
+
+
+def load_home_snapshot(app):
+    store = getattr(app, "home_snapshot", None)
+    data = store.load() if store is not None else None
+    if not data:
+        return None
+    return app.backend.restore_home_sections(data["sections"]) or None
+
+
+def revalidate_home(app, force=False, max_age_sec=HOME_REVALIDATE_TTL_SEC):
+    """
+    Refresh Home sections in the background (stale-while-revalidate).
+    The result is persisted as the next startup snapshot and diffed into the
+    page if Home is still showing.
+    """
+    if getattr(app, "_home_revalidate_inflight", False):
+        return
+    last = float(getattr(app, "_home_revalidated_at", 0.0) or 0.0)
+    if not force and last > 0.0 and (time.monotonic() - last) < max_age_sec:
+        return
+    app._home_revalidate_inflight = True
+    scope = getattr(app, "_account_scope", "guest")
+    store = getattr(app, "home_snapshot", None)
+
+    def task():
+        sections = app.backend.get_home_page()
+        if sections and store is not None:
+            snapshot = app.backend.snapshot_home_sections(sections)
+            if snapshot and store.scope_key == scope:
+                store.save(snapshot)
+
+        def apply():
+            app._home_revalidate_inflight = False
+            if scope != getattr(app, "_account_scope", "guest") or not app.backend.user:
+                return False
+            app._home_revalidated_at = time.monotonic()
+            if not sections:
+                if _home_is_visible(app) and not getattr(app, "_home_sections_cache", None):
+                    _clear_container(app.collection_content_box)
+                return False
+            app._home_sections_cache = sections
+            if _home_is_visible(app):
+                update_home_sections(app, sections)
+            return False
 
-    GLib.idle_add(_render_home_chunk)
+        GLib.idle_add(apply)
+
+    run_view_task(app, "home_revalidate", task)
 
 
 def render_history_dashboard(app):
@@ -1673,6 +1920,7 @@ def render_liked_songs_dashboard(app, tracks=None):
     artist_meta = {}
     artist_key_strs = []
     artist_key_u64 = []
+    album_key_u64 = []
     title_lc = []
     artist_lc = []
     album_lc = []
@@ -1700,6 +1948,7 @@ def render_liked_songs_dashboard(app, tracks=None):
         title_lc.append(str(getattr(t, "name", "") or "").lower())
         artist_lc.append(str(getattr(artist_obj, "name", "") or "").lower())
         album_lc.append(str(getattr(getattr(t, "album", None), "name", "") or "").lower())
+        album_key_u64.append(_stable_u64_from_text(f"album:{getattr(getattr(t, 'album', None), 'id', None) or album_lc[-1]}"))
         durations.append(int(getattr(t, "duration", 0) or 0))
 
     title_rank = _build_rank(title_lc)
@@ -1720,9 +1969,35 @@ def render_liked_songs_dashboard(app, tracks=None):
 
     artist_counts = None
     rust_core = _get_rust_collection_core()
+    # Stateful Rust index: columns cross FFI once here, then every filter,
+    # sort or page change only fetches the visible page of indices.
+    collection = None
     if rust_core is not None and getattr(rust_core, "available", False) and not key_collision:
         try:
-            artist_counts = rust_core.count_artist_keys(artist_key_u64)
+            collection = rust_core.create_collection_index()
+            if collection is not None:
+                loaded = collection.load_columns(
+                    artist_keys=artist_key_u64,
+                    album_keys=album_key_u64,
+                    title_rank=title_rank,
+                    artist_rank=artist_rank,
+                    album_rank=album_rank,
+                    durations=durations,
+                    favorites=[True] * len(all_tracks),
+                )
+                if loaded and collection.load_search(bytes(search_blob), search_offsets, search_lens):
+                    logger.info("Liked songs collection index loaded: Rust (total=%s)", len(all_tracks))
+                else:
+                    collection.close()
+                    collection = None
+        except Exception:
+            collection = None
+            logger.exception("Rust liked-songs collection index failed; fallback to stateless filters")
+        try:
+            if collection is not None:
+                artist_counts = collection.facet_counts(collection.FACET_ARTIST)
+            else:
+                artist_counts = rust_core.count_artist_keys(artist_key_u64)
             logger.info("Liked songs artist aggregation path: Rust")
         except Exception:
             artist_counts = None
@@ -1886,7 +2161,7 @@ def render_liked_songs_dashboard(app, tracks=None):
 
     list_box = Gtk.ListBox(css_classes=["tracks-list"], margin_start=0, margin_end=0, margin_bottom=32)
     app.liked_track_list = list_box
-    list_box.connect("row-activated", lambda box, row: app.on_history_track_clicked(getattr(box, "liked_tracks", []), getattr(row, "liked_track_index", -1)))
+    list_box.connect("row-activated", lambda _box, row: app.on_history_track_clicked(_filtered_tracks(), getattr(row, "liked_track_index", -1)))
     table_box.append(list_box)
 
     def _play_liked_tracks(tracks, shuffle=False):
@@ -1923,25 +2198,81 @@ def render_liked_songs_dashboard(app, tracks=None):
         insert_at = min(len(base_queue), current_idx + 1)
         new_queue = list(base_queue)
         new_queue[insert_at:insert_at] = items
-        if hasattr(app, "_set_play_queue"):
+        order = getattr(app, "shuffle_order", None)
+        if order is not None and len(order) == len(base_queue):
+            # Keep the shuffle history/read-ahead; the new tracks simply play next.
+            app.play_queue = new_queue
+            order.insert(insert_at, len(items), up_next=True)
+        elif hasattr(app, "_set_play_queue"):
             app._set_play_queue(new_queue)
         else:
             app.play_queue = new_queue
         if hasattr(app, "_refresh_queue_views"):
-            GLib.idle_add(app._refresh_queue_views)
+            app_ui_queue.post(app._refresh_queue_views, key="queue_views")
 
-    play_all_btn.connect("clicked", lambda _b: _play_liked_tracks(getattr(list_box, "liked_tracks", []), shuffle=False))
-    shuffle_btn.connect("clicked", lambda _b: _play_liked_tracks(getattr(list_box, "liked_tracks", []), shuffle=True))
-    play_next_btn.connect("clicked", lambda _b: _queue_liked_tracks_next(getattr(list_box, "liked_tracks", [])))
+    play_all_btn.connect("clicked", lambda _b: _play_liked_tracks(_filtered_tracks(), shuffle=False))
+    shuffle_btn.connect("clicked", lambda _b: _play_liked_tracks(_filtered_tracks(), shuffle=True))
+    play_next_btn.connect("clicked", lambda _b: _queue_liked_tracks_next(_filtered_tracks()))
+
+    def _collection_query(offset=0, limit=None):
+        q = str(getattr(app, "liked_tracks_query", "") or "").strip().lower()
+        mode = getattr(app, "liked_tracks_sort", "recent")
+        artist_filter = getattr(app, "liked_tracks_artist_filter", None)
+        artist_keys = [key_to_u64[artist_filter]] if artist_filter and artist_filter in key_to_u64 else None
+        sort_id = int(sort_mode_id.get(mode, 0))
+        return collection.query(
+            sort_keys=[sort_id] if sort_id else [],
+            artist_keys=artist_keys,
+            text=q,
+            offset=offset,
+            limit=limit,
+        )
+
+    def _filtered_tracks():
+        # Full filtered order is only materialized when playback needs it.
+        indices = getattr(list_box, "liked_filtered_indices", None)
+        if indices is None and collection is not None:
+            try:
+                res = _collection_query()
+                indices = res[0] if res is not None else None
+            except Exception:
+                logger.exception("Rust liked-songs full query failed")
+        if indices is None:
+            return []
+        return [all_tracks[i] for i in indices if 0 <= int(i) < len(all_tracks)]
 
     def _apply_filters():
         q = str(getattr(app, "liked_tracks_query", "") or "").strip().lower()
         mode = getattr(app, "liked_tracks_sort", "recent")
         artist_filter = getattr(app, "liked_tracks_artist_filter", None)
         filtered_indices = None
+        page_indices = None
+        total = 0
+        page_size = max(1, int(getattr(app, "liked_tracks_page_size", 50) or 50))
+        page = max(0, int(getattr(app, "liked_tracks_page", 0) or 0))
+
+        if collection is not None:
+            try:
+                res = _collection_query(offset=page * page_size, limit=page_size)
+                if res is not None:
+                    page_indices, total = res
+                    last_page = max(0, (total - 1) // page_size)
+                    if page > last_page:
+                        page = last_page
+                        page_indices, total = _collection_query(offset=page * page_size, limit=page_size)
+                    logger.info(
+                        "Liked songs filter/sort path: Rust-index (mode=%s, query_len=%s, total=%s, result=%s)",
+                        mode,
+                        len(q),
+                        len(all_tracks),
+                        total,
+                    )
+            except Exception:
+                page_indices = None
+                logger.exception("Rust liked-songs index query failed; fallback to stateless filters")
 
-        # Fast path: when query is empty, offload filter/sort to Rust.
-        if not q and rust_core is not None and getattr(rust_core, "available", False):
+        # Stateless path for older viz cores without the collection index.
+        if page_indices is None and not q and rust_core is not None and getattr(rust_core, "available", False):
             try:
                 use_filter = bool(artist_filter and artist_filter in key_to_u64)
                 filter_key = int(key_to_u64.get(artist_filter, 0))
@@ -1966,7 +2297,7 @@ def render_liked_songs_dashboard(app, tracks=None):
                 filtered_indices = None
                 logger.exception("Rust liked-songs filter/sort failed; fallback to Python")
 
-        if filtered_indices is None and q and rust_core is not None and getattr(rust_core, "available", False):
+        if page_indices is None and filtered_indices is None and q and rust_core is not None and getattr(rust_core, "available", False):
             try:
                 use_filter = bool(artist_filter and artist_filter in key_to_u64)
                 filter_key = int(key_to_u64.get(artist_filter, 0))
@@ -1996,7 +2327,7 @@ def render_liked_songs_dashboard(app, tracks=None):
                 filtered_indices = None
                 logger.exception("Rust liked-songs query filter/sort failed; fallback to Python")
 
-        if filtered_indices is None:
+        if page_indices is None and filtered_indices is None:
             logger.info(
                 "Liked songs filter/sort path: Python-fallback (mode=%s, query_len=%s, artist_filter=%s, total=%s)",
                 mode,
@@ -2023,27 +2354,24 @@ def render_liked_songs_dashboard(app, tracks=None):
                 filtered_indices.sort(key=lambda i: durations[i])
             # recent => keep backend order
 
-        filtered = [all_tracks[i] for i in filtered_indices]
+        if page_indices is None:
+            total = len(filtered_indices)
+            total_pages = max(1, (total + page_size - 1) // page_size)
+            page = min(page, total_pages - 1)
+            page_indices = filtered_indices[page * page_size:(page + 1) * page_size]
+        total_pages = max(1, (total + page_size - 1) // page_size)
 
         _clear_container(list_box)
-        list_box.liked_tracks = filtered
+        list_box.liked_filtered_indices = filtered_indices
 
-        total = len(filtered)
-        page_size = max(1, int(getattr(app, "liked_tracks_page_size", 50) or 50))
-        total_pages = max(1, (total + page_size - 1) // page_size)
-        page = int(getattr(app, "liked_tracks_page", 0) or 0)
-        if page >= total_pages:
-            page = total_pages - 1
-        if page < 0:
-            page = 0
         app.liked_tracks_page = page
         start = page * page_size
         end = min(start + page_size, total)
-        page_items = filtered[start:end] if total > 0 else []
+        page_items = [all_tracks[i] for i in page_indices if 0 <= int(i) < len(all_tracks)]
 
-        play_all_btn.set_sensitive(bool(filtered))
-        shuffle_btn.set_sensitive(bool(filtered))
-        play_next_btn.set_sensitive(bool(filtered))
+        play_all_btn.set_sensitive(total > 0)
+        shuffle_btn.set_sensitive(total > 0)
+        play_next_btn.set_sensitive(total > 0)
         prev_page_btn.set_sensitive(page > 0)
         next_page_btn.set_sensitive(page < (total_pages - 1))
         if total > 0:
@@ -2273,6 +2601,17 @@ def render_playlists_home(app):
         payload = dict(app.backend.get_playlists_and_folders(parent_folder=parent_folder, limit=1000) or {})
         folders = list(payload.get("folders", []) or [])
         playlists = list(payload.get("playlists", []) or [])
+        cached_previews = app.backend.peek_folder_preview_artworks(folders, limit=4, size=320)
+        preview_cells = {}
+
+        def _fill_preview(cells, preview_urls):
+            for idx, img in enumerate(cells):
+                if idx < len(preview_urls):
+                    utils.load_img(img, preview_urls[idx], app.cache_dir, 62)
+                    img.set_opacity(1.0)
+                else:
+                    img.set_from_icon_name("audio-x-generic-symbolic")
+                    img.set_opacity(0.35)
 
         def apply():
             count_lbl.set_text(f"{len(folders)} folders • {len(playlists)} playlists")
@@ -2288,20 +2627,22 @@ def render_playlists_home(app):
                 collage.set_row_homogeneous(True)
                 collage.set_column_homogeneous(True)
                 collage.set_size_request(130, 130)
-                preview_urls = list(app.backend.get_folder_preview_artworks(f, limit=4, size=320) or [])
+                fid = str(getattr(f, "id", "") or "")
+                cells = []
                 for idx in range(4):
                     cell = Gtk.Box(css_classes=["playlist-folder-cell"])
                     img = Gtk.Image(css_classes=["album-cover-img", "playlist-cover-img", "playlist-folder-preview-img"])
                     img.set_size_request(62, 62)
                     img.set_pixel_size(62)
-                    if idx < len(preview_urls):
-                        utils.load_img(img, preview_urls[idx], app.cache_dir, 62)
-                        img.set_opacity(1.0)
-                    else:
-                        img.set_from_icon_name("audio-x-generic-symbolic")
-                        img.set_opacity(0.35)
+                    cells.append(img)
                     cell.append(img)
                     collage.attach(cell, idx % 2, idx // 2, 1, 1)
+                if fid in cached_previews:
+                    _fill_preview(cells, cached_previews[fid])
+                else:
+                    # Placeholder until the batched preview fetch below lands.
+                    _fill_preview(cells, [])
+                    preview_cells[fid] = cells
                 collage.set_row_spacing(2)
                 collage.set_column_spacing(2)
                 cover.append(collage)
@@ -2395,7 +2736,20 @@ def render_playlists_home(app):
 
         GLib.idle_add(apply)
 
-    Thread(target=task, daemon=True).start()
+        missing = [f for f in folders if str(getattr(f, "id", "") or "") not in cached_previews]
+        if not missing:
+            return
+        previews = app.backend.get_folder_preview_artworks_batch(missing, limit=4, size=320)
+
+        def apply_previews():
+            for fid, cells in preview_cells.items():
+                if fid in previews and cells[0].get_root() is not None:
+                    _fill_preview(cells, previews[fid])
+            return False
+
+        GLib.idle_add(apply_previews)
+
+    app_executor.submit(LANE_NETWORK, task)
 
 
 def render_playlist_detail(app, playlist_id):
@@ -2412,20 +2766,17 @@ def render_playlist_detail(app, playlist_id):
     cover.set_size_request(160, 160)
     refs = app.playlist_mgr.get_cover_refs(p, limit=4)
     collage_dir = os.path.join(app.cache_dir, "playlist_covers")
-    collage = utils.generate_auto_collage_cover(
+    utils.load_collage_img(
+        cover,
         refs,
-        image_cache_dir=app.cache_dir,
-        collage_cache_dir=collage_dir,
+        app.cache_dir,
+        collage_dir,
+        160,
         key_prefix=f"playlist_{p.get('id', 'x')}_{p.get('updated_at', 0)}",
         size=256,
         overlay_alpha=0.34,
         overlay_style="mix",
     )
-    if collage:
-        utils.load_img(cover, collage, app.cache_dir, 160)
-    else:
-        cover.set_pixel_size(160)
-        cover.set_from_icon_name("audio-x-generic-symbolic")
     header_box.append(cover)
 
     info = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4, valign=Gtk.Align.CENTER, hexpand=True)
@@ -2648,15 +2999,16 @@ def render_daily_mixes(app, mixes):
             if len(cover_refs) >= 4:
                 break
         collage_dir = os.path.join(app.cache_dir, "playlist_covers")
-        collage_path = utils.generate_auto_collage_cover(
+        utils.load_collage_img(
+            collage,
             cover_refs,
-            image_cache_dir=app.cache_dir,
-            collage_cache_dir=collage_dir,
+            app.cache_dir,
+            collage_dir,
+            42,
+            fallback_icon=None,
             key_prefix=f"daily_mix_{mix.get('date_label', 'today')}",
             size=256,
         )
-        if collage_path:
-            utils.load_img(collage, collage_path, app.cache_dir, 42)
         head.append(collage)
         title = Gtk.Label(
             label=f"{mix.get('title', 'Daily Mix')} · {mix.get('date_label', '')}",
@@ -1,8 +1,10 @@
-from threading import Thread
 import logging
 
 from gi.repository import GLib, Gtk
+import app_executor
+from app_executor import LANE_NETWORK
 from actions import ui_actions
+from ui.progressive_render import cancel_renders
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +19,7 @@ def on_nav_selected(app, box, row):
         app.grid_subtitle_label.set_visible(True)
 
     app.nav_history.clear()
+    cancel_renders(app)
     app.artist_fav_btn.set_visible(False)
     app.right_stack.set_visible_child_name("grid_view")
     if hasattr(app, "_remember_last_view"):
@@ -33,9 +36,15 @@ def on_nav_selected(app, box, row):
         if hasattr(app, "grid_subtitle_label") and app.grid_subtitle_label is not None:
             app.grid_subtitle_label.set_text("Fresh picks and playlists tailored to your listening")
         if app.backend.user:
-            cached_sections = getattr(app, "_home_sections_cache", None)
-            if cached_sections:
-                app.batch_load_home(cached_sections)
+            # Paint from memory or the on-disk snapshot right away, then
+            # revalidate in the background and diff the result in.
+            sections = getattr(app, "_home_sections_cache", None)
+            if not sections:
+                sections = app.load_home_snapshot()
+                app._home_sections_cache = sections
+            if sections:
+                app.batch_load_home(sections)
+                app.revalidate_home()
                 return
 
             loading = Gtk.Label(
@@ -46,20 +55,7 @@ def on_nav_selected(app, box, row):
                 margin_top=8,
             )
             app.collection_content_box.append(loading)
-
-            def task():
-                sections = app.backend.get_home_page()
-
-                def apply_home():
-                    while c := app.collection_content_box.get_first_child():
-                        app.collection_content_box.remove(c)
-                    app._home_sections_cache = sections
-                    app.batch_load_home(sections)
-                    return False
-
-                GLib.idle_add(apply_home)
-
-            Thread(target=task, daemon=True).start()
+            app.revalidate_home(force=True)
         return
 
     if row.nav_id == "collection":
@@ -79,7 +75,7 @@ def on_nav_selected(app, box, row):
                 albums = list(app.backend.get_recent_albums())
                 GLib.idle_add(app.render_collection_dashboard, [], albums)
 
-            Thread(target=task, daemon=True).start()
+            ui_actions.run_view_task(app, "collection", task)
         else:
             app.render_collection_dashboard([], [])
         return
@@ -134,7 +130,7 @@ def on_nav_selected(app, box, row):
 
             GLib.idle_add(apply_daily)
 
-        Thread(target=task, daemon=True).start()
+        app_executor.submit(LANE_NETWORK, task)
         return
 
     if row.nav_id == "history":
@@ -156,7 +152,7 @@ def on_nav_selected(app, box, row):
                 logger.info("Artists page prepared: total=%s", len(artists))
                 GLib.idle_add(app.batch_load_artists, artists)
 
-            Thread(target=task, daemon=True).start()
+            app_executor.submit(LANE_NETWORK, task)
 
 
 def on_artist_clicked(app, artist):
@@ -170,6 +166,7 @@ def on_artist_clicked(app, artist):
         app.nav_history.append(current_view)
 
     app.current_selected_artist = artist
+    cancel_renders(app)
     app.right_stack.set_visible_child_name("grid_view")
     if hasattr(app, "_remember_last_view"):
         app._remember_last_view("grid_view")
@@ -192,7 +189,7 @@ def on_artist_clicked(app, artist):
         logger.info("Artist albums prepared: artist=%s total=%s", getattr(artist, "name", "Unknown"), len(albums))
         GLib.idle_add(app.batch_load_albums, albums)
 
-    Thread(target=task, daemon=True).start()
+    app_executor.submit(LANE_NETWORK, task)
 
 
 def on_back_clicked(app, btn):
@@ -0,0 +1,158 @@
+import asyncio
+import logging
+import threading
+from typing import Awaitable, Callable, Optional
+
+import app_executor
+from app_executor import LANE_NETWORK
+
+logger = logging.getLogger(__name__)
+
+class AsyncBridge:
+    """
+    An asyncio loop on its own daemon thread, joined to the GLib main loop
+    through callbacks.
+
+    Coroutines only orchestrate: the blocking tidalapi/requests calls are
+    awaited through call(), which runs them on an app_executor lane. A
+    hundred pending fetches are then a hundred cheap asyncio tasks behind a
+    bounded lane rather than a hundred threads, and asyncio provides the
+    timeouts (wait_for), fan-out (gather) and cancellation.
+    """
+
+    def __init__(self, dispatch: Optional[Callable] = None, executor: Optional[app_executor.TaskExecutor] = None):
+        self._dispatch = dispatch
+        self._executor = executor or app_executor.get_executor()
+        self._loop = None
+        self._lock = threading.Lock()
+
+    def set_dispatch(self, dispatch: Optional[Callable]):
+        self._dispatch = dispatch
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            with self._lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    ready = threading.Event()
+
+                    def _serve():
+                        asyncio.set_event_loop(loop)
+                        loop.call_soon(ready.set)
+                        loop.run_forever()
+
+                    threading.Thread(target=_serve, name="asyncio-bridge", daemon=True).start()
+                    ready.wait()
+                    self._loop = loop
+        return self._loop
+
+    def run(
+        self,
+        coro: Awaitable,
+        on_done: Optional[Callable] = None,
+        on_error: Optional[Callable] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Schedule coro on the bridge loop from any thread. Returns a
+        concurrent.futures.Future; cancel() on it cancels the coroutine.
+        on_done(result) / on_error(exc) go through dispatch (by default the
+        executor's, i.e. the GLib main loop in the app) and are skipped when
+        the future was cancelled.
+        """
+        if timeout is not None:
+            coro = asyncio.wait_for(coro, timeout)
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+        def _finished(fut):
+            if fut.cancelled():
+                return
+            exc = fut.exception()
+            callback = on_error if exc is not None else on_done
+            if exc is not None and on_error is None:
+                logger.warning("Async task failed: %s", exc)
+            if callback is None:
+                return
+            value = exc if exc is not None else fut.result()
+            dispatch = self._dispatch or self._executor.dispatch
+            if dispatch is not None:
+                dispatch(callback, value)
+            else:
+                callback(value)
+
+        future.add_done_callback(_finished)
+        return future
+
+    async def call(self, fn: Callable, *args, timeout: Optional[float] = None, lane: str = LANE_NETWORK):
+        """
+        Await a blocking fn(*args) running on an executor lane. Cancelling
+        the await (or hitting the timeout) drops the call if it is still
+        queued; a call already in flight finishes and is ignored.
+        """
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+
+        def _settle(ok, value):
+            if waiter.done():
+                return
+            if ok:
+                waiter.set_result(value)
+            else:
+                waiter.set_exception(value)
+
+        def _job():
+            try:
+                value = fn(*args)
+            except Exception as e:
+                loop.call_soon_threadsafe(_settle, False, e)
+            else:
+                loop.call_soon_threadsafe(_settle, True, value)
+
+        task = self._executor.submit(lane, _job, name=getattr(fn, "__name__", "call"))
+        try:
+            if timeout is None:
+                return await waiter
+            return await asyncio.wait_for(waiter, timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            task.cancel()
+            raise
+
+    async def gather_limited(self, coros, limit: int = 8, return_exceptions: bool = True):
+        """
+        gather() with at most `limit` of the coroutines in flight.
+        """
+        sem = asyncio.Semaphore(max(1, int(limit)))
+
+        async def _one(coro):
+            async with sem:
+                return await coro
+
+        return await asyncio.gather(*(_one(c) for c in coros), return_exceptions=return_exceptions)
+
+    def shutdown(self):
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+
+
+_BRIDGE = None
+_BRIDGE_LOCK = threading.Lock()
+
+
+def get_bridge() -> AsyncBridge:
+    global _BRIDGE
+    if _BRIDGE is None:
+        with _BRIDGE_LOCK:
+            if _BRIDGE is None:
+                _BRIDGE = AsyncBridge()
+    return _BRIDGE
+
+
+def run(coro: Awaitable, **kwargs):
+    return get_bridge().run(coro, **kwargs)
+
+
+async def call(fn: Callable, *args, **kwargs):
+    return await get_bridge().call(fn, *args, **kwargs)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 
 def classify_exception(exc: Exception) -> str:
+    if isinstance(exc, TimeoutError):
+        return "network"
     text = str(exc).lower()
     if any(k in text for k in ("401", "403", "unauthorized", "forbidden", "login", "session expired", "token")):
         return "auth"
@@ -0,0 +1,287 @@
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Named lanes for background work. Each has its own workers and queue, so a
+# burst of one kind (say, favorites pages) cannot starve another (device
+# switching).
+LANE_NETWORK = "network"
+LANE_DISK = "disk"
+LANE_CPU = "cpu"
+LANE_AUDIO = "audio"
+DEFAULT_LIMITS = {
+    LANE_NETWORK: 8,
+    LANE_DISK: 2,
+    LANE_CPU: max(1, min(4, (os.cpu_count() or 2) - 1)),
+    # Output (re)binds must not overlap.
+    LANE_AUDIO: 1,
+}
+# Workers exit after this long without work.
+IDLE_TIMEOUT_SEC = 30.0
+
+_state = threading.local()
+
+
+class Task:
+    """
+    Handle for submitted work. cancel() drops it if it has not started yet;
+    once running, it only suppresses the callbacks, and the function can poll
+    app_executor.cancelled() to stop early.
+    """
+
+    __slots__ = ("name", "lane", "fn", "args", "on_done", "on_error", "queued_at", "_state", "_cancel", "_event", "result", "error")
+
+    def __init__(self, name, lane, fn, args, on_done, on_error):
+        self.name = name
+        self.lane = lane
+        self.fn = fn
+        self.args = args
+        self.on_done = on_done
+        self.on_error = on_error
+        self.queued_at = time.monotonic()
+        self._state = "queued"
+        self._cancel = False
+        self._event = threading.Event()
+        self.result = None
+        self.error = None
+
+    def cancel(self) -> bool:
+        """
+        True when the task will not run (it was still queued).
+        """
+        self._cancel = True
+        return self._state == "queued"
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel
+
+    def done(self) -> bool:
+        return self._event.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._event.wait(timeout)
+
+
+class _Lane:
+    def __init__(self, name, limit):
+        self.name = name
+        self.limit = max(1, int(limit))
+        self.queue = deque()
+        self.workers = 0
+        self.idle = 0
+        # Idle slots claimed by submit() whose notify a worker has not consumed yet.
+        self.wakeups = 0
+        self.running = 0
+        self.cond = None
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.max_depth = 0
+        self.wait_total = 0.0
+        self.run_total = 0.0
+
+
+class TaskExecutor:
+    """
+    Bounded thread lanes with completion callbacks.
+
+    on_done(result) / on_error(exc) are passed to `dispatch` (GLib.idle_add
+    in the app, so they run on the main loop); without one they run on the
+    worker. Neither is called for a cancelled task.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[dict] = None,
+        dispatch: Optional[Callable] = None,
+        idle_timeout: float = IDLE_TIMEOUT_SEC,
+    ):
+        merged = dict(DEFAULT_LIMITS)
+        merged.update(limits or {})
+        self._lock = threading.Lock()
+        self._lanes = {}
+        for name, limit in merged.items():
+            self._add_lane(name, limit)
+        self._dispatch = dispatch
+        self._idle_timeout = max(0.1, float(idle_timeout))
+
+    def _add_lane(self, name, limit):
+        lane = _Lane(name, limit)
+        lane.cond = threading.Condition(self._lock)
+        self._lanes[name] = lane
+        return lane
+
+    @property
+    def dispatch(self) -> Optional[Callable]:
+        return self._dispatch
+
+    def set_dispatch(self, dispatch: Optional[Callable]):
+        self._dispatch = dispatch
+
+    def submit(
+        self,
+        lane: str,
+        fn: Callable,
+        *args,
+        on_done: Optional[Callable] = None,
+        on_error: Optional[Callable] = None,
+        name: Optional[str] = None,
+    ) -> Task:
+        task = Task(name or getattr(fn, "__name__", "task"), lane, fn, args, on_done, on_error)
+        spawn = False
+        with self._lock:
+            state = self._lanes.get(lane)
+            if state is None:
+                logger.warning("Unknown executor lane %r; using %s", lane, LANE_NETWORK)
+                state = self._lanes[LANE_NETWORK]
+                task.lane = LANE_NETWORK
+            state.queue.append(task)
+            state.submitted += 1
+            state.max_depth = max(state.max_depth, len(state.queue))
+            if state.idle > 0:
+                # Claim one idle worker so the next submit spawns instead.
+                state.idle -= 1
+                state.wakeups += 1
+                state.cond.notify()
+            elif state.workers < state.limit:
+                state.workers += 1
+                spawn = True
+        if spawn:
+            threading.Thread(target=self._worker, args=(state,), name=f"exec-{state.name}", daemon=True).start()
+        return task
+
+    def metrics(self) -> dict:
+        """
+        Per lane: queue depth, running and worker counts, totals and the mean
+        queue wait / run time in milliseconds.
+        """
+        out = {}
+        with self._lock:
+            for name, lane in self._lanes.items():
+                finished = lane.completed + lane.failed
+                out[name] = {
+                    "limit": lane.limit,
+                    "queued": len(lane.queue),
+                    "running": lane.running,
+                    "workers": lane.workers,
+                    "submitted": lane.submitted,
+                    "completed": lane.completed,
+                    "failed": lane.failed,
+                    "cancelled": lane.cancelled,
+                    "max_queued": lane.max_depth,
+                    "avg_wait_ms": round(lane.wait_total * 1000.0 / finished, 2) if finished else 0.0,
+                    "avg_run_ms": round(lane.run_total * 1000.0 / finished, 2) if finished else 0.0,
+                }
+        return out
+
+    def _next(self, lane):
+        # Called with the lock held. None when the worker should exit.
+        while True:
+            while lane.queue:
+                task = lane.queue.popleft()
+                if task._cancel:
+                    task._state = "cancelled"
+                    lane.cancelled += 1
+                    task._event.set()
+                    continue
+                task._state = "running"
+                lane.running += 1
+                return task
+            lane.idle += 1
+            # wait()'s return value can't tell a claim apart: a notify racing
+            # the timeout is consumed but reported as a timeout.
+            deadline = time.monotonic() + self._idle_timeout
+            while lane.wakeups == 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                lane.cond.wait(remaining)
+            if lane.wakeups > 0:
+                # submit() already took this worker off the idle count.
+                lane.wakeups -= 1
+                continue
+            lane.idle -= 1
+            if not lane.queue:
+                lane.workers -= 1
+                return None
+
+    def _worker(self, lane):
+        while True:
+            with self._lock:
+                task = self._next(lane)
+            if task is None:
+                return
+            self._run(lane, task)
+
+    def _run(self, lane, task):
+        started = time.monotonic()
+        _state.task = task
+        ok = True
+        try:
+            task.result = task.fn(*task.args)
+        except Exception as e:
+            ok = False
+            task.error = e
+            if task.on_error is None:
+                logger.warning("Background task %s [%s] failed: %s", task.name, lane.name, e)
+        finally:
+            _state.task = None
+        finished = time.monotonic()
+        with self._lock:
+            lane.running -= 1
+            lane.wait_total += started - task.queued_at
+            lane.run_total += finished - started
+            if ok:
+                lane.completed += 1
+            else:
+                lane.failed += 1
+            task._state = "done"
+        task._event.set()
+        if task._cancel:
+            return
+        callback = task.on_done if ok else task.on_error
+        if callback is None:
+            return
+        value = task.result if ok else task.error
+        try:
+            if self._dispatch is not None:
+                self._dispatch(callback, value)
+            else:
+                callback(value)
+        except Exception as e:
+            logger.warning("Callback of task %s failed: %s", task.name, e)
+
+
+def cancelled() -> bool:
+    """
+    Inside a task: whether it has been cancelled.
+    """
+    task = getattr(_state, "task", None)
+    return bool(task is not None and task._cancel)
+
+
+_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_executor() -> TaskExecutor:
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = TaskExecutor()
+    return _EXECUTOR
+
+
+def submit(lane: str, fn: Callable, *args, **kwargs) -> Task:
+    """
+    Run fn(*args) on the shared executor (see TaskExecutor.submit).
+    """
+    return get_executor().submit(lane, fn, *args, **kwargs)
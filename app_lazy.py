@@ -0,0 +1,41 @@
+import importlib
+import threading
+
+import app_startup
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access, so
+    rarely used or alternative implementations (visualizer backends, the
+    signal-path window) stay off the startup path. The import is timed as a
+    "lazy_import:<name>" startup span.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def load(self):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    with app_startup.phase(f"lazy_import:{self._name}"):
+                        self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_module(name: str) -> LazyModule:
+    return LazyModule(name)
@@ -1,7 +1,17 @@
+import atexit
 import logging
 import os
+import queue
+import threading
+import time
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# Default window for RateLimitedLogger: one record per message template.
+RATE_LIMIT_SEC = 5.0
+
+_listener = None
+_atexit_registered = False
 
 
 def _parse_int_env(name: str, default: int) -> int:
@@ -48,10 +58,59 @@ def _apply_module_levels(root_logger: logging.Logger, default_level: int) -> Non
         root_logger.info("Log level override: %s=%s", module_name, logging.getLevelName(level))
 
 
+class RateLimitedLogger(logging.LoggerAdapter):
+    """
+    Logger adapter for hot paths (per-sort, per-page, per-frame messages):
+    each message template is emitted at most once per interval, and the
+    next emitted record reports how many were suppressed in between.
+    Records from different call sites that share a template share a window.
+    """
+
+    def __init__(self, logger: logging.Logger, interval_sec: float = RATE_LIMIT_SEC, clock=time.monotonic):
+        super().__init__(logger, {})
+        self.interval_sec = float(interval_sec)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._windows = {}
+
+    def log(self, level, msg, *args, **kwargs):
+        if not self.isEnabledFor(level):
+            return
+        key = (level, msg)
+        now = self._clock()
+        with self._lock:
+            last, suppressed = self._windows.get(key, (None, 0))
+            if last is not None and now - last < self.interval_sec:
+                self._windows[key] = (last, suppressed + 1)
+                return
+            self._windows[key] = (now, 0)
+        if suppressed:
+            msg = f"{msg} (+{suppressed} similar suppressed)"
+        self.logger.log(level, msg, *args, **kwargs)
+
+
+def rate_limited(logger: logging.Logger, interval_sec: float = RATE_LIMIT_SEC) -> RateLimitedLogger:
+    return RateLimitedLogger(logger, interval_sec)
+
+
+def shutdown_logging() -> None:
+    """
+    Stop the queue listener after draining records already queued.
+    """
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
+
 def setup_logging() -> None:
     """
     Configure application-wide logging once.
 
+    Loggers only put records on an in-memory queue (QueueHandler); a
+    QueueListener thread formats them and does the console/file I/O, so a
+    slow terminal or log file never blocks the GTK thread or audio control.
+
     Env vars:
     - HIRESTI_LOG_LEVEL: DEBUG/INFO/WARNING/ERROR (default: INFO)
     - HIRESTI_LOG_FILE: optional path to a log file
@@ -67,6 +126,7 @@ def setup_logging() -> None:
     root.setLevel(level)
 
     # Reset handlers to avoid duplicated logs on repeated setup.
+    shutdown_logging()
     root.handlers.clear()
 
     formatter = logging.Formatter(
@@ -77,7 +137,7 @@ def setup_logging() -> None:
     console = logging.StreamHandler()
     console.setLevel(level)
     console.setFormatter(formatter)
-    root.addHandler(console)
+    handlers = [console]
 
     log_file = os.getenv("HIRESTI_LOG_FILE")
     if log_file:
@@ -93,6 +153,15 @@ def setup_logging() -> None:
         )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    global _listener, _atexit_registered
+    records = queue.SimpleQueue()
+    root.addHandler(QueueHandler(records))
+    _listener = QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+    if not _atexit_registered:
+        atexit.register(shutdown_logging)
+        _atexit_registered = True
 
     _apply_module_levels(root, level)
@@ -0,0 +1,271 @@
+import bisect
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# HIRESTI_METRICS_DUMP=/path/to/metrics.json writes a snapshot on exit
+# (=1 uses DEFAULT_DUMP_PATH); SIGUSR1 writes one at any time.
+DUMP_ENV = "HIRESTI_METRICS_DUMP"
+DEFAULT_DUMP_PATH = "~/.cache/hiresti/metrics.json"
+SNAPSHOT_VERSION = 1
+# Histogram bucket upper bounds, in seconds (50us .. 30s).
+DEFAULT_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+
+def _key(name, labels):
+    if not labels:
+        return name
+    return name + "{" + ",".join(f"{k}={labels[k]}" for k in sorted(labels)) + "}"
+
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "count", "total", "min", "max")
+
+    def __init__(self, bounds=DEFAULT_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def quantile(self, q):
+        """
+        Upper bound of the bucket holding quantile q (capped at the max seen).
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                bound = self.bounds[i] if i < len(self.bounds) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": (self.total / self.count) if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": {str(b): n for b, n in zip(self.bounds + ("+inf",), self.counts) if n},
+        }
+
+
+class MetricsRegistry:
+    """
+    Counters, gauges and bucketed histograms keyed by name plus labels,
+    e.g. inc("tidal_api_seconds_errors", endpoint="search"). Recording is a
+    dict update under one lock, cheap enough for FFI calls and UI ticks.
+    Collectors add live sections (executor lanes, UI queue) to snapshots.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._gauges = {}
+        self._histograms = {}
+        self._collectors = {}
+        self._caches = {}
+        self._started = time.time()
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            self._gauges[key] = value
+
+    def observe(self, name: str, value: float, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = Histogram()
+            hist.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def cache_lookup(self, cache: str, hit: bool):
+        with self._lock:
+            slot = self._caches.get(cache)
+            if slot is None:
+                slot = self._caches[cache] = [0, 0]
+            slot[0] += 1 if hit else 0
+            slot[1] += 1
+
+    def register_collector(self, name: str, fn: Callable[[], dict]):
+        with self._lock:
+            self._collectors[name] = fn
+
+    def cache_hit_ratios(self) -> dict:
+        with self._lock:
+            caches = {k: tuple(v) for k, v in self._caches.items()}
+        return {
+            cache: {"hits": hits, "lookups": total, "ratio": round(hits / total, 4) if total else None}
+            for cache, (hits, total) in sorted(caches.items())
+        }
+
+    def snapshot(self, app_version: Optional[str] = None) -> dict:
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            histograms = {k: h.to_dict() for k, h in self._histograms.items()}
+            collectors = dict(self._collectors)
+        out = {
+            "version": SNAPSHOT_VERSION,
+            "app_version": app_version,
+            "taken_at": time.time(),
+            "uptime_sec": round(time.time() - self._started, 3),
+            "counters": dict(sorted(counters.items())),
+            "gauges": dict(sorted(gauges.items())),
+            "histograms": dict(sorted(histograms.items())),
+            "cache_hit_ratio": self.cache_hit_ratios(),
+        }
+        for name, fn in collectors.items():
+            try:
+                out[name] = fn()
+            except Exception as e:
+                out[name] = {"error": str(e)}
+        return out
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+            self._caches.clear()
+            self._started = time.time()
+
+
+def format_text(snap: dict) -> str:
+    """
+    Plain-text rendering of a snapshot for the diagnostics page.
+    """
+
+    def ms(v):
+        return "-" if v is None else f"{v * 1000.0:.2f}"
+
+    lines = [f"Uptime {snap.get('uptime_sec', 0):.0f}s  version {snap.get('app_version') or '-'}", ""]
+    ratios = snap.get("cache_hit_ratio") or {}
+    if ratios:
+        lines.append("Cache hit ratio")
+        for cache, r in ratios.items():
+            ratio = "-" if r["ratio"] is None else f"{r['ratio'] * 100.0:.1f}%"
+            lines.append(f"  {cache:<14} {ratio:>7}  ({r['hits']}/{r['lookups']})")
+        lines.append("")
+    hists = snap.get("histograms") or {}
+    if hists:
+        lines.append(f"{'Timings (ms)':<46} {'count':>7} {'p50':>9} {'p95':>9} {'max':>9}")
+        for key, h in hists.items():
+            lines.append(f"  {key:<44} {h['count']:>7} {ms(h['p50']):>9} {ms(h['p95']):>9} {ms(h['max']):>9}")
+        lines.append("")
+    counters = snap.get("counters") or {}
+    if counters:
+        lines.append("Counters")
+        for key, n in counters.items():
+            lines.append(f"  {key:<44} {n:>9g}")
+        lines.append("")
+    gauges = snap.get("gauges") or {}
+    if gauges:
+        lines.append("Gauges")
+        for key, v in gauges.items():
+            lines.append(f"  {key:<44} {v:>9g}")
+        lines.append("")
+    for name in sorted(k for k, v in snap.items() if isinstance(v, dict) and k not in (
+        "counters", "gauges", "histograms", "cache_hit_ratio"
+    )):
+        lines.append(f"{name}: {json.dumps(snap[name], sort_keys=True)}")
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def dump_path() -> Optional[str]:
+    raw = str(os.getenv(DUMP_ENV, "") or "").strip()
+    if not raw or raw == "0":
+        return None
+    if raw.lower() in ("1", "true", "yes", "on"):
+        raw = DEFAULT_DUMP_PATH
+    return os.path.expanduser(raw)
+
+
+def write_json(path: str, app_version: Optional[str] = None) -> Optional[str]:
+    """
+    Atomically write a snapshot of the default registry; returns the path.
+    """
+    path = os.path.expanduser(path)
+    temp_path = f"{path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(REGISTRY.snapshot(app_version), f, indent=1, default=str)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.warning("Failed to write metrics to %s: %s", path, e)
+        return None
+    return path
+
+
+REGISTRY = MetricsRegistry()
+inc = REGISTRY.inc
+set_gauge = REGISTRY.set_gauge
+observe = REGISTRY.observe
+timer = REGISTRY.timer
+cache_lookup = REGISTRY.cache_lookup
+register_collector = REGISTRY.register_collector
+snapshot = REGISTRY.snapshot
+
+
+def timed(name: str, **labels):
+    """
+    Decorator: observe the call's duration, and count calls that raise.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            except Exception:
+                REGISTRY.inc(f"{name}_errors", **labels)
+                raise
+            finally:
+                REGISTRY.observe(name, time.perf_counter() - start, **labels)
+
+        return wrapper
+
+    return decorator
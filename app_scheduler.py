@@ -0,0 +1,216 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+import app_startup
+
+logger = logging.getLogger(__name__)
+
+# Startup work in the order it matters to the user. Lower runs first.
+PRIORITY_SESSION = 0
+PRIORITY_HOME = 1
+PRIORITY_VISIBLE = 2
+PRIORITY_FAVORITES = 3
+PRIORITY_PREFETCH = 4
+PRIORITY_NAMES = {
+    PRIORITY_SESSION: "session",
+    PRIORITY_HOME: "home",
+    PRIORITY_VISIBLE: "visible",
+    PRIORITY_FAVORITES: "favorites",
+    PRIORITY_PREFETCH: "prefetch",
+}
+# Concurrent tasks per priority lane; they all share one HTTP pool.
+DEFAULT_LIMITS = {
+    PRIORITY_SESSION: 1,
+    PRIORITY_HOME: 1,
+    PRIORITY_VISIBLE: 3,
+    PRIORITY_FAVORITES: 1,
+    PRIORITY_PREFETCH: 1,
+}
+# Lanes from here on are bulk work: they wait for every more urgent task and
+# for a quiet moment after the last user interaction.
+BACKGROUND_FROM = PRIORITY_FAVORITES
+INTERACTION_GRACE_SEC = 2.0
+# Finished tasks kept for timings().
+HISTORY_LIMIT = 64
+# Only the first tasks go into the startup timeline (app_startup spans).
+TRACE_TASKS = 32
+
+
+class _Task:
+    __slots__ = ("name", "priority", "fn", "on_done", "queued_at", "started_at", "finished_at", "ok")
+
+    def __init__(self, name, priority, fn, on_done, queued_at):
+        self.name = name
+        self.priority = priority
+        self.fn = fn
+        self.on_done = on_done
+        self.queued_at = queued_at
+        self.started_at = None
+        self.finished_at = None
+        self.ok = None
+
+
+class StartupScheduler:
+    """
+    Priority lanes for background work that would otherwise race for the
+    same HTTP pool after launch: session check, Home snapshot, the visible
+    view, favorites sync, then prefetch.
+
+    Each lane runs at most `limits[priority]` tasks at once, more urgent lanes
+    are always picked first, and background lanes (BACKGROUND_FROM and up)
+    hold off while anything more urgent is queued or running, or while the
+    user has just interacted. on_done(result) is handed to `dispatch`, which
+    the app sets to GLib.idle_add so callbacks land on the main thread; it is
+    not called when fn raises.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[dict] = None,
+        dispatch: Optional[Callable] = None,
+        grace_sec: float = INTERACTION_GRACE_SEC,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._limits = dict(DEFAULT_LIMITS)
+        self._limits.update(limits or {})
+        self._dispatch = dispatch
+        self._grace_sec = max(0.0, float(grace_sec))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._queue = []
+        self._seq = itertools.count()
+        self._running = {}
+        self._pending = {}
+        self._quiet_until = 0.0
+        self._timer = None
+        self._history = []
+        self._traced = 0
+
+    def submit(self, name: str, fn: Callable, priority: int = PRIORITY_PREFETCH, on_done: Optional[Callable] = None):
+        task = _Task(str(name), int(priority), fn, on_done, self._clock())
+        with self._lock:
+            heapq.heappush(self._queue, (task.priority, next(self._seq), task))
+            self._pending[task.priority] = self._pending.get(task.priority, 0) + 1
+        self._pump()
+        return task
+
+    def note_interaction(self):
+        """
+        The user clicked or typed: keep background lanes quiet for a moment
+        so whatever they asked for gets the connections.
+        """
+        if self._grace_sec <= 0.0:
+            return
+        with self._lock:
+            self._quiet_until = self._clock() + self._grace_sec
+
+    def busy(self, priority: Optional[int] = None) -> bool:
+        """
+        Anything queued or running (at `priority` or more urgent, if given).
+        """
+        with self._lock:
+            return self._has_urgent(None if priority is None else int(priority) + 1)
+
+    def timings(self) -> list:
+        """
+        Finished tasks, oldest first: name, lane, wait and run seconds.
+        """
+        with self._lock:
+            return [
+                {
+                    "name": t.name,
+                    "lane": PRIORITY_NAMES.get(t.priority, str(t.priority)),
+                    "wait": t.started_at - t.queued_at,
+                    "run": t.finished_at - t.started_at,
+                    "ok": t.ok,
+                }
+                for t in self._history
+            ]
+
+    def _has_urgent(self, below):
+        for table in (self._pending, self._running):
+            for priority, count in table.items():
+                if count > 0 and (below is None or priority < below):
+                    return True
+        return False
+
+    def _runnable(self, task, now):
+        if self._running.get(task.priority, 0) >= max(1, int(self._limits.get(task.priority, 1))):
+            return False
+        if task.priority >= BACKGROUND_FROM:
+            if now < self._quiet_until:
+                return False
+            # Pending counts include the task itself.
+            for priority in range(task.priority):
+                if self._pending.get(priority, 0) or self._running.get(priority, 0):
+                    return False
+        return True
+
+    def _pump(self):
+        started = []
+        wake_at = None
+        with self._lock:
+            now = self._clock()
+            held = []
+            while self._queue:
+                entry = heapq.heappop(self._queue)
+                task = entry[2]
+                if not self._runnable(task, now):
+                    held.append(entry)
+                    continue
+                self._pending[task.priority] -= 1
+                self._running[task.priority] = self._running.get(task.priority, 0) + 1
+                task.started_at = now
+                started.append(task)
+            for entry in held:
+                heapq.heappush(self._queue, entry)
+            if self._queue and self._quiet_until > now and self._timer is None:
+                wake_at = self._quiet_until - now
+                self._timer = threading.Timer(wake_at, self._on_quiet)
+                self._timer.daemon = True
+        if wake_at is not None:
+            self._timer.start()
+        for task in started:
+            threading.Thread(target=self._run, args=(task,), daemon=True).start()
+
+    def _on_quiet(self):
+        with self._lock:
+            self._timer = None
+        self._pump()
+
+    def _run(self, task):
+        result = None
+        ok = False
+        try:
+            result = task.fn()
+            ok = True
+        except Exception as e:
+            logger.warning("Startup task %s failed: %s", task.name, e)
+        finished = self._clock()
+        with self._lock:
+            task.finished_at = finished
+            task.ok = ok
+            self._running[task.priority] -= 1
+            self._history.append(task)
+            del self._history[:-HISTORY_LIMIT]
+            trace = self._traced < TRACE_TASKS
+            self._traced += 1
+        if trace:
+            app_startup.record(f"task:{task.name}", task.started_at, finished)
+        logger.debug(
+            "Startup task %s [%s] waited %.0fms, ran %.0fms",
+            task.name,
+            PRIORITY_NAMES.get(task.priority, task.priority),
+            (task.started_at - task.queued_at) * 1000.0,
+            (finished - task.started_at) * 1000.0,
+        )
+        if ok and task.on_done is not None:
+            if self._dispatch is not None:
+                self._dispatch(task.on_done, result)
+            else:
+                task.on_done(result)
+        self._pump()
@@ -16,6 +16,7 @@ DEFAULT_SETTINGS = {
     "play_mode": 0,
     "last_nav": "home",
     "last_view": "grid_view",
+    "last_account_scope": "guest",
     "viz_expanded": False,
     "spectrum_theme": 0,
     "viz_backend_policy": 0,
@@ -104,6 +105,7 @@ def normalize_settings(raw: dict[str, Any] | None) -> dict[str, Any]:
     normalized["play_mode"] = _as_int(raw.get("play_mode"), DEFAULT_SETTINGS["play_mode"], minimum=0, maximum=3)
     normalized["last_nav"] = _as_str(raw.get("last_nav"), DEFAULT_SETTINGS["last_nav"])
     normalized["last_view"] = _as_str(raw.get("last_view"), DEFAULT_SETTINGS["last_view"])
+    normalized["last_account_scope"] = _as_str(raw.get("last_account_scope"), DEFAULT_SETTINGS["last_account_scope"])
     normalized["viz_expanded"] = _as_bool(raw.get("viz_expanded"), DEFAULT_SETTINGS["viz_expanded"])
     normalized["spectrum_theme"] = _as_int(raw.get("spectrum_theme"), DEFAULT_SETTINGS["spectrum_theme"], minimum=0, maximum=64)
     normalized["viz_backend_policy"] = _as_int(raw.get("viz_backend_policy"), DEFAULT_SETTINGS["viz_backend_policy"], minimum=0, maximum=1)
@@ -0,0 +1,179 @@
+import functools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# HIRESTI_STARTUP_TRACE=1 (default path) or =/path/to/trace.json writes a JSON
+# timeline of startup phases and imports.
+TRACE_ENV = "HIRESTI_STARTUP_TRACE"
+# Quit as soon as the first frame is drawn (used by tools/bench_startup.py).
+EXIT_ENV = "HIRESTI_STARTUP_EXIT_AFTER_FIRST_FRAME"
+DEFAULT_TRACE_PATH = "~/.cache/hiresti/startup_trace.json"
+TRACE_VERSION = 1
+# Eager imports faster than this are left out of the timeline.
+IMPORT_MIN_SEC = 0.001
+
+# Imported first thing by main.py, so offsets are measured from (almost) process start.
+_T0 = time.monotonic()
+_T0_WALL = time.time()
+_spans = []
+_marks = {}
+_reported = False
+_write_lock = threading.Lock()
+
+
+def trace_path():
+    raw = str(os.getenv(TRACE_ENV, "") or "").strip()
+    if not raw or raw == "0":
+        return None
+    if raw.lower() in ("1", "true", "yes", "on"):
+        raw = DEFAULT_TRACE_PATH
+    return os.path.expanduser(raw)
+
+
+def exit_after_first_frame() -> bool:
+    return str(os.getenv(EXIT_ENV, "") or "").strip() not in ("", "0")
+
+
+def elapsed() -> float:
+    return time.monotonic() - _T0
+
+
+def record(name: str, start: float, end: float) -> None:
+    _spans.append((name, start - _T0, end - start))
+
+
+@contextmanager
+def phase(name: str):
+    """
+    Time a startup phase (backend init, UI build, a lazy import, ...).
+    """
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        record(name, start, time.monotonic())
+
+
+def traced(name: str):
+    """
+    Decorator form of phase(); every call is recorded.
+    """
+
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with phase(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def mark(name: str) -> None:
+    """
+    Record a one-off milestone such as "imports" or "first_frame".
+    """
+    _marks.setdefault(name, elapsed())
+
+
+def breakdown() -> dict:
+    return {
+        "marks": dict(_marks),
+        "spans": [{"name": n, "start": s, "duration": d} for n, s, d in _spans],
+        "lazy_imports": sum(d for n, _s, d in _spans if n.startswith("lazy_import:")),
+    }
+
+
+def _span_total(name: str) -> float:
+    return sum(d for n, _s, d in _spans if n == name)
+
+
+def report() -> None:
+    """
+    Log the startup breakdown once (called when the first frame is drawn).
+    """
+    global _reported
+    if _reported:
+        return
+    _reported = True
+    lazy = [(n[len("lazy_import:"):], d) for n, _s, d in _spans if n.startswith("lazy_import:")]
+    logger.info(
+        "Startup: imports %.0fms, backend init %.0fms, audio engine %.0fms, UI build %.0fms, first frame at %.0fms%s",
+        _marks.get("imports", 0.0) * 1000.0,
+        _span_total("backend_init") * 1000.0,
+        _span_total("audio_engine_init") * 1000.0,
+        _span_total("ui_build") * 1000.0,
+        _marks.get("first_frame", elapsed()) * 1000.0,
+        ("; lazy imports so far: " + ", ".join(f"{n} {d * 1000.0:.0f}ms" for n, d in lazy)) if lazy else "",
+    )
+
+
+def write_trace(path=None):
+    """
+    Write the timeline collected so far as JSON (atomically). Does nothing
+    unless tracing is enabled or a path is given; returns the path written.
+    """
+    path = path or trace_path()
+    if not path:
+        return None
+    data = {
+        "version": TRACE_VERSION,
+        "pid": os.getpid(),
+        "python": sys.version.split()[0],
+        "started_at": _T0_WALL,
+        "written_at": elapsed(),
+    }
+    data.update(breakdown())
+    with _write_lock:
+        temp_path = f"{path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning("Failed to write startup trace %s: %s", path, e)
+            return None
+    return path
+
+
+def _install_import_timer() -> None:
+    """
+    Record an "import:<name>" span for each top-level import that actually
+    loads something (nested imports are part of their parent's span).
+    """
+    import builtins
+
+    real_import = builtins.__import__
+    state = threading.local()
+
+    def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+        depth = getattr(state, "depth", 0)
+        fresh = depth == 0 and level == 0 and (
+            name not in sys.modules
+            or any(f"{name}.{sub}" not in sys.modules for sub in (fromlist or ()) if sub != "*")
+        )
+        state.depth = depth + 1
+        start = time.monotonic()
+        try:
+            return real_import(name, globals, locals, fromlist, level)
+        finally:
+            state.depth = depth
+            if fresh:
+                end = time.monotonic()
+                if end - start >= IMPORT_MIN_SEC:
+                    record(f"import:{name}", start, end)
+
+    builtins.__import__ = timed_import
+
+
+if trace_path():
+    _install_import_timer()
@@ -0,0 +1,165 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+import app_metrics
+
+logger = logging.getLogger(__name__)
+
+# One flush per display frame at most.
+FRAME_SEC = 1.0 / 60.0
+# Work beyond this per flush is carried over to the next frame.
+FRAME_BUDGET_SEC = 0.008
+
+
+class UIQueue:
+    """
+    Coalesced main-thread work queue.
+
+    post() from any thread queues a callable; all pending work runs in one
+    main-loop callback, at most once per FRAME_SEC. Posts with the same key
+    collapse into one entry (first position, latest arguments), so a burst
+    of "refresh the queue views" requests renders once. A flush stops after
+    FRAME_BUDGET_SEC and leaves the rest for the next frame. Return values
+    are ignored (unlike GLib.idle_add, True does not repeat the call).
+
+    `schedule(delay_sec, callback)` hooks into the main loop; the app uses
+    GLib.idle_add / GLib.timeout_add. Without it, post() runs work inline.
+    """
+
+    def __init__(
+        self,
+        schedule: Optional[Callable] = None,
+        frame_sec: float = FRAME_SEC,
+        budget_sec: float = FRAME_BUDGET_SEC,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._schedule = schedule
+        self._frame_sec = max(0.0, float(frame_sec))
+        self._budget_sec = max(0.0, float(budget_sec))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pending = OrderedDict()
+        self._seq = 0
+        self._scheduled = False
+        self._last_flush = None
+        self._stats = {"flushes": 0, "items": 0, "coalesced": 0, "deferred": 0, "over_budget": 0}
+        self._flush_total = 0.0
+        self._flush_last = 0.0
+        self._flush_max = 0.0
+
+    def set_schedule(self, schedule: Optional[Callable]):
+        self._schedule = schedule
+
+    def post(self, fn: Callable, *args, key: Optional[Hashable] = None):
+        if self._schedule is None:
+            self._invoke(fn, args)
+            return
+        with self._lock:
+            if key is not None and key in self._pending:
+                self._pending[key] = (fn, args)
+                self._stats["coalesced"] += 1
+                return
+            if key is None:
+                self._seq += 1
+                key = ("_seq", self._seq)
+            self._pending[key] = (fn, args)
+            if self._scheduled:
+                return
+            self._scheduled = True
+            delay = self._delay_locked()
+        self._schedule(delay, self._on_flush)
+
+    def _delay_locked(self):
+        if self._last_flush is None:
+            return 0.0
+        return max(0.0, self._last_flush + self._frame_sec - self._clock())
+
+    def _on_flush(self):
+        self.flush()
+        return False
+
+    def _invoke(self, fn, args):
+        try:
+            fn(*args)
+        except Exception as e:
+            logger.warning("UI update %s failed: %s", getattr(fn, "__name__", fn), e)
+
+    def flush(self):
+        """
+        Run pending work on the calling (main) thread.
+        """
+        start = self._clock()
+        with self._lock:
+            self._last_flush = start
+            batch = self._pending
+            self._pending = OrderedDict()
+        ran = 0
+        items = list(batch.items())
+        for i, (_key, (fn, args)) in enumerate(items):
+            self._invoke(fn, args)
+            ran += 1
+            if self._budget_sec and self._clock() - start >= self._budget_sec and i + 1 < len(items):
+                leftover = items[i + 1 :]
+                with self._lock:
+                    # Carried-over work goes first; newer posts with the same key replace it.
+                    merged = OrderedDict(leftover)
+                    for k, v in self._pending.items():
+                        merged[k] = v
+                    self._pending = merged
+                    self._stats["deferred"] += len(leftover)
+                break
+        elapsed = self._clock() - start
+        with self._lock:
+            self._stats["flushes"] += 1
+            self._stats["items"] += ran
+            over = bool(self._budget_sec) and elapsed > self._budget_sec
+            if over:
+                self._stats["over_budget"] += 1
+            self._flush_total += elapsed
+            self._flush_last = elapsed
+            self._flush_max = max(self._flush_max, elapsed)
+            again = bool(self._pending)
+            self._scheduled = again
+            delay = self._delay_locked() if again else None
+        app_metrics.observe("ui_flush_seconds", elapsed)
+        if over:
+            logger.debug("UI flush ran %d updates in %.1fms", ran, elapsed * 1000.0)
+        if again and self._schedule is not None:
+            self._schedule(delay, self._on_flush)
+        return ran
+
+    def stats(self) -> dict:
+        """
+        Flush counts and per-frame UI work time in milliseconds.
+        """
+        with self._lock:
+            out = dict(self._stats)
+            out["pending"] = len(self._pending)
+            flushes = out["flushes"]
+            out["last_ms"] = round(self._flush_last * 1000.0, 3)
+            out["max_ms"] = round(self._flush_max * 1000.0, 3)
+            out["avg_ms"] = round(self._flush_total * 1000.0 / flushes, 3) if flushes else 0.0
+        return out
+
+
+_QUEUE = None
+_QUEUE_LOCK = threading.Lock()
+
+
+def get_queue() -> UIQueue:
+    global _QUEUE
+    if _QUEUE is None:
+        with _QUEUE_LOCK:
+            if _QUEUE is None:
+                _QUEUE = UIQueue()
+    return _QUEUE
+
+
+def post(fn: Callable, *args, key: Optional[Hashable] = None):
+    """
+    Queue fn(*args) for the next main-loop flush (see UIQueue.post).
+    """
+    get_queue().post(fn, *args, key=key)
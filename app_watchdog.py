@@ -0,0 +1,176 @@
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Callable, Optional
+
+import app_metrics
+
+logger = logging.getLogger(__name__)
+
+# HIRESTI_WATCHDOG_MS=<threshold in ms> changes the stall threshold; 0 turns
+# the watchdog off.
+WATCHDOG_ENV = "HIRESTI_WATCHDOG_MS"
+DEFAULT_THRESHOLD_SEC = 0.2
+# Two pings per threshold, so a stall of 1.5x the threshold is always seen.
+PING_INTERVAL_SEC = 0.1
+STACK_LIMIT = 40
+RECENT_LIMIT = 20
+APP_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def threshold_from_env() -> Optional[float]:
+    """
+    Stall threshold in seconds, or None when the watchdog is disabled.
+    """
+    raw = str(os.getenv(WATCHDOG_ENV, "") or "").strip()
+    if not raw:
+        return DEFAULT_THRESHOLD_SEC
+    try:
+        ms = float(raw)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", WATCHDOG_ENV, raw)
+        return DEFAULT_THRESHOLD_SEC
+    return ms / 1000.0 if ms > 0 else None
+
+
+def callback_source(stack, root: str = APP_ROOT) -> str:
+    """
+    The main-loop callback a stack is running: the outermost frame in the
+    app's own code (below GLib's run() and the module-level entry point).
+    """
+    for fs in stack:
+        if fs.filename.startswith(root) and fs.name != "<module>":
+            return f"{fs.name} ({os.path.relpath(fs.filename, root)}:{fs.lineno})"
+    if stack:
+        fs = stack[-1]
+        return f"{fs.name} ({os.path.basename(fs.filename)}:{fs.lineno})"
+    return "?"
+
+
+class MainLoopWatchdog:
+    """
+    Detects callbacks that block the GLib main loop.
+
+    A daemon thread posts a high-priority ping to the main loop every
+    PING_INTERVAL_SEC. When a ping is not answered within the threshold, the
+    main thread's Python stack is captured (sys._current_frames) while the
+    blocking callback is still on it; once the ping runs, the stall is
+    logged with that stack and its duration goes into the
+    `main_loop_stall_seconds` histogram.
+
+    `schedule(callback)` must run callback on the loop; the app uses
+    GLib.timeout_add(0, ..., priority=GLib.PRIORITY_HIGH).
+    """
+
+    def __init__(
+        self,
+        schedule: Callable[[Callable], object],
+        threshold_sec: float = DEFAULT_THRESHOLD_SEC,
+        interval_sec: float = PING_INTERVAL_SEC,
+        thread_ident: Optional[int] = None,
+        on_stall: Optional[Callable[[dict], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._schedule = schedule
+        self._threshold = max(0.001, float(threshold_sec))
+        self._interval = max(0.001, float(interval_sec))
+        self._ident = thread_ident if thread_ident is not None else threading.main_thread().ident
+        self._on_stall = on_stall
+        self._clock = clock
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._recent = deque(maxlen=RECENT_LIMIT)
+        self._count = 0
+        self._worst = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="main-loop-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _capture(self):
+        frame = sys._current_frames().get(self._ident)
+        if frame is None:
+            return []
+        return traceback.extract_stack(frame, limit=STACK_LIMIT)
+
+    def _run(self):
+        while not self._stop.is_set():
+            acked = threading.Event()
+            answered = []
+
+            def _ping():
+                answered.append(self._clock())
+                acked.set()
+                return False
+
+            sent = self._clock()
+            try:
+                self._schedule(_ping)
+            except Exception as e:
+                logger.debug("Watchdog ping failed: %s", e)
+                return
+            if not acked.wait(self._threshold):
+                stack = self._capture()
+                while not acked.wait(0.5):
+                    if self._stop.is_set():
+                        return
+                self._record(answered[0] - sent, stack)
+            self._stop.wait(self._interval)
+
+    def _record(self, duration, stack):
+        source = callback_source(stack)
+        stall = {
+            "at": time.time(),
+            "duration_ms": round(duration * 1000.0, 1),
+            "source": source,
+            "stack": [f"{fs.filename}:{fs.lineno} {fs.name}" for fs in stack],
+        }
+        with self._lock:
+            self._recent.append(stall)
+            self._count += 1
+            self._worst = max(self._worst, duration)
+        app_metrics.observe("main_loop_stall_seconds", duration)
+        app_metrics.inc("main_loop_stalls")
+        logger.warning(
+            "Main loop stalled %.0fms in %s\n%s",
+            duration * 1000.0,
+            source,
+            "".join(traceback.format_list(stack)).rstrip(),
+        )
+        if self._on_stall is not None:
+            try:
+                self._on_stall(stall)
+            except Exception as e:
+                logger.debug("Stall callback failed: %s", e)
+
+    def stats(self) -> dict:
+        """
+        Stall count, worst stall and the latest stalls (without stacks).
+        """
+        with self._lock:
+            recent = [{k: v for k, v in s.items() if k != "stack"} for s in self._recent]
+            return {
+                "stalls": self._count,
+                "worst_ms": round(self._worst * 1000.0, 1),
+                "threshold_ms": round(self._threshold * 1000.0, 1),
+                "recent": recent[-5:],
+            }
+
+    def recent(self) -> list:
+        with self._lock:
+            return list(self._recent)
@@ -7,11 +7,11 @@ import cairo
 import hashlib
 import logging
 import math
-import os
 import random
 from threading import Thread
 
-import requests
+import utils
+from cover_palette import extract_palette, load_cached_palette, palette_mean_rgb, save_cached_palette
 
 logger = logging.getLogger(__name__)
 
@@ -152,6 +152,7 @@ class _BackgroundCommon:
         self._active = True
         self.base_bg_rgb = (0.04, 0.04, 0.06)
         self._last_cover_key = None
+        self.cover_palette = []
         self.motion_mode = "Soft"
         self.motion_profiles = {
             "Static": {"energy_gain": 0.0, "phase_speed": 0.0, "smoothing": 0.10},
@@ -233,33 +234,20 @@ class _BackgroundCommon:
         )
         logger.debug("Background random colors: A=%s, B=%s", self.color_a, self.color_b)
 
-    def _dominant_rgb_from_pixbuf(self, pb):
+    def _palette_from_pixbuf(self, pb):
         if pb is None:
-            return None
-        pixels = pb.get_pixels()
-        rowstride = pb.get_rowstride()
-        n_channels = pb.get_n_channels()
-        width = pb.get_width()
-        height = pb.get_height()
-        if width <= 0 or height <= 0:
-            return None
-        step = 2
-        rs = gs = bs = 0.0
-        count = 0
-        for y in range(0, height, step):
-            base = y * rowstride
-            for x in range(0, width, step):
-                idx = base + (x * n_channels)
-                rs += pixels[idx]
-                gs += pixels[idx + 1]
-                bs += pixels[idx + 2]
-                count += 1
-        if count <= 0:
-            return None
-        return (rs / count / 255.0, gs / count / 255.0, bs / count / 255.0)
+            return []
+        return extract_palette(
+            pb.get_pixels(),
+            pb.get_width(),
+            pb.get_height(),
+            pb.get_rowstride(),
+            pb.get_n_channels(),
+        )
 
     def set_colors_from_cover(self, cover_url, cache_dir):
         if not cover_url or not cache_dir:
+            self.cover_palette = []
             self.randomize_colors()
             return
 
@@ -270,21 +258,25 @@ class _BackgroundCommon:
 
         def task():
             try:
-                os.makedirs(cache_dir, exist_ok=True)
-                f_path = os.path.join(cache_dir, cover_key)
-                if not os.path.exists(f_path):
-                    r = requests.get(cover_url, timeout=8)
-                    r.raise_for_status()
-                    with open(f_path, "wb") as f:
-                        f.write(r.content)
-
-                pb = GdkPixbuf.Pixbuf.new_from_file_at_scale(f_path, 48, 48, True)
-                rgb = self._dominant_rgb_from_pixbuf(pb)
+                palette = load_cached_palette(cache_dir, cover_key)
+                if palette is None:
+                    # Same cache file as load_img(), so the cover is usually on disk already.
+                    f_path = utils.ensure_image_local_path(cover_url, cache_dir)
+                    if not f_path:
+                        raise OSError("cover download failed")
+                    pb = GdkPixbuf.Pixbuf.new_from_file_at_scale(f_path, 48, 48, True)
+                    palette = self._palette_from_pixbuf(pb)
+                    if palette:
+                        save_cached_palette(cache_dir, cover_key, palette)
+                rgb = palette_mean_rgb(palette)
                 if rgb is None:
                     GLib.idle_add(self.randomize_colors)
                     return
 
                 def apply_colors():
+                    if self._last_cover_key != cover_key:
+                        return False
+                    self.cover_palette = list(palette)
                     r, g, b = rgb
                     # Boost very dark covers so the lyrics background remains visible.
                     peak = max(r, g, b, 1e-6)
@@ -0,0 +1,158 @@
+import json
+import logging
+import os
+
+from rust_viz import RustVizCore
+
+logger = logging.getLogger(__name__)
+
+PALETTE_SIZE = 5
+PALETTE_MAX_ITERS = 8
+PALETTE_CACHE_SUBDIR = "palettes"
+_PALETTE_CACHE_VERSION = 1
+_RUST_PALETTE_CORE = None
+
+
+def _get_rust_palette_core():
+    global _RUST_PALETTE_CORE
+    if _RUST_PALETTE_CORE is None:
+        try:
+            _RUST_PALETTE_CORE = RustVizCore()
+        except Exception:
+            _RUST_PALETTE_CORE = False
+    return _RUST_PALETTE_CORE if _RUST_PALETTE_CORE is not False else None
+
+
+def _luma(p):
+    return (0.299 * p[0]) + (0.587 * p[1]) + (0.114 * p[2])
+
+
+def _dist2(a, b):
+    return (a[0] - b[0]) * (a[0] - b[0]) + (a[1] - b[1]) * (a[1] - b[1]) + (a[2] - b[2]) * (a[2] - b[2])
+
+
+def _kmeans_palette_py(pixels, width, height, rowstride, n_channels, k, max_iters):
+    """
+    Python twin of rust_viz_core::extract_palette (same seeding and ordering).
+    """
+    samples = []
+    total = len(pixels)
+    for y in range(height):
+        base = y * rowstride
+        for x in range(width):
+            idx = base + (x * n_channels)
+            if idx + n_channels > total:
+                break
+            if n_channels >= 4 and pixels[idx + 3] < 128:
+                continue
+            samples.append((float(pixels[idx]), float(pixels[idx + 1]), float(pixels[idx + 2])))
+    n = len(samples)
+    if n == 0:
+        return []
+    order = sorted(range(n), key=lambda i: (_luma(samples[i]), i))
+    # Farthest-point seeding from the median-luma sample.
+    centroids = [samples[order[n // 2]]]
+    nearest = [_dist2(p, centroids[0]) for p in samples]
+    while len(centroids) < k:
+        far = max(range(n), key=lambda i: (nearest[i], -i))
+        if nearest[far] <= 0.0:
+            break
+        c = samples[far]
+        centroids.append(c)
+        nearest = [min(d, _dist2(p, c)) for d, p in zip(nearest, samples)]
+    k = len(centroids)
+
+    assign = [-1] * n
+    counts = [0] * k
+    for _ in range(max(1, max_iters)):
+        changed = False
+        for i, (r, g, b) in enumerate(samples):
+            best = 0
+            best_d = None
+            for j, c in enumerate(centroids):
+                d = _dist2((r, g, b), c)
+                if best_d is None or d < best_d:
+                    best_d = d
+                    best = j
+            if assign[i] != best:
+                assign[i] = best
+                changed = True
+        sums = [[0.0, 0.0, 0.0] for _ in range(k)]
+        counts = [0] * k
+        for i, (r, g, b) in enumerate(samples):
+            acc = sums[assign[i]]
+            acc[0] += r
+            acc[1] += g
+            acc[2] += b
+            counts[assign[i]] += 1
+        for j in range(k):
+            if counts[j] > 0:
+                centroids[j] = (sums[j][0] / counts[j], sums[j][1] / counts[j], sums[j][2] / counts[j])
+        if not changed:
+            break
+
+    ranked = sorted((j for j in range(k) if counts[j] > 0), key=lambda j: (-counts[j], j))
+    return [
+        (centroids[j][0] / 255.0, centroids[j][1] / 255.0, centroids[j][2] / 255.0, counts[j] / float(n))
+        for j in ranked
+    ]
+
+
+def extract_palette(pixels, width, height, rowstride, n_channels, k=PALETTE_SIZE, max_iters=PALETTE_MAX_ITERS):
+    """
+    k-means palette of a small RGB(A) buffer (e.g. a 48x48 cover pixbuf).
+    Returns [(r, g, b, share), ...] with 0..1 components, most common first.
+    """
+    if not pixels or width <= 0 or height <= 0 or n_channels < 3:
+        return []
+    k = max(1, int(k))
+    core = _get_rust_palette_core()
+    if core is not None:
+        out = core.extract_palette(pixels, width, height, rowstride, n_channels, k, max_iters)
+        if out is not None:
+            return out
+    return _kmeans_palette_py(bytes(pixels), int(width), int(height), int(rowstride), int(n_channels), k, int(max_iters))
+
+
+def palette_mean_rgb(palette):
+    """
+    Share-weighted mean of a palette, i.e. the average color of the cover.
+    """
+    total = sum(float(p[3]) for p in palette or [])
+    if total <= 0.0:
+        return None
+    return tuple(sum(float(p[c]) * float(p[3]) for p in palette) / total for c in range(3))
+
+
+def _palette_cache_path(cache_dir, cover_key):
+    return os.path.join(cache_dir, PALETTE_CACHE_SUBDIR, f"{cover_key}.json")
+
+
+def load_cached_palette(cache_dir, cover_key, k=PALETTE_SIZE):
+    path = _palette_cache_path(cache_dir, cover_key)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != _PALETTE_CACHE_VERSION or data.get("k") != int(k):
+        return None
+    try:
+        return [tuple(float(v) for v in entry[:4]) for entry in data.get("palette") or []]
+    except (TypeError, ValueError):
+        return None
+
+
+def save_cached_palette(cache_dir, cover_key, palette, k=PALETTE_SIZE):
+    path = _palette_cache_path(cache_dir, cover_key)
+    temp_path = f"{path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": _PALETTE_CACHE_VERSION, "k": int(k), "palette": [list(p) for p in palette]},
+                f,
+            )
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.debug("Failed to persist cover palette %s: %s", cover_key, e)
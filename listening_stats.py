@@ -0,0 +1,185 @@
+import heapq
+import threading
+from datetime import timedelta
+
+# Weights shared by the daily mixes and Smart Shuffle. Each play adds a base
+# weight plus a recency term that starts at 1.0 and decays towards RECENCY_FLOOR
+# as newer plays are logged (about the floor after HISTORY_WINDOW plays).
+TRACK_BASE, TRACK_RECENCY = 1.6, 1.0
+ARTIST_BASE, ARTIST_RECENCY = 1.0, 0.4
+ALBUM_BASE, ALBUM_RECENCY = 0.8, 0.3
+ARTIST_WEIGHT = 0.9
+ALBUM_WEIGHT = 0.5
+HISTORY_WINDOW = 400
+RECENCY_FLOOR = 0.2
+RECENCY_DECAY = 0.01 ** (1.0 / HISTORY_WINDOW)
+_REBASE_EVERY = 20000
+
+
+def entry_keys(entry):
+    """
+    (track, artist, album) keys of a history entry, as build_daily_mixes keys them.
+    """
+    e = entry or {}
+    track_id = e.get("track_id")
+    return (
+        str(track_id) if track_id is not None else "",
+        str(e.get("artist_id") or e.get("artist") or ""),
+        str(e.get("album_id") or ""),
+    )
+
+
+def track_keys(track):
+    """
+    Same keys for a live (tidalapi or LocalTrack) track object.
+    """
+    artist = getattr(track, "artist", None)
+    album = getattr(track, "album", None)
+    track_id = getattr(track, "id", None)
+    return (
+        str(track_id) if track_id is not None else "",
+        str(getattr(artist, "id", None) or getattr(artist, "name", None) or ""),
+        str(getattr(album, "id", None) or ""),
+    )
+
+
+class ListeningScores:
+    """
+    Track/artist/album play scores maintained one play at a time.
+
+    A play's recency is RECENCY_FLOOR + (1 - RECENCY_FLOOR) * RECENCY_DECAY**age,
+    age counted in later plays. The decaying part is summed in units of
+    RECENCY_DECAY**-events, so logging a play touches three dict slots instead
+    of re-weighting the whole history. Plays are logged on the main thread
+    while the Daily Mix page ranks from a worker, hence the lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events = 0
+        self._scale = 1.0
+        self._tracks = {}
+        self._artists = {}
+        self._albums = {}
+        self._meta = {}
+
+    @classmethod
+    def from_entries(cls, entries):
+        """
+        Build from history entries, newest first (HistoryManager order).
+        """
+        scores = cls()
+        for e in reversed(list(entries or [])):
+            scores.record_entry(e)
+        return scores
+
+    def __len__(self):
+        return len(self._tracks)
+
+    def __contains__(self, track_id):
+        return str(track_id) in self._tracks
+
+    def _bump(self, table, key):
+        slot = table.get(key)
+        if slot is None:
+            table[key] = [1, self._scale]
+        else:
+            slot[0] += 1
+            slot[1] += self._scale
+
+    def _rebase(self):
+        factor = 1.0 / self._scale
+        for table in (self._tracks, self._artists, self._albums):
+            for slot in table.values():
+                slot[1] *= factor
+        self._scale = 1.0
+        self._events = 0
+
+    def record(self, track_id, artist_key="", album_key="", meta=None):
+        track_id = str(track_id or "")
+        if not track_id:
+            return
+        with self._lock:
+            self._record(track_id, artist_key, album_key, meta)
+
+    def _record(self, track_id, artist_key, album_key, meta):
+        self._events += 1
+        if self._events >= _REBASE_EVERY:
+            self._rebase()
+        self._scale /= RECENCY_DECAY
+        self._bump(self._tracks, track_id)
+        if artist_key:
+            self._bump(self._artists, str(artist_key))
+        if album_key:
+            self._bump(self._albums, str(album_key))
+        if meta is not None:
+            self._meta[track_id] = meta
+
+    def record_entry(self, entry):
+        tid, artist_key, album_key = entry_keys(entry)
+        self.record(tid, artist_key, album_key, meta=entry)
+
+    def _stat(self, table, key, base, recency):
+        slot = table.get(key)
+        if slot is None:
+            return 0.0
+        count, decayed = slot
+        return count * (base + recency * RECENCY_FLOOR) + recency * (1.0 - RECENCY_FLOOR) * decayed / self._scale
+
+    def score(self, track_id, artist_key="", album_key=""):
+        """
+        track + 0.9 * artist + 0.5 * album; 0.0 for something never played.
+        """
+        return (
+            self._stat(self._tracks, str(track_id or ""), TRACK_BASE, TRACK_RECENCY)
+            + ARTIST_WEIGHT * self._stat(self._artists, str(artist_key or ""), ARTIST_BASE, ARTIST_RECENCY)
+            + ALBUM_WEIGHT * self._stat(self._albums, str(album_key or ""), ALBUM_BASE, ALBUM_RECENCY)
+        )
+
+    def meta(self, track_id):
+        """
+        Latest logged entry of a track (None when recorded without one).
+        """
+        return self._meta.get(str(track_id))
+
+    def top_tracks(self, limit=None):
+        """
+        Track ids with a logged entry, best score first.
+        """
+
+        def _score(tid):
+            _, artist_key, album_key = entry_keys(self._meta[tid])
+            return self.score(tid, artist_key, album_key)
+
+        with self._lock:
+            if limit is None:
+                return sorted(self._meta, key=_score, reverse=True)
+            return heapq.nlargest(max(0, int(limit)), self._meta, key=_score)
+
+
+def daily_mix_picks(scores, today, days=7, per_day=8, min_tracks=6):
+    """
+    [(day, [entry, ...]), ...] for the Daily Mix page: the score ranking is
+    rotated by a per-day seed and no track repeats across days. Depends only
+    on the scores and the date, so callers can memoize it per calendar day.
+    """
+    ranked = scores.top_tracks()
+    mixes = []
+    used = set()
+    for day_offset in range(days):
+        if not ranked:
+            break
+        day = today - timedelta(days=day_offset)
+        rot = int(day.strftime("%Y%m%d")) % len(ranked)
+        picks = []
+        for tid in ranked[rot:] + ranked[:rot]:
+            if tid in used:
+                continue
+            picks.append(tid)
+            if len(picks) >= per_day:
+                break
+        if len(picks) < min_tracks:
+            break
+        used.update(picks)
+        mixes.append((day, [scores.meta(tid) for tid in picks]))
+    return mixes
@@ -1,8 +1,60 @@
 import re
+import html
 import logging
+from bisect import bisect_right
 
 logger = logging.getLogger(__name__)
 
+
+def timeline_index(points, t, hint=-1):
+    """
+    Index of the last point <= t in a sorted list, -1 before the first one.
+    During playback t only moves forward, so the hint (previous result) and
+    its successor are checked first; seeks fall back to bisect.
+    """
+    n = len(points)
+    if 0 <= hint < n and points[hint] <= t:
+        if hint + 1 >= n or points[hint + 1] > t:
+            return hint
+        if hint + 2 >= n or points[hint + 2] > t:
+            return hint + 1
+    elif hint == -1 and (n == 0 or points[0] > t):
+        return -1
+    return bisect_right(points, t) - 1
+
+
+class KaraokeLine:
+    """
+    One enhanced-LRC line with word start times and per-word markup spans
+    escaped once. markup(i) is assembled the first time word i is reached
+    and reused afterwards, so ticks on the same word never touch strings.
+    """
+
+    def __init__(self, words, active_color="#FFFFFF", inactive_color="#AEB8C8"):
+        self.words = list(words or [])
+        self.times = [t for t, _ in self.words]
+        tokens = [html.escape(token) for _, token in self.words]
+        self._active = [f'<span foreground="{active_color}" weight="700">{txt}</span>' for txt in tokens]
+        self._inactive = [f'<span foreground="{inactive_color}">{txt}</span>' for txt in tokens]
+        self._markups = [None] * (len(self.words) + 1)
+
+    def __len__(self):
+        return len(self.words)
+
+    def word_index_at(self, t, hint=-1):
+        return timeline_index(self.times, t, hint)
+
+    def markup(self, active_idx):
+        """
+        Markup with words up to active_idx highlighted (-1: none).
+        """
+        slot = max(-1, min(int(active_idx), len(self.words) - 1)) + 1
+        cached = self._markups[slot]
+        if cached is None:
+            cached = "".join(self._active[:slot]) + "".join(self._inactive[slot:])
+            self._markups[slot] = cached
+        return cached
+
 class LyricsManager:
     def __init__(self):
         self.lyrics_map = {} 
@@ -74,10 +126,11 @@ class LyricsManager:
         self.time_points.sort()
         logger.debug("Lyrics parsed. synced=%s lines=%s", self.has_synced, len(self.time_points))
 
+    def line_index_for_time(self, current_time, hint=-1):
+        if not self.has_synced:
+            return -1
+        return timeline_index(self.time_points, current_time, hint)
+
     def get_lyric_for_time(self, current_time):
-        if not self.has_synced or not self.time_points: return None
-        found_time = -1
-        for t in self.time_points:
-            if t <= current_time: found_time = t
-            else: break 
-        return self.lyrics_map[found_time] if found_time != -1 else None
+        idx = self.line_index_for_time(current_time)
+        return self.lyrics_map[self.time_points[idx]] if idx != -1 else None
@@ -1,12 +1,14 @@
+import app_startup
 import os
 import logging
 import time
 import math
 import random
 import shutil
+import signal
 import subprocess
 import platform
-from datetime import datetime, timedelta
+from datetime import datetime
 from urllib.parse import urlparse
 os.environ["MESA_LOG_LEVEL"] = "error"
 
@@ -18,15 +20,13 @@ import webbrowser
 from threading import Thread, current_thread, main_thread
 from tidal_backend import TidalBackend
 from rust_audio_engine import create_audio_engine
-from models import HistoryManager, PlaylistManager
-from signal_path import AudioSignalPathWindow
+from models import HistoryManager, HomeSnapshotStore, PlaylistManager
+from listening_stats import HISTORY_WINDOW, daily_mix_picks
+from shuffle_order import ShuffleOrder
 import utils
 import ui_config
 from ui import builders as ui_builders
 from ui import views_builders as ui_views_builders
-from visualizer import SpectrumVisualizer
-from visualizer_glarea import SpectrumVisualizerGLArea
-from visualizer_gpu import SpectrumVisualizerGPU
 from actions import ui_actions
 from actions import ui_navigation
 from actions import playback_actions
@@ -34,11 +34,38 @@ from actions import audio_settings_actions
 from actions import lyrics_playback_actions
 from actions import playback_stream_actions
 from lyrics_manager import LyricsManager
-from app_logging import setup_logging
+from rust_viz import DEFAULT_SPECTRUM_LAYOUT
+from app_logging import rate_limited, setup_logging
 from app_settings import load_settings, save_settings as persist_settings
 from app_errors import classify_exception
-
+from app_lazy import lazy_module
+import app_executor
+import app_metrics
+import app_ui_queue
+import app_watchdog
+from app_executor import LANE_AUDIO, LANE_DISK, LANE_NETWORK
+from app_scheduler import (
+    PRIORITY_FAVORITES,
+    PRIORITY_HOME,
+    PRIORITY_PREFETCH,
+    PRIORITY_SESSION,
+    StartupScheduler,
+)
+
+app_startup.mark("imports")
 logger = logging.getLogger(__name__)
+# VIZ TRACE messages fire per draw callback.
+viz_trace_logger = rate_limited(logger, 1.0)
+
+# Only one spectrum backend is in use at a time; each is imported when first built.
+VIZ_BACKENDS = {
+    "gl": (lazy_module("visualizer_glarea"), "SpectrumVisualizerGLArea"),
+    "gpu": (lazy_module("visualizer_gpu"), "SpectrumVisualizerGPU"),
+    "cairo": (lazy_module("visualizer"), "SpectrumVisualizer"),
+}
+background_viz = lazy_module("background_viz")
+app_async = lazy_module("app_async")
+signal_path = lazy_module("signal_path")
 
 try:
     import pystray
@@ -52,6 +79,24 @@ try:
 except Exception:
     qrcode = None
 
+
+def _schedule_ui_flush(delay, callback):
+    if delay <= 0:
+        GLib.idle_add(callback)
+    else:
+        GLib.timeout_add(max(1, int(delay * 1000)), callback)
+
+
+def _schedule_watchdog_ping(callback):
+    # High priority: the ping must not queue behind ordinary idle work.
+    GLib.timeout_add(0, callback, priority=GLib.PRIORITY_HIGH)
+
+
+def _idle_dispatch(fn, value):
+    # Completion callbacks of app_executor (and app_async) / StartupScheduler run on the main loop.
+    GLib.idle_add(lambda: (fn(value), False)[1])
+
+
 class TidalApp(Adw.Application):
     MODE_LOOP = 0     # 列表循环 (默认)
     MODE_ONE = 1      # 单曲循环
@@ -179,6 +224,9 @@ class TidalApp(Adw.Application):
         self._diag_health = {"network": "idle", "decoder": "idle", "output": "idle"}
         self._diag_pop = None
         self._diag_text = None
+        self.metrics_btn = None
+        self._metrics_pop = None
+        self._metrics_text = None
         self._login_in_progress = False
         self._login_attempt_id = None
         self._login_mode = None
@@ -234,16 +282,21 @@ class TidalApp(Adw.Application):
 
     def record_diag_event(self, message):
         if current_thread() is not main_thread():
-            GLib.idle_add(self.record_diag_event, message)
+            app_ui_queue.post(self.record_diag_event, message)
             return
         ts = time.strftime("%H:%M:%S")
         self._diag_events.append(f"{ts} | {message}")
         if len(self._diag_events) > 120:
             self._diag_events = self._diag_events[-120:]
         if self._diag_text is not None:
-            combined = list(getattr(self.player, "event_log", [])) + self._diag_events
-            buf = self._diag_text.get_buffer()
-            buf.set_text("\n".join(combined[-120:]))
+            # A burst of events rewrites the text view once.
+            app_ui_queue.post(self._refresh_diag_text, key="diag_text")
+
+    def _refresh_diag_text(self):
+        if self._diag_text is None:
+            return
+        combined = list(getattr(self.player, "event_log", [])) + self._diag_events
+        self._diag_text.get_buffer().set_text("\n".join(combined[-120:]))
 
     def _apply_status_class(self, label, state):
         if label is None:
@@ -261,7 +314,8 @@ class TidalApp(Adw.Application):
 
     def set_diag_health(self, kind, state, detail=None):
         if current_thread() is not main_thread():
-            GLib.idle_add(self.set_diag_health, kind, state, detail)
+            # Reports for one kind collapse into one update carrying the latest state.
+            app_ui_queue.post(self.set_diag_health, kind, state, detail, key=("diag_health", kind))
             return
         if kind not in self._diag_health:
             return
@@ -287,6 +341,48 @@ class TidalApp(Adw.Application):
         buf.set_text("\n".join(combined[-120:]) if combined else "No events yet.")
         self._diag_pop.popup()
 
+    def show_metrics(self, _btn=None):
+        if self._metrics_pop is None or self._metrics_text is None:
+            return
+        snap = app_metrics.snapshot(app_version=str(getattr(self, "app_version", "dev")))
+        self._metrics_text.get_buffer().set_text(app_metrics.format_text(snap))
+        if not self._metrics_pop.get_visible():
+            self._metrics_pop.popup()
+
+    def dump_metrics(self, path=None):
+        """
+        Write a JSON metrics snapshot (HIRESTI_METRICS_DUMP path by default,
+        else a timestamped file in the cache dir); returns the written path.
+        """
+        if not path:
+            path = app_metrics.dump_path() or os.path.join(
+                self._cache_root, f"metrics-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+            )
+        return app_metrics.write_json(path, app_version=str(getattr(self, "app_version", "dev")))
+
+    def on_export_metrics_clicked(self, _btn=None):
+        path = self.dump_metrics()
+        if path:
+            self.show_output_notice(f"Metrics saved to {path}", "ok", 3600)
+        else:
+            self.show_output_notice("Failed to save metrics.", "error", 2800)
+
+    def _install_metrics_signal(self):
+        # `kill -USR1 <pid>` dumps metrics from a running instance.
+        if not hasattr(signal, "SIGUSR1") or not hasattr(GLib, "unix_signal_add"):
+            return
+
+        def _on_sigusr1(*_args):
+            path = self.dump_metrics()
+            if path:
+                logger.info("Metrics written to %s", path)
+            return True
+
+        try:
+            GLib.unix_signal_add(GLib.PRIORITY_DEFAULT, signal.SIGUSR1, _on_sigusr1)
+        except Exception as e:
+            logger.debug("SIGUSR1 metrics dump unavailable: %s", e)
+
     def show_output_notice(self, text, state="idle", timeout_ms=2600):
         if not text or self.output_notice_revealer is None or self.output_notice_label is None:
             return
@@ -383,6 +479,7 @@ class TidalApp(Adw.Application):
             msg = str(detail or "Unknown output error")
             self.show_output_notice(f"Output error: {msg}", "error", 3600)
 
+    @app_startup.traced("schedule_cache_maintenance")
     def _schedule_cache_maintenance(self):
         def _parse_int_env(name, default):
             raw = os.getenv(name)
@@ -397,21 +494,28 @@ class TidalApp(Adw.Application):
         max_mb = _parse_int_env("HIRESTI_COVER_CACHE_MAX_MB", 300)
         max_days = _parse_int_env("HIRESTI_COVER_CACHE_MAX_DAYS", 30)
         max_bytes = max_mb * 1024 * 1024
+        lyrics_max_files = _parse_int_env("HIRESTI_LYRICS_CACHE_MAX_FILES", 5000)
+        lyrics_max_days = _parse_int_env("HIRESTI_LYRICS_CACHE_MAX_DAYS", 90)
 
         def task():
             logger.info(
-                "Running cover/audio cache maintenance (cover=%sMB ttl=%sd, audio tracks=%s)",
+                "Running cover/audio/lyrics cache maintenance (cover=%sMB ttl=%sd, audio tracks=%s, lyrics=%s ttl=%sd)",
                 max_mb,
                 max_days,
                 getattr(self, "audio_cache_tracks", 0),
+                lyrics_max_files,
+                lyrics_max_days,
             )
-            utils.prune_image_cache(self.cache_dir, max_bytes=max_bytes, max_age_days=max_days)
-            utils.prune_audio_cache(
-                getattr(self, "audio_cache_dir", ""),
-                max_tracks=max(0, int(getattr(self, "audio_cache_tracks", 0) or 0)),
-            )
+            with app_startup.phase("cache_maintenance"):
+                utils.prune_image_cache(self.cache_dir, max_bytes=max_bytes, max_age_days=max_days)
+                utils.prune_audio_cache(
+                    getattr(self, "audio_cache_dir", ""),
+                    max_tracks=max(0, int(getattr(self, "audio_cache_tracks", 0) or 0)),
+                )
+                self.backend.prune_lyrics_cache(max_files=lyrics_max_files, max_age_days=lyrics_max_days)
+            app_startup.write_trace()
 
-        Thread(target=task, daemon=True).start()
+        app_executor.submit(LANE_DISK, task)
 
     def _account_scope_from_backend_user(self):
         user = getattr(self.backend, "user", None)
@@ -433,18 +537,24 @@ class TidalApp(Adw.Application):
             self.history_mgr.set_scope(scope)
         if hasattr(self, "playlist_mgr") and self.playlist_mgr is not None:
             self.playlist_mgr.set_scope(scope)
+        if hasattr(self, "home_snapshot") and self.home_snapshot is not None:
+            self.home_snapshot.set_scope(scope)
+        # Listening scores are rebuilt from the new account's history on demand.
+        self.listening_scores = None
         # Reset playlist-specific transient state to avoid stale references across accounts.
         self.current_playlist_id = None
         self.playlist_edit_mode = False
         self.playlist_rename_mode = False
         logger.info("Local data scope switched to account: %s", scope)
 
+    @app_startup.traced("app_init")
     def __init__(self):
         super().__init__(application_id="com.hiresti.player")
         GLib.set_application_name("HiresTI")
         GLib.set_prgname("HiresTI")
         self.app_version = self._detect_app_version()
-        self.backend = TidalBackend()
+        with app_startup.phase("backend_init"):
+            self.backend = TidalBackend()
         self._cache_root = os.path.expanduser("~/.cache/hiresti")
         self._account_scope = "guest"
         self.settings_file = os.path.join(self._cache_root, "settings.json")
@@ -469,14 +579,16 @@ class TidalApp(Adw.Application):
         self.play_mode = self.settings.get("play_mode", self.MODE_LOOP)
         if self.play_mode not in self.MODE_ICONS:
             self.play_mode = self.MODE_LOOP
-        self.shuffle_indices = [] # 用来存随机播放的顺序列表
-
-        self.player = create_audio_engine(
-            on_eos_callback=self.on_next_track,
-            on_tag_callback=self.update_tech_label,
-            on_spectrum_callback=self.on_spectrum_data,
-            on_viz_sync_offset_update=self.on_viz_sync_offset_update,
-        )
+        self.shuffle_order = ShuffleOrder()  # 随机播放顺序 (游标 + 历史)
+        self.listening_scores = None  # 播放评分 (Smart Shuffle / Daily Mix)
+
+        with app_startup.phase("audio_engine_init"):
+            self.player = create_audio_engine(
+                on_eos_callback=self.on_next_track,
+                on_tag_callback=self.update_tech_label,
+                on_spectrum_callback=self.on_spectrum_data,
+                on_viz_sync_offset_update=self.on_viz_sync_offset_update,
+            )
         self._viz_sync_device_key = None
         self._viz_sync_offsets = dict(self.settings.get("viz_sync_device_offsets", {}))
         self._viz_sync_last_saved_ms = int(self.settings.get("viz_sync_offset_ms", 0) or 0)
@@ -500,6 +612,7 @@ class TidalApp(Adw.Application):
 
         self.history_mgr = HistoryManager(base_dir=self._cache_root, scope_key=self._account_scope)
         self.playlist_mgr = PlaylistManager(base_dir=self._cache_root, scope_key=self._account_scope)
+        self.home_snapshot = HomeSnapshotStore(base_dir=self._cache_root, scope_key=self._account_scope)
         self.cache_dir = os.path.join(self._cache_root, "covers")
         os.makedirs(self.cache_dir, exist_ok=True)
         self.audio_cache_dir = os.path.join(self._cache_root, "audio")
@@ -538,6 +651,17 @@ class TidalApp(Adw.Application):
         self._playing_pulse_source = 0
         self._playing_pulse_on = False
         self._home_sections_cache = None
+        self._home_snapshot_primed = None
+        self._home_revalidated_at = 0.0
+        self._home_revalidate_inflight = False
+        app_executor.get_executor().set_dispatch(_idle_dispatch)
+        app_ui_queue.get_queue().set_schedule(_schedule_ui_flush)
+        self.startup_scheduler = StartupScheduler(dispatch=_idle_dispatch)
+        app_metrics.register_collector("executor", app_executor.get_executor().metrics)
+        app_metrics.register_collector("ui_queue", app_ui_queue.get_queue().stats)
+        app_metrics.register_collector("startup_tasks", self.startup_scheduler.timings)
+        self._install_metrics_signal()
+        self.watchdog = None
         self.stream_prefetch_cache = {}
         self._init_ui_refs()
         # Mini mode state must be initialized at startup.
@@ -617,6 +741,10 @@ class TidalApp(Adw.Application):
         self.save_settings()
         if self.player is not None:
             self.player.cleanup()
+        if self.watchdog is not None:
+            self.watchdog.stop()
+        if app_metrics.dump_path():
+            self.dump_metrics()
         # Call explicit parent vfunc to avoid introspection edge-cases when
         # shutting down from headless/error paths.
         Adw.Application.do_shutdown(self)
@@ -723,6 +851,7 @@ class TidalApp(Adw.Application):
             c = 64
         if self.viz is not None:
             self.viz.set_num_bars(c)
+            self._sync_spectrum_layout()
         self.settings["viz_bar_count"] = c
         if update_dropdown and self.viz_bars_dd is not None:
             self.viz_bars_dd.set_selected(self.VIZ_BAR_OPTIONS.index(c))
@@ -754,14 +883,16 @@ class TidalApp(Adw.Application):
     def _build_visualizer_for_backend(self, backend_key):
         order = []
         if backend_key == "cairo":
-            order = [("cairo", SpectrumVisualizer), ("gl", SpectrumVisualizerGLArea), ("gpu", SpectrumVisualizerGPU)]
+            order = ["cairo", "gl", "gpu"]
         elif backend_key == "gpu":
-            order = [("gpu", SpectrumVisualizerGPU), ("gl", SpectrumVisualizerGLArea), ("cairo", SpectrumVisualizer)]
+            order = ["gpu", "gl", "cairo"]
         else:
-            order = [("gl", SpectrumVisualizerGLArea), ("gpu", SpectrumVisualizerGPU), ("cairo", SpectrumVisualizer)]
-        for key, ctor in order:
+            order = ["gl", "gpu", "cairo"]
+        for key in order:
+            module, class_name = VIZ_BACKENDS[key]
             try:
-                return ctor(), key
+                # Import errors (e.g. no PyOpenGL) fall back like constructor errors.
+                return getattr(module, class_name)(), key
             except Exception as e:
                 logger.warning("Visualizer backend %s unavailable, falling back: %s", key, e)
         raise RuntimeError("No visualizer backend available")
@@ -840,6 +971,7 @@ class TidalApp(Adw.Application):
         if vis_name:
             self.viz_stack.set_visible_child_name(vis_name)
         self._sync_viz_tab_runtime_state()
+        self._sync_spectrum_layout()
         self._sync_viz_dropdown_models(theme_name=theme_name, effect_name=effect_name, profile_name=profile_name)
         logger.info("Visualizer backend switched: %s (requested=%s effect=%s)", actual_key, backend_key, effect_name)
 
@@ -907,6 +1039,7 @@ class TidalApp(Adw.Application):
             eff_idx = names.index(effect_name)
         else:
             eff_idx = 0
+        self._sync_spectrum_layout()
         self.settings["viz_effect"] = eff_idx
         if update_dropdown and self.viz_effect_dd is not None:
             self._viz_ui_syncing = True
@@ -1094,9 +1227,37 @@ class TidalApp(Adw.Application):
             self.lyrics_ctrl_box.set_visible(is_lyrics)
         if hasattr(self, "lyrics_offset_box") and self.lyrics_offset_box is not None:
             self.lyrics_offset_box.set_visible(is_lyrics)
+        if is_lyrics:
+            self._ensure_bg_viz()
         self._sync_viz_tab_runtime_state()
         self._sync_spectrum_stream_state()
 
+    def _ensure_bg_viz(self):
+        """
+        Build the lyrics background on first use and replay the state it missed
+        (motion mode, theme, current cover, fade opacity).
+        """
+        if self.bg_viz is not None or self.lyrics_tab_root is None:
+            return self.bg_viz
+        motion_idx = self.settings.get("lyrics_bg_motion", 1)
+        with app_startup.phase("bg_viz_init"):
+            self.bg_viz = background_viz.BackgroundVisualizer()
+        self.lyrics_tab_root.set_child(self.bg_viz)
+        if self.lyrics_motion_dd is not None:
+            # Setting the model re-selects index 0; the saved mode is applied right after.
+            self.lyrics_motion_dd.set_model(Gtk.StringList.new(self.bg_viz.get_motion_mode_names()))
+        self._apply_lyrics_motion_by_index(motion_idx, update_dropdown=True)
+        dark = getattr(self, "_bg_viz_dark", None)
+        if dark is not None:
+            self.bg_viz.set_theme_mode(dark)
+        cover_url = getattr(self, "_lyrics_bg_cover_url", None)
+        if cover_url:
+            self.bg_viz.set_colors_from_cover(cover_url, self.cache_dir)
+        else:
+            self.bg_viz.randomize_colors()
+        self._set_viz_content_opacity(getattr(self, "_viz_content_alpha", 1.0))
+        return self.bg_viz
+
     def _sync_viz_tab_runtime_state(self):
         revealer = getattr(self, "viz_revealer", None)
         is_open = bool(revealer is not None and revealer.get_reveal_child())
@@ -1131,9 +1292,25 @@ class TidalApp(Adw.Application):
 
     def _sync_spectrum_stream_state(self):
         self._sync_viz_tab_runtime_state()
+        self._sync_spectrum_layout()
         if self.player is not None and hasattr(self.player, "set_spectrum_enabled"):
             self.player.set_spectrum_enabled(self._should_enable_spectrum_stream())
 
+    def _sync_spectrum_layout(self):
+        # The engine bins frames for the visible visualizer; the lyrics
+        # background reads the low bands of the default layout.
+        viz = getattr(self, "viz", None)
+        page = str(getattr(self, "_viz_current_page", "spectrum") or "spectrum")
+        layout = DEFAULT_SPECTRUM_LAYOUT
+        if viz is not None and page == "spectrum" and hasattr(viz, "get_spectrum_layout"):
+            layout = viz.get_spectrum_layout()
+        applied = False
+        player = getattr(self, "player", None)
+        if player is not None and hasattr(player, "set_spectrum_layout"):
+            applied = player.set_spectrum_layout(*layout)
+        if viz is not None and hasattr(viz, "set_spectrum_input_layout"):
+            viz.set_spectrum_input_layout(layout if applied else DEFAULT_SPECTRUM_LAYOUT)
+
     def _restore_last_view(self):
         nav_id = self.settings.get("last_nav", "home")
         view = self.settings.get("last_view", "grid_view")
@@ -1162,6 +1339,7 @@ class TidalApp(Adw.Application):
             self.nav_list.select_row(target)
             self.on_nav_selected(self.nav_list, target)
 
+    @app_startup.traced("activate")
     def do_activate(self):
         if self.window_created: 
             self.win.present()
@@ -1194,9 +1372,10 @@ class TidalApp(Adw.Application):
         self.main_vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         self.window_handle.set_child(self.main_vbox)
 
-        self._build_header(self.main_vbox)
-        self._build_body(self.main_vbox)
-        self._build_player_bar(self.main_vbox)
+        with app_startup.phase("ui_build"):
+            self._build_header(self.main_vbox)
+            self._build_body(self.main_vbox)
+            self._build_player_bar(self.main_vbox)
         self._setup_theme_watch()
         self._restore_runtime_state()
         self._set_login_view_pending()
@@ -1241,8 +1420,15 @@ class TidalApp(Adw.Application):
         key_controller = Gtk.EventControllerKey()
         key_controller.connect("key-pressed", self.on_key_pressed)
         self.win.add_controller(key_controller)
+        # Clicks (and key presses, in on_key_pressed) briefly hold back startup bulk work.
+        interaction_click = Gtk.GestureClick(button=0)
+        interaction_click.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
+        interaction_click.connect("pressed", lambda *_: self.startup_scheduler.note_interaction())
+        self.win.add_controller(interaction_click)
 
-        self.win.present()
+        with app_startup.phase("win_present"):
+            self.win.present()
+        self.win.add_tick_callback(self._on_first_frame)
         GLib.idle_add(self._clear_initial_search_focus)
         GLib.timeout_add(120, self._clear_initial_search_focus)
         self.win.connect("notify::default-width", self.update_layout_proportions)
@@ -1423,14 +1609,51 @@ class TidalApp(Adw.Application):
         return True
 
     def _restore_session_async(self):
-        def task():
-            ok = self.backend.try_load_session()
-            if ok:
-                GLib.idle_add(self.on_login_success)
+        """
+        Check the saved session and read the last account's Home snapshot side
+        by side on the startup scheduler, so Home can paint as soon as the
+        session is back. Favorites are synced later by on_login_success.
+        """
+        last_scope = str(self.settings.get("last_account_scope", "guest") or "guest")
+        state = {"session": None, "home": last_scope == "guest"}
+
+        def finish():
+            if state["session"] is None or not state["home"]:
+                return
+            app_startup.write_trace()
+            if state["session"]:
+                self.on_login_success()
             else:
-                GLib.idle_add(self._toggle_login_view, False)
+                self._toggle_login_view(False)
+
+        def load_home_snapshot():
+            # A broken snapshot must not hold up the login view.
+            try:
+                data = HomeSnapshotStore(base_dir=self._cache_root, scope_key=last_scope).load()
+                if data:
+                    self._home_snapshot_primed = (last_scope, self.backend.restore_home_sections(data["sections"]))
+            except Exception as e:
+                logger.debug("Home snapshot restore failed: %s", e)
+
+        def on_home(_result):
+            state["home"] = True
+            finish()
+
+        def load_session():
+            with app_startup.phase("session_restore"):
+                try:
+                    return bool(self.backend.try_load_session(sync_favorites=False))
+                except Exception as e:
+                    logger.warning("Session restore failed: %s", e)
+                    return False
 
-        Thread(target=task, daemon=True).start()
+        def on_session(ok):
+            state["session"] = ok
+            finish()
+
+        if not state["home"]:
+            self.startup_scheduler.submit("home_snapshot", load_home_snapshot, PRIORITY_HOME, on_home)
+        self.startup_scheduler.submit("session", load_session, PRIORITY_SESSION, on_session)
 
     def _setup_theme_watch(self):
         """
@@ -1477,6 +1700,7 @@ class TidalApp(Adw.Application):
             self.lyrics_vbox.remove_css_class("lyrics-theme-dark")
             self.lyrics_vbox.remove_css_class("lyrics-theme-light")
             self.lyrics_vbox.add_css_class("lyrics-theme-dark" if is_dark else "lyrics-theme-light")
+        self._bg_viz_dark = is_dark
         if self.bg_viz is not None:
             self.bg_viz.set_theme_mode(is_dark)
 
@@ -1522,6 +1746,7 @@ class TidalApp(Adw.Application):
 
     def on_key_pressed(self, controller, keyval, keycode, state):
         """处理键盘快捷键"""
+        self.startup_scheduler.note_interaction()
         # 1. 空格键: 播放/暂停
         if keyval == Gdk.KEY_space:
             # 如果焦点不在搜索框里，才触发播放/暂停
@@ -1658,6 +1883,30 @@ class TidalApp(Adw.Application):
             self.win.set_size_request(ui_config.WINDOW_WIDTH, ui_config.WINDOW_HEIGHT)
             self.win.set_default_size(self.saved_width, self.saved_height)
 
+    def _on_first_frame(self, _widget, _frame_clock):
+        app_startup.mark("first_frame")
+        app_startup.report()
+        app_startup.write_trace()
+        self._start_watchdog()
+        if app_startup.exit_after_first_frame():
+            GLib.idle_add(lambda: (self.quit(), False)[1])
+        return False
+
+    def _start_watchdog(self):
+        threshold = app_watchdog.threshold_from_env()
+        if threshold is None or self.watchdog is not None:
+            return
+        self.watchdog = app_watchdog.MainLoopWatchdog(
+            _schedule_watchdog_ping,
+            threshold_sec=threshold,
+            on_stall=self._on_main_loop_stall,
+        )
+        app_metrics.register_collector("main_loop", self.watchdog.stats)
+        self.watchdog.start()
+
+    def _on_main_loop_stall(self, stall):
+        self.record_diag_event(f"UI stall {stall['duration_ms']:.0f}ms in {stall['source']}")
+
     def _build_user_popover(self):
         pop = Gtk.Popover()
         vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6, margin_top=6, margin_bottom=6, margin_start=6, margin_end=6)
@@ -1668,7 +1917,7 @@ class TidalApp(Adw.Application):
         return pop
     
     def on_tech_info_clicked(self, btn):
-        win = AudioSignalPathWindow(self)
+        win = signal_path.AudioSignalPathWindow(self)
         win.present()
 
     def _build_body(self, container):
@@ -1788,7 +2037,7 @@ class TidalApp(Adw.Application):
             if self._viz_trace_last_cb_ts > 0.0:
                 gap_ms = (now_cb - self._viz_trace_last_cb_ts) * 1000.0
                 if gap_ms >= 80.0:
-                    logger.info("VIZ TRACE callback-gap: %.1fms", gap_ms)
+                    viz_trace_logger.info("VIZ TRACE callback-gap: %.1fms", gap_ms)
             self._viz_trace_last_cb_ts = now_cb
         # Soft handoff: don't cut placeholder on first real frame.
         # Wait for a short real-frame streak and blend from current placeholder frame.
@@ -2084,7 +2333,7 @@ class TidalApp(Adw.Application):
             self.show_output_notice("Please scan the QR code with your phone to login.", "ok", 3200)
 
         def login_thread():
-            ok = self.backend.finish_login(login_future)
+            ok = self.backend.finish_login(login_future, sync_favorites=False)
             if ok:
                 GLib.idle_add(self._on_login_success_for_attempt, attempt_id)
             else:
@@ -2096,6 +2345,7 @@ class TidalApp(Adw.Application):
                 msg = detail or "Authentication failed or timed out."
                 GLib.idle_add(self._on_login_failed_for_attempt, attempt_id, msg)
 
+        # Device-code polling can block for minutes; keep it off the bounded lanes.
         Thread(target=login_thread, daemon=True).start()
 
     def _open_login_url(self, url, attempt_id):
@@ -2291,6 +2541,9 @@ class TidalApp(Adw.Application):
         self.backend.logout()
         self._apply_account_scope(force=True)
         self._home_sections_cache = None
+        self._home_revalidated_at = 0.0
+        self.settings["last_account_scope"] = "guest"
+        self.schedule_save_settings()
         self.stream_prefetch_cache.clear()
         self._toggle_login_view(False)
         self.refresh_visible_track_fav_buttons()
@@ -2302,11 +2555,34 @@ class TidalApp(Adw.Application):
         logger.info("Login successful.")
         self.show_output_notice("Login successful.", "ok", 2000)
         self._apply_account_scope(force=True)
-        self._home_sections_cache = None
+        primed = self._home_snapshot_primed
+        self._home_snapshot_primed = None
+        self._home_sections_cache = primed[1] if primed and primed[0] == self._account_scope else None
+        self._home_revalidated_at = 0.0
+        if self.settings.get("last_account_scope") != self._account_scope:
+            self.settings["last_account_scope"] = self._account_scope
+            self.schedule_save_settings()
         self._toggle_login_view(True)
         self.refresh_visible_track_fav_buttons()
         self.refresh_current_track_favorite_state()
         self._restore_last_view()
+        self._schedule_favorites_sync()
+
+    def _schedule_favorites_sync(self):
+        """
+        Bulk favorite-id fetch (albums, artists, tracks). Queued behind the
+        session check and whatever view _restore_last_view started, so the
+        first page never waits on the library sync.
+        """
+        scope = self._account_scope
+
+        def apply(_result):
+            if scope != self._account_scope:
+                return
+            self.refresh_visible_track_fav_buttons()
+            self.refresh_current_track_favorite_state()
+
+        self.startup_scheduler.submit("favorites_sync", self.backend.refresh_favorite_ids, PRIORITY_FAVORITES, apply)
 
     def on_bit_perfect_toggled(self, switch, state):
         self.settings["bit_perfect"] = state; self.save_settings()
@@ -2351,7 +2627,7 @@ class TidalApp(Adw.Application):
 
                     GLib.idle_add(_apply_ui)
 
-                Thread(target=_switch_to_pro_audio, daemon=True).start()
+                app_executor.submit(LANE_AUDIO, _switch_to_pro_audio)
 
     def on_exclusive_toggled(self, switch, state):
         self.settings["exclusive_lock"] = state
@@ -2392,46 +2668,20 @@ class TidalApp(Adw.Application):
         
         # 状态处理
         if self.play_mode == self.MODE_SHUFFLE or self.play_mode == self.MODE_SMART:
-            # 立即生成随机池，防止切歌时 shuffle_indices 为空
+            # 立即生成随机顺序，以当前曲目为起点
             self._generate_shuffle_list()
             # print(f"[Mode] Switched to {tooltip}")
         else:
             # 切回顺序模式，清空随机池以节省内存
-            self.shuffle_indices = []
+            self.shuffle_order.reset(0)
             # print(f"[Mode] Switched to {tooltip}")
         self.settings["play_mode"] = self.play_mode
         self.schedule_save_settings()
 
     def _generate_shuffle_list(self):
-        """生成随机播放索引列表"""
-        # 1. 安全检查：列表是否存在
-        queue = self._get_active_queue()
-        if not queue:
-            self.shuffle_indices = []
-            return 
-        
-        total = len(queue)
-        if total == 0:
-            self.shuffle_indices = []
-            return
-
-        # 2. 生成基础索引 [0, 1, 2, ... total-1]
-        indices = list(range(total))
-        
-        # 3. 获取当前播放索引（防止类型错误）
+        """生成随机播放顺序（以当前曲目为起点的新排列）"""
         current_idx = getattr(self, 'current_track_index', -1)
-        if current_idx is None: current_idx = -1
-        
-        # 4. 如果当前正在播放，从随机池中移除它（避免下一首立刻重复）
-        if current_idx >= 0 and current_idx < total:
-            if current_idx in indices:
-                indices.remove(current_idx)
-            
-        # 5. 执行洗牌
-        import random
-        random.shuffle(indices)
-        
-        self.shuffle_indices = indices
+        playback_actions.reset_shuffle_order(self, current=current_idx if current_idx is not None else None)
 
     def get_next_index(self, direction=1):
         return playback_actions.get_next_index(self, direction)
@@ -2786,7 +3036,7 @@ class TidalApp(Adw.Application):
                     return
                 GLib.idle_add(self.on_artist_clicked, resolved)
 
-            Thread(target=resolve_artist, daemon=True).start()
+            app_executor.submit(LANE_NETWORK, resolve_artist)
 
     def on_artist_clicked(self, artist):
         ui_navigation.on_artist_clicked(self, artist)
@@ -2800,6 +3050,15 @@ class TidalApp(Adw.Application):
     def batch_load_home(self, sections):
         ui_actions.batch_load_home(self, sections)
 
+    def update_home_sections(self, sections):
+        ui_actions.update_home_sections(self, sections)
+
+    def load_home_snapshot(self):
+        return ui_actions.load_home_snapshot(self)
+
+    def revalidate_home(self, force=False):
+        ui_actions.revalidate_home(self, force=force)
+
     def render_daily_mixes(self, mixes=None):
         if mixes is None:
             mixes = self.build_daily_mixes()
@@ -2852,11 +3111,11 @@ class TidalApp(Adw.Application):
             self.render_liked_songs_dashboard(tracks)
             return False
 
-        def task():
+        async def fetch():
             if _is_stale() or (not _liked_view_active()):
                 return
             # Stage 1: get a small slice for fast first paint.
-            head_tracks = list(self.backend.get_favorite_tracks(limit=100))
+            head_tracks = list(await self.backend.get_favorite_tracks_async(limit=100))
             if head_tracks and not _is_stale():
                 if len(head_tracks) > len(cached_tracks):
                     GLib.idle_add(lambda: _apply_if_active(head_tracks))
@@ -2865,7 +3124,8 @@ class TidalApp(Adw.Application):
             # Skip full fetch if user already left Liked Songs to avoid pointless heavy work.
             if _is_stale() or (not _liked_view_active()):
                 return
-            tracks = list(self.backend.get_favorite_tracks(limit=20000))
+            # A large library is hundreds of pages; the stale check bounds it instead of a timeout.
+            tracks = list(await self.backend.get_favorite_tracks_async(limit=20000, timeout=None))
             if _is_stale():
                 return
             try:
@@ -2879,7 +3139,7 @@ class TidalApp(Adw.Application):
             self.liked_tracks_last_fetch_ts = time.time()
             GLib.idle_add(lambda: _apply_if_active(tracks))
 
-        Thread(target=task, daemon=True).start()
+        app_async.run(fetch())
         return False
 
     def render_queue_dashboard(self):
@@ -2940,7 +3200,7 @@ class TidalApp(Adw.Application):
 
     def _set_play_queue(self, tracks):
         self.play_queue = list(tracks or [])
-        self.shuffle_indices = []
+        self.shuffle_order.reset(0)
 
     def _refresh_queue_views(self):
         self.render_queue_drawer()
@@ -3025,7 +3285,7 @@ class TidalApp(Adw.Application):
 
                 GLib.idle_add(apply)
 
-            Thread(target=task, daemon=True).start()
+            app_executor.submit(LANE_NETWORK, task)
 
         self._prompt_playlist_name(
             "New Folder",
@@ -3067,7 +3327,7 @@ class TidalApp(Adw.Application):
 
                 GLib.idle_add(apply)
 
-            Thread(target=task, daemon=True).start()
+            app_executor.submit(LANE_NETWORK, task)
 
         self._prompt_playlist_name(
             "Rename Folder",
@@ -3128,7 +3388,7 @@ class TidalApp(Adw.Application):
 
                 GLib.idle_add(apply)
 
-            Thread(target=task, daemon=True).start()
+            app_executor.submit(LANE_NETWORK, task)
 
         dialog.connect("response", _on_response)
         dialog.present()
@@ -3203,7 +3463,7 @@ class TidalApp(Adw.Application):
 
             GLib.idle_add(apply)
 
-        Thread(target=task, daemon=True).start()
+        app_executor.submit(LANE_NETWORK, task)
 
     def _refresh_remote_playlist_visibility_button(self, playlist_obj=None):
         btn = getattr(self, "remote_playlist_visibility_btn", None)
@@ -3252,7 +3512,7 @@ class TidalApp(Adw.Application):
 
             GLib.idle_add(apply)
 
-        Thread(target=task, daemon=True).start()
+        app_executor.submit(LANE_NETWORK, task)
 
     def _open_cloud_playlist_editor(
         self,
@@ -3415,7 +3675,7 @@ class TidalApp(Adw.Application):
 
                 GLib.idle_add(apply)
 
-            Thread(target=task, daemon=True).start()
+            app_executor.submit(LANE_NETWORK, task)
 
         self._open_cloud_playlist_editor(
             dialog_title="Edit playlist",
@@ -3474,7 +3734,7 @@ class TidalApp(Adw.Application):
 
                 GLib.idle_add(apply)
 
-            Thread(target=task, daemon=True).start()
+            app_executor.submit(LANE_NETWORK, task)
 
         dialog.connect("response", _on_response)
         dialog.present()
@@ -3537,7 +3797,7 @@ class TidalApp(Adw.Application):
 
                 GLib.idle_add(apply)
 
-            Thread(target=task, daemon=True).start()
+            app_executor.submit(LANE_NETWORK, task)
 
         dialog.connect("response", _on_response)
         dialog.present()
@@ -3562,7 +3822,7 @@ class TidalApp(Adw.Application):
 
             GLib.idle_add(apply)
 
-        Thread(target=task, daemon=True).start()
+        app_executor.submit(LANE_NETWORK, task)
 
     def on_playlist_track_selected(self, box, row):
         if not row:
@@ -3630,7 +3890,7 @@ class TidalApp(Adw.Application):
 
                 GLib.idle_add(apply)
 
-            Thread(target=task, daemon=True).start()
+            app_executor.submit(LANE_NETWORK, task)
 
         self._open_cloud_playlist_editor(
             dialog_title="Create playlist",
@@ -3731,7 +3991,7 @@ class TidalApp(Adw.Application):
 
                 GLib.idle_add(apply)
 
-            Thread(target=task, daemon=True).start()
+            app_executor.submit(LANE_NETWORK, task)
 
         self._prompt_playlist_pick(_do_add)
 
@@ -3827,7 +4087,7 @@ class TidalApp(Adw.Application):
 
             GLib.idle_add(apply)
 
-        Thread(target=do, daemon=True).start()
+        app_executor.submit(LANE_NETWORK, do)
 
     def on_search_tracks_prev_page(self, _btn=None):
         self.search_tracks_page = max(0, int(getattr(self, "search_tracks_page", 0) or 0) - 1)
@@ -4030,6 +4290,7 @@ class TidalApp(Adw.Application):
         removed_current = idx == int(getattr(self, "current_track_index", -1) or -1)
         tracks.pop(idx)
         self.play_queue = tracks
+        self.shuffle_order.remove(idx)
 
         if not tracks:
             self.current_track_index = -1
@@ -4042,7 +4303,7 @@ class TidalApp(Adw.Application):
             if self.play_btn is not None:
                 self.play_btn.set_icon_name("media-playback-start-symbolic")
             self.refresh_current_track_favorite_state()
-            GLib.idle_add(self._refresh_queue_views)
+            app_ui_queue.post(self._refresh_queue_views, key="queue_views")
             return
 
         if idx < self.current_track_index:
@@ -4050,11 +4311,11 @@ class TidalApp(Adw.Application):
 
         if removed_current:
             new_idx = min(idx, len(tracks) - 1)
-            GLib.idle_add(self._refresh_queue_views)
+            app_ui_queue.post(self._refresh_queue_views, key="queue_views")
             GLib.idle_add(lambda: self.play_track(new_idx) or False)
             return
 
-        GLib.idle_add(self._refresh_queue_views)
+        app_ui_queue.post(self._refresh_queue_views, key="queue_views")
         self._update_track_list_icon()
 
     def on_queue_clear_clicked(self, _btn=None):
@@ -4072,102 +4333,30 @@ class TidalApp(Adw.Application):
         if self.play_btn is not None:
             self.play_btn.set_icon_name("media-playback-start-symbolic")
         self.refresh_current_track_favorite_state()
-        GLib.idle_add(self._refresh_queue_views)
+        app_ui_queue.post(self._refresh_queue_views, key="queue_views")
 
     def build_daily_mixes(self, days=7, per_day=8):
         per_day = max(6, int(per_day))
-        entries = []
-        if hasattr(self, "history_mgr") and self.history_mgr is not None:
-            entries = self.history_mgr.get_recent_track_entries(limit=400)
-            if not entries and getattr(self.backend, "user", None):
-                # Backfill for legacy history format (album-only records).
-                for alb in self.history_mgr.get_albums()[:24]:
-                    tracks = self.backend.get_tracks(alb) or []
-                    for t in tracks[:10]:
-                        entries.append(
-                            {
-                                "track_id": getattr(t, "id", None),
-                                "track_name": getattr(t, "name", "Unknown Track"),
-                                "duration": getattr(t, "duration", 0) or 0,
-                                "album_id": getattr(getattr(t, "album", None), "id", getattr(alb, "id", None)),
-                                "album_name": getattr(getattr(t, "album", None), "name", getattr(alb, "name", "Unknown Album")),
-                                "artist": getattr(getattr(t, "artist", None), "name", "Unknown"),
-                                "artist_id": getattr(getattr(t, "artist", None), "id", None),
-                                "cover": getattr(getattr(t, "album", None), "cover", getattr(alb, "cover_url", None)),
-                            }
-                        )
-                    if len(entries) >= 400:
-                        break
-        if not entries:
+        today = datetime.now().date()
+        memo_key = (today, getattr(self, "_account_scope", None), int(days), per_day)
+        memo = getattr(self, "_daily_mix_memo", None)
+        if memo is not None and memo[0] == memo_key:
+            self.daily_mix_data = memo[1]
+            return memo[1]
+        if not hasattr(self, "history_mgr") or self.history_mgr is None:
             self.daily_mix_data = []
             return []
 
-        track_stats = {}
-        artist_stats = {}
-        album_stats = {}
-        meta_by_track = {}
-        total = max(1, len(entries))
-
-        for idx, e in enumerate(entries):
-            tid = str(e.get("track_id"))
-            if not tid:
-                continue
-            recency = max(0.2, 1.0 - (idx / total))
-            track_stats[tid] = track_stats.get(tid, 0.0) + 1.6 + recency
-
-            artist_key = str(e.get("artist_id") or e.get("artist") or "")
-            if artist_key:
-                artist_stats[artist_key] = artist_stats.get(artist_key, 0.0) + 1.0 + recency * 0.4
-
-            album_key = str(e.get("album_id") or "")
-            if album_key:
-                album_stats[album_key] = album_stats.get(album_key, 0.0) + 0.8 + recency * 0.3
-
-            if tid not in meta_by_track:
-                meta_by_track[tid] = e
-
-        if not meta_by_track:
+        scores = playback_actions.listening_scores(self)
+        if not len(scores):
+            self._start_daily_mix_backfill()
             self.daily_mix_data = []
             return []
 
-        def _score(tid):
-            meta = meta_by_track[tid]
-            artist_key = str(meta.get("artist_id") or meta.get("artist") or "")
-            album_key = str(meta.get("album_id") or "")
-            return (
-                track_stats.get(tid, 0.0)
-                + 0.9 * artist_stats.get(artist_key, 0.0)
-                + 0.5 * album_stats.get(album_key, 0.0)
-            )
-
-        sorted_ids = sorted(meta_by_track.keys(), key=_score, reverse=True)
         mixes = []
-        today = datetime.now().date()
-        used_track_ids = set()
-
-        for day_offset in range(days):
-            day = today - timedelta(days=day_offset)
-            day_seed = int(day.strftime("%Y%m%d"))
-            if not sorted_ids:
-                break
-            rot = day_seed % len(sorted_ids)
-            rotated = sorted_ids[rot:] + sorted_ids[:rot]
-            pick_ids = []
-            for tid in rotated:
-                if tid in used_track_ids:
-                    continue
-                pick_ids.append(tid)
-                if len(pick_ids) >= per_day:
-                    break
-            if len(pick_ids) < 6:
-                break
-            tracks = []
-            for tid in pick_ids:
-                local_track = self.history_mgr.to_local_track(meta_by_track[tid])
-                if local_track is not None:
-                    tracks.append(local_track)
+        for day, entries in daily_mix_picks(scores, today, days=days, per_day=per_day):
+            tracks = [t for t in (self.history_mgr.to_local_track(e) for e in entries) if t is not None]
             if len(tracks) >= 6:
-                used_track_ids.update(pick_ids)
                 mixes.append(
                     {
                         "date_label": day.strftime("%Y-%m-%d"),
@@ -4176,9 +4365,70 @@ class TidalApp(Adw.Application):
                     }
                 )
 
+        if mixes:
+            self._daily_mix_memo = (memo_key, mixes)
         self.daily_mix_data = mixes
         return mixes
 
+    def _start_daily_mix_backfill(self):
+        """
+        Legacy histories only list albums. Expand up to 24 of them into track
+        entries once per account, in the background, and persist the result so
+        later Daily Mix builds never hit the network for it.
+        """
+        history_mgr = getattr(self, "history_mgr", None)
+        if history_mgr is None or not getattr(self.backend, "user", None):
+            return
+        if history_mgr.load_backfill() is not None:
+            return
+        scope = history_mgr.scope_key
+        running = getattr(self, "_daily_mix_backfill_scopes", None)
+        if running is None:
+            running = self._daily_mix_backfill_scopes = set()
+        if scope in running:
+            return
+        running.add(scope)
+
+        def task():
+            entries = []
+            try:
+                for alb in history_mgr.get_albums()[:24]:
+                    for t in (self.backend.get_tracks(alb) or [])[:10]:
+                        entries.append(
+                            {
+                                "track_id": getattr(t, "id", None),
+                                "track_name": getattr(t, "name", "Unknown Track"),
+                                "duration": getattr(t, "duration", 0) or 0,
+                                "album_id": getattr(getattr(t, "album", None), "id", getattr(alb, "id", None)),
+                                "album_name": getattr(getattr(t, "album", None), "name", getattr(alb, "name", "Unknown Album")),
+                                "artist": getattr(getattr(t, "artist", None), "name", "Unknown"),
+                                "artist_id": getattr(getattr(t, "artist", None), "id", None),
+                                "cover": getattr(getattr(t, "album", None), "cover", getattr(alb, "cover_url", None)),
+                            }
+                        )
+                    if len(entries) >= HISTORY_WINDOW:
+                        break
+            except Exception as e:
+                logger.warning("Daily mix history backfill failed: %s", e)
+                running.discard(scope)
+                return
+            history_mgr.save_backfill(entries)
+            running.discard(scope)
+
+            def apply():
+                if history_mgr.scope_key != scope:
+                    return False
+                self.listening_scores = None
+                self._daily_mix_memo = None
+                row = self.nav_list.get_selected_row() if self.nav_list is not None else None
+                if row is not None and getattr(row, "nav_id", None) == "daily_mix":
+                    self.on_nav_selected(self.nav_list, row)
+                return False
+
+            GLib.idle_add(apply)
+
+        self.startup_scheduler.submit("daily_mix_backfill", task, PRIORITY_PREFETCH)
+
     def on_daily_mix_track_selected(self, box, row):
         if not row:
             return
@@ -4388,7 +4638,8 @@ class TidalApp(Adw.Application):
         def _tick():
             self._ui_loop_source = 0
             try:
-                keep_running = bool(self.update_ui_loop())
+                with app_metrics.timer("ui_tick_seconds"):
+                    keep_running = bool(self.update_ui_loop())
             except Exception:
                 logger.exception("UI loop tick failed")
                 keep_running = True
@@ -4465,23 +4716,9 @@ class TidalApp(Adw.Application):
             btn.set_sensitive(False)
             return
 
-        track_id = str(track.id)
-        btn.set_sensitive(False)
-
-        def do():
-            is_fav = self.backend.is_track_favorite(track_id)
-
-            def apply():
-                current = getattr(getattr(self, "playing_track", None), "id", None)
-                if str(current) != track_id:
-                    return False
-                self._update_fav_icon(btn, is_fav)
-                btn.set_sensitive(True)
-                return False
-
-            GLib.idle_add(apply)
-
-        Thread(target=do, daemon=True).start()
+        # Favorite ids are a local set kept by the backend; no worker needed.
+        self._update_fav_icon(btn, self.backend.is_track_favorite(str(track.id)))
+        btn.set_sensitive(True)
 
     def create_track_fav_button(self, track, css_classes=None):
         classes = css_classes or ["flat", "circular", "track-heart-btn"]
@@ -4502,21 +4739,8 @@ class TidalApp(Adw.Application):
             btn.set_sensitive(False)
             return
 
-        btn.set_sensitive(False)
-
-        def do():
-            is_fav = self.backend.is_track_favorite(track_id)
-
-            def apply():
-                if getattr(btn, "_track_fav_id", None) != track_id:
-                    return False
-                self._update_fav_icon(btn, is_fav)
-                btn.set_sensitive(True)
-                return False
-
-            GLib.idle_add(apply)
-
-        Thread(target=do, daemon=True).start()
+        self._update_fav_icon(btn, self.backend.is_track_favorite(track_id))
+        btn.set_sensitive(True)
 
     def on_track_row_fav_clicked(self, btn):
         track_id = getattr(btn, "_track_fav_id", None)
@@ -4527,24 +4751,20 @@ class TidalApp(Adw.Application):
         is_add = not is_currently_active
         btn.set_sensitive(False)
 
-        def do():
-            ok = self.backend.toggle_track_favorite(track_id, is_add)
-
-            def apply():
-                if getattr(btn, "_track_fav_id", None) != track_id:
-                    return False
-                if ok:
-                    self._update_fav_icon(btn, is_add)
-                    if str(getattr(getattr(self, "playing_track", None), "id", "")) == track_id:
-                        self.refresh_current_track_favorite_state()
-                    self.refresh_visible_track_fav_buttons()
-                    self.refresh_liked_songs_dashboard()
-                btn.set_sensitive(True)
-                return False
-
-            GLib.idle_add(apply)
+        def apply(ok):
+            if getattr(btn, "_track_fav_id", None) != track_id:
+                return
+            if ok:
+                self._update_fav_icon(btn, is_add)
+                if str(getattr(getattr(self, "playing_track", None), "id", "")) == track_id:
+                    self.refresh_current_track_favorite_state()
+                self.refresh_visible_track_fav_buttons()
+                self.refresh_liked_songs_dashboard()
+            btn.set_sensitive(True)
 
-        Thread(target=do, daemon=True).start()
+        app_executor.submit(
+            LANE_NETWORK, self.backend.toggle_track_favorite, track_id, is_add, on_done=apply, on_error=lambda _e: apply(False)
+        )
 
     def refresh_visible_track_fav_buttons(self):
         roots = [
@@ -4579,38 +4799,34 @@ class TidalApp(Adw.Application):
         is_add = not is_currently_active
         btn.set_sensitive(False)
 
-        def do():
-            ok = self.backend.toggle_track_favorite(track_id, is_add)
-
-            def apply():
-                current = getattr(getattr(self, "playing_track", None), "id", None)
-                if str(current) != track_id:
-                    return False
-                if ok:
-                    self._update_fav_icon(btn, is_add)
-                btn.set_sensitive(True)
-                return False
-
-            GLib.idle_add(apply)
+        def apply(ok):
+            current = getattr(getattr(self, "playing_track", None), "id", None)
+            if str(current) != track_id:
+                return
+            if ok:
+                self._update_fav_icon(btn, is_add)
+            btn.set_sensitive(True)
 
-        Thread(target=do, daemon=True).start()
+        app_executor.submit(
+            LANE_NETWORK, self.backend.toggle_track_favorite, track_id, is_add, on_done=apply, on_error=lambda _e: apply(False)
+        )
 
     def on_fav_clicked(self, btn):
         if not self.current_album: return
         is_currently_active = "active" in btn.get_css_classes()
         is_add = not is_currently_active
-        def do():
-            if self.backend.toggle_album_favorite(self.current_album.id, is_add): GLib.idle_add(lambda: self._update_fav_icon(btn, is_add))
-        Thread(target=do, daemon=True).start()
+        def apply(ok):
+            if ok: self._update_fav_icon(btn, is_add)
+        app_executor.submit(LANE_NETWORK, self.backend.toggle_album_favorite, self.current_album.id, is_add, on_done=apply)
 
     def on_artist_fav_clicked(self, btn):
         if not self.current_selected_artist: return
         art = self.current_selected_artist
         is_currently_active = "active" in btn.get_css_classes()
         is_add = not is_currently_active
-        def do():
-            if self.backend.toggle_artist_favorite(art.id, is_add): GLib.idle_add(lambda: self._update_fav_icon(btn, is_add))
-        Thread(target=do, daemon=True).start()
+        def apply(ok):
+            if ok: self._update_fav_icon(btn, is_add)
+        app_executor.submit(LANE_NETWORK, self.backend.toggle_artist_favorite, art.id, is_add, on_done=apply)
 
     def _build_search_view(self):
         ui_views_builders.build_search_view(self)
@@ -4807,6 +5023,7 @@ class TidalApp(Adw.Application):
 
     def _set_viz_content_opacity(self, alpha):
         a = max(0.0, min(1.0, float(alpha)))
+        self._viz_content_alpha = a
         if getattr(self, "viz", None) is not None:
             self.viz.set_opacity(a)
         if getattr(self, "bg_viz", None) is not None:
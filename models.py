@@ -62,6 +62,7 @@ class HistoryManager:
             self.path = os.path.join(self.base_dir, "history.json")
         else:
             self.path = os.path.join(self.base_dir, "profiles", key, "history.json")
+        self.backfill_path = os.path.join(os.path.dirname(self.path), "history_backfill.json")
         os.makedirs(os.path.dirname(self.path), exist_ok=True)
 
     def add(self, track, cover_url):
@@ -87,8 +88,9 @@ class HistoryManager:
             history = history[:500]
             with open(self.path, "w", encoding="utf-8") as f:
                 json.dump(history, f)
+            return new_entry
         except Exception:
-            pass
+            return None
 
     def load_raw(self):
         if not os.path.exists(self.path):
@@ -99,6 +101,32 @@ class HistoryManager:
         except Exception:
             return []
 
+    def load_backfill(self):
+        """
+        Track entries derived once from a legacy album-only history, or None
+        when that backfill has not been done for this account yet.
+        """
+        if not os.path.exists(self.backfill_path):
+            return None
+        try:
+            with open(self.backfill_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            return None
+        if not isinstance(data, list):
+            return None
+        return [item for item in data if isinstance(item, dict) and item.get("track_id")]
+
+    def save_backfill(self, entries):
+        temp_file = f"{self.backfill_path}.tmp"
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(list(entries or []), f)
+            os.replace(temp_file, self.backfill_path)
+            return True
+        except Exception:
+            return False
+
     def to_local_track(self, entry):
         if not isinstance(entry, dict):
             return None
@@ -196,6 +224,63 @@ class HistoryManager:
         return albums
 
 
+class HomeSnapshotStore:
+    """
+    Per-account on-disk copy of the processed Home sections.
+    Items are plain dicts (no tidalapi objects) so Home can be painted before
+    the session is restored; see TidalBackend.snapshot_home_sections().
+    """
+
+    VERSION = 1
+
+    def __init__(self, base_dir=None, scope_key="guest"):
+        self.base_dir = os.path.expanduser(base_dir or "~/.cache/hiresti")
+        self.scope_key = "guest"
+        self.path = ""
+        self.set_scope(scope_key)
+
+    def set_scope(self, scope_key):
+        key = str(scope_key or "guest").strip() or "guest"
+        self.scope_key = key
+        if key == "guest":
+            self.path = os.path.join(self.base_dir, "home_snapshot.json")
+        else:
+            self.path = os.path.join(self.base_dir, "profiles", key, "home_snapshot.json")
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            return None
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return None
+        sections = data.get("sections")
+        if not isinstance(sections, list):
+            return None
+        return {"saved_at": float(data.get("saved_at", 0) or 0), "sections": sections}
+
+    def save(self, sections):
+        data = {"version": self.VERSION, "saved_at": time.time(), "sections": list(sections or [])}
+        temp_file = f"{self.path}.tmp"
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(temp_file, self.path)
+            return True
+        except Exception:
+            return False
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
 class PlaylistManager:
     def __init__(self, base_dir=None, scope_key="guest"):
         self.base_dir = os.path.expanduser(base_dir or "~/.cache/hiresti")
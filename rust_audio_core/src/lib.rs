@@ -1,3 +1,5 @@
+mod spectrum;
+
 use gstreamer as gst;
 use pipewire as pw;
 use gst::prelude::*;
@@ -9,10 +11,13 @@ use std::os::raw::{c_char, c_double, c_int, c_void};
 use std::ptr;
 use std::process::Command;
 use std::rc::Rc;
-use std::sync::Once;
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::{Arc, Mutex, Once};
 use std::thread;
 use std::time::Duration;
 
+use spectrum::{SampleFormat, SpectrumAnalyzer, SpectrumLayout, SpectrumScale, WindowKind};
+
 static GST_INIT: Once = Once::new();
 static PW_INIT: Once = Once::new();
 const SPECTRUM_BANDS_MAX: usize = 128;
@@ -44,6 +49,8 @@ fn json_escape(v: &str) -> String {
 pub struct Engine {
     playbin: gst::Element,
     _audio_filter_bin: Option<gst::Bin>,
+    spectrum_tap: Option<Arc<Mutex<SpectrumAnalyzer>>>,
+    spectrum_tap_enabled: Arc<AtomicBool>,
     uri: String,
     last_error: Option<String>,
     event_cb: Option<EventCallback>,
@@ -62,6 +69,7 @@ pub struct Engine {
     spectrum_ring_count: usize,
     spectrum_seen_msgs: u64,
     spectrum_msg_count: u64,
+    spectrum_tap_dropped_reported: u64,
     element_msg_seen: u64,
     fmt_probe_tick: u64,
     last_codec: String,
@@ -647,6 +655,83 @@ impl Engine {
         Some(bin)
     }
 
+    fn setup_spectrum_tap(
+        playbin: &gst::Element,
+        analyzer: &Arc<Mutex<SpectrumAnalyzer>>,
+        enabled: &Arc<AtomicBool>,
+    ) -> Option<gst::Bin> {
+        // identity forwards buffers untouched; the probe only reads them, so the
+        // sink still gets the decoder's native format.
+        let tap = gst::ElementFactory::make("identity").name("rust-spectrum-tap").build().ok()?;
+        let bin = gst::Bin::new();
+        if bin.add(&tap).is_err() {
+            return None;
+        }
+        let sink_pad = tap.static_pad("sink")?;
+        let src_pad = tap.static_pad("src")?;
+        let analyzer = Arc::clone(analyzer);
+        let enabled = Arc::clone(enabled);
+        let segment: Mutex<Option<gst::FormattedSegment<gst::ClockTime>>> = Mutex::new(None);
+        sink_pad.add_probe(
+            gst::PadProbeType::BUFFER | gst::PadProbeType::EVENT_DOWNSTREAM | gst::PadProbeType::EVENT_FLUSH,
+            move |_pad, info| {
+                match info.data {
+                    Some(gst::PadProbeData::Event(ref ev)) => match ev.view() {
+                        gst::EventView::Caps(c) => {
+                            let (format, rate, channels) = spectrum_caps_format(c.caps());
+                            if let Ok(mut a) = analyzer.lock() {
+                                a.set_format(format, rate, channels);
+                            }
+                        }
+                        gst::EventView::Segment(e) => {
+                            if let Ok(mut seg) = segment.lock() {
+                                *seg = e.segment().downcast_ref::<gst::ClockTime>().cloned();
+                            }
+                            if let Ok(mut a) = analyzer.lock() {
+                                a.reset();
+                            }
+                        }
+                        gst::EventView::FlushStop(..) => {
+                            if let Ok(mut a) = analyzer.lock() {
+                                a.reset();
+                            }
+                        }
+                        _ => {}
+                    },
+                    Some(gst::PadProbeData::Buffer(ref buffer)) => {
+                        if !enabled.load(Ordering::Relaxed) {
+                            return gst::PadProbeReturn::Ok;
+                        }
+                        let Some(pts) = buffer.pts() else {
+                            return gst::PadProbeReturn::Ok;
+                        };
+                        // Stream time, like the position the UI syncs frames against.
+                        let start = segment
+                            .lock()
+                            .ok()
+                            .and_then(|seg| seg.as_ref().and_then(|s| s.to_stream_time(pts)))
+                            .unwrap_or(pts);
+                        let Ok(map) = buffer.map_readable() else {
+                            return gst::PadProbeReturn::Ok;
+                        };
+                        if let Ok(mut a) = analyzer.lock() {
+                            a.push(map.as_slice(), (start.nseconds() as f64) / 1_000_000_000.0);
+                        }
+                    }
+                    _ => {}
+                }
+                gst::PadProbeReturn::Ok
+            },
+        )?;
+        let ghost_sink = gst::GhostPad::with_target(&sink_pad).ok()?;
+        let ghost_src = gst::GhostPad::with_target(&src_pad).ok()?;
+        if bin.add_pad(&ghost_sink).is_err() || bin.add_pad(&ghost_src).is_err() {
+            return None;
+        }
+        playbin.set_property("audio-filter", &bin);
+        Some(bin)
+    }
+
     fn parse_spectrum_structure(&mut self, s: &gst::StructureRef, msg_ts_s: Option<f64>) {
         if !self.spectrum_enabled {
             return;
@@ -723,14 +808,20 @@ impl Engine {
             frame_pos_s = (pos.nseconds() as f64) / 1_000_000_000.0;
             ts_src = "query-pos";
         }
+        self.push_spectrum_frame(frame_pos_s, &tmp[..n], ts_src);
+    }
+
+    fn push_spectrum_frame(&mut self, frame_pos_s: f64, vals: &[f32], ts_src: &str) {
+        let n = vals.len().min(SPECTRUM_BANDS_MAX);
+        let vals = &vals[..n];
         self.spectrum_pos_s = frame_pos_s;
 
-        self.spectrum_vals[..n].copy_from_slice(&tmp[..n]);
+        self.spectrum_vals[..n].copy_from_slice(vals);
         self.spectrum_len = n;
         self.spectrum_seq = self.spectrum_seq.wrapping_add(1);
         let ridx = self.spectrum_ring_write;
         self.spectrum_ring_vals[ridx] = [0.0; SPECTRUM_BANDS_MAX];
-        self.spectrum_ring_vals[ridx][..n].copy_from_slice(&tmp[..n]);
+        self.spectrum_ring_vals[ridx][..n].copy_from_slice(vals);
         self.spectrum_ring_len[ridx] = n as u16;
         self.spectrum_ring_pos_s[ridx] = frame_pos_s;
         self.spectrum_ring_seq[ridx] = self.spectrum_seq;
@@ -759,6 +850,26 @@ impl Engine {
         }
     }
 
+    /// Move frames computed on the streaming thread into the ring.
+    fn drain_spectrum_tap(&mut self) {
+        let Some(tap) = self.spectrum_tap.clone() else {
+            return;
+        };
+        let Ok(mut analyzer) = tap.lock() else {
+            return;
+        };
+        let dropped = analyzer.dropped();
+        for frame in analyzer.drain() {
+            self.push_spectrum_frame(frame.pos_s, &frame.vals[..frame.len], "tap");
+        }
+        // The analyzer's count is cumulative; report only frames dropped since the last report.
+        let delta = dropped.wrapping_sub(self.spectrum_tap_dropped_reported);
+        if delta > 0 {
+            self.spectrum_tap_dropped_reported = dropped;
+            self.emit_event(EVT_STATE, &format!("spectrum-tap-dropped={delta} total={dropped}"));
+        }
+    }
+
     fn new() -> Result<Self, String> {
         GST_INIT.call_once(|| {
             let _ = gst::init();
@@ -779,11 +890,23 @@ impl Engine {
             }
         }
 
-        let filter_bin = Self::setup_spectrum_filter(&playbin);
+        let spectrum_tap_enabled = Arc::new(AtomicBool::new(true));
+        let mut layout = SpectrumLayout::default();
+        if let Some(window) = env::var("HIRESTI_SPECTRUM_WINDOW").ok().and_then(|v| WindowKind::from_name(&v)) {
+            layout.window = window;
+        }
+        let analyzer = Arc::new(Mutex::new(SpectrumAnalyzer::new(layout)));
+        let (filter_bin, spectrum_tap) = match Self::setup_spectrum_tap(&playbin, &analyzer, &spectrum_tap_enabled) {
+            Some(bin) => (Some(bin), Some(analyzer)),
+            // Without the tap, fall back to parsing spectrum element messages.
+            None => (Self::setup_spectrum_filter(&playbin), None),
+        };
 
         Ok(Self {
             playbin,
             _audio_filter_bin: filter_bin,
+            spectrum_tap,
+            spectrum_tap_enabled,
             uri: String::new(),
             last_error: None,
             event_cb: None,
@@ -802,6 +925,7 @@ impl Engine {
             spectrum_ring_count: 0,
             spectrum_seen_msgs: 0,
             spectrum_msg_count: 0,
+            spectrum_tap_dropped_reported: 0,
             element_msg_seen: 0,
             fmt_probe_tick: 0,
             last_codec: String::new(),
@@ -846,6 +970,7 @@ impl Engine {
         let Some(bus) = self.playbin.bus() else {
             return 0;
         };
+        self.drain_spectrum_tap();
         let mut count = 0;
         let max_per_tick = 128;
         while let Some(msg) = bus.timed_pop(gst::ClockTime::from_mseconds(0)) {
@@ -1064,6 +1189,13 @@ impl Engine {
                     return -13;
                 }
             }
+        } else if driver_norm.starts_with("fake") || driver_norm == "null" {
+            // Headless benchmarks/CI: discards audio but stays clocked like a device.
+            let s = gst::ElementFactory::make("fakesink").name("rust-fake-sink").build().ok();
+            if let Some(ref elem) = s {
+                elem.set_property("sync", true);
+            }
+            s
         } else {
             self.set_error(format!("unsupported driver: {driver}"));
             self.emit_event(EVT_ERROR, &format!("unsupported driver: {driver}"));
@@ -1104,6 +1236,19 @@ impl Engine {
     }
 }
 
+fn spectrum_caps_format(caps: &gst::CapsRef) -> (Option<SampleFormat>, u32, usize) {
+    let Some(s) = caps.structure(0) else {
+        return (None, 0, 0);
+    };
+    if s.get::<&str>("layout").map(|l| l != "interleaved").unwrap_or(false) {
+        return (None, 0, 0);
+    }
+    let format = s.get::<&str>("format").ok().and_then(SampleFormat::from_caps_format);
+    let rate = s.get::<i32>("rate").unwrap_or(0).max(0) as u32;
+    let channels = s.get::<i32>("channels").unwrap_or(0).max(0) as usize;
+    (format, rate, channels)
+}
+
 fn read_running_alsa_hw_params() -> (Option<i32>, Option<i32>) {
     let mut out_rate: Option<i32> = None;
     let mut out_depth: Option<i32> = None;
@@ -1268,10 +1413,66 @@ pub extern "C" fn rac_set_spectrum_enabled(ptr: *mut Engine, enabled: c_int) ->
         return -1;
     };
     engine.spectrum_enabled = enabled != 0;
+    engine.spectrum_tap_enabled.store(engine.spectrum_enabled, Ordering::Relaxed);
     if !engine.spectrum_enabled {
         engine.spectrum_len = 0;
         engine.spectrum_ring_count = 0;
+        if let Some(tap) = engine.spectrum_tap.as_ref() {
+            if let Ok(mut analyzer) = tap.lock() {
+                analyzer.reset();
+            }
+        }
+    }
+    0
+}
+
+/// Band layout of the frames returned by rac_get_spectrum_frames_since.
+/// scale: 0 linear, 1 log; fmax <= 0 means Nyquist. Returns -3 when the
+/// engine runs on the spectrum element fallback (fixed 64 linear bands).
+#[no_mangle]
+pub extern "C" fn rac_set_spectrum_layout(
+    ptr: *mut Engine,
+    bands: c_int,
+    scale: c_int,
+    fmin: c_double,
+    fmax: c_double,
+) -> c_int {
+    let Some(engine) = as_mut_engine(ptr) else {
+        return -1;
+    };
+    let scale = match scale {
+        0 => SpectrumScale::Linear,
+        1 => SpectrumScale::Log,
+        _ => return -2,
+    };
+    if bands <= 0 || bands as usize > SPECTRUM_BANDS_MAX || !fmin.is_finite() || !fmax.is_finite() || fmin < 0.0 {
+        return -2;
+    }
+    if fmax > 0.0 && fmax <= fmin {
+        return -2;
+    }
+    let Some(tap) = engine.spectrum_tap.clone() else {
+        return -3;
+    };
+    let Ok(mut analyzer) = tap.lock() else {
+        return -4;
+    };
+    let layout = SpectrumLayout {
+        bands: bands as usize,
+        scale,
+        fmin: fmin as f32,
+        fmax: fmax.max(0.0) as f32,
+        window: analyzer.layout().window,
+    };
+    if layout == analyzer.layout() {
+        return 0;
     }
+    analyzer.set_layout(layout);
+    drop(analyzer);
+    // Frames already in the ring have the old band count.
+    engine.spectrum_len = 0;
+    engine.spectrum_ring_count = 0;
+    engine.spectrum_ring_write = 0;
     0
 }
 
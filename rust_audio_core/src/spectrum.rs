@@ -0,0 +1,509 @@
+//! In-engine spectrum analysis.
+//!
+//! PCM is tapped with a pad probe on the playbin audio-filter (the audio path
+//! itself is untouched), downmixed to mono and run through a windowed real
+//! FFT every display interval. FFT bins are then folded into the requested
+//! band layout and reported in dB on the same scale the GStreamer `spectrum`
+//! element used, floored at -60 dB, so consumers of
+//! `rac_get_spectrum_frames_since` see the same value range.
+//!
+//! The element ran one (2·bands−2)-point FFT with a bin per band and reported
+//! power / nfft². Here each band sums power / n² over its bins of the longer
+//! FFT: the window's energy spread over those bins adds back up, so a tone
+//! and broadband noise land on the element's level whatever n is.
+
+use realfft::num_complex::Complex;
+use realfft::{RealFftPlanner, RealToComplex};
+use std::collections::VecDeque;
+use std::fmt;
+use std::sync::Arc;
+
+use crate::SPECTRUM_BANDS_MAX;
+
+/// Display-rate hop between frames (matches the old element's 16ms interval).
+pub const SPECTRUM_INTERVAL_S: f64 = 0.016;
+pub const SPECTRUM_FLOOR_DB: f32 = -60.0;
+const FFT_LEN_MIN: usize = 1024;
+const FFT_LEN_MAX: usize = 16384;
+/// Frames computed on the streaming thread but not yet drained by pump_events.
+const PENDING_CAP: usize = 256;
+
+#[derive(Clone, Copy, Debug, PartialEq)]
+pub enum SpectrumScale {
+    Linear,
+    Log,
+}
+
+#[derive(Clone, Copy, Debug, PartialEq)]
+pub enum WindowKind {
+    Rect,
+    Hann,
+    Hamming,
+    Blackman,
+}
+
+impl WindowKind {
+    pub fn from_name(name: &str) -> Option<Self> {
+        match name.trim().to_ascii_lowercase().as_str() {
+            "rect" | "none" => Some(Self::Rect),
+            "hann" => Some(Self::Hann),
+            "hamming" => Some(Self::Hamming),
+            "blackman" => Some(Self::Blackman),
+            _ => None,
+        }
+    }
+}
+
+#[derive(Clone, Copy, Debug, PartialEq)]
+pub struct SpectrumLayout {
+    pub bands: usize,
+    pub scale: SpectrumScale,
+    pub fmin: f32,
+    /// Upper edge in Hz; 0 means Nyquist.
+    pub fmax: f32,
+    pub window: WindowKind,
+}
+
+impl Default for SpectrumLayout {
+    // What the spectrum element produced: 64 linear bands up to Nyquist.
+    fn default() -> Self {
+        Self {
+            bands: 64,
+            scale: SpectrumScale::Linear,
+            fmin: 0.0,
+            fmax: 0.0,
+            window: WindowKind::Hann,
+        }
+    }
+}
+
+#[derive(Clone, Copy, Debug, PartialEq)]
+pub enum SampleFormat {
+    S16,
+    S24,
+    S24In32,
+    S32,
+    F32,
+    F64,
+}
+
+impl SampleFormat {
+    /// Interleaved little-endian raw formats the tap understands.
+    pub fn from_caps_format(name: &str) -> Option<Self> {
+        match name {
+            "S16LE" => Some(Self::S16),
+            "S24LE" => Some(Self::S24),
+            "S24_32LE" => Some(Self::S24In32),
+            "S32LE" => Some(Self::S32),
+            "F32LE" => Some(Self::F32),
+            "F64LE" => Some(Self::F64),
+            _ => None,
+        }
+    }
+
+    fn width(self) -> usize {
+        match self {
+            Self::S16 => 2,
+            Self::S24 => 3,
+            Self::S24In32 | Self::S32 | Self::F32 => 4,
+            Self::F64 => 8,
+        }
+    }
+
+    fn sample(self, b: &[u8]) -> f32 {
+        match self {
+            Self::S16 => i16::from_le_bytes([b[0], b[1]]) as f32 / 32768.0,
+            Self::S24 => (i32::from_le_bytes([0, b[0], b[1], b[2]]) >> 8) as f32 / 8_388_608.0,
+            Self::S24In32 => ((i32::from_le_bytes([b[0], b[1], b[2], b[3]]) << 8) >> 8) as f32 / 8_388_608.0,
+            Self::S32 => i32::from_le_bytes([b[0], b[1], b[2], b[3]]) as f32 / 2_147_483_648.0,
+            Self::F32 => f32::from_le_bytes([b[0], b[1], b[2], b[3]]),
+            Self::F64 => f64::from_le_bytes([b[0], b[1], b[2], b[3], b[4], b[5], b[6], b[7]]) as f32,
+        }
+    }
+}
+
+/// FFT bins behind one output band.
+#[derive(Clone, Copy, Debug, PartialEq)]
+enum BandBins {
+    /// Power summed over bins lo..hi.
+    Sum(usize, usize),
+    /// Narrower than one bin (the low end of log layouts): power interpolated
+    /// between bin and bin + 1 at the band centre, so neighbouring bands do
+    /// not repeat the same bin.
+    Interp(usize, f32),
+}
+
+#[derive(Clone, Copy)]
+pub struct SpectrumFrame {
+    pub pos_s: f64,
+    pub len: usize,
+    pub vals: [f32; SPECTRUM_BANDS_MAX],
+}
+
+pub struct SpectrumAnalyzer {
+    layout: SpectrumLayout,
+    format: Option<SampleFormat>,
+    rate: u32,
+    channels: usize,
+    fft: Option<Arc<dyn RealToComplex<f32>>>,
+    fft_len: usize,
+    hop: usize,
+    window: Vec<f32>,
+    // Mono history, fft_len samples, written circularly.
+    history: Vec<f32>,
+    hist_write: usize,
+    hist_filled: usize,
+    since_hop: usize,
+    input: Vec<f32>,
+    output: Vec<Complex<f32>>,
+    scratch: Vec<Complex<f32>>,
+    band_bins: Vec<BandBins>,
+    pending: VecDeque<SpectrumFrame>,
+    dropped: u64,
+}
+
+impl fmt::Debug for SpectrumAnalyzer {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        f.debug_struct("SpectrumAnalyzer")
+            .field("layout", &self.layout)
+            .field("format", &self.format)
+            .field("rate", &self.rate)
+            .field("channels", &self.channels)
+            .field("fft_len", &self.fft_len)
+            .field("pending", &self.pending.len())
+            .finish()
+    }
+}
+
+impl SpectrumAnalyzer {
+    pub fn new(layout: SpectrumLayout) -> Self {
+        Self {
+            layout,
+            format: None,
+            rate: 0,
+            channels: 0,
+            fft: None,
+            fft_len: 0,
+            hop: 0,
+            window: Vec::new(),
+            history: Vec::new(),
+            hist_write: 0,
+            hist_filled: 0,
+            since_hop: 0,
+            input: Vec::new(),
+            output: Vec::new(),
+            scratch: Vec::new(),
+            band_bins: Vec::new(),
+            pending: VecDeque::with_capacity(PENDING_CAP),
+            dropped: 0,
+        }
+    }
+
+    pub fn layout(&self) -> SpectrumLayout {
+        self.layout
+    }
+
+    pub fn dropped(&self) -> u64 {
+        self.dropped
+    }
+
+    /// New caps: replan the FFT for the stream rate. None disables analysis
+    /// until the next supported caps.
+    pub fn set_format(&mut self, format: Option<SampleFormat>, rate: u32, channels: usize) {
+        if format == self.format && rate == self.rate && channels == self.channels {
+            return;
+        }
+        self.format = format;
+        self.rate = rate;
+        self.channels = channels;
+        if format.is_none() || rate == 0 || channels == 0 {
+            self.fft = None;
+            return;
+        }
+        // ~40ms of audio per transform at any rate (2048 points at 44.1/48k).
+        let fft_len = (rate as usize / 24).next_power_of_two().clamp(FFT_LEN_MIN, FFT_LEN_MAX);
+        if fft_len != self.fft_len || self.fft.is_none() {
+            let fft = RealFftPlanner::<f32>::new().plan_fft_forward(fft_len);
+            self.input = fft.make_input_vec();
+            self.output = fft.make_output_vec();
+            self.scratch = fft.make_scratch_vec();
+            self.fft = Some(fft);
+            self.fft_len = fft_len;
+            self.history = vec![0.0; fft_len];
+        }
+        self.hop = ((rate as f64) * SPECTRUM_INTERVAL_S).round().max(1.0) as usize;
+        self.rebuild_window();
+        self.rebuild_bands();
+        self.reset();
+    }
+
+    pub fn set_layout(&mut self, layout: SpectrumLayout) {
+        let window_changed = layout.window != self.layout.window;
+        self.layout = layout;
+        if window_changed {
+            self.rebuild_window();
+        }
+        self.rebuild_bands();
+        // Frames queued in the old layout would reach a visualizer expecting the new one.
+        self.pending.clear();
+    }
+
+    /// Forget buffered samples (flush, seek, new segment).
+    pub fn reset(&mut self) {
+        self.history.iter_mut().for_each(|v| *v = 0.0);
+        self.hist_write = 0;
+        self.hist_filled = 0;
+        self.since_hop = 0;
+        self.pending.clear();
+    }
+
+    pub fn drain(&mut self) -> std::collections::vec_deque::Drain<'_, SpectrumFrame> {
+        self.pending.drain(..)
+    }
+
+    fn rebuild_window(&mut self) {
+        let n = self.fft_len;
+        let denom = (n.max(2) - 1) as f32;
+        let tau = std::f32::consts::TAU;
+        self.window = (0..n)
+            .map(|i| {
+                let x = i as f32 / denom;
+                match self.layout.window {
+                    WindowKind::Rect => 1.0,
+                    WindowKind::Hann => 0.5 - 0.5 * (tau * x).cos(),
+                    WindowKind::Hamming => 0.54 - 0.46 * (tau * x).cos(),
+                    WindowKind::Blackman => 0.42 - 0.5 * (tau * x).cos() + 0.08 * (2.0 * tau * x).cos(),
+                }
+            })
+            .collect();
+    }
+
+    fn rebuild_bands(&mut self) {
+        self.band_bins.clear();
+        if self.fft_len == 0 || self.rate == 0 {
+            return;
+        }
+        let bins = self.fft_len / 2 + 1;
+        let bin_hz = self.rate as f32 / self.fft_len as f32;
+        let nyquist = self.rate as f32 / 2.0;
+        let bands = self.layout.bands.clamp(1, SPECTRUM_BANDS_MAX);
+        let fmax = if self.layout.fmax > 0.0 { self.layout.fmax.min(nyquist) } else { nyquist };
+        let mut fmin = self.layout.fmin.max(0.0).min(fmax);
+        if self.layout.scale == SpectrumScale::Log {
+            // log(0) is undefined; the first bin is the lowest meaningful edge.
+            fmin = fmin.max(bin_hz).min(fmax);
+        }
+        let edge = |i: usize| -> f32 {
+            let t = i as f32 / bands as f32;
+            match self.layout.scale {
+                SpectrumScale::Linear => fmin + (fmax - fmin) * t,
+                SpectrumScale::Log => fmin * (fmax / fmin).powf(t),
+            }
+        };
+        for i in 0..bands {
+            let (f0, f1) = (edge(i), edge(i + 1));
+            if f1 - f0 < bin_hz {
+                let centre = match self.layout.scale {
+                    SpectrumScale::Linear => 0.5 * (f0 + f1),
+                    SpectrumScale::Log => (f0 * f1).sqrt(),
+                } / bin_hz;
+                let bin = (centre.floor().max(0.0) as usize).min(bins - 2);
+                self.band_bins.push(BandBins::Interp(bin, (centre - bin as f32).clamp(0.0, 1.0)));
+                continue;
+            }
+            let lo = ((f0 / bin_hz).round() as usize).min(bins - 1);
+            let hi = ((f1 / bin_hz).round() as usize).clamp(lo + 1, bins);
+            self.band_bins.push(BandBins::Sum(lo, hi));
+        }
+    }
+
+    /// Feed one interleaved buffer whose first sample plays at `start_s`
+    /// (stream time). Emits a frame every hop once a full window is buffered.
+    pub fn push(&mut self, data: &[u8], start_s: f64) {
+        let (Some(format), true) = (self.format, self.fft.is_some()) else {
+            return;
+        };
+        let width = format.width();
+        let stride = width * self.channels;
+        if stride == 0 {
+            return;
+        }
+        let inv_ch = 1.0 / self.channels as f32;
+        let n = self.fft_len;
+        for (i, frame) in data.chunks_exact(stride).enumerate() {
+            let mut mono = 0.0f32;
+            for ch in frame.chunks_exact(width) {
+                mono += format.sample(ch);
+            }
+            self.history[self.hist_write] = mono * inv_ch;
+            self.hist_write = (self.hist_write + 1) % n;
+            self.hist_filled = (self.hist_filled + 1).min(n);
+            self.since_hop += 1;
+            if self.since_hop >= self.hop && self.hist_filled == n {
+                self.since_hop = 0;
+                let pos_s = start_s + (i + 1) as f64 / self.rate as f64;
+                self.analyze(pos_s);
+            }
+        }
+    }
+
+    fn analyze(&mut self, pos_s: f64) {
+        let Some(fft) = self.fft.clone() else {
+            return;
+        };
+        let n = self.fft_len;
+        // Oldest sample first, so the window lines up with time.
+        for j in 0..n {
+            let src = (self.hist_write + j) % n;
+            self.input[j] = self.history[src] * self.window[j];
+        }
+        if fft.process_with_scratch(&mut self.input, &mut self.output, &mut self.scratch).is_err() {
+            return;
+        }
+        let norm = (n as f32) * (n as f32);
+        let mut frame = SpectrumFrame {
+            pos_s,
+            len: self.band_bins.len(),
+            vals: [SPECTRUM_FLOOR_DB; SPECTRUM_BANDS_MAX],
+        };
+        for (b, band) in self.band_bins.iter().enumerate() {
+            let power = match *band {
+                BandBins::Sum(lo, hi) => self.output[lo..hi].iter().map(|c| c.norm_sqr()).sum::<f32>(),
+                BandBins::Interp(bin, frac) => {
+                    (1.0 - frac) * self.output[bin].norm_sqr() + frac * self.output[bin + 1].norm_sqr()
+                }
+            };
+            let db = 10.0 * (power / norm).log10();
+            frame.vals[b] = if db.is_finite() { db.max(SPECTRUM_FLOOR_DB) } else { SPECTRUM_FLOOR_DB };
+        }
+        if self.pending.len() >= PENDING_CAP {
+            self.pending.pop_front();
+            self.dropped = self.dropped.wrapping_add(1);
+        }
+        self.pending.push_back(frame);
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    const RATE: u32 = 48_000;
+
+    fn analyzer(bands: usize) -> SpectrumAnalyzer {
+        let mut a = SpectrumAnalyzer::new(SpectrumLayout { bands, ..SpectrumLayout::default() });
+        a.set_format(Some(SampleFormat::F32), RATE, 1);
+        a
+    }
+
+    fn feed(a: &mut SpectrumAnalyzer, samples: &[f32]) -> Vec<SpectrumFrame> {
+        let bytes: Vec<u8> = samples.iter().flat_map(|v| v.to_le_bytes()).collect();
+        a.push(&bytes, 0.0);
+        a.drain().collect()
+    }
+
+    fn sine(freq: f32, len: usize) -> Vec<f32> {
+        let w = std::f32::consts::TAU * freq / RATE as f32;
+        (0..len).map(|i| (w * i as f32).sin()).collect()
+    }
+
+    /// Uniform in [-1, 1) (variance 1/3) from a fixed xorshift seed.
+    fn noise(len: usize) -> Vec<f32> {
+        let mut x: u32 = 0x9e37_79b9;
+        (0..len)
+            .map(|_| {
+                x ^= x << 13;
+                x ^= x >> 17;
+                x ^= x << 5;
+                (x as f32 / u32::MAX as f32) * 2.0 - 1.0
+            })
+            .collect()
+    }
+
+    fn peak(vals: &[f32]) -> (usize, f32) {
+        vals.iter().copied().enumerate().fold((0, f32::MIN), |m, (i, v)| if v > m.1 { (i, v) } else { m })
+    }
+
+    #[test]
+    fn sine_lands_in_its_band_at_the_element_level() {
+        // Bin 68 of the 2048-point FFT; 64 linear bands are 375 Hz wide.
+        let freq = 68.0 * RATE as f32 / 2048.0;
+        let mut a = analyzer(64);
+        assert_eq!(a.fft_len, 2048);
+        let frames = feed(&mut a, &sine(freq, 8192));
+        assert!(!frames.is_empty());
+        let vals = &frames.last().unwrap().vals[..64];
+        let (band, db) = peak(vals);
+        assert_eq!(band, (freq / 375.0) as usize);
+        // Hann main lobe: (n/4)² + 2·(n/8)² over n² = 3/32.
+        assert!((db - 10.0 * (3.0f32 / 32.0).log10()).abs() < 0.5, "{db}");
+        assert!(vals[band + 2] < -50.0 && vals[band - 2] < -50.0);
+
+        // Band width does not change a tone's level.
+        let mut wide = analyzer(32);
+        let wide_vals = feed(&mut wide, &sine(freq, 8192)).last().unwrap().vals;
+        assert!((peak(&wide_vals[..32]).1 - db).abs() < 0.1);
+    }
+
+    #[test]
+    fn white_noise_matches_the_element_band_level() {
+        let mut a = analyzer(64);
+        let frames = feed(&mut a, &noise(48_000));
+        assert!(frames.len() > 10);
+        let mut sum = 0.0f32;
+        let mut count = 0;
+        for frame in &frames {
+            for &v in &frame.vals[1..64] {
+                sum += v;
+                count += 1;
+            }
+        }
+        let mean = sum / count as f32;
+        // The element: one 126-point Hamming bin per band, σ²·Σw²/n / 126.
+        let element_db = 10.0 * ((1.0f32 / 3.0) * 0.397 / 126.0).log10();
+        assert!((mean - element_db).abs() < 1.0, "{mean} vs {element_db}");
+    }
+
+    fn log_analyzer(bands: usize) -> SpectrumAnalyzer {
+        let mut a = SpectrumAnalyzer::new(SpectrumLayout {
+            bands,
+            scale: SpectrumScale::Log,
+            fmin: 30.0,
+            fmax: 20_000.0,
+            window: WindowKind::Hann,
+        });
+        a.set_format(Some(SampleFormat::F32), RATE, 1);
+        a
+    }
+
+    #[test]
+    fn sub_bin_log_bands_do_not_repeat_bins() {
+        let mut a = log_analyzer(128);
+        let sub_bin = a.band_bins.iter().filter(|b| matches!(b, BandBins::Interp(..))).count();
+        assert!(sub_bin > 40, "{sub_bin}");
+        for pair in a.band_bins.windows(2) {
+            assert_ne!(pair[0], pair[1]);
+        }
+        let frame = feed(&mut a, &noise(8192)).pop().unwrap();
+        let vals = &frame.vals[..128];
+        assert!(vals[..sub_bin].windows(2).all(|w| w[0] != w[1]));
+    }
+
+    #[test]
+    fn low_tone_peaks_at_its_log_band() {
+        let mut a = log_analyzer(128);
+        let vals = feed(&mut a, &sine(100.0, 8192)).pop().unwrap().vals;
+        let (band, db) = peak(&vals[..128]);
+        let ratio = (20_000.0f32 / 30.0).powf(1.0 / 128.0);
+        let centre = 30.0 * ratio.powf(band as f32 + 0.5);
+        assert!((centre - 100.0).abs() < RATE as f32 / 2048.0, "band {band} at {centre} Hz");
+        assert!(db > -15.0, "{db}");
+    }
+
+    #[test]
+    fn silence_reads_the_floor() {
+        let mut a = analyzer(64);
+        let frames = feed(&mut a, &vec![0.0; 4096]);
+        assert!(frames.iter().all(|f| f.vals[..64].iter().all(|&v| v == SPECTRUM_FLOOR_DB)));
+    }
+}
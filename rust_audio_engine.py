@@ -9,6 +9,9 @@ import time
 from pathlib import Path
 from collections import deque
 
+import app_metrics
+from app_logging import rate_limited
+
 from gi.repository import GLib
 import gi
 gi.require_version("Gst", "1.0")
@@ -16,6 +19,8 @@ gi.require_version("GstPbutils", "1.0")
 from gi.repository import Gst, GstPbutils
 
 logger = logging.getLogger(__name__)
+# VIZ TRACE messages fire per pump tick / frame.
+viz_trace_logger = rate_limited(logger, 1.0)
 
 
 class _RustAudioCore:
@@ -23,6 +28,7 @@ class _RustAudioCore:
     EVENT_ERROR = 2
     EVENT_EOS = 3
     EVENT_TAG = 4
+    SPECTRUM_SCALES = {"linear": 0, "log": 1}
 
     def __init__(self):
         self.lib = None
@@ -119,6 +125,15 @@ class _RustAudioCore:
             if hasattr(lib, "rac_set_pipewire_pro_audio"):
                 lib.rac_set_pipewire_pro_audio.restype = ctypes.c_int
                 lib.rac_set_pipewire_pro_audio.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+            if hasattr(lib, "rac_set_spectrum_layout"):
+                lib.rac_set_spectrum_layout.restype = ctypes.c_int
+                lib.rac_set_spectrum_layout.argtypes = [
+                    ctypes.c_void_p,
+                    ctypes.c_int,
+                    ctypes.c_int,
+                    ctypes.c_double,
+                    ctypes.c_double,
+                ]
             if hasattr(lib, "rac_get_runtime_snapshot"):
                 lib.rac_get_runtime_snapshot.restype = ctypes.c_void_p
                 lib.rac_get_runtime_snapshot.argtypes = [ctypes.c_void_p]
@@ -188,7 +203,11 @@ class _RustAudioCore:
                 fn = getattr(self.lib, fn_name, None)
                 if fn is None:
                     return -2
-                return int(fn(self.handle, *args))
+                start = time.perf_counter()
+                try:
+                    return int(fn(self.handle, *args))
+                finally:
+                    app_metrics.observe("ffi_call_seconds", time.perf_counter() - start, fn=fn_name)
             except Exception:
                 logger.exception("Rust audio core call failed: %s", fn_name)
                 return default_rc
@@ -583,6 +602,23 @@ class _RustAudioCore:
         except Exception:
             return False
 
+    def set_spectrum_layout(self, bands, scale="linear", fmin=0.0, fmax=0.0):
+        if not self.available:
+            return -1
+        if not hasattr(self.lib, "rac_set_spectrum_layout"):
+            return -2
+        scale_id = self.SPECTRUM_SCALES.get(str(scale or "").lower())
+        if scale_id is None:
+            return -2
+        return self._call_int(
+            "rac_set_spectrum_layout",
+            ctypes.c_int(int(bands)),
+            ctypes.c_int(scale_id),
+            ctypes.c_double(float(fmin or 0.0)),
+            ctypes.c_double(float(fmax or 0.0)),
+            default_rc=-3,
+        )
+
 
 class RustAudioPlayerAdapter:
     """
@@ -1084,6 +1120,8 @@ class RustAudioPlayerAdapter:
         self._rust_last_spectrum_seen_ts = 0.0
         self._rust_last_spectrum_recover_ts = 0.0
         self._rust_spectrum_enabled = False
+        # Last layout the core accepted; None until one is.
+        self._spectrum_layout = None
         self._viz_latency_cached_ms = 0.0
         self._viz_latency_smooth_ms = 0.0
         self._viz_msg_age_smooth_ms = 0.0
@@ -1502,6 +1540,28 @@ class RustAudioPlayerAdapter:
         )
         return True
 
+    def set_spectrum_layout(self, bands, scale="linear", fmin=0.0, fmax=0.0):
+        """
+        Ask the engine for frames in this band layout. False when it cannot
+        (older core, or the spectrum element fallback): frames then keep the
+        default 64 linear bands.
+        """
+        layout = (int(bands), str(scale), float(fmin or 0.0), float(fmax or 0.0))
+        if layout == self._spectrum_layout:
+            return True
+        rc = self._rust.set_spectrum_layout(*layout) if self._rust.available else -1
+        if rc != 0:
+            # Not remembered, so the next call retries (the core may not be up
+            # yet, or the error was transient).
+            logger.debug("Spectrum layout not applied: bands=%d scale=%s fmin=%.0f fmax=%.0f rc=%s", *layout, rc)
+            return False
+        self._spectrum_layout = layout
+        # Queued frames are in the previous layout.
+        self._viz_spectrum_queue.clear()
+        self._viz_last_render_frame = None
+        logger.info("Spectrum layout: bands=%d scale=%s fmin=%.0f fmax=%.0f", *layout)
+        return True
+
     def _classify_rust_error(self, text):
         t = str(text or "").lower()
         if any(k in t for k in self._ERR_DEVICE_KEYS):
@@ -1900,7 +1960,7 @@ class RustAudioPlayerAdapter:
             if self._viz_trace_last_tick_ts > 0.0:
                 tick_gap_ms = (now_tick - self._viz_trace_last_tick_ts) * 1000.0
                 if tick_gap_ms >= 45.0:
-                    logger.info("VIZ TRACE rust-pump-gap: %.1fms", tick_gap_ms)
+                    viz_trace_logger.info("VIZ TRACE rust-pump-gap: %.1fms", tick_gap_ms)
             self._viz_trace_last_tick_ts = now_tick
         self._rust.pump_events()
         try:
@@ -1933,15 +1993,19 @@ class RustAudioPlayerAdapter:
                         self._viz_spectrum_queue.clear()
                     except Exception:
                         pass
+                elif self._last_rust_spectrum_seq and int(seq) > int(self._last_rust_spectrum_seq) + 1:
+                    # Frames overwritten in the core's ring before we polled.
+                    app_metrics.inc("spectrum_frames_dropped", int(seq) - int(self._last_rust_spectrum_seq) - 1)
                 self._last_rust_spectrum_seq = max(self._last_rust_spectrum_seq, seq)
                 self._rust_spectrum_frames_seen += 1
+                app_metrics.inc("spectrum_frames")
                 self._rust_last_spectrum_seen_ts = time.monotonic()
                 if self._viz_trace_enabled and bool(self._rust_spectrum_enabled):
                     now_f = time.monotonic()
                     if self._viz_trace_last_frame_ts > 0.0:
                         fgap_ms = (now_f - self._viz_trace_last_frame_ts) * 1000.0
                         if fgap_ms >= 60.0:
-                            logger.info("VIZ TRACE rust-frame-gap: %.1fms", fgap_ms)
+                            viz_trace_logger.info("VIZ TRACE rust-frame-gap: %.1fms", fgap_ms)
                     self._viz_trace_last_frame_ts = now_f
                 if self._rust_spectrum_frames_seen % 1800 == 0:
                     logger.debug("Rust spectrum frames delivered: %d", self._rust_spectrum_frames_seen)
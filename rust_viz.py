@@ -7,6 +7,43 @@ from typing import Iterable, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Band layouts requested from the audio engine: (bands, scale, fmin_hz, fmax_hz).
+# The default is what the engine emits unless told otherwise.
+DEFAULT_SPECTRUM_LAYOUT = (64, "linear", 0.0, 0.0)
+LOG_LAYOUT_FMIN_HZ = 30.0
+LOG_LAYOUT_FMAX_HZ = 20000.0
+
+
+def log_spectrum_layout(bands):
+    return (max(1, min(128, int(bands))), "log", LOG_LAYOUT_FMIN_HZ, LOG_LAYOUT_FMAX_HZ)
+
+
+def fold_log_bins(values, out_count):
+    """
+    Bins already log-spaced by the engine, averaged down (or repeated up) to
+    out_count, then given build_log_bins' level shaping (pow 0.84 and a
+    0.92..1.08 low-to-high tilt) so log-bin effects keep their look. No
+    frequency warping: the engine did that.
+    """
+    vals = list(values)
+    n = len(vals)
+    if out_count <= 0:
+        return []
+    if n == 0:
+        return [0.0] * out_count
+    if n == out_count:
+        folded = vals
+    else:
+        folded = [0.0] * out_count
+        for i in range(out_count):
+            a = (i * n) // out_count
+            b = max(a + 1, ((i + 1) * n) // out_count)
+            seg = vals[a:b]
+            folded[i] = sum(seg) / float(len(seg))
+    last = float(max(1, out_count - 1))
+    return [max(0.0, min(1.0, pow(max(0.0, min(1.0, v)), 0.84) * (0.92 + 0.16 * (i / last)))) for i, v in enumerate(folded)]
+
+
 class RustVizCore:
     def __init__(self):
         self._lib = self._load_library()
@@ -286,6 +323,26 @@ class RustVizCore:
         except Exception:
             logger.info("Rust viz core lacks count_artist_keys symbol; using Python fallback for artist counts.")
 
+        self._extract_palette = None
+        try:
+            palette = self._lib.extract_palette
+            palette.argtypes = [
+                ctypes.POINTER(ctypes.c_ubyte),  # pixels ptr
+                ctypes.c_size_t,                 # pixels len
+                ctypes.c_size_t,                 # width
+                ctypes.c_size_t,                 # height
+                ctypes.c_size_t,                 # rowstride
+                ctypes.c_size_t,                 # n channels
+                ctypes.c_size_t,                 # k
+                ctypes.c_size_t,                 # max iters
+                ctypes.POINTER(ctypes.c_float),  # out rgb ptr (k*3)
+                ctypes.POINTER(ctypes.c_float),  # out weights ptr (k)
+            ]
+            palette.restype = ctypes.c_size_t
+            self._extract_palette = palette
+        except Exception:
+            logger.info("Rust viz core lacks extract_palette symbol; using Python fallback for cover palettes.")
+
         self._filter_sort_indices_no_query = None
         try:
             filt = self._lib.filter_sort_indices_no_query
@@ -334,6 +391,82 @@ class RustVizCore:
         except Exception:
             logger.info("Rust viz core lacks filter_sort_indices_with_query symbol; using Python fallback for query filters.")
 
+        self._collection_new = None
+        self._collection_free = None
+        self._collection_load_columns = None
+        self._collection_load_search = None
+        self._collection_query = None
+        self._collection_facet_counts = None
+        try:
+            col_new = self._lib.collection_new
+            col_new.argtypes = []
+            col_new.restype = ctypes.c_void_p
+            col_free = self._lib.collection_free
+            col_free.argtypes = [ctypes.c_void_p]
+            col_free.restype = None
+            col_load = self._lib.collection_load_columns
+            col_load.argtypes = [
+                ctypes.c_void_p,
+                ctypes.POINTER(ctypes.c_uint64),  # artist keys ptr
+                ctypes.POINTER(ctypes.c_uint64),  # album keys ptr
+                ctypes.POINTER(ctypes.c_uint32),  # title rank ptr
+                ctypes.POINTER(ctypes.c_uint32),  # artist rank ptr
+                ctypes.POINTER(ctypes.c_uint32),  # album rank ptr
+                ctypes.POINTER(ctypes.c_uint32),  # durations ptr
+                ctypes.POINTER(ctypes.c_ubyte),   # favorites ptr
+                ctypes.c_size_t,                  # len
+            ]
+            col_load.restype = ctypes.c_int
+            col_search = self._lib.collection_load_search
+            col_search.argtypes = [
+                ctypes.c_void_p,
+                ctypes.POINTER(ctypes.c_ubyte),   # search blob ptr
+                ctypes.c_size_t,                  # search blob len
+                ctypes.POINTER(ctypes.c_uint32),  # search offsets ptr
+                ctypes.POINTER(ctypes.c_uint32),  # search lens ptr
+                ctypes.c_size_t,                  # len
+            ]
+            col_search.restype = ctypes.c_int
+            col_query = self._lib.collection_query
+            col_query.argtypes = [
+                ctypes.c_void_p,
+                ctypes.POINTER(ctypes.c_uint32),  # sort keys ptr
+                ctypes.c_size_t,                  # sort keys len
+                ctypes.POINTER(ctypes.c_uint64),  # artist filter ptr
+                ctypes.c_size_t,                  # artist filter len
+                ctypes.POINTER(ctypes.c_uint64),  # album filter ptr
+                ctypes.c_size_t,                  # album filter len
+                ctypes.c_uint32,                  # duration min
+                ctypes.c_uint32,                  # duration max
+                ctypes.c_uint8,                   # favorite filter
+                ctypes.POINTER(ctypes.c_ubyte),   # query ptr
+                ctypes.c_size_t,                  # query len
+                ctypes.c_size_t,                  # offset
+                ctypes.c_size_t,                  # limit
+                ctypes.POINTER(ctypes.c_uint32),  # out indices ptr
+                ctypes.c_size_t,                  # out len
+                ctypes.POINTER(ctypes.c_size_t),  # out total
+            ]
+            col_query.restype = ctypes.c_size_t
+            col_facets = self._lib.collection_facet_counts
+            col_facets.argtypes = [
+                ctypes.c_void_p,
+                ctypes.c_uint32,                  # facet
+                ctypes.c_uint8,                   # matched only
+                ctypes.POINTER(ctypes.c_uint64),  # out keys ptr
+                ctypes.POINTER(ctypes.c_uint32),  # out counts ptr
+                ctypes.c_size_t,                  # out len
+            ]
+            col_facets.restype = ctypes.c_size_t
+            self._collection_new = col_new
+            self._collection_free = col_free
+            self._collection_load_columns = col_load
+            self._collection_load_search = col_search
+            self._collection_query = col_query
+            self._collection_facet_counts = col_facets
+        except Exception:
+            logger.info("Rust viz core lacks collection_* symbols; using stateless collection filters.")
+
         newp = self._lib.viz_processor_new
         newp.argtypes = [
             ctypes.c_size_t,  # num bars
@@ -1029,6 +1162,44 @@ class RustVizCore:
             out.append((int(out_keys[i]), int(out_counts[i])))
         return out
 
+    def extract_palette(
+        self,
+        pixels: bytes,
+        width: int,
+        height: int,
+        rowstride: int,
+        n_channels: int,
+        k: int = 5,
+        max_iters: int = 8,
+    ) -> Optional[List[tuple]]:
+        if self._lib is None or self._extract_palette is None:
+            return None
+        data = bytes(pixels or b"")
+        k = max(1, int(k))
+        if not data:
+            return []
+        in_buf = (ctypes.c_ubyte * len(data)).from_buffer_copy(data)
+        out_rgb = (ctypes.c_float * (k * 3))()
+        out_weights = (ctypes.c_float * k)()
+        written = int(
+            self._extract_palette(
+                in_buf,
+                len(data),
+                int(width),
+                int(height),
+                int(rowstride),
+                int(n_channels),
+                k,
+                int(max_iters),
+                out_rgb,
+                out_weights,
+            )
+        )
+        return [
+            (float(out_rgb[i * 3]), float(out_rgb[i * 3 + 1]), float(out_rgb[i * 3 + 2]), float(out_weights[i]))
+            for i in range(min(written, k))
+        ]
+
     def filter_sort_indices_no_query(
         self,
         artist_keys: Iterable[int],
@@ -1184,6 +1355,207 @@ class RustVizCore:
             return None
         return RustBarsRenderer(self, ctypes.c_void_p(ptr), int(num_bars))
 
+    def create_collection_index(self) -> Optional["RustCollectionIndex"]:
+        if self._lib is None or self._collection_new is None:
+            return None
+        ptr = self._collection_new()
+        if not ptr:
+            return None
+        return RustCollectionIndex(self, ctypes.c_void_p(ptr))
+
+
+class RustCollectionIndex:
+    """Columnar track collection held on the Rust side.
+
+    Columns are copied over FFI once by ``load_columns``; each ``query`` only
+    transfers the filter arguments and the requested page of row indices.
+    """
+
+    SORT_RECENT = 0
+    SORT_TITLE = 1
+    SORT_ARTIST = 2
+    SORT_ALBUM = 3
+    SORT_DURATION = 4
+    SORT_FAVORITE = 5
+    SORT_DESC = 0x100
+
+    FACET_ARTIST = 0
+    FACET_ALBUM = 1
+
+    FAVORITE_ANY = 0
+    FAVORITE_ONLY = 1
+    FAVORITE_EXCLUDE = 2
+
+    def __init__(self, core: RustVizCore, ptr: ctypes.c_void_p):
+        self._core = core
+        self._ptr = ptr
+        self._len = 0
+        self._has_search = False
+        self._total = ctypes.c_size_t(0)
+
+    def close(self):
+        if self._ptr:
+            self._core._collection_free(self._ptr)
+            self._ptr = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def __len__(self):
+        return self._len
+
+    @property
+    def has_search(self) -> bool:
+        return self._has_search
+
+    def load_columns(
+        self,
+        artist_keys: Iterable[int],
+        album_keys: Iterable[int],
+        title_rank: Iterable[int],
+        artist_rank: Iterable[int],
+        album_rank: Iterable[int],
+        durations: Iterable[int],
+        favorites: Optional[Iterable[bool]] = None,
+    ) -> bool:
+        if not self._ptr:
+            return False
+        artist_vals = [int(v) & ((1 << 64) - 1) for v in (artist_keys or [])]
+        n = len(artist_vals)
+        album_vals = [int(v) & ((1 << 64) - 1) for v in (album_keys or [])]
+        title_vals = [int(v) & 0xFFFFFFFF for v in (title_rank or [])]
+        artist_rank_vals = [int(v) & 0xFFFFFFFF for v in (artist_rank or [])]
+        album_rank_vals = [int(v) & 0xFFFFFFFF for v in (album_rank or [])]
+        dur_vals = [int(v) & 0xFFFFFFFF for v in (durations or [])]
+        fav_vals = [1 if v else 0 for v in (favorites if favorites is not None else [False] * n)]
+        if any(len(col) != n for col in (album_vals, title_vals, artist_rank_vals, album_rank_vals, dur_vals, fav_vals)):
+            return False
+        rc = int(
+            self._core._collection_load_columns(
+                self._ptr,
+                (ctypes.c_uint64 * max(1, n))(*artist_vals),
+                (ctypes.c_uint64 * max(1, n))(*album_vals),
+                (ctypes.c_uint32 * max(1, n))(*title_vals),
+                (ctypes.c_uint32 * max(1, n))(*artist_rank_vals),
+                (ctypes.c_uint32 * max(1, n))(*album_rank_vals),
+                (ctypes.c_uint32 * max(1, n))(*dur_vals),
+                (ctypes.c_ubyte * max(1, n))(*fav_vals),
+                ctypes.c_size_t(n),
+            )
+        )
+        if rc != 0:
+            return False
+        self._len = n
+        self._has_search = False
+        return True
+
+    def load_search(self, search_blob: bytes, search_offsets: Iterable[int], search_lens: Iterable[int]) -> bool:
+        if not self._ptr:
+            return False
+        blob = bytes(search_blob or b"")
+        offsets = [int(v) & 0xFFFFFFFF for v in (search_offsets or [])]
+        lens = [int(v) & 0xFFFFFFFF for v in (search_lens or [])]
+        n = self._len
+        if len(offsets) != n or len(lens) != n:
+            return False
+        blob_len = len(blob)
+        blob_buf = (ctypes.c_ubyte * max(1, blob_len)).from_buffer_copy(blob or b"\0")
+        rc = int(
+            self._core._collection_load_search(
+                self._ptr,
+                blob_buf,
+                ctypes.c_size_t(blob_len),
+                (ctypes.c_uint32 * max(1, n))(*offsets),
+                (ctypes.c_uint32 * max(1, n))(*lens),
+                ctypes.c_size_t(n),
+            )
+        )
+        self._has_search = rc == 0
+        return self._has_search
+
+    def query(
+        self,
+        sort_keys: Iterable[int] = (),
+        artist_keys: Optional[Iterable[int]] = None,
+        album_keys: Optional[Iterable[int]] = None,
+        min_duration: Optional[int] = None,
+        max_duration: Optional[int] = None,
+        favorite: int = FAVORITE_ANY,
+        text: str = "",
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Optional[tuple]:
+        """Return ``(page_indices, total_matches)`` for the given filters.
+
+        ``sort_keys`` holds ``SORT_*`` values, optionally OR'ed with
+        ``SORT_DESC``; earlier keys take precedence. Empty ``artist_keys`` or
+        ``album_keys`` mean no filter on that facet.
+        """
+        if not self._ptr:
+            return None
+        keys = [int(k) & 0xFFFFFFFF for k in (sort_keys or [])]
+        artists = [int(v) & ((1 << 64) - 1) for v in (artist_keys or [])]
+        albums = [int(v) & ((1 << 64) - 1) for v in (album_keys or [])]
+        query_bytes = str(text or "").encode("utf-8", "ignore")
+        if query_bytes and not self._has_search:
+            return None
+        off = max(0, int(offset or 0))
+        lim = self._len if limit is None else max(0, int(limit))
+        out_n = max(0, min(lim, self._len - off))
+        out_buf = (ctypes.c_uint32 * max(1, out_n))()
+        query_buf = (ctypes.c_ubyte * len(query_bytes)).from_buffer_copy(query_bytes) if query_bytes else None
+        written = int(
+            self._core._collection_query(
+                self._ptr,
+                (ctypes.c_uint32 * len(keys))(*keys) if keys else None,
+                ctypes.c_size_t(len(keys)),
+                (ctypes.c_uint64 * len(artists))(*artists) if artists else None,
+                ctypes.c_size_t(len(artists)),
+                (ctypes.c_uint64 * len(albums))(*albums) if albums else None,
+                ctypes.c_size_t(len(albums)),
+                ctypes.c_uint32(max(0, int(min_duration or 0)) & 0xFFFFFFFF),
+                ctypes.c_uint32(0xFFFFFFFF if max_duration is None else max(0, int(max_duration)) & 0xFFFFFFFF),
+                ctypes.c_uint8(int(favorite) & 0xFF),
+                query_buf,
+                ctypes.c_size_t(len(query_bytes)),
+                ctypes.c_size_t(off),
+                ctypes.c_size_t(lim),
+                out_buf,
+                ctypes.c_size_t(out_n),
+                ctypes.byref(self._total),
+            )
+        )
+        written = max(0, min(written, out_n))
+        return [int(out_buf[i]) for i in range(written)], int(self._total.value)
+
+    def facet_counts(self, facet: int = FACET_ARTIST, matched_only: bool = False) -> Optional[List[tuple]]:
+        """Return ``[(key, count), ...]`` ordered by count desc, key asc.
+
+        With ``matched_only`` the counts cover the rows matched by the most
+        recent ``query`` call instead of the whole collection.
+        """
+        if not self._ptr:
+            return None
+        n = self._len
+        if n <= 0:
+            return []
+        out_keys = (ctypes.c_uint64 * n)()
+        out_counts = (ctypes.c_uint32 * n)()
+        written = int(
+            self._core._collection_facet_counts(
+                self._ptr,
+                ctypes.c_uint32(int(facet) & 0xFFFFFFFF),
+                ctypes.c_uint8(1 if matched_only else 0),
+                out_keys,
+                out_counts,
+                ctypes.c_size_t(n),
+            )
+        )
+        return [(int(out_keys[i]), int(out_counts[i])) for i in range(min(written, n))]
+
 
 class RustBarsRenderer:
     def __init__(self, core: RustVizCore, ptr: ctypes.c_void_p, num_bars: int):
@@ -1356,3 +1356,463 @@ pub extern "C" fn filter_sort_indices_with_query(
     }
     n
 }
+
+const COLLECTION_SORT_FIELD_MASK: u32 = 0xFF;
+const COLLECTION_SORT_DESC: u32 = 0x100;
+const COLLECTION_MAX_SORT_KEYS: usize = 8;
+
+pub struct CollectionIndex {
+    len: usize,
+    artist_keys: Vec<u64>,
+    album_keys: Vec<u64>,
+    title_rank: Vec<u32>,
+    artist_rank: Vec<u32>,
+    album_rank: Vec<u32>,
+    durations: Vec<u32>,
+    favorites: Vec<u8>,
+    search_blob: Vec<u8>,
+    search_offsets: Vec<u32>,
+    search_lens: Vec<u32>,
+    matched: Vec<u32>,
+}
+
+struct CollectionQuery<'a> {
+    sort_keys: &'a [u32],
+    artist_filter: Vec<u64>,
+    album_filter: Vec<u64>,
+    dur_min: u32,
+    dur_max: u32,
+    favorite_filter: u8,
+    text: &'a [u8],
+}
+
+impl CollectionIndex {
+    fn new() -> Self {
+        Self {
+            len: 0,
+            artist_keys: Vec::new(),
+            album_keys: Vec::new(),
+            title_rank: Vec::new(),
+            artist_rank: Vec::new(),
+            album_rank: Vec::new(),
+            durations: Vec::new(),
+            favorites: Vec::new(),
+            search_blob: Vec::new(),
+            search_offsets: Vec::new(),
+            search_lens: Vec::new(),
+            matched: Vec::new(),
+        }
+    }
+
+    fn sort_value(&self, field: u32, i: usize) -> u64 {
+        match field {
+            1 => self.title_rank[i] as u64,
+            2 => self.artist_rank[i] as u64,
+            3 => self.album_rank[i] as u64,
+            4 => self.durations[i] as u64,
+            5 => self.favorites[i] as u64,
+            _ => i as u64,
+        }
+    }
+
+    fn compare(&self, sort_keys: &[u32], a: usize, b: usize) -> std::cmp::Ordering {
+        for &k in sort_keys {
+            let field = k & COLLECTION_SORT_FIELD_MASK;
+            let ord = self.sort_value(field, a).cmp(&self.sort_value(field, b));
+            let ord = if k & COLLECTION_SORT_DESC != 0 { ord.reverse() } else { ord };
+            if ord != std::cmp::Ordering::Equal {
+                return ord;
+            }
+        }
+        a.cmp(&b)
+    }
+
+    fn text_matches(&self, i: usize, text: &[u8]) -> bool {
+        if text.is_empty() {
+            return true;
+        }
+        if self.search_offsets.len() != self.len {
+            return false;
+        }
+        let blob_len = self.search_blob.len();
+        let off = self.search_offsets[i] as usize;
+        if off >= blob_len {
+            return false;
+        }
+        let end = off.saturating_add(self.search_lens[i] as usize).min(blob_len);
+        end > off && bytes_contains(&self.search_blob[off..end], text)
+    }
+
+    fn matches(&self, q: &CollectionQuery, i: usize) -> bool {
+        if !q.artist_filter.is_empty() && q.artist_filter.binary_search(&self.artist_keys[i]).is_err() {
+            return false;
+        }
+        if !q.album_filter.is_empty() && q.album_filter.binary_search(&self.album_keys[i]).is_err() {
+            return false;
+        }
+        let dur = self.durations[i];
+        if dur < q.dur_min || dur > q.dur_max {
+            return false;
+        }
+        match q.favorite_filter {
+            1 if self.favorites[i] == 0 => return false,
+            2 if self.favorites[i] != 0 => return false,
+            _ => {}
+        }
+        self.text_matches(i, q.text)
+    }
+
+    fn run_query(&mut self, q: &CollectionQuery, offset: usize, limit: usize) -> (usize, usize) {
+        let mut idxs: Vec<usize> = (0..self.len).filter(|&i| self.matches(q, i)).collect();
+        let total = idxs.len();
+        let start = offset.min(total);
+        let end = start.saturating_add(limit).min(total);
+        let mut sort_keys: Vec<u32> = Vec::with_capacity(COLLECTION_MAX_SORT_KEYS);
+        for &k in q.sort_keys.iter().take(COLLECTION_MAX_SORT_KEYS) {
+            if k & COLLECTION_SORT_FIELD_MASK == 0 {
+                // Insertion order (recent) is unique, so later keys can never
+                // break a tie. Ascending it is the final tiebreak already.
+                if k & COLLECTION_SORT_DESC != 0 {
+                    sort_keys.push(k);
+                }
+                break;
+            }
+            sort_keys.push(k);
+        }
+        if !sort_keys.is_empty() && end > start {
+            // Only the requested window has to be ordered: partition around
+            // the window end, then fully sort the head that contains it.
+            if end < total {
+                idxs.select_nth_unstable_by(end, |&a, &b| self.compare(&sort_keys, a, b));
+            }
+            idxs[..end].sort_unstable_by(|&a, &b| self.compare(&sort_keys, a, b));
+        }
+        self.matched.clear();
+        self.matched.extend(idxs.iter().map(|&i| i as u32));
+        self.matched[..end].rotate_left(start);
+        (start, end)
+    }
+}
+
+fn sorted_filter_keys(ptr: *const u64, len: usize) -> Vec<u64> {
+    if ptr.is_null() || len == 0 {
+        return Vec::new();
+    }
+    let mut keys = unsafe { slice::from_raw_parts(ptr, len) }.to_vec();
+    keys.sort_unstable();
+    keys.dedup();
+    keys
+}
+
+#[no_mangle]
+pub extern "C" fn collection_new() -> *mut CollectionIndex {
+    Box::into_raw(Box::new(CollectionIndex::new()))
+}
+
+#[no_mangle]
+pub extern "C" fn collection_free(ptr: *mut CollectionIndex) {
+    if ptr.is_null() {
+        return;
+    }
+    unsafe {
+        drop(Box::from_raw(ptr));
+    }
+}
+
+#[no_mangle]
+pub extern "C" fn collection_load_columns(
+    ptr: *mut CollectionIndex,
+    artist_keys_ptr: *const u64,
+    album_keys_ptr: *const u64,
+    title_rank_ptr: *const u32,
+    artist_rank_ptr: *const u32,
+    album_rank_ptr: *const u32,
+    durations_ptr: *const u32,
+    favorites_ptr: *const u8,
+    len: usize,
+) -> c_int {
+    if ptr.is_null()
+        || artist_keys_ptr.is_null()
+        || album_keys_ptr.is_null()
+        || title_rank_ptr.is_null()
+        || artist_rank_ptr.is_null()
+        || album_rank_ptr.is_null()
+        || durations_ptr.is_null()
+        || favorites_ptr.is_null()
+    {
+        return -1;
+    }
+    let c = unsafe { &mut *ptr };
+    unsafe {
+        c.artist_keys = slice::from_raw_parts(artist_keys_ptr, len).to_vec();
+        c.album_keys = slice::from_raw_parts(album_keys_ptr, len).to_vec();
+        c.title_rank = slice::from_raw_parts(title_rank_ptr, len).to_vec();
+        c.artist_rank = slice::from_raw_parts(artist_rank_ptr, len).to_vec();
+        c.album_rank = slice::from_raw_parts(album_rank_ptr, len).to_vec();
+        c.durations = slice::from_raw_parts(durations_ptr, len).to_vec();
+        c.favorites = slice::from_raw_parts(favorites_ptr, len).to_vec();
+    }
+    c.len = len;
+    c.search_blob.clear();
+    c.search_offsets.clear();
+    c.search_lens.clear();
+    c.matched.clear();
+    0
+}
+
+#[no_mangle]
+pub extern "C" fn collection_load_search(
+    ptr: *mut CollectionIndex,
+    search_blob_ptr: *const u8,
+    search_blob_len: usize,
+    search_offsets_ptr: *const u32,
+    search_lens_ptr: *const u32,
+    len: usize,
+) -> c_int {
+    if ptr.is_null() || search_blob_ptr.is_null() || search_offsets_ptr.is_null() || search_lens_ptr.is_null() {
+        return -1;
+    }
+    let c = unsafe { &mut *ptr };
+    if len != c.len {
+        return -2;
+    }
+    unsafe {
+        c.search_blob = slice::from_raw_parts(search_blob_ptr, search_blob_len).to_vec();
+        c.search_offsets = slice::from_raw_parts(search_offsets_ptr, len).to_vec();
+        c.search_lens = slice::from_raw_parts(search_lens_ptr, len).to_vec();
+    }
+    0
+}
+
+#[no_mangle]
+pub extern "C" fn collection_query(
+    ptr: *mut CollectionIndex,
+    sort_keys_ptr: *const u32,
+    sort_keys_len: usize,
+    artist_filter_ptr: *const u64,
+    artist_filter_len: usize,
+    album_filter_ptr: *const u64,
+    album_filter_len: usize,
+    dur_min: u32,
+    dur_max: u32,
+    favorite_filter: u8,
+    query_ptr: *const u8,
+    query_len: usize,
+    offset: usize,
+    limit: usize,
+    out_indices_ptr: *mut u32,
+    out_len: usize,
+    out_total: *mut usize,
+) -> usize {
+    if ptr.is_null() || out_total.is_null() {
+        return 0;
+    }
+    let c = unsafe { &mut *ptr };
+    let sort_keys: &[u32] = if sort_keys_ptr.is_null() || sort_keys_len == 0 {
+        &[]
+    } else {
+        unsafe { slice::from_raw_parts(sort_keys_ptr, sort_keys_len) }
+    };
+    let text: &[u8] = if query_ptr.is_null() || query_len == 0 {
+        &[]
+    } else {
+        unsafe { slice::from_raw_parts(query_ptr, query_len) }
+    };
+    let q = CollectionQuery {
+        sort_keys,
+        artist_filter: sorted_filter_keys(artist_filter_ptr, artist_filter_len),
+        album_filter: sorted_filter_keys(album_filter_ptr, album_filter_len),
+        dur_min,
+        dur_max,
+        favorite_filter,
+        text,
+    };
+    let (start, end) = c.run_query(&q, offset, limit);
+    unsafe {
+        *out_total = c.matched.len();
+    }
+    if out_indices_ptr.is_null() || out_len == 0 {
+        return 0;
+    }
+    let out = unsafe { slice::from_raw_parts_mut(out_indices_ptr, out_len) };
+    let n = (end - start).min(out_len);
+    out[..n].copy_from_slice(&c.matched[..n]);
+    n
+}
+
+#[no_mangle]
+pub extern "C" fn collection_facet_counts(
+    ptr: *const CollectionIndex,
+    facet: u32,
+    matched_only: u8,
+    out_keys_ptr: *mut u64,
+    out_counts_ptr: *mut u32,
+    out_len: usize,
+) -> usize {
+    if ptr.is_null() || out_keys_ptr.is_null() || out_counts_ptr.is_null() || out_len == 0 {
+        return 0;
+    }
+    let c = unsafe { &*ptr };
+    let column: &[u64] = match facet {
+        0 => &c.artist_keys,
+        1 => &c.album_keys,
+        _ => return 0,
+    };
+    let mut counts: HashMap<u64, u32> = HashMap::new();
+    if matched_only != 0 {
+        for &i in &c.matched {
+            let entry = counts.entry(column[i as usize]).or_insert(0);
+            *entry = entry.saturating_add(1);
+        }
+    } else {
+        for &k in column {
+            let entry = counts.entry(k).or_insert(0);
+            *entry = entry.saturating_add(1);
+        }
+    }
+    let mut pairs: Vec<(u64, u32)> = counts.into_iter().collect();
+    pairs.sort_unstable_by(|a, b| b.1.cmp(&a.1).then_with(|| a.0.cmp(&b.0)));
+
+    let out_keys = unsafe { slice::from_raw_parts_mut(out_keys_ptr, out_len) };
+    let out_counts = unsafe { slice::from_raw_parts_mut(out_counts_ptr, out_len) };
+    let n = pairs.len().min(out_len);
+    for i in 0..n {
+        out_keys[i] = pairs[i].0;
+        out_counts[i] = pairs[i].1;
+    }
+    n
+}
+
+/// Deterministic k-means palette over an RGB(A) pixel buffer.
+/// Centroids are seeded farthest-point first from the median-luma pixel, so
+/// equal input always gives equal output. Pixels with alpha < 128 are ignored. Writes up to `k`
+/// colors (0..1 floats, RGB triplets) sorted by share, plus their shares.
+#[no_mangle]
+pub extern "C" fn extract_palette(
+    pixels_ptr: *const u8,
+    pixels_len: usize,
+    width: usize,
+    height: usize,
+    rowstride: usize,
+    n_channels: usize,
+    k: usize,
+    max_iters: usize,
+    out_rgb_ptr: *mut f32,
+    out_weights_ptr: *mut f32,
+) -> usize {
+    if pixels_ptr.is_null() || out_rgb_ptr.is_null() || out_weights_ptr.is_null() {
+        return 0;
+    }
+    if width == 0 || height == 0 || n_channels < 3 || k == 0 {
+        return 0;
+    }
+    let pixels = unsafe { slice::from_raw_parts(pixels_ptr, pixels_len) };
+    let mut samples: Vec<[f32; 3]> = Vec::with_capacity(width * height);
+    for y in 0..height {
+        let base = y * rowstride;
+        for x in 0..width {
+            let idx = base + x * n_channels;
+            if idx + n_channels > pixels.len() {
+                break;
+            }
+            if n_channels >= 4 && pixels[idx + 3] < 128 {
+                continue;
+            }
+            samples.push([pixels[idx] as f32, pixels[idx + 1] as f32, pixels[idx + 2] as f32]);
+        }
+    }
+    let n = samples.len();
+    if n == 0 {
+        return 0;
+    }
+    let k = k.min(n);
+
+    let dist2 = |a: &[f32; 3], b: &[f32; 3]| {
+        let dr = a[0] - b[0];
+        let dg = a[1] - b[1];
+        let db = a[2] - b[2];
+        dr * dr + dg * dg + db * db
+    };
+    let luma = |p: &[f32; 3]| 0.299 * p[0] + 0.587 * p[1] + 0.114 * p[2];
+    let mut order: Vec<usize> = (0..n).collect();
+    order.sort_by(|&a, &b| {
+        luma(&samples[a])
+            .partial_cmp(&luma(&samples[b]))
+            .unwrap_or(std::cmp::Ordering::Equal)
+            .then_with(|| a.cmp(&b))
+    });
+    // Farthest-point seeding from the median-luma sample.
+    let mut centroids: Vec<[f32; 3]> = vec![samples[order[n / 2]]];
+    let mut nearest: Vec<f32> = samples.iter().map(|p| dist2(p, &centroids[0])).collect();
+    while centroids.len() < k {
+        let mut far = 0usize;
+        for i in 1..n {
+            if nearest[i] > nearest[far] {
+                far = i;
+            }
+        }
+        if nearest[far] <= 0.0 {
+            break;
+        }
+        let c = samples[far];
+        for (i, p) in samples.iter().enumerate() {
+            let d = dist2(p, &c);
+            if d < nearest[i] {
+                nearest[i] = d;
+            }
+        }
+        centroids.push(c);
+    }
+    let k = centroids.len();
+
+    let mut assign: Vec<usize> = vec![usize::MAX; n];
+    let mut counts: Vec<usize> = vec![0; k];
+    for _ in 0..max_iters.max(1) {
+        let mut changed = false;
+        for (i, p) in samples.iter().enumerate() {
+            let mut best = 0usize;
+            let mut best_d = f32::MAX;
+            for (j, c) in centroids.iter().enumerate() {
+                let d = dist2(p, c);
+                if d < best_d {
+                    best_d = d;
+                    best = j;
+                }
+            }
+            if assign[i] != best {
+                assign[i] = best;
+                changed = true;
+            }
+        }
+        let mut sums: Vec<[f64; 3]> = vec![[0.0; 3]; k];
+        counts.iter_mut().for_each(|c| *c = 0);
+        for (i, p) in samples.iter().enumerate() {
+            let j = assign[i];
+            sums[j][0] += p[0] as f64;
+            sums[j][1] += p[1] as f64;
+            sums[j][2] += p[2] as f64;
+            counts[j] += 1;
+        }
+        for j in 0..k {
+            if counts[j] > 0 {
+                let c = counts[j] as f64;
+                centroids[j] = [(sums[j][0] / c) as f32, (sums[j][1] / c) as f32, (sums[j][2] / c) as f32];
+            }
+        }
+        if !changed {
+            break;
+        }
+    }
+
+    let mut ranked: Vec<usize> = (0..k).filter(|&j| counts[j] > 0).collect();
+    ranked.sort_by(|&a, &b| counts[b].cmp(&counts[a]).then_with(|| a.cmp(&b)));
+    let out_rgb = unsafe { slice::from_raw_parts_mut(out_rgb_ptr, k * 3) };
+    let out_weights = unsafe { slice::from_raw_parts_mut(out_weights_ptr, k) };
+    for (slot, &j) in ranked.iter().enumerate() {
+        out_rgb[slot * 3] = centroids[j][0] / 255.0;
+        out_rgb[slot * 3 + 1] = centroids[j][1] / 255.0;
+        out_rgb[slot * 3 + 2] = centroids[j][2] / 255.0;
+        out_weights[slot] = counts[j] as f32 / n as f32;
+    }
+    ranked.len()
+}
@@ -0,0 +1,343 @@
+import heapq
+import random
+from collections import deque
+
+
+class ShuffleOrder:
+    """
+    Lazy Fisher-Yates permutation of queue indices with a play cursor.
+
+    Only the part of the permutation that has been played or peeked at is
+    materialized (`_seq`); the remaining pool is a virtual identity array with
+    sparse swap maps, so reset/next/prev/peek are O(1). `_seq[:cursor]` is the
+    back-navigation history and `_seq[cursor + 1:]` the read-ahead that
+    prefetch sees, which is exactly what next() will return.
+    """
+
+    def __init__(self, size=0, current=None, rng=None):
+        self._rng = rng or random.Random()
+        self.reset(size, current)
+
+    def reset(self, size, current=None):
+        self._size = max(0, int(size or 0))
+        self._pos_val = {}
+        self._val_pos = {}
+        self._drawn = 0
+        self._seq = []
+        self._cursor = -1
+        self._wrap_first = None
+        if current is not None and 0 <= int(current) < self._size:
+            self._take(int(current))
+            self._cursor = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def current(self):
+        if 0 <= self._cursor < len(self._seq):
+            return self._seq[self._cursor]
+        return None
+
+    @property
+    def history(self):
+        return list(self._seq[: max(0, self._cursor)])
+
+    def remaining(self):
+        """Tracks not yet played in this cycle."""
+        return self._size - (self._cursor + 1)
+
+    # Pool slots >= _drawn hold the undrawn values; identity unless mapped.
+    def _value_at(self, slot):
+        return self._pos_val.get(slot, slot)
+
+    def _slot_of(self, value):
+        return self._val_pos.get(value, value)
+
+    def _set_slot(self, slot, value):
+        if slot == value:
+            self._pos_val.pop(slot, None)
+            self._val_pos.pop(value, None)
+        else:
+            self._pos_val[slot] = value
+            self._val_pos[value] = slot
+
+    def _in_pool(self, value):
+        slot = self._slot_of(value)
+        return self._drawn <= slot < self._size and self._value_at(slot) == value
+
+    def _take(self, value):
+        # Swap value into the head slot of the pool and consume it.
+        slot = self._slot_of(value)
+        head = self._drawn
+        if slot != head:
+            self._set_slot(slot, self._value_at(head))
+        self._pos_val.pop(head, None)
+        self._val_pos.pop(value, None)
+        self._drawn += 1
+        self._seq.append(value)
+
+    def _draw(self):
+        if self._drawn >= self._size:
+            return None
+        value = self._value_at(self._rng.randrange(self._drawn, self._size))
+        self._take(value)
+        return value
+
+    def peek(self, ahead=1):
+        """
+        Upcoming indices without moving the cursor. Stops at the end of the
+        current cycle.
+        """
+        ahead = max(0, int(ahead))
+        while len(self._seq) - 1 - self._cursor < ahead and self._draw() is not None:
+            pass
+        start = self._cursor + 1
+        return self._seq[start : start + ahead]
+
+    def _next_cycle_first(self):
+        # Decided once so upcoming() and next() agree across the wrap.
+        if self._wrap_first is None and self._size > 0:
+            first = self._rng.randrange(self._size)
+            if first == self.current and self._size > 1:
+                first = (first + 1 + self._rng.randrange(self._size - 1)) % self._size
+            self._wrap_first = first
+        return self._wrap_first
+
+    def upcoming(self):
+        """The index next() will return, looking across the end of the cycle."""
+        ahead = self.peek(1)
+        if ahead:
+            return ahead[0]
+        return self._next_cycle_first()
+
+    def next(self):
+        if self._size <= 0:
+            return None
+        if not self.peek(1):
+            # Cycle exhausted: start a new permutation, never repeating the last track back to back.
+            first = self._next_cycle_first()
+            self.reset(self._size, first)
+            return first
+        self._cursor += 1
+        return self._seq[self._cursor]
+
+    def prev(self):
+        """Step back through history; None when there is none in this cycle."""
+        if self._cursor <= 0:
+            return None
+        self._cursor -= 1
+        return self._seq[self._cursor]
+
+    def jump(self, value):
+        """
+        Make value the current track (user picked it directly). It is moved
+        right after the cursor so history and read-ahead stay intact.
+        """
+        value = int(value)
+        if not 0 <= value < self._size or value == self.current:
+            return
+        nxt = self._cursor + 1
+        if nxt < len(self._seq) and self._seq[nxt] == value:
+            self._cursor = nxt
+            return
+        if self._in_pool(value):
+            self._take(value)
+            self._seq.pop()
+        else:
+            pos = self._seq.index(value)
+            self._seq.pop(pos)
+            if pos <= self._cursor:
+                self._cursor -= 1
+        self._seq.insert(self._cursor + 1, value)
+        self._cursor += 1
+        self._wrap_first = None
+
+    def _rebuild(self, seq, pool, size):
+        self._size = size
+        self._seq = seq
+        self._drawn = len(seq)
+        self._wrap_first = None
+        self._pos_val = {}
+        self._val_pos = {}
+        for offset, value in enumerate(pool):
+            self._set_slot(self._drawn + offset, value)
+
+    def _pool_values(self):
+        return [self._value_at(slot) for slot in range(self._drawn, self._size)]
+
+    def insert(self, index, count=1, up_next=False):
+        """
+        The queue grew by count tracks at index. Existing order is kept;
+        new tracks join the unplayed pool, or play next when up_next is set.
+        """
+        count = max(0, int(count))
+        index = max(0, min(int(index), self._size))
+        if count == 0:
+            return
+
+        def shift(v):
+            return v + count if v >= index else v
+
+        seq = [shift(v) for v in self._seq]
+        pool = [shift(v) for v in self._pool_values()]
+        added = list(range(index, index + count))
+        if up_next:
+            seq[self._cursor + 1 : self._cursor + 1] = added
+        else:
+            pool.extend(added)
+        self._rebuild(seq, pool, self._size + count)
+
+    def remove(self, index):
+        """The track at index left the queue; later indices shift down."""
+        index = int(index)
+        if not 0 <= index < self._size:
+            return
+
+        def shift(v):
+            return v - 1 if v > index else v
+
+        seq = list(self._seq)
+        if index in seq:
+            pos = seq.index(index)
+            seq.pop(pos)
+            if pos <= self._cursor:
+                self._cursor -= 1
+        pool = [shift(v) for v in self._pool_values() if v != index]
+        self._rebuild([shift(v) for v in seq], pool, self._size - 1)
+
+
+class SmartShuffleOrder(ShuffleOrder):
+    """
+    MODE_SMART order: the pool is drawn best-first by ListeningScores instead
+    of uniformly; an artist's scores are quartered for each of the last few
+    picks that were theirs, so one favourite cannot take over the queue.
+
+    Each artist keeps a max-heap of its undrawn tracks, and a top heap holds
+    one versioned entry per artist (its best track times its current penalty).
+    A penalty change just pushes a fresh entry for that artist, so a pick is
+    O(log n) no matter how the penalties move; stale entries are skipped.
+
+    Like ShuffleOrder it is not locked: peeks mutate the heaps, so only the
+    main thread may touch it (workers get precomputed indices).
+    """
+
+    DIVERSITY_WINDOW = 3
+    DIVERSITY_PENALTY = 0.25
+    # Random tie-break so unheard tracks (score 0) still come out shuffled.
+    JITTER = 1.0
+
+    def __init__(self, size=0, current=None, rng=None, keys=None, scores=None):
+        self._keys = list(keys or [])
+        self._scores = scores
+        super().__init__(size, current, rng)
+
+    def reset(self, size, current=None, keys=None, scores=None):
+        size = max(0, int(size or 0))
+        if keys is not None:
+            self._keys = list(keys)
+        if scores is not None:
+            self._scores = scores
+        self._keys = self._keys[:size] + [("", "", "")] * (size - len(self._keys))
+        self._taken = set()
+        self._recent = deque()
+        self._recent_counts = {}
+        self._size = size
+        self._build_heaps(range(size))
+        super().reset(size, current)
+
+    def _artist_of(self, value):
+        return self._keys[value][1] or f"#{value}"
+
+    def _base_score(self, value):
+        tid, artist_key, album_key = self._keys[value]
+        base = self._scores.score(tid, artist_key, album_key) if self._scores is not None else 0.0
+        return base + (self._rng.random() * self.JITTER)
+
+    def _build_heaps(self, values):
+        self._artist_heaps = {}
+        for value in values:
+            if value not in self._taken:
+                self._artist_heaps.setdefault(self._artist_of(value), []).append((-self._base_score(value), value))
+        self._top = []
+        self._top_version = {}
+        for artist, heap in self._artist_heaps.items():
+            heapq.heapify(heap)
+            self._push_artist(artist)
+
+    def _push_artist(self, artist):
+        heap = self._artist_heaps.get(artist)
+        while heap and heap[0][1] in self._taken:
+            heapq.heappop(heap)
+        version = self._top_version.get(artist, 0) + 1
+        self._top_version[artist] = version
+        if heap:
+            penalty = self.DIVERSITY_PENALTY ** self._recent_counts.get(artist, 0)
+            heapq.heappush(self._top, (heap[0][0] * penalty, artist, version))
+
+    def _note_pick(self, value):
+        artist = self._artist_of(value)
+        self._recent.append(artist)
+        self._recent_counts[artist] = self._recent_counts.get(artist, 0) + 1
+        changed = {artist}
+        if len(self._recent) > self.DIVERSITY_WINDOW:
+            old = self._recent.popleft()
+            self._recent_counts[old] -= 1
+            changed.add(old)
+        for name in changed:
+            if name in self._artist_heaps:
+                self._push_artist(name)
+
+    def _in_pool(self, value):
+        return 0 <= value < self._size and value not in self._taken
+
+    def _take(self, value):
+        self._taken.add(value)
+        self._drawn += 1
+        self._seq.append(value)
+        self._note_pick(value)
+
+    def _draw(self):
+        while self._top:
+            _, artist, version = heapq.heappop(self._top)
+            if self._top_version.get(artist) != version:
+                continue
+            heap = self._artist_heaps.get(artist)
+            while heap and heap[0][1] in self._taken:
+                heapq.heappop(heap)
+            if not heap:
+                continue
+            _, value = heapq.heappop(heap)
+            self._take(value)
+            return value
+        return None
+
+    def _next_cycle_first(self):
+        if self._wrap_first is None and self._size > 0:
+            current = self.current
+            candidates = [v for v in range(self._size) if v != current] or [0]
+            self._wrap_first = max(candidates, key=self._base_score)
+        return self._wrap_first
+
+    def _pool_values(self):
+        return [v for v in range(self._size) if v not in self._taken]
+
+    def _rebuild(self, seq, pool, size):
+        self._size = size
+        self._seq = seq
+        self._drawn = len(seq)
+        self._wrap_first = None
+        self._taken = set(seq)
+        self._build_heaps(pool)
+
+    def insert(self, index, count=1, up_next=False):
+        count = max(0, int(count))
+        at = max(0, min(int(index), self._size))
+        if count:
+            self._keys[at:at] = [("", "", "")] * count
+        super().insert(index, count, up_next)
+
+    def remove(self, index):
+        if 0 <= int(index) < self._size:
+            self._keys.pop(int(index))
+        super().remove(index)
@@ -0,0 +1,139 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app_async import AsyncBridge
+from app_executor import LANE_NETWORK, TaskExecutor
+from tidal_backend import TidalBackend
+
+
+@pytest.fixture
+def bridge():
+    b = AsyncBridge(executor=TaskExecutor(limits={LANE_NETWORK: 2}))
+    yield b
+    b.shutdown()
+
+
+def test_call_runs_blocking_fn_on_lane_and_delivers_via_dispatch(bridge):
+    delivered = []
+    bridge.set_dispatch(lambda fn, value: delivered.append((fn, value)))
+    loop_thread = []
+
+    async def job():
+        loop_thread.append(threading.current_thread().name)
+        return await bridge.call(lambda a, b: (threading.current_thread().name, a * b), 6, 7)
+
+    fut = bridge.run(job(), on_done=print)
+    name, value = fut.result(2)
+
+    assert value == 42
+    assert name.startswith("exec-network")
+    assert loop_thread == ["asyncio-bridge"]
+    assert _wait(lambda: delivered == [(print, (name, 42))])
+
+
+def test_fan_out_is_bounded_by_the_lane(bridge):
+    lock = threading.Lock()
+    state = {"now": 0, "peak": 0}
+
+    def fetch(i):
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+        time.sleep(0.01)
+        with lock:
+            state["now"] -= 1
+        return i
+
+    async def job():
+        return await bridge.gather_limited([bridge.call(fetch, i) for i in range(10)], limit=10)
+
+    assert bridge.run(job()).result(5) == list(range(10))
+    assert state["peak"] == 2
+
+
+def test_timeout_raises_and_reports_on_error(bridge):
+    release = threading.Event()
+    errors = []
+
+    async def job():
+        return await bridge.call(release.wait, 2, timeout=0.05)
+
+    fut = bridge.run(job(), on_error=errors.append)
+    with pytest.raises(asyncio.TimeoutError):
+        fut.result(2)
+    release.set()
+    assert _wait(lambda: len(errors) == 1 and isinstance(errors[0], asyncio.TimeoutError))
+
+
+def test_cancel_skips_callbacks(bridge):
+    release = threading.Event()
+    done = []
+
+    async def job():
+        return await bridge.call(release.wait, 2)
+
+    fut = bridge.run(job(), on_done=done.append, on_error=done.append)
+    time.sleep(0.05)
+    assert fut.cancel()
+    release.set()
+    time.sleep(0.05)
+    assert done == []
+
+
+def test_search_many_async_drops_failed_variants(monkeypatch, bridge):
+    import app_async
+
+    monkeypatch.setattr(app_async, "get_bridge", lambda: bridge)
+    backend = TidalBackend.__new__(TidalBackend)
+
+    def search_items(query):
+        if query == "bad":
+            raise RuntimeError("boom")
+        return {"tracks": [query]}
+
+    backend.search_items = search_items
+
+    assert bridge.run(backend.search_many_async(["a", "bad", "b"])).result(2) == [{"tracks": ["a"]}, {"tracks": ["b"]}]
+    with pytest.raises(RuntimeError):
+        bridge.run(backend.search_many_async(["bad"])).result(2)
+
+
+
+def test_backend_async_variants_run_on_the_network_lane(monkeypatch, bridge):
+    import app_async
+
+    monkeypatch.setattr(app_async, "get_bridge", lambda: bridge)
+    backend = TidalBackend.__new__(TidalBackend)
+    threads = []
+    library = [SimpleNamespace(id=i) for i in range(1, 251)]
+
+    def tracks(limit=None, offset=0):
+        threads.append(threading.current_thread().name)
+        return library[offset : offset + limit]
+
+    backend.user = SimpleNamespace(favorites=SimpleNamespace(tracks=tracks))
+    backend.get_stream_url = lambda track: (threads.append(threading.current_thread().name), f"url-{track.id}")[1]
+    backend.peek_lyrics = lambda track_id, disk=True: (track_id == 1, "cached")
+    backend.get_lyrics = lambda track_id: (threads.append(threading.current_thread().name), f"lyrics-{track_id}")[1]
+
+    head = bridge.run(backend.get_favorite_tracks_async(limit=100)).result(2)
+    assert [t.id for t in head] == list(range(1, 101))
+    full = bridge.run(backend.get_favorite_tracks_async(limit=20000, timeout=None)).result(2)
+    assert len(full) == 250
+    assert bridge.run(backend.get_stream_url_async(SimpleNamespace(id=7))).result(2) == "url-7"
+    assert bridge.run(backend.get_lyrics_async(1)).result(2) == "cached"
+    assert bridge.run(backend.get_lyrics_async(2)).result(2) == "lyrics-2"
+    assert threads and all(name.startswith("exec-network") for name in threads)
+
+
+def _wait(cond, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if cond():
+            return True
+        time.sleep(0.005)
+    return False
@@ -0,0 +1,106 @@
+import threading
+import time
+
+import app_executor
+from app_executor import LANE_AUDIO, LANE_DISK, LANE_NETWORK, TaskExecutor
+
+
+def _wait(cond, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if cond():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_lane_runs_at_most_its_limit():
+    ex = TaskExecutor(limits={LANE_DISK: 2})
+    lock = threading.Lock()
+    state = {"now": 0, "peak": 0}
+
+    def job():
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+        time.sleep(0.01)
+        with lock:
+            state["now"] -= 1
+
+    tasks = [ex.submit(LANE_DISK, job) for _ in range(6)]
+
+    assert all(t.wait(2) for t in tasks)
+    assert state["peak"] == 2
+    m = ex.metrics()[LANE_DISK]
+    assert m["completed"] == 6 and m["queued"] == 0 and m["running"] == 0
+    assert m["max_queued"] >= 3
+
+
+def test_callbacks_go_through_dispatch_with_result_or_error():
+    calls = []
+    ex = TaskExecutor(dispatch=lambda fn, value: calls.append((fn.__name__, value)))
+
+    def on_done(value):
+        pass
+
+    def on_error(exc):
+        pass
+
+    ok = ex.submit(LANE_NETWORK, lambda a, b: a + b, 2, 3, on_done=on_done)
+    bad = ex.submit(LANE_NETWORK, lambda: 1 / 0, on_error=on_error)
+    assert ok.wait(2) and bad.wait(2)
+    assert _wait(lambda: len(calls) == 2)
+
+    assert ("on_done", 5) in calls
+    assert any(name == "on_error" and isinstance(v, ZeroDivisionError) for name, v in calls)
+    assert ex.metrics()[LANE_NETWORK]["failed"] == 1
+
+
+def test_cancel_drops_queued_task_and_silences_running_one():
+    ex = TaskExecutor(limits={LANE_AUDIO: 1})
+    gate = threading.Event()
+    seen = []
+
+    def running():
+        gate.wait(2)
+        seen.append(app_executor.cancelled())
+
+    first = ex.submit(LANE_AUDIO, running, on_done=seen.append)
+    queued = ex.submit(LANE_AUDIO, lambda: seen.append("ran"))
+    assert _wait(lambda: ex.metrics()[LANE_AUDIO]["running"] == 1)
+
+    assert queued.cancel() is True
+    assert first.cancel() is False
+    gate.set()
+
+    assert first.wait(2) and queued.wait(2)
+    assert seen == [True]
+    assert ex.metrics()[LANE_AUDIO]["cancelled"] == 1
+
+
+def test_idle_workers_are_reused_and_exit():
+    ex = TaskExecutor(idle_timeout=0.1)
+    ex.submit(LANE_NETWORK, lambda: None).wait(2)
+    assert _wait(lambda: ex.metrics()[LANE_NETWORK]["running"] == 0)
+    ex.submit(LANE_NETWORK, lambda: None).wait(2)
+    assert ex.metrics()[LANE_NETWORK]["workers"] == 1
+
+    assert _wait(lambda: ex.metrics()[LANE_NETWORK]["workers"] == 0)
+
+
+class _TimeoutReportingCondition(threading.Condition):
+    # A notify that races the wait timeout: consumed, but reported as a timeout.
+    def wait(self, timeout=None):
+        super().wait(timeout)
+        return False
+
+
+def test_notify_reported_as_timeout_keeps_idle_accounting():
+    ex = TaskExecutor(idle_timeout=5.0)
+    lane = ex._lanes[LANE_AUDIO]
+    lane.cond = _TimeoutReportingCondition(ex._lock)
+    for _ in range(3):
+        task = ex.submit(LANE_AUDIO, lambda: None)
+        assert task.wait(1.0)
+        assert _wait(lambda: lane.idle == 1)
+    assert lane.workers == 1 and lane.wakeups == 0
@@ -0,0 +1,57 @@
+import logging
+import logging.handlers
+import threading
+
+import pytest
+
+import app_logging
+from app_logging import RateLimitedLogger
+
+
+@pytest.fixture
+def restore_root():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield root
+    app_logging.shutdown_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_setup_logging_writes_through_queue_listener(tmp_path, monkeypatch, restore_root):
+    log_file = tmp_path / "logs" / "hiresti.log"
+    monkeypatch.setenv("HIRESTI_LOG_FILE", str(log_file))
+    monkeypatch.setenv("HIRESTI_LOG_LEVEL", "INFO")
+    app_logging.setup_logging()
+
+    handlers = restore_root.handlers
+    assert len(handlers) == 1 and isinstance(handlers[0], logging.handlers.QueueHandler)
+    listener_thread = [t for t in threading.enumerate() if t is app_logging._listener._thread]
+    assert listener_thread
+
+    logging.getLogger("hot.path").info("rendered page %s", 3)
+    logging.getLogger("hot.path").debug("not written")
+    app_logging.shutdown_logging()
+
+    text = log_file.read_text(encoding="utf-8")
+    assert "hot.path | rendered page 3" in text
+    assert "not written" not in text
+
+
+def test_rate_limited_logger_keys_by_template(caplog):
+    now = [0.0]
+    log = RateLimitedLogger(logging.getLogger("hot.sort"), interval_sec=5.0, clock=lambda: now[0])
+    caplog.set_level(logging.INFO, logger="hot.sort")
+
+    for n in range(4):
+        log.info("sort path: Rust (%s, total=%s)", "albums", n)
+    log.info("page render: %s", 1)
+    now[0] = 6.0
+    log.info("sort path: Rust (%s, total=%s)", "albums", 9)
+    log.debug("sort path: Rust (%s, total=%s)", "albums", 10)
+
+    assert [r.getMessage() for r in caplog.records] == [
+        "sort path: Rust (albums, total=0)",
+        "page render: 1",
+        "sort path: Rust (albums, total=9) (+3 similar suppressed)",
+    ]
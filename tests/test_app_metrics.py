@@ -0,0 +1,99 @@
+import importlib.util
+import json
+import os
+
+import pytest
+
+import app_metrics
+from app_metrics import Histogram, MetricsRegistry
+
+
+def _diff_tool():
+    path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "tools", "metrics_diff.py")
+    spec = importlib.util.spec_from_file_location("metrics_diff", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_histogram_quantiles_use_bucket_bounds():
+    h = Histogram(bounds=(0.001, 0.01, 0.1))
+    for v in [0.0005] * 90 + [0.05] * 9 + [0.5]:
+        h.observe(v)
+
+    d = h.to_dict()
+    assert d["count"] == 100
+    assert d["p50"] == 0.001
+    assert d["p95"] == 0.1
+    assert d["p99"] == 0.1
+    assert d["max"] == 0.5 and d["min"] == 0.0005
+    assert d["buckets"] == {"0.001": 90, "0.1": 9, "+inf": 1}
+
+
+def test_registry_counters_labels_and_cache_ratios():
+    reg = MetricsRegistry()
+    reg.inc("spectrum_frames_dropped", 3)
+    reg.inc("spectrum_frames_dropped")
+    reg.set_gauge("queue_depth", 7, lane="network")
+    for hit in (True, True, False, True):
+        reg.cache_lookup("covers", hit)
+    reg.cache_lookup("lyrics", False)
+    with reg.timer("tidal_api_seconds", endpoint="search"):
+        pass
+    reg.register_collector("lanes", lambda: {"network": {"queued": 0}})
+    reg.register_collector("broken", lambda: 1 / 0)
+
+    snap = reg.snapshot(app_version="1.2.3")
+
+    assert snap["app_version"] == "1.2.3"
+    assert snap["counters"] == {"spectrum_frames_dropped": 4}
+    assert snap["gauges"] == {"queue_depth{lane=network}": 7}
+    assert snap["histograms"]["tidal_api_seconds{endpoint=search}"]["count"] == 1
+    assert snap["cache_hit_ratio"]["covers"] == {"hits": 3, "lookups": 4, "ratio": 0.75}
+    assert snap["cache_hit_ratio"]["lyrics"]["ratio"] == 0.0
+    assert snap["lanes"] == {"network": {"queued": 0}}
+    assert "error" in snap["broken"]
+    text = app_metrics.format_text(snap)
+    assert "covers" in text and "75.0%" in text and "tidal_api_seconds{endpoint=search}" in text
+
+
+def test_timed_counts_errors_and_still_observes():
+    app_metrics.REGISTRY.reset()
+
+    @app_metrics.timed("fetch_seconds", endpoint="x")
+    def fetch(fail):
+        if fail:
+            raise ValueError("boom")
+        return 1
+
+    assert fetch(False) == 1
+    with pytest.raises(ValueError):
+        fetch(True)
+
+    snap = app_metrics.snapshot()
+    assert snap["histograms"]["fetch_seconds{endpoint=x}"]["count"] == 2
+    assert snap["counters"] == {"fetch_seconds_errors{endpoint=x}": 1}
+    app_metrics.REGISTRY.reset()
+
+
+def test_json_dump_round_trips_through_metrics_diff(tmp_path, monkeypatch):
+    app_metrics.REGISTRY.reset()
+    for _ in range(10):
+        app_metrics.observe("ui_tick_seconds", 0.002)
+    app_metrics.cache_lookup("stream_url", True)
+    old = app_metrics.write_json(str(tmp_path / "old.json"), app_version="1.0")
+    for _ in range(40):
+        app_metrics.observe("ui_tick_seconds", 0.02)
+    new = app_metrics.write_json(str(tmp_path / "new.json"), app_version="1.1")
+    app_metrics.REGISTRY.reset()
+
+    with open(new, encoding="utf-8") as f:
+        assert json.load(f)["version"] == app_metrics.SNAPSHOT_VERSION
+    metrics_diff = _diff_tool()
+    assert metrics_diff.main([old, new]) == 1
+    assert metrics_diff.main([old, new, "--tolerance", "100"]) == 0
+
+    monkeypatch.setenv(app_metrics.DUMP_ENV, "0")
+    assert app_metrics.dump_path() is None
+    monkeypatch.setenv(app_metrics.DUMP_ENV, "1")
+    assert app_metrics.dump_path() == os.path.expanduser(app_metrics.DEFAULT_DUMP_PATH)
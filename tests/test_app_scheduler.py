@@ -0,0 +1,94 @@
+import threading
+import time
+
+import app_scheduler
+from app_scheduler import (
+    PRIORITY_FAVORITES,
+    PRIORITY_PREFETCH,
+    PRIORITY_SESSION,
+    PRIORITY_VISIBLE,
+    StartupScheduler,
+)
+
+
+def _wait(cond, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if cond():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_background_lane_waits_for_session_and_visible_work():
+    sched = StartupScheduler(grace_sec=0)
+    release = threading.Event()
+    order = []
+
+    sched.submit("session", lambda: (release.wait(2), order.append("session")), PRIORITY_SESSION)
+    sched.submit("favorites", lambda: order.append("favorites"), PRIORITY_FAVORITES)
+    sched.submit("home", lambda: order.append("home"), PRIORITY_VISIBLE)
+
+    assert _wait(lambda: "home" in order)
+    time.sleep(0.05)
+    assert "favorites" not in order
+
+    release.set()
+    assert _wait(lambda: len(order) == 3)
+    assert order == ["home", "session", "favorites"]
+    assert not sched.busy()
+
+
+def test_lane_concurrency_limit():
+    sched = StartupScheduler(limits={PRIORITY_PREFETCH: 1}, grace_sec=0)
+    lock = threading.Lock()
+    state = {"now": 0, "peak": 0, "done": 0}
+
+    def job():
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+        time.sleep(0.01)
+        with lock:
+            state["now"] -= 1
+            state["done"] += 1
+
+    for i in range(4):
+        sched.submit(f"prefetch{i}", job, PRIORITY_PREFETCH)
+
+    assert _wait(lambda: state["done"] == 4)
+    assert state["peak"] == 1
+
+
+def test_interaction_holds_background_until_quiet():
+    now = [100.0]
+    sched = StartupScheduler(grace_sec=5.0, clock=lambda: now[0])
+    ran = threading.Event()
+
+    sched.note_interaction()
+    sched.submit("favorites", ran.set, PRIORITY_FAVORITES)
+    sched._timer.cancel()
+    assert not ran.wait(0.05)
+
+    now[0] += 5.0
+    sched._on_quiet()
+    assert ran.wait(2)
+
+
+def test_on_done_goes_through_dispatch_and_timings_are_kept(monkeypatch):
+    spans = []
+    monkeypatch.setattr(app_scheduler.app_startup, "record", lambda name, s, e: spans.append(name))
+    dispatched = []
+    sched = StartupScheduler(dispatch=lambda fn, result: dispatched.append((fn, result)), grace_sec=0)
+    got = []
+
+    sched.submit("session", lambda: 42, PRIORITY_SESSION, got.append)
+    sched.submit("broken", lambda: 1 / 0, PRIORITY_SESSION, got.append)
+
+    assert _wait(lambda: len(sched.timings()) == 2)
+    assert [(fn, result) for fn, result in dispatched] == [(got.append, 42)]
+    assert [(t["name"], t["lane"], t["ok"]) for t in sched.timings()] == [
+        ("session", "session", True),
+        ("broken", "session", False),
+    ]
+    assert spans == ["task:session", "task:broken"]
@@ -0,0 +1,92 @@
+import importlib.util
+import json
+import logging
+import os
+import sys
+
+import app_startup
+from app_lazy import lazy_module
+
+
+def test_lazy_module_imports_on_first_use_and_is_timed(monkeypatch):
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    mod = lazy_module("colorsys")
+    assert not mod.loaded
+    assert "colorsys" not in sys.modules
+
+    assert mod.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert mod.loaded
+    assert any(s["name"] == "lazy_import:colorsys" for s in app_startup.breakdown()["spans"])
+
+
+def test_lazy_module_import_errors_surface_on_access():
+    mod = lazy_module("no_such_module_hiresti")
+    try:
+        mod.anything
+    except ImportError:
+        pass
+    else:
+        raise AssertionError("expected ImportError")
+    assert not mod.loaded
+
+
+def test_startup_report_logs_phases_once(monkeypatch, caplog):
+    monkeypatch.setattr(app_startup, "_spans", [])
+    monkeypatch.setattr(app_startup, "_marks", {})
+    monkeypatch.setattr(app_startup, "_reported", False)
+    with app_startup.phase("backend_init"):
+        pass
+    app_startup.mark("imports")
+    app_startup.mark("first_frame")
+    first = app_startup.breakdown()["marks"]["first_frame"]
+    app_startup.mark("first_frame")
+    assert app_startup.breakdown()["marks"]["first_frame"] == first
+
+    with caplog.at_level(logging.INFO, logger="app_startup"):
+        app_startup.report()
+        app_startup.report()
+    lines = [r.getMessage() for r in caplog.records if r.name == "app_startup"]
+    assert len(lines) == 1
+    assert "backend init" in lines[0] and "first frame at" in lines[0]
+
+
+def test_write_trace_only_when_enabled(monkeypatch, tmp_path):
+    monkeypatch.delenv(app_startup.TRACE_ENV, raising=False)
+    assert app_startup.trace_path() is None
+    assert app_startup.write_trace() is None
+
+    path = tmp_path / "trace.json"
+    monkeypatch.setenv(app_startup.TRACE_ENV, str(path))
+    monkeypatch.setattr(app_startup, "_spans", [])
+    monkeypatch.setattr(app_startup, "_marks", {})
+    app_startup.record("app_init", app_startup._T0, app_startup._T0 + 0.25)
+    app_startup.mark("first_frame")
+
+    assert app_startup.write_trace() == str(path)
+    data = json.loads(path.read_text())
+    assert data["version"] == app_startup.TRACE_VERSION
+    assert data["spans"] == [{"name": "app_init", "start": 0.0, "duration": 0.25}]
+    assert "first_frame" in data["marks"]
+
+
+def _bench_tool():
+    path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "tools", "bench_startup.py")
+    spec = importlib.util.spec_from_file_location("bench_startup", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_bench_summary_and_regression_check():
+    bench = _bench_tool()
+    traces = [
+        {"marks": {"first_frame": ff, "imports": 0.1}, "spans": [{"name": "ui_build", "duration": 0.2}]}
+        for ff in (0.9, 1.0, 1.5)
+    ]
+    summary = bench.summarize(traces)
+
+    assert summary["first_frame_ms"] == 1000.0
+    assert summary["ui_build_ms"] == 200.0
+    assert bench.evaluate(summary, {"first_frame_ms": 900.0}) == []
+    assert bench.evaluate(summary, {"first_frame_ms": 700.0})
+    assert bench.evaluate(summary, None, budget_ms=800.0)
@@ -0,0 +1,84 @@
+import threading
+
+from app_ui_queue import UIQueue
+
+
+class _Loop:
+    """Records scheduled flushes instead of running a GLib main loop."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, delay, callback):
+        self.calls.append((delay, callback))
+
+    def run_next(self):
+        _delay, callback = self.calls.pop(0)
+        return callback()
+
+
+def test_posts_batch_into_one_flush_and_keyed_updates_collapse():
+    loop = _Loop()
+    q = UIQueue(schedule=loop)
+    seen = []
+
+    q.post(seen.append, "a")
+    q.post(seen.append, "queue-1", key="queue")
+    q.post(seen.append, "b")
+    q.post(seen.append, "queue-2", key="queue")
+
+    assert len(loop.calls) == 1
+    assert loop.run_next() is False
+    assert seen == ["a", "queue-2", "b"]
+    stats = q.stats()
+    assert stats["flushes"] == 1 and stats["items"] == 3 and stats["coalesced"] == 1
+
+
+def test_next_flush_waits_for_the_next_frame():
+    now = [10.0]
+    loop = _Loop()
+    q = UIQueue(schedule=loop, frame_sec=0.016, clock=lambda: now[0])
+
+    q.post(lambda: None)
+    assert loop.calls[0][0] == 0.0
+    loop.run_next()
+
+    now[0] += 0.004
+    q.post(lambda: None)
+    assert abs(loop.calls[0][0] - 0.012) < 1e-9
+
+
+def test_over_budget_work_carries_over():
+    now = [0.0]
+    loop = _Loop()
+    q = UIQueue(schedule=loop, frame_sec=0.0, budget_sec=0.008, clock=lambda: now[0])
+    seen = []
+
+    def slow(tag):
+        now[0] += 0.005
+        seen.append(tag)
+
+    for tag in "abcd":
+        q.post(slow, tag)
+    loop.run_next()
+    assert seen == ["a", "b"]
+    assert len(loop.calls) == 1
+
+    loop.run_next()
+    assert seen == ["a", "b", "c", "d"]
+    stats = q.stats()
+    assert stats["deferred"] == 2 and stats["over_budget"] == 2 and stats["max_ms"] >= 10.0
+
+
+def test_failing_update_does_not_stop_the_batch_and_no_schedule_runs_inline():
+    loop = _Loop()
+    q = UIQueue(schedule=loop)
+    seen = []
+    q.post(lambda: 1 / 0)
+    q.post(seen.append, 1)
+    loop.run_next()
+    assert seen == [1]
+
+    inline = UIQueue()
+    inline.post(seen.append, threading.current_thread().name)
+    assert seen[-1] == threading.current_thread().name
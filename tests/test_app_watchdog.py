@@ -0,0 +1,76 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import app_metrics
+import app_watchdog
+from app_watchdog import MainLoopWatchdog
+
+
+@pytest.fixture
+def loop():
+    # A one-thread pool stands in for the GLib main loop.
+    pool = ThreadPoolExecutor(max_workers=1)
+    ident = pool.submit(threading.get_ident).result()
+    yield pool, ident
+    pool.shutdown(wait=False)
+
+
+def _blocking_callback():
+    time.sleep(0.3)
+
+
+def test_stall_is_captured_with_callback_source(loop):
+    pool, ident = loop
+    app_metrics.REGISTRY.reset()
+    stalls = []
+    dog = MainLoopWatchdog(pool.submit, threshold_sec=0.1, interval_sec=0.02, thread_ident=ident, on_stall=stalls.append)
+    dog.start()
+    time.sleep(0.05)
+    pool.submit(_blocking_callback)
+
+    assert _wait(lambda: len(stalls) == 1)
+    dog.stop()
+    stall = stalls[0]
+    assert stall["source"].startswith("_blocking_callback (tests/test_app_watchdog.py:")
+    assert 100.0 <= stall["duration_ms"] <= 400.0
+    assert any("_blocking_callback" in line for line in stall["stack"])
+
+    stats = dog.stats()
+    assert stats["stalls"] == 1 and "stack" not in stats["recent"][0]
+    snap = app_metrics.snapshot()
+    assert snap["counters"]["main_loop_stalls"] == 1
+    assert snap["histograms"]["main_loop_stall_seconds"]["count"] == 1
+    app_metrics.REGISTRY.reset()
+
+
+def test_responsive_loop_records_nothing(loop):
+    pool, ident = loop
+    stalls = []
+    dog = MainLoopWatchdog(pool.submit, threshold_sec=0.1, interval_sec=0.01, thread_ident=ident, on_stall=stalls.append)
+    dog.start()
+    for _ in range(10):
+        pool.submit(time.sleep, 0.01)
+    time.sleep(0.3)
+    dog.stop()
+    assert stalls == [] and dog.stats()["stalls"] == 0
+
+
+def test_threshold_from_env(monkeypatch):
+    monkeypatch.delenv(app_watchdog.WATCHDOG_ENV, raising=False)
+    assert app_watchdog.threshold_from_env() == app_watchdog.DEFAULT_THRESHOLD_SEC
+    monkeypatch.setenv(app_watchdog.WATCHDOG_ENV, "500")
+    assert app_watchdog.threshold_from_env() == 0.5
+    monkeypatch.setenv(app_watchdog.WATCHDOG_ENV, "0")
+    assert app_watchdog.threshold_from_env() is None
+
+
+def _wait(cond, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if cond():
+            return True
+        time.sleep(0.005)
+    return False
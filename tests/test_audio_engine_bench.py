@@ -0,0 +1,42 @@
+import importlib.util
+import os
+import wave
+
+
+def _bench_tool():
+    path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "tools", "bench_audio_engine.py")
+    spec = importlib.util.spec_from_file_location("bench_audio_engine", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_generated_wav_has_requested_format(tmp_path):
+    bench = _bench_tool()
+    path = bench.write_wav(str(tmp_path / "sweep.wav"), seconds=1.5, rate=8000, bits=24)
+
+    with wave.open(path, "rb") as w:
+        assert (w.getnchannels(), w.getsampwidth(), w.getframerate()) == (2, 3, 8000)
+        assert w.getnframes() == 12000
+
+
+def test_summary_and_regression_check():
+    bench = _bench_tool()
+    runs = [
+        {"first_audio_ms": 80.0, "seek_ms": [20.0, 30.0], "spectrum_fps": 30.0, "cpu_sec_per_min": 1.2, "errors": []},
+        {"first_audio_ms": 100.0, "seek_ms": [25.0], "spectrum_fps": 28.0, "cpu_sec_per_min": 1.0, "errors": []},
+        {"first_audio_ms": 90.0, "seek_ms": [], "errors": ["seek to 3.0s did not resume"]},
+    ]
+    summary = bench.summarize({"wav_44100_16": runs})["wav_44100_16"]
+
+    assert summary["first_audio_ms"] == 90.0
+    assert summary["seek_ms"] == 25.0
+    assert summary["spectrum_fps"] == 29.0
+    assert summary["output_switch_ms"] is None
+    assert summary["errors"] == 1
+
+    ok = dict(summary, errors=0)
+    assert bench.evaluate({"f": ok}, {"f": dict(ok, first_audio_ms=85.0)}) == []
+    assert bench.evaluate({"f": ok}, {"f": dict(ok, first_audio_ms=50.0)})
+    assert bench.evaluate({"f": ok}, {"f": dict(ok, spectrum_fps=40.0)})
+    assert bench.evaluate({"f": summary}, None)
@@ -0,0 +1,51 @@
+import importlib.util
+import os
+
+TOOLS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "tools")
+
+
+def _bench_tool():
+    path = os.path.join(TOOLS, "bench_backend.py")
+    spec = importlib.util.spec_from_file_location("bench_backend", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_backend_runs_against_fake_session():
+    bench = _bench_tool()
+    session = bench.FakeTidalSession(library_size=250, seed=3)
+    backend = bench.make_backend(session)
+
+    assert [t.id for t in backend.get_favorite_tracks(limit=250)] == list(range(1, 251))
+    assert session.calls["favorite_tracks"] == 3
+    word = session.tracks()[0].name.split()[0].lower()
+    found = backend.search_items(word)
+    assert found["tracks"] and all(word in t.name.lower() for t in found["tracks"])
+    assert backend.get_home_page()
+    no_picture = next(a for a in session.artists() if a.picture is None and session._albums_by_artist.get(a.id))
+    assert backend.get_artist_artwork_url(no_picture, 320).startswith("https://resources.tidal.com/images/")
+
+
+def test_failures_and_latency_are_injected():
+    bench = _bench_tool()
+    session = bench.FakeTidalSession(library_size=100, latency_ms=5, failure_rate=1.0)
+    backend = bench.make_backend(session)
+
+    assert backend.get_favorite_tracks(limit=100) == []
+    assert backend.search_items("night") == {"artists": [], "albums": [], "tracks": []}
+    result = bench.run_scenario("home", 100, runs=1, latency_ms=5)
+    assert result["requests"] == 1 and result["median_ms"] >= 5.0
+
+
+def test_playlist_sync_scenario_and_regression_check():
+    bench = _bench_tool()
+    result = bench.run_scenario("playlist_sync", 400, runs=1)
+    assert result["items"] == 200
+
+    settings = {"latency_ms": 0.0, "jitter_ms": 0.0, "failure_rate": 0.0}
+    summary = {"settings": settings, "results": {"search@1000": {"median_ms": 30.0, "requests": 3}}}
+    assert bench.evaluate(summary, {"settings": settings, "results": {"search@1000": {"median_ms": 28.0, "requests": 3}}}) == []
+    assert bench.evaluate(summary, {"settings": settings, "results": {"search@1000": {"median_ms": 10.0, "requests": 3}}})
+    assert bench.evaluate(summary, {"settings": settings, "results": {"search@1000": {"median_ms": 30.0, "requests": 2}}})
+    assert bench.evaluate(summary, {"settings": {"latency_ms": 40.0}, "results": {}}) == []
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+import cover_palette
+from rust_viz import RustVizCore
+
+
+def _rgba(colors, counts, width=10):
+    data = bytearray()
+    for color, count in zip(colors, counts):
+        for _ in range(count):
+            data.extend(bytes(color) + b"\xff")
+    height = len(data) // (width * 4)
+    return bytes(data[: width * 4 * height]), width, height
+
+
+def test_python_palette_finds_clusters_in_share_order():
+    pixels, w, h = _rgba([(250, 10, 10), (10, 10, 250), (10, 250, 10)], [60, 30, 10])
+    palette = cover_palette._kmeans_palette_py(pixels, w, h, w * 4, 4, 3, 8)
+
+    assert [round(p[3], 2) for p in palette] == [0.6, 0.3, 0.1]
+    assert palette[0][0] > 0.9 and palette[1][2] > 0.9 and palette[2][1] > 0.9
+
+
+def test_palette_skips_transparent_pixels_and_mean_matches_cover_average():
+    pixels = bytes([200, 100, 0, 255, 0, 0, 0, 0] * 8)
+    palette = cover_palette._kmeans_palette_py(pixels, 4, 4, 16, 4, 5, 8)
+
+    assert len(palette) == 1
+    assert cover_palette.palette_mean_rgb(palette) == pytest.approx((200 / 255, 100 / 255, 0.0))
+    assert cover_palette.palette_mean_rgb([]) is None
+
+
+def test_rust_palette_matches_python_fallback():
+    core = RustVizCore()
+    rng = random.Random(7)
+    w = h = 48
+    pixels = bytes(rng.randrange(256) if i % 4 != 3 else 255 for i in range(w * h * 4))
+    rust = core.extract_palette(pixels, w, h, w * 4, 4, 5, 8) if core.available else None
+    if rust is None:
+        pytest.skip("rust_viz_core with extract_palette is not built")
+    py = cover_palette._kmeans_palette_py(pixels, w, h, w * 4, 4, 5, 8)
+
+    assert len(rust) == len(py)
+    for a, b in zip(rust, py):
+        assert a == pytest.approx(b, abs=1e-5)
+
+
+def test_palette_cache_roundtrip(tmp_path):
+    palette = [(0.5, 0.25, 0.125, 0.75), (0.1, 0.2, 0.3, 0.25)]
+    assert cover_palette.load_cached_palette(str(tmp_path), "abc") is None
+
+    cover_palette.save_cached_palette(str(tmp_path), "abc", palette)
+
+    assert cover_palette.load_cached_palette(str(tmp_path), "abc") == palette
+    assert cover_palette.load_cached_palette(str(tmp_path), "abc", k=3) is None
@@ -0,0 +1,68 @@
+import json
+from types import SimpleNamespace
+
+from models import HomeSnapshotStore
+from tidal_backend import TidalBackend
+
+
+def _live_sections():
+    album = SimpleNamespace(id=101, name="Album A")
+    mix = SimpleNamespace(id="mix-7", name="My Mix")
+    return [
+        {
+            "title": "For You",
+            "items": [
+                {"obj": album, "name": "Album A", "sub_title": "Artist A", "image_url": "https://img/a.jpg", "type": "Album"},
+                {"obj": mix, "name": "My Mix", "sub_title": "", "image_url": None, "type": "Mix"},
+                {"obj": SimpleNamespace(name="No id"), "name": "No id", "sub_title": "", "image_url": None, "type": "Album"},
+            ],
+        },
+        {"title": "Empty", "items": []},
+    ]
+
+
+def test_snapshot_roundtrip_keeps_item_keys_and_drops_unresolvable():
+    backend = TidalBackend()
+    snapshot = backend.snapshot_home_sections(_live_sections())
+
+    # Must be plain JSON.
+    restored = backend.restore_home_sections(json.loads(json.dumps(snapshot)))
+
+    assert [sec["title"] for sec in restored] == ["For You"]
+    items = restored[0]["items"]
+    assert [backend.home_item_key(it) for it in items] == ["Album:101", "Mix:mix-7"]
+    assert all(it["snapshot"] for it in items)
+    assert items[0]["obj"].name == "Album A"
+    assert items[1]["image_url"] is None
+
+
+def test_resolve_home_item_uses_session_getter_for_snapshot_items():
+    backend = TidalBackend()
+    live = SimpleNamespace(id="101", name="Album A")
+    backend.session = SimpleNamespace(album=lambda album_id: live if album_id == "101" else None)
+    item = backend.restore_home_sections(backend.snapshot_home_sections(_live_sections()))[0]["items"][0]
+
+    assert backend.resolve_home_item(item) is live
+    assert backend.resolve_home_item({"obj": live, "type": "Album"}) is live
+    assert backend.resolve_home_item({"snapshot": True, "id": "1", "type": "PageLink"}) is None
+
+
+def test_home_snapshot_store_is_account_scoped(tmp_path):
+    guest = HomeSnapshotStore(base_dir=str(tmp_path))
+    user = HomeSnapshotStore(base_dir=str(tmp_path), scope_key="u_42")
+
+    assert guest.load() is None
+    assert user.save([{"title": "For You", "items": [{"id": "1", "type": "Album"}]}])
+
+    assert guest.load() is None
+    loaded = user.load()
+    assert loaded["sections"][0]["title"] == "For You"
+    assert loaded["saved_at"] > 0
+    assert user.path == str(tmp_path / "profiles" / "u_42" / "home_snapshot.json")
+
+
+def test_home_snapshot_store_ignores_corrupt_file(tmp_path):
+    store = HomeSnapshotStore(base_dir=str(tmp_path))
+    with open(store.path, "w", encoding="utf-8") as f:
+        f.write("{not json")
+    assert store.load() is None
@@ -0,0 +1,88 @@
+import pytest
+
+from listening_stats import ListeningScores, entry_keys
+
+
+def _entry(tid, artist="A", album="X"):
+    return {"track_id": tid, "artist": artist, "album_id": album}
+
+
+def test_single_play_matches_daily_mix_weights():
+    scores = ListeningScores()
+    scores.record_entry(_entry(1))
+
+    # track 1.6 + 1.0, artist 0.9 * (1.0 + 0.4), album 0.5 * (0.8 + 0.3)
+    assert scores.score("1", "A", "X") == pytest.approx(2.6 + 0.9 * 1.4 + 0.5 * 1.1)
+    assert scores.score("2") == 0.0
+
+
+def test_older_plays_decay_towards_the_recency_floor():
+    scores = ListeningScores()
+    scores.record("old")
+    first = scores.score("old")
+    for i in range(400):
+        scores.record(f"new{i}")
+
+    assert scores.score("old") < first
+    assert scores.score("old") == pytest.approx(1.6 + 0.2, abs=0.01)
+    assert scores.score("new399") == pytest.approx(first)
+
+
+def test_incremental_scores_match_a_rebuild_from_history():
+    history = [_entry(i % 7, artist=f"ar{i % 3}", album=f"al{i % 5}") for i in range(60)]
+    rebuilt = ListeningScores.from_entries(history)
+    incremental = ListeningScores()
+    for e in reversed(history):
+        incremental.record_entry(e)
+
+    for tid in range(7):
+        keys = entry_keys(rebuilt.meta(tid))
+        assert incremental.score(*keys) == pytest.approx(rebuilt.score(*keys))
+    assert rebuilt.top_tracks(3) == rebuilt.top_tracks()[:3]
+    assert len(rebuilt) == 7
+
+
+def test_rebase_keeps_scores(monkeypatch):
+    import listening_stats
+
+    reference = ListeningScores()
+    for i in range(12):
+        reference.record(str(i % 4), "a")
+    monkeypatch.setattr(listening_stats, "_REBASE_EVERY", 5)
+    scores = ListeningScores()
+    for i in range(12):
+        scores.record(str(i % 4), "a")
+
+    for tid in "0123":
+        assert scores.score(tid, "a") == pytest.approx(reference.score(tid, "a"))
+
+
+def test_daily_mix_picks_rotate_per_day_without_repeats():
+    from datetime import date
+
+    from listening_stats import daily_mix_picks
+
+    scores = ListeningScores.from_entries([_entry(i, artist=f"ar{i % 4}") for i in range(30)])
+    today = date(2026, 3, 14)
+    mixes = daily_mix_picks(scores, today, days=7, per_day=8)
+
+    # 8 + 8 + 8 + 6; a fifth day would have fewer than 6 tracks.
+    assert [day.day for day, _ in mixes] == [14, 13, 12, 11]
+    ids = [e["track_id"] for _, entries in mixes for e in entries]
+    assert len(ids) == len(set(ids)) == 30
+    assert daily_mix_picks(scores, today, days=7, per_day=8) == mixes
+    assert daily_mix_picks(ListeningScores(), today) == []
+
+
+def test_history_backfill_is_persisted_per_account(tmp_path):
+    from models import HistoryManager
+
+    guest = HistoryManager(base_dir=str(tmp_path))
+    user = HistoryManager(base_dir=str(tmp_path), scope_key="u_1")
+    assert user.load_backfill() is None
+
+    assert user.save_backfill([_entry(5), {"track_id": None}])
+    assert user.load_backfill() == [_entry(5)]
+    assert guest.load_backfill() is None
+    assert user.save_backfill([])
+    assert user.load_backfill() == []
@@ -0,0 +1,82 @@
+import json
+import os
+import time
+from types import SimpleNamespace
+
+import tidal_backend
+from tidal_backend import TidalBackend
+
+
+def _backend(tmp_path, lyrics):
+    backend = TidalBackend()
+    backend.lyrics_cache_dir = str(tmp_path / "lyrics")
+    calls = []
+
+    def fake_track(track_id):
+        calls.append(track_id)
+        value = lyrics.get(track_id)
+        if isinstance(value, Exception):
+            raise value
+        return SimpleNamespace(lyrics=lambda: value)
+
+    backend.session = SimpleNamespace(track=fake_track)
+    return backend, calls
+
+
+def test_lyrics_survive_restart_without_network(tmp_path):
+    lyrics = {1: SimpleNamespace(subtitles="[00:01.00]hi", text="hi")}
+    backend, calls = _backend(tmp_path, lyrics)
+    assert backend.get_lyrics(1) == "[00:01.00]hi"
+
+    again, again_calls = _backend(tmp_path, {})
+    assert again.peek_lyrics(1, disk=False) == (False, None)
+    assert again.peek_lyrics(1) == (True, "[00:01.00]hi")
+    assert again.get_lyrics(1) == "[00:01.00]hi"
+    assert calls == [1]
+    assert again_calls == []
+
+
+def test_missing_lyrics_are_cached_until_ttl(tmp_path):
+    backend, calls = _backend(tmp_path, {2: Exception("404 Not Found")})
+    assert backend.get_lyrics(2) is None
+
+    fresh, fresh_calls = _backend(tmp_path, {2: Exception("404 Not Found")})
+    assert fresh.peek_lyrics(2) == (True, None)
+    assert fresh.get_lyrics(2) is None
+    assert fresh_calls == []
+
+    path = fresh._lyrics_cache_path(2)
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    data["saved_at"] -= tidal_backend.LYRICS_MISS_TTL_SEC + 1
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+    expired, expired_calls = _backend(tmp_path, {2: Exception("404 Not Found")})
+    assert expired.peek_lyrics(2) == (False, None)
+    expired.get_lyrics(2)
+    assert expired_calls == [2]
+    assert calls == [2]
+
+
+def test_transient_lyrics_errors_are_not_persisted(tmp_path):
+    backend, calls = _backend(tmp_path, {3: Exception("connection reset")})
+    assert backend.get_lyrics(3) is None
+    assert backend.peek_lyrics(3) == (False, None)
+    assert not os.path.exists(backend._lyrics_cache_path(3))
+    assert calls == [3]
+
+
+def test_prune_lyrics_cache_drops_old_and_excess_entries(tmp_path):
+    backend, _ = _backend(tmp_path, {})
+    os.makedirs(backend.lyrics_cache_dir)
+    now = time.time()
+    ages = {"old": 100, "a": 3, "b": 2, "c": 1}
+    for name, days in ages.items():
+        path = os.path.join(backend.lyrics_cache_dir, f"{name}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{}")
+        os.utime(path, (now - days * 86400, now - days * 86400))
+
+    backend.prune_lyrics_cache(max_files=2, max_age_days=30)
+    assert sorted(os.listdir(backend.lyrics_cache_dir)) == ["b.json", "c.json"]
@@ -1,4 +1,4 @@
-from lyrics_manager import LyricsManager
+from lyrics_manager import KaraokeLine, LyricsManager, timeline_index
 
 
 def test_parse_synced_lyrics():
@@ -28,3 +28,38 @@ def test_empty_lyrics_resets_state():
     assert mgr.has_synced is False
     assert mgr.time_points == []
     assert mgr.lyrics_map == {}
+
+
+def test_timeline_index_matches_linear_scan_with_and_without_hint():
+    points = [0.5, 1.0, 1.0, 2.5, 4.0, 7.5]
+    for t in [0.0, 0.5, 0.9, 1.0, 3.0, 4.0, 9.0]:
+        expected = max((i for i, p in enumerate(points) if p <= t), default=-1)
+        assert timeline_index(points, t) == expected
+        for hint in range(-1, len(points)):
+            assert timeline_index(points, t, hint) == expected
+    assert timeline_index([], 1.0, 3) == -1
+
+
+def test_line_index_and_lyric_lookup():
+    mgr = LyricsManager()
+    mgr.load_lyrics("[00:03.00]c\n[00:01.00]a\n[00:02.00]b\n")
+    assert mgr.line_index_for_time(0.5) == -1
+    assert mgr.line_index_for_time(2.5, hint=0) == 1
+    assert mgr.get_lyric_for_time(0.5) is None
+    assert mgr.get_lyric_for_time(9.0) == "c"
+
+
+def test_karaoke_line_markup_is_escaped_and_cached():
+    mgr = LyricsManager()
+    mgr.load_lyrics("[00:01.00]<00:01.00>Rock <00:01.50>& <00:02.00>roll")
+    line = KaraokeLine(mgr.karaoke_map[1.0], active_color="#FFF", inactive_color="#999")
+
+    assert line.word_index_at(1.7) == 1
+    assert line.markup(1) == (
+        '<span foreground="#FFF" weight="700">Rock </span>'
+        '<span foreground="#FFF" weight="700">&amp; </span>'
+        '<span foreground="#999">roll</span>'
+    )
+    assert line.markup(1) is line.markup(1)
+    assert line.markup(-1).count("#999") == 3
+    assert line.markup(10) == line.markup(2)
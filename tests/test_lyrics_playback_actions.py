@@ -0,0 +1,66 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import app_async
+from actions import lyrics_playback_actions
+from app_async import AsyncBridge
+from app_executor import LANE_NETWORK, TaskExecutor
+
+
+@pytest.fixture
+def bridge(monkeypatch):
+    b = AsyncBridge(executor=TaskExecutor(limits={LANE_NETWORK: 2}))
+    monkeypatch.setattr(app_async, "get_bridge", lambda: b)
+    yield b
+    b.shutdown()
+
+
+class _Backend:
+    quality = "LOSSLESS"
+
+    def __init__(self):
+        self.calls = []
+        self.both_started = threading.Barrier(2, timeout=2)
+
+    async def get_lyrics_async(self, track_id):
+        return await app_async.call(self._fetch, "lyrics", track_id)
+
+    async def get_stream_url_async(self, track):
+        return await app_async.call(self._fetch, "url", track.id)
+
+    def _fetch(self, kind, track_id):
+        self.calls.append((kind, track_id, threading.current_thread().name))
+        # Both requests must be in flight together.
+        self.both_started.wait()
+        return f"{kind}-{track_id}"
+
+    def get_artwork_url(self, track, size):
+        return f"art-{track.id}-{size}"
+
+
+def test_prefetch_warms_lyrics_and_stream_url_concurrently(bridge):
+    backend = _Backend()
+    app = SimpleNamespace(backend=backend, stream_prefetch_cache={})
+    track = SimpleNamespace(id=9, name="Song", artist=SimpleNamespace(name="A"), album=SimpleNamespace(name="B"))
+
+    bridge.run(lyrics_playback_actions._prefetch_next_track(app, track)).result(3)
+
+    assert sorted(kind for kind, _, _ in backend.calls) == ["lyrics", "url"]
+    assert all(name.startswith("exec-network") for _, _, name in backend.calls)
+    entry = app.stream_prefetch_cache[9]
+    assert entry["url"] == "url-9" and entry["quality"] == "LOSSLESS"
+    assert entry["meta"] == {"name": "Song", "artist": "A", "album": "B", "artwork_url": "art-9-320"}
+
+
+def test_prefetch_skips_stream_url_already_cached(bridge):
+    backend = _Backend()
+    backend.both_started = threading.Barrier(1)
+    cached = {"url": "old", "quality": "LOSSLESS", "meta": {}}
+    app = SimpleNamespace(backend=backend, stream_prefetch_cache={9: cached})
+
+    bridge.run(lyrics_playback_actions._prefetch_next_track(app, SimpleNamespace(id=9))).result(3)
+
+    assert [kind for kind, _, _ in backend.calls] == ["lyrics"]
+    assert app.stream_prefetch_cache[9] is cached
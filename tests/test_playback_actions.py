@@ -44,3 +44,42 @@ def test_get_next_index_shuffle_not_same_track():
         next_idx = playback_actions.get_next_index(app, 1)
         assert 0 <= next_idx < len(app.current_track_list)
         assert next_idx != app.current_track_index
+
+
+def test_shuffle_plays_whole_queue_and_prefetch_matches_next():
+    app = _make_app()
+    app.play_mode = app.MODE_SHUFFLE
+    app.current_track_index = 0
+    played = []
+
+    def _play_track(idx):
+        app.current_track_index = idx
+        played.append(idx)
+
+    app.play_track = _play_track
+    for _ in range(3):
+        expected = playback_actions.get_next_index(app, 1)
+        playback_actions.on_next_track(app)
+        assert played[-1] == expected
+    assert sorted([0] + played) == [0, 1, 2, 3]
+
+
+def test_smart_mode_follows_listening_history():
+    app = _make_app()
+    app.current_track_list = [
+        SimpleNamespace(id=i, artist=SimpleNamespace(id=f"ar{i}", name=""), album=SimpleNamespace(id=None))
+        for i in range(4)
+    ]
+    app.history_mgr = SimpleNamespace(
+        get_recent_track_entries=lambda limit=400: [{"track_id": 3, "artist_id": "ar3"}] * 3
+    )
+    app.play_mode = app.MODE_SMART
+    app.current_track_index = 0
+    app.play_track = lambda idx: setattr(app, "current_track_index", idx)
+
+    assert playback_actions.get_next_index(app, 1) == 3
+    playback_actions.on_next_track(app)
+    assert app.current_track_index == 3
+
+    playback_actions.record_play(app, {"track_id": 1, "artist_id": "ar1"})
+    assert app.listening_scores.score("1", "ar1") > 0.0
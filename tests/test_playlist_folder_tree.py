@@ -0,0 +1,156 @@
+import threading
+from types import SimpleNamespace
+
+from tidal_backend import TidalBackend
+
+
+TREE = {
+    "root": ["a", "b"],
+    "a": ["a1", "a2"],
+    "b": ["b1"],
+    "a1": ["a1x"],
+}
+
+
+class FakeFolder:
+    def __init__(self, fid):
+        self.id = fid
+        self.name = fid.upper()
+        self.removed = False
+
+    def rename(self, name):
+        self.name = name
+        return True
+
+    def remove(self):
+        self.removed = True
+        return True
+
+
+def _backend(fail_once=()):
+    backend = TidalBackend()
+    backend.user = SimpleNamespace(id=7)
+    calls = []
+    failing = set(fail_once)
+    lock = threading.Lock()
+
+    def fake_page(parent_folder_id="root", limit=50, offset=0):
+        with lock:
+            calls.append(parent_folder_id)
+            if parent_folder_id in failing:
+                failing.discard(parent_folder_id)
+                raise ConnectionError("reset")
+        return [FakeFolder(fid) for fid in TREE.get(parent_folder_id, [])[offset : offset + limit]]
+
+    backend._fetch_playlist_folders_page = fake_page
+    return backend, calls
+
+
+def test_folder_tree_keeps_breadth_first_order_and_paths():
+    backend, calls = _backend()
+    rows = backend.get_all_playlist_folders()
+
+    assert [r["id"] for r in rows] == ["a", "b", "a1", "a2", "b1", "a1x"]
+    assert rows[-1]["path"] == "A/A1/A1X"
+    assert rows[-1]["parent_id"] == "a1"
+    assert sorted(calls) == sorted(["root", "a", "b", "a1", "a2", "b1", "a1x"])
+
+
+def test_folder_tree_respects_depth_and_limit():
+    backend, _calls = _backend()
+    assert [r["id"] for r in backend.get_all_playlist_folders(max_depth=2, force=True)] == ["a", "b", "a1", "a2", "b1"]
+    assert [r["id"] for r in backend.get_all_playlist_folders(limit=3, force=True)] == ["a", "b", "a1"]
+
+
+def test_folder_tree_is_cached_until_folder_change():
+    backend, calls = _backend()
+    first = backend.get_all_playlist_folders()
+    crawled = len(calls)
+
+    second = backend.get_all_playlist_folders(limit=5000, max_depth=12)
+    assert len(calls) == crawled
+    assert [r["id"] for r in second] == [r["id"] for r in first]
+    assert [r["id"] for r in backend.get_all_playlist_folders(max_depth=1)] == ["a", "b"]
+    assert len(calls) == crawled
+
+    assert backend.rename_cloud_folder(first[0]["obj"], "Renamed")["ok"]
+    backend.get_all_playlist_folders()
+    assert len(calls) == crawled * 2
+
+
+
+def test_folder_tree_with_a_failed_request_is_not_cached():
+    backend, calls = _backend(fail_once={"a"})
+    partial = backend.get_all_playlist_folders()
+    assert [r["id"] for r in partial] == ["a", "b", "b1"]
+
+    crawled = len(calls)
+    full = backend.get_all_playlist_folders()
+    assert [r["id"] for r in full] == ["a", "b", "a1", "a2", "b1", "a1x"]
+    assert len(calls) > crawled
+
+    crawled = len(calls)
+    assert [r["id"] for r in backend.get_all_playlist_folders()] == [r["id"] for r in full]
+    assert len(calls) == crawled
+
+def test_folder_tree_cache_is_per_user():
+    backend, calls = _backend()
+    backend.get_all_playlist_folders()
+    crawled = len(calls)
+    backend.user = SimpleNamespace(id=8)
+    backend.get_all_playlist_folders()
+    assert len(calls) == crawled * 2
+
+
+def _preview_backend(tmp_path):
+    backend = TidalBackend()
+    backend.folder_preview_cache_file = str(tmp_path / "folder_previews.json")
+    calls = []
+    lock = threading.Lock()
+
+    def fake_preview(folder, limit=4, size=320):
+        _ = size
+        with lock:
+            calls.append(folder.id)
+        return [f"https://img/{folder.id}/{i}.jpg" for i in range(min(limit, folder.total_number_of_items))]
+
+    backend.get_folder_preview_artworks = fake_preview
+    return backend, calls
+
+
+def _folder(fid, items, modified="2026-01-01T00:00:00"):
+    return SimpleNamespace(id=fid, total_number_of_items=items, last_modified=modified)
+
+
+def test_folder_previews_are_batched_and_persisted(tmp_path):
+    backend, calls = _preview_backend(tmp_path)
+    folders = [_folder("f1", 6), _folder("f2", 2), _folder("f3", 0)]
+
+    first = backend.get_folder_preview_artworks_batch(folders)
+    assert len(first["f1"]) == 4
+    assert len(first["f2"]) == 2
+    assert first["f3"] == []
+    assert sorted(calls) == ["f1", "f2", "f3"]
+
+    # A fresh backend reads the persisted cache without fetching.
+    again, again_calls = _preview_backend(tmp_path)
+    assert again.peek_folder_preview_artworks(folders) == first
+    assert again.get_folder_preview_artworks_batch(folders) == first
+    assert again_calls == []
+
+
+def test_folder_preview_cache_follows_last_modified_marker(tmp_path):
+    backend, calls = _preview_backend(tmp_path)
+    backend.get_folder_preview_artworks_batch([_folder("f1", 3)])
+    changed = _folder("f1", 3, modified="2026-02-01T00:00:00")
+
+    assert backend.peek_folder_preview_artworks([changed]) == {}
+    backend.get_folder_preview_artworks_batch([changed])
+    assert calls == ["f1", "f1"]
+
+
+def test_failed_folder_preview_fetch_is_not_cached(tmp_path):
+    backend, _calls = _preview_backend(tmp_path)
+    backend.get_folder_preview_artworks = lambda folder, limit=4, size=320: []
+    assert backend.get_folder_preview_artworks_batch([_folder("f1", 5)]) == {"f1": []}
+    assert backend.peek_folder_preview_artworks([_folder("f1", 5)]) == {}
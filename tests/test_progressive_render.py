@@ -0,0 +1,125 @@
+from ui import progressive_render
+from ui.progressive_render import MAX_CHUNK, ProgressiveRenderer
+
+
+class FakeClock:
+    """Frame clock at 60Hz; the renderer's budget is then 0.4 * 16.67ms."""
+
+    def get_frame_time(self):
+        return 0
+
+    def get_refresh_info(self, _frame_time):
+        return 16667, 0
+
+
+class FakeWidget:
+    def __init__(self):
+        self.tick = None
+        self.removed = []
+
+    def add_tick_callback(self, cb):
+        self.tick = cb
+        return 1
+
+    def remove_tick_callback(self, tick_id):
+        self.removed.append(tick_id)
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _renderer(monkeypatch, items, cost_ms, **kwargs):
+    timer = FakeTimer()
+    monkeypatch.setattr(progressive_render.time, "perf_counter", timer)
+    built = []
+
+    def build(item):
+        built.append(item)
+        timer.now += cost_ms / 1000.0
+
+    widget = FakeWidget()
+    renderer = ProgressiveRenderer(widget, items, build, **kwargs).start()
+    return renderer, widget, built
+
+
+def _tick(renderer, widget):
+    return renderer._on_tick(widget, FakeClock())
+
+
+def test_cheap_items_grow_the_chunk_up_to_the_cap(monkeypatch):
+    renderer, widget, built = _renderer(monkeypatch, range(500), cost_ms=0.1, initial_chunk=4)
+
+    _tick(renderer, widget)
+    assert len(built) == 4
+    # 6.67ms budget / 0.1ms per item.
+    assert renderer._chunk == 66
+    _tick(renderer, widget)
+    assert len(built) == 70
+
+    renderer, widget, _built = _renderer(monkeypatch, range(500), cost_ms=0.01, initial_chunk=4)
+    _tick(renderer, widget)
+    assert renderer._chunk == MAX_CHUNK
+
+
+def test_expensive_items_stop_at_the_budget_and_shrink_the_chunk(monkeypatch):
+    renderer, widget, built = _renderer(monkeypatch, range(50), cost_ms=2.0, initial_chunk=10)
+
+    _tick(renderer, widget)
+    # The 4th item crosses the 6.67ms budget.
+    assert len(built) == 4
+    assert renderer._chunk == 3
+    _tick(renderer, widget)
+    assert len(built) == 7
+
+
+def test_render_is_cancelled_once_no_longer_current(monkeypatch):
+    current = {"ok": True}
+    finished = []
+    renderer, widget, built = _renderer(
+        monkeypatch,
+        range(20),
+        cost_ms=0.5,
+        initial_chunk=4,
+        is_current=lambda: current["ok"],
+        on_done=finished.append,
+    )
+
+    assert _tick(renderer, widget) == progressive_render.GLib.SOURCE_CONTINUE
+    current["ok"] = False
+    assert _tick(renderer, widget) == progressive_render.GLib.SOURCE_REMOVE
+    assert built == [0, 1, 2, 3]
+    assert finished == [True]
+    assert renderer.done and renderer.pending == 0
+    # The tick callback removed itself; it must not be removed again.
+    assert widget.removed == []
+
+
+def test_pending_items_follow_the_priority_key(monkeypatch):
+    rank = {i: i for i in range(8)}
+    sorts = []
+
+    def priority(item):
+        sorts.append(item)
+        return rank[item]
+
+    renderer, widget, built = _renderer(
+        monkeypatch, [5, 3, 7, 1, 0, 6, 2, 4], cost_ms=0.1, initial_chunk=2, priority=priority
+    )
+
+    _tick(renderer, widget)
+    assert built == [0, 1]
+
+    # Scroll events only flag a re-sort; the next tick sorts once.
+    rank.update({7: -2, 6: -1})
+    sorts.clear()
+    for _ in range(5):
+        renderer.request_reprioritize()
+    assert sorts == []
+    _tick(renderer, widget)
+    assert built[2:4] == [7, 6]
+    assert len(sorts) == 6
@@ -0,0 +1,31 @@
+from collections import deque
+from types import SimpleNamespace
+
+from rust_audio_engine import RustAudioPlayerAdapter
+
+
+def _adapter(results):
+    calls = []
+
+    def set_spectrum_layout(*layout):
+        calls.append(layout)
+        return results.pop(0)
+
+    adapter = RustAudioPlayerAdapter.__new__(RustAudioPlayerAdapter)
+    adapter._rust = SimpleNamespace(available=True, set_spectrum_layout=set_spectrum_layout)
+    adapter._spectrum_layout = None
+    adapter._viz_spectrum_queue = deque([object()])
+    adapter._viz_last_render_frame = object()
+    return adapter, calls
+
+
+def test_failed_spectrum_layout_is_retried():
+    adapter, calls = _adapter([-4, 0])
+    layout = (32, "log", 30.0, 20000.0)
+
+    assert adapter.set_spectrum_layout(*layout) is False
+    assert len(adapter._viz_spectrum_queue) == 1
+    assert adapter.set_spectrum_layout(*layout) is True
+    assert len(adapter._viz_spectrum_queue) == 0
+    assert adapter.set_spectrum_layout(*layout) is True
+    assert calls == [layout, layout]
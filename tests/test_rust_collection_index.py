@@ -0,0 +1,78 @@
+import pytest
+
+from rust_viz import RustCollectionIndex, RustVizCore
+
+
+@pytest.fixture
+def collection():
+    core = RustVizCore()
+    index = core.create_collection_index() if core.available else None
+    if index is None:
+        pytest.skip("rust_viz_core with collection index is not built")
+    n = 10
+    assert index.load_columns(
+        artist_keys=[i % 3 for i in range(n)],
+        album_keys=[i % 2 for i in range(n)],
+        title_rank=list(range(n))[::-1],
+        artist_rank=[i % 3 for i in range(n)],
+        album_rank=list(range(n)),
+        durations=[100 + i * 10 for i in range(n)],
+        favorites=[i % 2 == 0 for i in range(n)],
+    )
+    blob = bytearray()
+    offsets, lens = [], []
+    for i in range(n):
+        text = f"track {i}\nartist {i % 3}".encode("utf-8")
+        offsets.append(len(blob))
+        lens.append(len(text))
+        blob.extend(text)
+    assert index.load_search(bytes(blob), offsets, lens)
+    yield index
+    index.close()
+
+
+def test_query_returns_only_requested_page(collection):
+    page, total = collection.query(sort_keys=[RustCollectionIndex.SORT_TITLE], offset=2, limit=3)
+    assert total == 10
+    assert page == [7, 6, 5]
+
+
+def test_query_multi_key_sort_with_facet_filters(collection):
+    page, total = collection.query(
+        sort_keys=[RustCollectionIndex.SORT_ARTIST | RustCollectionIndex.SORT_DESC, RustCollectionIndex.SORT_TITLE],
+        artist_keys=[0, 1],
+        limit=5,
+    )
+    assert total == 7
+    # Artist 1 before artist 0; ties broken by title rank, not index.
+    assert page == [7, 4, 1, 9, 6]
+
+
+
+def test_query_recent_sort_follows_insertion_order(collection):
+    recent_desc = RustCollectionIndex.SORT_RECENT | RustCollectionIndex.SORT_DESC
+    page, total = collection.query(sort_keys=[recent_desc], limit=4)
+    assert (page, total) == ([9, 8, 7, 6], 10)
+    page, _ = collection.query(sort_keys=[RustCollectionIndex.SORT_RECENT], limit=4)
+    assert page == [0, 1, 2, 3]
+    # Insertion order is unique, so keys after it never apply.
+    page, _ = collection.query(sort_keys=[RustCollectionIndex.SORT_RECENT, RustCollectionIndex.SORT_TITLE], limit=4)
+    assert page == [0, 1, 2, 3]
+    page, _ = collection.query(sort_keys=[RustCollectionIndex.SORT_ARTIST, recent_desc], artist_keys=[2])
+    assert page == [8, 5, 2]
+
+def test_query_duration_favorite_and_text_filters(collection):
+    page, total = collection.query(
+        favorite=RustCollectionIndex.FAVORITE_ONLY,
+        min_duration=120,
+        max_duration=170,
+    )
+    assert (page, total) == ([2, 4, 6], 3)
+    page, total = collection.query(text="artist 2")
+    assert (page, total) == ([2, 5, 8], 3)
+
+
+def test_facet_counts_cover_whole_collection_or_last_match(collection):
+    assert collection.facet_counts(RustCollectionIndex.FACET_ALBUM) == [(0, 5), (1, 5)]
+    collection.query(album_keys=[1])
+    assert collection.facet_counts(RustCollectionIndex.FACET_ARTIST, matched_only=True) == [(0, 2), (1, 2), (2, 1)]
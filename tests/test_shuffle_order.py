@@ -0,0 +1,117 @@
+import random
+
+from listening_stats import ListeningScores
+from shuffle_order import ShuffleOrder, SmartShuffleOrder
+
+
+def _order(size, current=None, seed=3):
+    return ShuffleOrder(size, current, rng=random.Random(seed))
+
+
+def test_cycle_visits_every_index_once_and_never_repeats_at_wrap():
+    order = _order(50, current=7)
+    cycle = [7] + [order.next() for _ in range(49)]
+    assert sorted(cycle) == list(range(50))
+
+    last = cycle[-1]
+    nxt = order.upcoming()
+    assert order.next() == nxt
+    assert nxt != last
+    assert order.remaining() == 49
+
+
+def test_peek_is_what_next_returns():
+    order = _order(20, current=0)
+    ahead = order.peek(3)
+    assert len(ahead) == 3
+    assert [order.next() for _ in range(3)] == ahead
+    assert order.upcoming() == order.next()
+
+
+def test_prev_walks_history_then_next_replays_it():
+    order = _order(10, current=4)
+    played = [order.next() for _ in range(3)]
+    assert order.prev() == played[1]
+    assert order.prev() == played[0]
+    assert order.prev() == 4
+    assert order.prev() is None
+    assert [order.next() for _ in range(3)] == played
+
+
+def test_jump_keeps_history_and_unplayed_pool():
+    order = _order(10, current=0)
+    first = order.next()
+    target = next(i for i in range(10) if i not in (0, first))
+    order.jump(target)
+    assert order.current == target
+    assert order.history == [0, first]
+    rest = [order.next() for _ in range(7)]
+    assert sorted([0, first, target] + rest) == list(range(10))
+
+
+def test_insert_up_next_and_remove_keep_order_stable():
+    order = _order(6, current=2)
+    ahead = order.peek(2)
+
+    order.insert(3, 2, up_next=True)
+    shifted = [v + 2 if v >= 3 else v for v in ahead]
+    assert order.current == 2
+    assert order.peek(4) == [3, 4] + shifted
+    assert len(order) == 8
+
+    order.remove(3)
+    assert order.peek(3) == [3] + [v - 1 if v > 3 else v for v in shifted]
+    played = [2] + [order.next() for _ in range(6)]
+    assert sorted(played) == list(range(7))
+
+
+def test_remove_current_continues_with_read_ahead():
+    order = _order(5, current=1)
+    ahead = order.peek(1)[0]
+    order.remove(1)
+    assert order.current is None
+    assert order.next() == (ahead - 1 if ahead > 1 else ahead)
+
+
+def _smart(keys, plays, current=None):
+    scores = ListeningScores()
+    for key in plays:
+        scores.record(*key)
+    return SmartShuffleOrder(len(keys), current, rng=random.Random(5), keys=keys, scores=scores)
+
+
+def test_smart_order_plays_favourites_first_and_covers_the_queue():
+    keys = [(f"t{i}", f"ar{i}", f"al{i}") for i in range(6)]
+    order = _smart(keys, [keys[4]] * 5 + [keys[2]] * 2)
+
+    picks = [order.next() for _ in range(6)]
+    assert picks[:2] == [4, 2]
+    assert sorted(picks) == list(range(6))
+
+
+def test_smart_order_spreads_out_a_dominant_artist():
+    keys = [(f"a{i}", "same", f"al{i}") for i in range(4)] + [(f"b{i}", f"other{i}", "") for i in range(4)]
+    order = _smart(keys, [keys[i] for i in range(4)] * 3)
+
+    picks = [order.next() for _ in range(8)]
+    same = [p < 4 for p in picks]
+    assert same[0]
+    assert not all(same[:4])
+    assert sorted(picks) == list(range(8))
+
+
+def test_smart_order_keeps_history_and_queue_edits():
+    keys = [(f"t{i}", f"ar{i}", "") for i in range(5)]
+    order = _smart(keys, [keys[3]] * 4, current=0)
+
+    assert order.upcoming() == 3
+    assert order.next() == 3
+    assert order.prev() == 0
+    assert order.next() == 3
+    order.insert(1, 2, up_next=True)
+    assert order.peek(2) == [1, 2]
+    order.remove(0)
+    assert order.current == 4
+    for _ in range(order.remaining()):
+        order.next()
+    assert sorted(order.history + [order.current]) == list(range(6))
@@ -0,0 +1,29 @@
+import pytest
+
+from rust_viz import DEFAULT_SPECTRUM_LAYOUT, fold_log_bins, log_spectrum_layout
+
+
+def test_log_layout_is_clamped_to_engine_band_limit():
+    assert log_spectrum_layout(32) == (32, "log", 30.0, 20000.0)
+    assert log_spectrum_layout(512)[0] == 128
+    assert log_spectrum_layout(0)[0] == 1
+    assert DEFAULT_SPECTRUM_LAYOUT == (64, "linear", 0.0, 0.0)
+
+
+def _shaped(v, i, n):
+    return min(1.0, pow(v, 0.84) * (0.92 + 0.16 * i / max(1, n - 1)))
+
+
+def test_fold_log_bins_keeps_level_shaping_on_matching_layout():
+    vals = [0.1 * i for i in range(8)]
+    expected = [_shaped(v, i, 8) for i, v in enumerate(vals)]
+    assert fold_log_bins(vals, 8) == pytest.approx(expected)
+    assert fold_log_bins((v for v in vals), 8) == pytest.approx(expected)
+
+
+def test_fold_log_bins_averages_and_repeats():
+    assert fold_log_bins([0.0, 1.0, 0.5, 0.5], 2) == pytest.approx([_shaped(0.5, 0, 2), _shaped(0.5, 1, 2)])
+    assert fold_log_bins([0.2, 0.8], 4) == pytest.approx([_shaped(v, i, 4) for i, v in enumerate([0.2, 0.2, 0.8, 0.8])])
+    assert fold_log_bins([], 3) == [0.0, 0.0, 0.0]
+    assert fold_log_bins([1.0], 0) == []
+    assert fold_log_bins([1.5, -0.2], 2) == pytest.approx([0.92, 0.0])
@@ -0,0 +1,93 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import app_async
+import utils
+from app_async import AsyncBridge
+from app_executor import LANE_NETWORK, TaskExecutor
+
+
+@pytest.fixture
+def bridge(monkeypatch):
+    b = AsyncBridge(executor=TaskExecutor(limits={LANE_NETWORK: 2}))
+    monkeypatch.setattr(app_async, "get_bridge", lambda: b)
+    yield b
+    b.shutdown()
+
+
+def _fake_downloads(monkeypatch, failing=()):
+    lock = threading.Lock()
+    state = {"now": 0, "peak": 0, "threads": []}
+    gate = threading.Event()
+
+    def ensure(ref, cache_dir):
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+            state["threads"].append(threading.current_thread().name)
+        gate.wait(0.02)
+        with lock:
+            state["now"] -= 1
+        return None if ref in failing else f"{cache_dir}/{ref}"
+
+    monkeypatch.setattr(utils, "ensure_image_local_path", ensure)
+    return state
+
+
+def test_fetch_images_async_shares_the_network_lane(monkeypatch, bridge):
+    state = _fake_downloads(monkeypatch, failing={"r3"})
+    refs = [f"r{i}" for i in range(12)]
+
+    paths = bridge.run(utils.fetch_images_async(refs, "c", limit=8)).result(5)
+
+    assert paths == [None if r == "r3" else f"c/{r}" for r in refs]
+    assert state["peak"] == 2
+    assert all(name.startswith("exec-network") for name in state["threads"])
+
+
+def test_collage_sources_go_through_fetch_images_async(monkeypatch, bridge, tmp_path):
+    state = _fake_downloads(monkeypatch, failing={"b"})
+    composed = []
+
+    def compose(paths, out_path, size, overlay_alpha, overlay_style):
+        composed.append((paths, threading.current_thread().name))
+        return out_path
+
+    monkeypatch.setattr(utils, "_compose_collage", compose)
+
+    out = bridge.run(
+        utils.generate_auto_collage_cover_async(["a", "b", "a", "c"], "img", str(tmp_path), size=64)
+    ).result(5)
+
+    assert out and out.startswith(str(tmp_path))
+    assert composed[0][0] == ["img/a", "img/c"]
+    assert composed[0][1].startswith("exec-cpu")
+    assert len(state["threads"]) == 3
+
+
+def test_load_img_resolves_downloads_and_decodes_off_the_main_thread(monkeypatch, bridge):
+    _fake_downloads(monkeypatch)
+    applied = threading.Event()
+    seen = {}
+
+    def apply(widget, u, f_path, size):
+        seen.update(widget=widget, u=u, f_path=f_path, size=size, thread=threading.current_thread().name)
+        applied.set()
+
+    monkeypatch.setattr(utils, "_apply_img_file", apply)
+    widget = SimpleNamespace(set_size_request=lambda w, h: None, set_from_pixbuf=lambda pb: None)
+    provider_threads = []
+
+    def provider():
+        provider_threads.append(threading.current_thread().name)
+        return "cover"
+
+    utils.load_img(widget, provider, "covers", size=48)
+
+    assert applied.wait(3)
+    assert provider_threads[0].startswith("exec-network")
+    assert seen["thread"].startswith("exec-cpu")
+    assert (seen["u"], seen["f_path"], seen["size"]) == ("cover", "covers/cover", 48)
+    assert widget._target_url == "cover"
@@ -4,12 +4,31 @@ import os
 import json
 import time
 import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urlparse
+from types import SimpleNamespace
+import app_metrics
 from app_errors import classify_exception
+from app_lazy import lazy_module
 
 logger = logging.getLogger(__name__)
 
+# Folder tree crawl: parallel requests per tree level and cache lifetime.
+FOLDER_CRAWL_WORKERS = 6
+FOLDER_TREE_TTL_SEC = 300.0
+FOLDER_PREVIEW_CACHE_MAX = 1000
+# Tracks without lyrics are re-checked after this long.
+LYRICS_MISS_TTL_SEC = 3 * 24 * 3600.0
+# Persisted lyrics are pruned at startup past this age or count.
+LYRICS_CACHE_MAX_DAYS = 90
+LYRICS_CACHE_MAX_FILES = 5000
+# Per-call timeout of the *_async variants.
+ASYNC_TIMEOUT_SEC = 20.0
+# asyncio costs ~50ms to import; only pay it when a coroutine is first used.
+app_async = lazy_module("app_async")
+
 class TidalBackend:
     def __init__(self):
         self._normalize_tls_ca_env()
@@ -35,9 +54,15 @@ class TidalBackend:
                     self._artist_placeholder_uuids.add(val)
         self.lyrics_cache = {}
         self.max_lyrics_cache = 300
+        self.lyrics_cache_dir = os.path.expanduser("~/.cache/hiresti/lyrics")
         self._last_login_error = ""
         # Circuit breaker for unstable mix endpoint.
         self._mix_fail_until = {}
+        self._folder_tree_cache = None
+        self._folder_tree_lock = threading.Lock()
+        self.folder_preview_cache_file = os.path.expanduser("~/.cache/hiresti/folder_previews.json")
+        self._folder_preview_cache = None
+        self._folder_preview_lock = threading.Lock()
 
     def _default_ca_bundle_candidates(self):
         candidates = [
@@ -268,13 +293,14 @@ class TidalBackend:
                 normalized = f"https://{normalized}"
         return normalized, normalized != raw
 
-    def finish_login(self, future):
+    def finish_login(self, future, sync_favorites=True):
         try:
             future.result()
             if self.session.check_login():
                 self.user = self.session.user
                 self.save_session()
-                self.refresh_favorite_ids()
+                if sync_favorites:
+                    self.refresh_favorite_ids()
                 self._apply_global_config()
                 self._set_last_login_error("")
                 return True
@@ -317,7 +343,12 @@ class TidalBackend:
         os.replace(temp_file, self.token_file)
         os.chmod(self.token_file, 0o600)
 
-    def try_load_session(self):
+    def try_load_session(self, sync_favorites=True):
+        """
+        Restore the saved OAuth session. With sync_favorites=False the bulk
+        favorite-id fetch is left to the caller (the app runs it after the
+        first view has loaded).
+        """
         if os.path.exists(self.legacy_token_file) and not os.path.exists(self.token_file):
             logger.warning("Legacy token file detected (.pkl). Please login again to migrate.")
             return False
@@ -340,8 +371,9 @@ class TidalBackend:
                 )
                 if self.session.check_login():
                     self.user = self.session.user
-                    self.refresh_favorite_ids()
-                    self._apply_global_config() 
+                    if sync_favorites:
+                        self.refresh_favorite_ids()
+                    self._apply_global_config()
                     return True
             except Exception as e:
                 logger.warning("Session load error [%s]: %s", classify_exception(e), e)
@@ -391,6 +423,7 @@ class TidalBackend:
     def is_track_favorite(self, track_id):
         return str(track_id) in self.fav_track_ids
 
+    @app_metrics.timed("tidal_api_seconds", endpoint="favorite_toggle")
     def toggle_album_favorite(self, album_id, add=True):
         try:
             if add:
@@ -404,6 +437,7 @@ class TidalBackend:
             logger.warning("Failed to toggle album favorite for %s (add=%s): %s", album_id, add, e)
             return False
 
+    @app_metrics.timed("tidal_api_seconds", endpoint="favorite_toggle")
     def toggle_artist_favorite(self, artist_id, add=True):
         try:
             if add:
@@ -417,6 +451,7 @@ class TidalBackend:
             logger.warning("Failed to toggle artist favorite for %s (add=%s): %s", artist_id, add, e)
             return False
 
+    @app_metrics.timed("tidal_api_seconds", endpoint="favorite_toggle")
     def toggle_track_favorite(self, track_id, add=True):
         try:
             fav = self.user.favorites
@@ -505,6 +540,7 @@ class TidalBackend:
 
         return merged[:target]
 
+    @app_metrics.timed("tidal_api_seconds", endpoint="favorite_artists")
     def get_favorites(self, limit=20000):
         try: 
             if not self.user:
@@ -516,6 +552,7 @@ class TidalBackend:
             logger.warning("Failed to fetch favorite artists: %s", e)
             return []
 
+    @app_metrics.timed("tidal_api_seconds", endpoint="favorite_albums")
     def get_recent_albums(self, limit=20000):
         try:
             if not self.user:
@@ -527,6 +564,7 @@ class TidalBackend:
             logger.warning("Failed to fetch recent albums: %s", e)
             return []
 
+    @app_metrics.timed("tidal_api_seconds", endpoint="favorite_tracks")
     def get_favorite_tracks(self, limit=50):
         try:
             if not self.user:
@@ -599,6 +637,7 @@ class TidalBackend:
             logger.warning("Failed to fetch favorite tracks: %s", e)
             return []
 
+    @app_metrics.timed("tidal_api_seconds", endpoint="user_playlists")
     def get_user_playlists(self, limit=80):
         if not self.user:
             return []
@@ -687,6 +726,7 @@ class TidalBackend:
         parent_id = str(parent_folder_id or "root")
         try:
             folder = self.user.create_folder(title, parent_id=parent_id)
+            self.invalidate_folder_tree()
             logger.info(
                 "Cloud folder created: id=%s name=%r parent=%s",
                 getattr(folder, "id", None),
@@ -724,6 +764,7 @@ class TidalBackend:
         try:
             ok = bool(folder.rename(new_name))
             if ok:
+                self.invalidate_folder_tree()
                 try:
                     folder.name = new_name
                 except Exception:
@@ -739,6 +780,8 @@ class TidalBackend:
             return {"ok": False, "folder_id": None}
         try:
             ok = bool(folder.remove())
+            if ok:
+                self.invalidate_folder_tree()
             return {"ok": ok, "folder_id": getattr(folder, "id", None)}
         except Exception as e:
             logger.warning("Failed deleting folder %s: %s", getattr(folder, "id", None), e)
@@ -760,6 +803,13 @@ class TidalBackend:
         )
 
     def get_playlist_folders(self, parent_folder_id="root", limit=1000):
+        return self._fetch_folder_level(parent_folder_id=parent_folder_id, limit=limit)[0]
+
+    def _fetch_folder_level(self, parent_folder_id="root", limit=1000):
+        """
+        Page through the folders under one parent. Returns (folders, ok); ok
+        is False when a page request failed and the list may be truncated.
+        """
         out = []
         page_size = 50
         offset = 0
@@ -769,14 +819,14 @@ class TidalBackend:
                 page = self._fetch_playlist_folders_page(parent_folder_id=parent_folder_id, limit=page_size, offset=offset)
             except Exception as e:
                 logger.warning("Failed fetching playlist folders (parent=%s): %s", parent_folder_id, e)
-                break
+                return out[:max_items], False
             if not page:
                 break
             out.extend(page)
             if len(page) < page_size:
                 break
             offset += len(page)
-        return out[:max_items]
+        return out[:max_items], True
 
     def get_playlists_in_folder(self, parent_folder=None, limit=1000):
         max_items = max(0, int(limit or 0))
@@ -831,6 +881,7 @@ class TidalBackend:
             offset += len(page)
         return out[:max_items]
 
+    @app_metrics.timed("tidal_api_seconds", endpoint="playlists_and_folders")
     def get_playlists_and_folders(self, parent_folder=None, limit=1000):
         parent_id = "root" if parent_folder is None else str(getattr(parent_folder, "id", parent_folder) or "root")
         folders = self.get_playlist_folders(parent_folder_id=parent_id, limit=limit)
@@ -865,26 +916,198 @@ class TidalBackend:
             )
         return urls[:max_items]
 
-    def get_all_playlist_folders(self, limit=1000, max_depth=8):
+    def _folder_preview_marker(self, folder):
+        modified = getattr(folder, "last_modified", None)
+        if hasattr(modified, "isoformat"):
+            modified = modified.isoformat()
+        return f"{modified or ''}|{int(getattr(folder, 'total_number_of_items', 0) or 0)}"
+
+    def _load_folder_preview_cache(self):
+        # Caller holds _folder_preview_lock.
+        if self._folder_preview_cache is not None:
+            return self._folder_preview_cache
+        data = {}
+        try:
+            with open(self.folder_preview_cache_file, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            if isinstance(raw, dict):
+                data = {str(k): v for k, v in raw.items() if isinstance(v, dict)}
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug("Ignoring unreadable folder preview cache: %s", e)
+        self._folder_preview_cache = data
+        return data
+
+    def _save_folder_preview_cache(self, data):
+        try:
+            os.makedirs(os.path.dirname(self.folder_preview_cache_file), exist_ok=True)
+            temp_file = f"{self.folder_preview_cache_file}.tmp"
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(temp_file, self.folder_preview_cache_file)
+        except Exception as e:
+            logger.debug("Failed to save folder preview cache: %s", e)
+
+    def peek_folder_preview_artworks(self, folders, limit=4, size=320):
+        """
+        Cached preview URL lists for folders whose last-modified marker is
+        unchanged. Never touches the network; misses are simply absent.
+        """
+        out = {}
+        with self._folder_preview_lock:
+            cache = self._load_folder_preview_cache()
+            for folder in list(folders or []):
+                fid = str(getattr(folder, "id", "") or "")
+                entry = cache.get(fid)
+                if not entry:
+                    continue
+                if entry.get("marker") != self._folder_preview_marker(folder) or entry.get("size") != int(size):
+                    continue
+                urls = list(entry.get("urls") or [])
+                if len(urls) >= int(limit) or entry.get("complete"):
+                    out[fid] = urls[: int(limit)]
+        return out
+
+    def get_folder_preview_artworks_batch(self, folders, limit=4, size=320):
+        """
+        Preview URL lists for many folders: cache hits first, misses fetched
+        concurrently on a bounded pool, then persisted in one write.
+        Returns {folder_id: [urls]}.
+        """
+        folders = [f for f in list(folders or []) if str(getattr(f, "id", "") or "")]
+        out = self.peek_folder_preview_artworks(folders, limit=limit, size=size)
+        missing = [f for f in folders if str(getattr(f, "id", "")) not in out]
+        if not missing:
+            return out
+
+        t0 = time.monotonic()
+        with ThreadPoolExecutor(max_workers=min(FOLDER_CRAWL_WORKERS, len(missing)), thread_name_prefix="folder-preview") as pool:
+            fetched = list(pool.map(lambda f: self.get_folder_preview_artworks(f, limit=limit, size=size), missing))
+
+        with self._folder_preview_lock:
+            cache = self._load_folder_preview_cache()
+            for folder, urls in zip(missing, fetched):
+                fid = str(getattr(folder, "id", ""))
+                urls = list(urls or [])
+                out[fid] = urls
+                item_count = int(getattr(folder, "total_number_of_items", 0) or 0)
+                # An empty result for a non-empty folder is most likely a failed
+                # fetch; keep it out of the cache so the next visit retries.
+                if not urls and item_count > 0:
+                    continue
+                cache.pop(fid, None)
+                cache[fid] = {
+                    "marker": self._folder_preview_marker(folder),
+                    "size": int(size),
+                    "urls": urls,
+                    "complete": len(urls) < int(limit),
+                }
+            while len(cache) > FOLDER_PREVIEW_CACHE_MAX:
+                cache.pop(next(iter(cache)))
+            self._save_folder_preview_cache(cache)
+        logger.debug(
+            "Folder previews resolved: folders=%s fetched=%s elapsed=%.0fms",
+            len(folders),
+            len(missing),
+            (time.monotonic() - t0) * 1000.0,
+        )
+        return out
+
+    def invalidate_folder_tree(self):
+        with self._folder_tree_lock:
+            self._folder_tree_cache = None
+
+    def _cached_folder_tree(self, limit, max_depth):
+        with self._folder_tree_lock:
+            cache = self._folder_tree_cache
+        if not cache:
+            return None
+        if cache["user_id"] != getattr(self.user, "id", None):
+            return None
+        if time.monotonic() - cache["at"] > FOLDER_TREE_TTL_SEC:
+            return None
+        if cache["max_depth"] < max_depth and cache["depth_capped"]:
+            return None
+        if cache["limit_capped"] and len(cache["results"]) < limit:
+            return None
+        # Callers may mutate the rows; hand out copies.
+        return [dict(row) for row in cache["results"] if row["depth"] < max_depth][:limit]
+
+    def get_all_playlist_folders(self, limit=1000, max_depth=8, force=False):
+        """
+        Flattened folder tree in breadth-first order with "/"-joined paths.
+        Each tree level is fetched concurrently on a small pool, and the
+        result is cached until a folder or playlist-move method invalidates it.
+        A crawl with a failed request is returned but not cached.
+        """
+        limit = int(limit)
+        max_depth = int(max_depth)
+        if not force:
+            cached = self._cached_folder_tree(limit, max_depth)
+            if cached is not None:
+                return cached
+
+        user_id = getattr(self.user, "id", None)
+        t0 = time.monotonic()
         results = []
-        queue = [("root", "", 0)]
         seen = set(["root"])
-        while queue and len(results) < int(limit):
-            parent_id, parent_path, depth = queue.pop(0)
-            if depth >= int(max_depth):
-                continue
-            children = self.get_playlist_folders(parent_folder_id=parent_id, limit=1000)
-            for f in children:
-                fid = str(getattr(f, "id", "") or "")
-                if not fid or fid in seen:
-                    continue
-                seen.add(fid)
-                name = str(getattr(f, "name", "") or "Folder")
-                path = f"{parent_path}/{name}" if parent_path else name
-                results.append({"id": fid, "name": name, "path": path, "obj": f, "parent_id": parent_id})
-                queue.append((fid, path, depth + 1))
-                if len(results) >= int(limit):
-                    break
+        level = [("root", "")]
+        depth = 0
+        requests_made = 0
+        limit_capped = False
+        complete = True
+
+        def _fetch(node):
+            return self._fetch_folder_level(parent_folder_id=node[0], limit=1000)
+
+        with ThreadPoolExecutor(max_workers=FOLDER_CRAWL_WORKERS, thread_name_prefix="folder-crawl") as pool:
+            while level and depth < max_depth and not limit_capped:
+                # map() keeps input order, so output matches the serial BFS.
+                fetched = list(pool.map(_fetch, level))
+                requests_made += len(level)
+                complete = complete and all(ok for _, ok in fetched)
+                next_level = []
+                for (parent_id, parent_path), (children, _ok) in zip(level, fetched):
+                    for f in children:
+                        fid = str(getattr(f, "id", "") or "")
+                        if not fid or fid in seen:
+                            continue
+                        seen.add(fid)
+                        name = str(getattr(f, "name", "") or "Folder")
+                        path = f"{parent_path}/{name}" if parent_path else name
+                        results.append(
+                            {"id": fid, "name": name, "path": path, "obj": f, "parent_id": parent_id, "depth": depth}
+                        )
+                        next_level.append((fid, path))
+                        if len(results) >= limit:
+                            limit_capped = True
+                            break
+                    if limit_capped:
+                        break
+                level = next_level
+                depth += 1
+
+        logger.debug(
+            "Folder tree crawled: folders=%s levels=%s requests=%s elapsed=%.0fms",
+            len(results),
+            depth,
+            requests_made,
+            (time.monotonic() - t0) * 1000.0,
+        )
+        if not complete:
+            # A transient failure must not hide folders until the TTL expires.
+            logger.info("Folder tree crawl incomplete; not caching it")
+            return results
+        with self._folder_tree_lock:
+            self._folder_tree_cache = {
+                "user_id": user_id,
+                "at": time.monotonic(),
+                "max_depth": max_depth,
+                "depth_capped": bool(level),
+                "limit_capped": limit_capped,
+                "results": [dict(row) for row in results],
+            }
         return results
 
     def move_cloud_playlist_to_folder(self, playlist_or_id, target_folder_id="root"):
@@ -906,6 +1129,8 @@ class TidalBackend:
                 base_url=self.session.config.api_v2_location,
                 params=params,
             )
+            # Folder objects carry item counts; drop the cached tree either way.
+            self.invalidate_folder_tree()
             return {
                 "ok": bool(getattr(res, "ok", False)),
                 "playlist_id": pid or None,
@@ -920,6 +1145,7 @@ class TidalBackend:
             )
             return {"ok": False, "playlist_id": pid or None, "target_folder_id": str(target_folder_id or "root")}
 
+    @app_metrics.timed("tidal_api_seconds", endpoint="playlist_edit")
     def add_tracks_to_cloud_playlist(self, playlist_or_id, tracks, dedupe=True, batch_size=100):
         pl = self._resolve_user_playlist(playlist_or_id)
         if pl is None:
@@ -998,6 +1224,7 @@ class TidalBackend:
                 "skipped_invalid": skipped_invalid,
             }
 
+    @app_metrics.timed("tidal_api_seconds", endpoint="playlist_edit")
     def remove_tracks_from_cloud_playlist(self, playlist_or_id, tracks_or_ids):
         pl = self._resolve_user_playlist(playlist_or_id)
         if pl is None:
@@ -1186,6 +1413,7 @@ class TidalBackend:
             "skipped_invalid": int(add_res.get("skipped_invalid", 0)),
         }
 
+    @app_metrics.timed("tidal_api_seconds", endpoint="artist_albums")
     def get_albums(self, art):
         try:
             # History/Local objects may only contain artist id/name and
@@ -1201,6 +1429,7 @@ class TidalBackend:
             logger.warning("Failed to fetch albums for artist %s: %s", getattr(art, "id", "unknown"), e)
             return []
 
+    @app_metrics.timed("tidal_api_seconds", endpoint="resolve_artist")
     def resolve_artist(self, artist_id=None, artist_name=None):
         """
         Resolve a lightweight/local artist reference into a real TIDAL artist object.
@@ -1227,6 +1456,7 @@ class TidalBackend:
     # ==========================================
     # [核心修改] 带过滤功能的 get_home_page
     # ==========================================
+    @app_metrics.timed("tidal_api_seconds", endpoint="home_page")
     def get_home_page(self):
         """
         获取 Tidal 首页，并根据用户需求过滤栏目。
@@ -1310,6 +1540,95 @@ class TidalBackend:
             logger.debug("Failed to process home item of type %s: %s", type(item).__name__, e)
             return None
 
+    def home_item_key(self, item):
+        obj = item.get("obj") if isinstance(item, dict) else None
+        oid = item.get("id") if isinstance(item, dict) and item.get("id") is not None else getattr(obj, "id", None)
+        typ = item.get("type") if isinstance(item, dict) else None
+        return f"{typ or 'Unknown'}:{oid}"
+
+    def snapshot_home_sections(self, sections):
+        """
+        Convert processed home sections into JSON-safe dicts for HomeSnapshotStore.
+        Items without a stable id cannot be resolved later and are skipped.
+        """
+        out = []
+        for sec in list(sections or []):
+            items = []
+            for item in list(sec.get("items") or []):
+                if not isinstance(item, dict):
+                    continue
+                oid = item.get("id") if item.get("id") is not None else getattr(item.get("obj"), "id", None)
+                if oid is None:
+                    continue
+                items.append(
+                    {
+                        "id": str(oid),
+                        "type": str(item.get("type") or ""),
+                        "name": str(item.get("name") or ""),
+                        "sub_title": str(item.get("sub_title") or ""),
+                        "image_url": str(item.get("image_url") or ""),
+                    }
+                )
+            if items:
+                out.append({"title": str(sec.get("title") or ""), "items": items})
+        return out
+
+    def restore_home_sections(self, snapshot_sections):
+        """
+        Rebuild render-ready home sections from a snapshot. Items carry a
+        lightweight placeholder obj and `snapshot=True`; use resolve_home_item()
+        to get the live object before opening one.
+        """
+        out = []
+        for sec in list(snapshot_sections or []):
+            if not isinstance(sec, dict):
+                continue
+            items = []
+            for raw in list(sec.get("items") or []):
+                if not isinstance(raw, dict) or not raw.get("id"):
+                    continue
+                name = str(raw.get("name") or "Unknown")
+                items.append(
+                    {
+                        "obj": SimpleNamespace(id=raw.get("id"), name=name),
+                        "id": raw.get("id"),
+                        "name": name,
+                        "sub_title": str(raw.get("sub_title") or ""),
+                        "image_url": raw.get("image_url") or None,
+                        "type": str(raw.get("type") or ""),
+                        "snapshot": True,
+                    }
+                )
+            if items:
+                out.append({"title": str(sec.get("title") or ""), "items": items})
+        return out
+
+    @app_metrics.timed("tidal_api_seconds", endpoint="home_item")
+    def resolve_home_item(self, item):
+        if not isinstance(item, dict):
+            return None
+        if not item.get("snapshot"):
+            return item.get("obj")
+        oid = item.get("id")
+        getter_name = {
+            "Album": "album",
+            "Artist": "artist",
+            "Track": "track",
+            "Video": "video",
+            "Playlist": "playlist",
+            "UserPlaylist": "playlist",
+            "Mix": "mix",
+            "MixV2": "mix",
+        }.get(str(item.get("type") or ""))
+        getter = getattr(self.session, getter_name, None) if getter_name else None
+        if oid is None or getter is None:
+            return None
+        try:
+            return self._retry_api_call(lambda: getter(oid))
+        except Exception as e:
+            logger.warning("Resolve home item %s failed [%s]: %s", self.home_item_key(item), classify_exception(e), e)
+            return None
+
     def _get_fallback_mixes(self):
         try:
             if hasattr(self.user, 'mixes'):
@@ -1319,6 +1638,7 @@ class TidalBackend:
             logger.warning("Failed to fetch fallback mixes: %s", e)
             return []
 
+    @app_metrics.timed("tidal_api_seconds", endpoint="tracks")
     def get_tracks(self, item):
         try:
             # 1. 解包
@@ -1702,6 +2022,7 @@ class TidalBackend:
             if cache_key and chosen_url:
                 self._artist_artwork_cache[cache_key] = chosen_url
 
+    @app_metrics.timed("tidal_api_seconds", endpoint="stream_url")
     def get_stream_url(self, track):
         preferred = self.quality
         qualities = self._get_stream_quality_fallback_chain()
@@ -1766,6 +2087,7 @@ class TidalBackend:
         logger.info("Quality mode set: %s -> %s", mode_str, self.quality)
         self._apply_global_config()
 
+    @app_metrics.timed("tidal_api_seconds", endpoint="search_artist")
     def search_artist(self, query):
         try:
             # Some tidalapi versions do not expose tidalapi.models.
@@ -1782,6 +2104,7 @@ class TidalBackend:
             logger.warning("Artist search failed for query '%s': %s", query, e)
             return []
 
+    @app_metrics.timed("tidal_api_seconds", endpoint="search")
     def search_items(self, query):
         logger.info("Starting search for query: '%s'", query)
         results = {'artists': [], 'albums': [], 'tracks': []}
@@ -1833,14 +2156,98 @@ class TidalBackend:
             logger.exception("Search critical failure [%s]: %s", classify_exception(e), e)
             return results
 
+    def _lyrics_cache_path(self, track_id):
+        safe = "".join(ch if (ch.isalnum() or ch in ("-", "_")) else "_" for ch in str(track_id))
+        return os.path.join(self.lyrics_cache_dir, f"{safe}.json")
+
+    def _load_lyrics_from_disk(self, track_id):
+        path = self._lyrics_cache_path(track_id)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False, None
+        if not isinstance(data, dict):
+            return False, None
+        text = data.get("text")
+        if text is None:
+            saved_at = float(data.get("saved_at", 0) or 0)
+            if (time.time() - saved_at) > LYRICS_MISS_TTL_SEC:
+                return False, None
+        elif not isinstance(text, str):
+            return False, None
+        return True, text
+
+    def _store_lyrics_on_disk(self, track_id, value):
+        path = self._lyrics_cache_path(track_id)
+        temp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self.lyrics_cache_dir, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"saved_at": time.time(), "text": value}, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.debug("Failed to persist lyrics for %s: %s", track_id, e)
+
+    def prune_lyrics_cache(self, max_files=LYRICS_CACHE_MAX_FILES, max_age_days=LYRICS_CACHE_MAX_DAYS):
+        """
+        Drop persisted lyrics older than max_age_days, then the oldest entries
+        beyond max_files.
+        """
+        try:
+            if not os.path.isdir(self.lyrics_cache_dir):
+                return
+            cutoff = time.time() - max_age_days * 24 * 3600
+            files = []
+            for entry in os.scandir(self.lyrics_cache_dir):
+                if not entry.is_file() or not entry.name.endswith((".json", ".tmp")):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+                if mtime < cutoff:
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+                elif entry.name.endswith(".json"):
+                    files.append((entry.path, mtime))
+            if len(files) <= max_files:
+                return
+            files.sort(key=lambda x: x[1], reverse=True)
+            for path, _ in files[max(0, max_files):]:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        except Exception as e:
+            logger.debug("Lyrics cache prune failed: %s", e)
+
+    def peek_lyrics(self, track_id, disk=True):
+        """
+        (hit, lyrics) from the memory cache and, when disk is set, the on-disk
+        store; never touches the network. A hit with None is a known miss.
+        """
+        if track_id in self.lyrics_cache:
+            return True, self.lyrics_cache.get(track_id)
+        if not disk:
+            return False, None
+        hit, value = self._load_lyrics_from_disk(track_id)
+        if hit:
+            self._cache_lyrics(track_id, value, persist=False)
+        return hit, value
+
     def get_lyrics(self, track_id):
         logger.debug("Fetching lyrics for track id: %s", track_id)
-        if track_id in self.lyrics_cache:
+        hit, cached = self.peek_lyrics(track_id)
+        if hit:
             logger.debug("Lyrics cache hit for track id: %s", track_id)
-            return self.lyrics_cache.get(track_id)
+            return cached
 
         try:
-            lyrics_obj = self.session.track(track_id).lyrics()
+            with app_metrics.timer("tidal_api_seconds", endpoint="lyrics"):
+                lyrics_obj = self.session.track(track_id).lyrics()
 
             if not lyrics_obj:
                 logger.debug("Lyrics result: none (no lyrics object found)")
@@ -1869,13 +2276,48 @@ class TidalBackend:
                 logger.warning("Lyrics fetch error [%s]: %s", classify_exception(e), e)
             return None
 
-    def _cache_lyrics(self, track_id, value):
+    def _cache_lyrics(self, track_id, value, persist=True):
+        if persist:
+            self._store_lyrics_on_disk(track_id, value)
         self.lyrics_cache[track_id] = value
         if len(self.lyrics_cache) <= self.max_lyrics_cache:
             return
         oldest_key = next(iter(self.lyrics_cache))
         self.lyrics_cache.pop(oldest_key, None)
 
+    # Async variants of the hot paths, for coroutines on the app_async bridge.
+    # The tidalapi calls stay blocking and run on the executor's network lane;
+    # these add timeouts, cancellation and cheap fan-out on top.
+
+    async def search_items_async(self, query, timeout=ASYNC_TIMEOUT_SEC):
+        return await app_async.call(self.search_items, query, timeout=timeout)
+
+    async def search_many_async(self, queries, timeout=ASYNC_TIMEOUT_SEC):
+        """
+        search_items for several query variants at once; a failed or timed-out
+        variant is dropped unless all of them fail.
+        """
+        queries = list(queries or [])
+        results = await app_async.get_bridge().gather_limited(
+            [self.search_items_async(q, timeout=timeout) for q in queries], limit=4
+        )
+        hits = [r for r in results if not isinstance(r, BaseException)]
+        if queries and not hits:
+            raise results[0]
+        return hits
+
+    async def get_favorite_tracks_async(self, limit=50, timeout=ASYNC_TIMEOUT_SEC * 3):
+        return await app_async.call(self.get_favorite_tracks, limit, timeout=timeout)
+
+    async def get_stream_url_async(self, track, timeout=ASYNC_TIMEOUT_SEC):
+        return await app_async.call(self.get_stream_url, track, timeout=timeout)
+
+    async def get_lyrics_async(self, track_id, timeout=ASYNC_TIMEOUT_SEC):
+        hit, cached = self.peek_lyrics(track_id, disk=False)
+        if hit:
+            return cached
+        return await app_async.call(self.get_lyrics, track_id, timeout=timeout)
+
     def logout(self):
         for token_path in (self.token_file, self.legacy_token_file):
             if os.path.exists(token_path):
@@ -1885,6 +2327,7 @@ class TidalBackend:
                     logger.warning("Failed to remove token file %s: %s", token_path, e)
         self.user = None
         self.session = tidalapi.Session()
+        self.invalidate_folder_tree()
         self.fav_album_ids = set()
         self.fav_track_ids = set()
         self._apply_global_config()
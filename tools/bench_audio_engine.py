@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Headless benchmark for the Rust audio core (rust_audio_core).
+
+Generates local test files (WAV, plus FLAC when GStreamer's flacenc is
+available), plays them through the engine on its "fake" output driver (a
+clock-synced fakesink, so no audio hardware is needed) and reports:
+
+- time to first audio: rac_set_uri + rac_play until the position advances
+- seek latency: rac_seek until playback resumes at the target
+- output switch: rac_set_output_tuned while playing, until the position advances again
+- spectrum frame rate and frames dropped (sequence gaps) while playing
+- process CPU seconds per minute of playback
+
+    cargo build --release --manifest-path rust_audio_core/Cargo.toml
+    python tools/bench_audio_engine.py
+    python tools/bench_audio_engine.py --formats wav --rates 44100,192000 --play-sec 20
+
+Exits 1 when a median regresses by more than --tolerance over the baseline.
+"""
+import argparse
+import json
+import math
+import os
+import resource
+import shutil
+import statistics
+import struct
+import sys
+import tempfile
+import time
+import wave
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "tools", "audio_engine_baseline.json")
+FAKE_DRIVER = "fake"
+POLL_SEC = 0.002
+WAIT_TIMEOUT_SEC = 5.0
+# Position reached after a seek, within this window of the target.
+SEEK_WINDOW_SEC = 0.5
+METRICS = ("first_audio_ms", "seek_ms", "output_switch_ms", "spectrum_fps", "spectrum_dropped", "cpu_sec_per_min")
+# Lower is better for all but the spectrum frame rate.
+HIGHER_IS_BETTER = ("spectrum_fps",)
+
+
+def write_wav(path, seconds=30.0, rate=44100, bits=16, channels=2):
+    """
+    A stereo sweep (55Hz..8kHz, repeating every second) so the spectrum
+    analyser sees moving bands.
+    """
+    width = bits // 8
+    peak = (1 << (bits - 1)) - 1
+    second = bytearray()
+    phase = 0.0
+    for i in range(rate):
+        freq = 55.0 * math.pow(8000.0 / 55.0, i / rate)
+        phase += 2.0 * math.pi * freq / rate
+        second += struct.pack("<i", int(0.5 * peak * math.sin(phase)))[:width] * channels
+    whole, rest = divmod(int(seconds * rate), rate)
+    with wave.open(path, "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(width)
+        w.setframerate(rate)
+        for _ in range(whole):
+            w.writeframes(second)
+        w.writeframes(bytes(second[: rest * width * channels]))
+    return path
+
+
+def wav_to_flac(wav_path, flac_path):
+    """
+    Encode with GStreamer; returns None when flacenc is unavailable.
+    """
+    try:
+        import gi
+
+        gi.require_version("Gst", "1.0")
+        from gi.repository import Gst
+
+        Gst.init(None)
+        pipeline = Gst.parse_launch(
+            f'filesrc location="{wav_path}" ! wavparse ! audioconvert ! flacenc ! filesink location="{flac_path}"'
+        )
+    except Exception as e:
+        print(f"FLAC encoding unavailable ({e}); WAV only", file=sys.stderr)
+        return None
+    pipeline.set_state(Gst.State.PLAYING)
+    msg = pipeline.get_bus().timed_pop_filtered(60 * Gst.SECOND, Gst.MessageType.EOS | Gst.MessageType.ERROR)
+    pipeline.set_state(Gst.State.NULL)
+    if msg is None or msg.type == Gst.MessageType.ERROR:
+        return None
+    return flac_path
+
+
+def _wait_for(cond, timeout=WAIT_TIMEOUT_SEC):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if cond():
+            return True
+        time.sleep(POLL_SEC)
+    return False
+
+
+def _advancing(core, after):
+    return lambda: core.get_position() > after
+
+
+def _cpu_sec():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def measure_file(core, path, play_sec=10.0, seeks=5):
+    """
+    One pass over a file; returns the raw measurements (ms / counts).
+    """
+    out = {"seek_ms": [], "errors": []}
+    core.stop()
+    started = time.perf_counter()
+    core.set_uri("file://" + os.path.abspath(path))
+    core.play()
+    if not _wait_for(_advancing(core, 0.0)):
+        out["errors"].append("no audio after play")
+        return out
+    out["first_audio_ms"] = (time.perf_counter() - started) * 1000.0
+
+    core.set_spectrum_enabled(True)
+    last_seq = 0
+    frames = dropped = 0
+    cpu0, t0 = _cpu_sec(), time.perf_counter()
+    while time.perf_counter() - t0 < play_sec:
+        for seq, _pos, _vals in core.get_spectrum_frames_since(last_seq, max_frames=48, max_bands=128):
+            if last_seq and seq > last_seq + 1:
+                dropped += seq - last_seq - 1
+            last_seq = max(last_seq, seq)
+            frames += 1
+        core.pump_events()
+        # Poll like the UI pump does (~60Hz).
+        time.sleep(1.0 / 60.0)
+    wall = time.perf_counter() - t0
+    out["cpu_sec_per_min"] = (_cpu_sec() - cpu0) / wall * 60.0
+    out["spectrum_fps"] = frames / wall
+    out["spectrum_dropped"] = dropped
+    core.set_spectrum_enabled(False)
+
+    duration = core.get_duration() or 0.0
+    for i in range(max(0, seeks)):
+        target = (duration or play_sec) * (0.2 + 0.6 * (i % 4) / 3.0)
+        started = time.perf_counter()
+        core.seek(target)
+        landed = lambda: abs(core.get_position() - target) < SEEK_WINDOW_SEC and core.get_position() > target  # noqa: E731
+        if _wait_for(landed):
+            out["seek_ms"].append((time.perf_counter() - started) * 1000.0)
+        else:
+            out["errors"].append(f"seek to {target:.1f}s did not resume")
+
+    pos = core.get_position()
+    started = time.perf_counter()
+    rc = core.set_output(FAKE_DRIVER, None, buffer_us=100000, latency_us=10000)
+    if rc == 0 and _wait_for(_advancing(core, pos + 0.01)):
+        out["output_switch_ms"] = (time.perf_counter() - started) * 1000.0
+    else:
+        out["errors"].append(f"output switch failed rc={rc}")
+    core.stop()
+    return out
+
+
+def summarize(results):
+    """
+    Per-file medians of each metric (first audio and output switch are
+    single samples per run; seeks are pooled across runs).
+    """
+
+    def median(values):
+        values = [v for v in values if v is not None]
+        return round(statistics.median(values), 2) if values else None
+
+    summary = {}
+    for name, runs in results.items():
+        entry = {"runs": len(runs), "errors": sum(len(r.get("errors", [])) for r in runs)}
+        for metric in METRICS:
+            if metric == "seek_ms":
+                entry[metric] = median([v for r in runs for v in r.get("seek_ms", [])])
+            else:
+                entry[metric] = median([r.get(metric) for r in runs])
+        summary[name] = entry
+    return summary
+
+
+def evaluate(summary, baseline=None, tolerance=0.2):
+    """
+    List of regression messages (empty when within limits).
+    """
+    problems = []
+    for name, cur in summary.items():
+        if cur.get("errors"):
+            problems.append(f"{name}: {cur['errors']} failed measurement(s)")
+        base = (baseline or {}).get(name) or {}
+        for metric in METRICS:
+            now, was = cur.get(metric), base.get(metric)
+            if now is None or not was:
+                continue
+            if metric in HIGHER_IS_BETTER:
+                worse = now < was * (1.0 - tolerance)
+            else:
+                worse = now > was * (1.0 + tolerance)
+            if worse:
+                problems.append(f"{name} {metric} {now:g} regressed >{tolerance:.0%} over baseline {was:g}")
+    return problems
+
+
+def make_files(workdir, formats, rates, seconds):
+    files = {}
+    for rate in rates:
+        bits = 16 if rate <= 48000 else 24
+        wav = write_wav(os.path.join(workdir, f"sweep_{rate}.wav"), seconds=seconds, rate=rate, bits=bits)
+        if "wav" in formats:
+            files[f"wav_{rate}_{bits}"] = wav
+        if "flac" in formats:
+            flac = wav_to_flac(wav, os.path.join(workdir, f"sweep_{rate}.flac"))
+            if flac:
+                files[f"flac_{rate}_{bits}"] = flac
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--formats", default="wav,flac")
+    parser.add_argument("--rates", default="44100,96000")
+    parser.add_argument("--file-sec", type=float, default=30.0, help="length of the generated files")
+    parser.add_argument("--play-sec", type=float, default=10.0, help="playback measured per run")
+    parser.add_argument("--seeks", type=int, default=5)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression (default 0.2)")
+    args = parser.parse_args()
+
+    sys.path.insert(0, REPO_ROOT)
+    from rust_audio_engine import _RustAudioCore
+
+    core = _RustAudioCore()
+    if not core.available:
+        print("Rust audio core not available; build rust_audio_core first", file=sys.stderr)
+        return 2
+    if core.set_output(FAKE_DRIVER, None) != 0:
+        print("engine has no fake output driver (rebuild rust_audio_core)", file=sys.stderr)
+        return 2
+
+    workdir = tempfile.mkdtemp(prefix="hiresti-audio-bench-")
+    try:
+        formats = {f.strip() for f in args.formats.split(",") if f.strip()}
+        rates = [int(r) for r in args.rates.split(",") if r.strip()]
+        files = make_files(workdir, formats, rates, args.file_sec)
+        results = {}
+        for name, path in files.items():
+            for i in range(max(1, args.runs)):
+                r = measure_file(core, path, play_sec=args.play_sec, seeks=args.seeks)
+                results.setdefault(name, []).append(r)
+                print(
+                    f"{name} run {i + 1}: first audio {r.get('first_audio_ms', float('nan')):.0f}ms, "
+                    f"{len(r['seek_ms'])} seeks, errors {r['errors'] or '-'}"
+                )
+    finally:
+        core.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    summary = summarize(results)
+    print(json.dumps(summary, indent=1))
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=1)
+            f.write("\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    baseline = None
+    try:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        print(f"no baseline at {args.baseline}; only failed measurements are checked")
+    problems = evaluate(summary, baseline, args.tolerance)
+    for msg in problems:
+        print(f"REGRESSION: {msg}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Offline TidalBackend benchmark against a fake TIDAL session.
+
+Each scenario runs the real backend code against tools/fake_tidal.py with a
+generated library of the given sizes, a per-request latency and an optional
+failure rate, and reports the median wall time, the number of API requests
+and the number of items returned.
+
+    python tools/bench_backend.py
+    python tools/bench_backend.py --sizes 1000,10000,50000 --latency-ms 30 --runs 5
+    python tools/bench_backend.py --scenarios search,home --update-baseline
+
+Exits 1 when a scenario's median regresses by more than --tolerance over the
+baseline (only compared when the baseline used the same latency settings).
+"""
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_tidal import FakeTidalSession, attach  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "tools", "backend_baseline.json")
+DEFAULT_SIZES = (1000, 10000, 50000)
+ARTWORK_ARTISTS = 200
+# Regressions below this many milliseconds are noise.
+MIN_REGRESSION_MS = 5.0
+
+
+def _favorites(backend, session, size):
+    return len(backend.get_favorite_tracks(limit=size)) + len(backend.get_recent_albums(limit=size))
+
+
+def _search(backend, session, size):
+    return sum(len(v) for q in ("night", "river gold", "zzz") for v in backend.search_items(q).values())
+
+
+def _home(backend, session, size):
+    return sum(len(s["items"]) for s in backend.get_home_page())
+
+
+def _artist_artwork(backend, session, size):
+    backend._artist_artwork_cache.clear()
+    artists = session.artists()[:ARTWORK_ARTISTS]
+    return sum(1 for a in artists if backend.get_artist_artwork_url(a, 320))
+
+
+def _playlist_sync(backend, session, size):
+    # Half of the local playlist is already in the cloud playlist.
+    target = session.user.create_playlist("Bench Sync", "")
+    tracks = [{"track_id": str(t.id)} for t in session.tracks()]
+    target.add([t["track_id"] for t in tracks[: len(tracks) // 2]])
+    result = backend.sync_local_playlist_to_cloud({"name": "Local", "tracks": tracks}, cloud_playlist_id=target.id)
+    return result["added"]
+
+
+SCENARIOS = {
+    "favorites": _favorites,
+    "search": _search,
+    "home": _home,
+    "artist_artwork": _artist_artwork,
+    "playlist_sync": _playlist_sync,
+}
+
+
+def make_backend(session):
+    from tidal_backend import TidalBackend
+
+    return attach(TidalBackend(), session)
+
+
+def run_scenario(name, size, runs=3, latency_ms=0.0, jitter_ms=0.0, failure_rate=0.0):
+    """
+    Median wall time (ms), requests per run and items returned for one
+    scenario at one library size. The library is built once, outside timing.
+    """
+    fn = SCENARIOS[name]
+    session = FakeTidalSession(size, latency_ms=latency_ms, jitter_ms=jitter_ms, failure_rate=failure_rate)
+    backend = make_backend(session)
+    times = []
+    items = None
+    requests_per_run = 0
+    for _ in range(max(1, runs)):
+        session.reset_calls()
+        started = time.perf_counter()
+        items = fn(backend, session, size)
+        times.append(time.perf_counter() - started)
+        requests_per_run = sum(session.calls.values())
+    return {
+        "median_ms": round(statistics.median(times) * 1000.0, 2),
+        "min_ms": round(min(times) * 1000.0, 2),
+        "requests": requests_per_run,
+        "items": items,
+    }
+
+
+def run_all(scenarios, sizes, runs=3, latency_ms=0.0, jitter_ms=0.0, failure_rate=0.0, on_result=None):
+    results = {}
+    for name in scenarios:
+        for size in sizes:
+            key = f"{name}@{size}"
+            results[key] = run_scenario(name, size, runs, latency_ms, jitter_ms, failure_rate)
+            if on_result is not None:
+                on_result(key, results[key])
+    return results
+
+
+def evaluate(summary, baseline=None, tolerance=0.2):
+    """
+    List of regression messages (empty when within limits).
+    """
+    if not baseline or baseline.get("settings") != summary.get("settings"):
+        return []
+    problems = []
+    for key, cur in summary.get("results", {}).items():
+        base = (baseline.get("results") or {}).get(key)
+        if not base:
+            continue
+        now_ms, base_ms = cur["median_ms"], base["median_ms"]
+        if now_ms > base_ms * (1.0 + tolerance) and now_ms - base_ms >= MIN_REGRESSION_MS:
+            problems.append(f"{key} {now_ms:.1f}ms regressed >{tolerance:.0%} over baseline {base_ms:.1f}ms")
+        if cur["requests"] > base["requests"]:
+            problems.append(f"{key} made {cur['requests']} requests (baseline {base['requests']})")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="comma-separated subset")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES))
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="share of requests failing with 503")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression (default 0.2)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = [s for s in scenarios if s not in SCENARIOS]
+    if unknown:
+        print(f"unknown scenario(s): {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+
+    def report(key, r):
+        print(f"{key:<26} {r['median_ms']:>10.1f}ms  {r['requests']:>6} requests  {r['items']:>7} items")
+
+    results = run_all(scenarios, sizes, args.runs, args.latency_ms, args.jitter_ms, args.failure_rate, on_result=report)
+    summary = {
+        "settings": {"latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms, "failure_rate": args.failure_rate},
+        "results": results,
+    }
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=1)
+            f.write("\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    baseline = None
+    try:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        print(f"no baseline at {args.baseline}; nothing to compare")
+    problems = evaluate(summary, baseline, args.tolerance)
+    for msg in problems:
+        print(f"REGRESSION: {msg}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Headless cold-start benchmark for TidalApp.
+
+Each run starts main.py under a virtual X display (xvfb-run) with a fresh
+HOME and the TIDAL session stubbed to "not logged in", so no network is
+involved. The app writes its HIRESTI_STARTUP_TRACE timeline and quits on the
+first frame; the median time to first frame is compared with a baseline.
+
+    python tools/bench_startup.py --runs 5
+    python tools/bench_startup.py --runs 9 --update-baseline
+
+Exits 1 when the median regresses by more than --tolerance over the baseline,
+or exceeds --budget-ms.
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "tools", "startup_baseline.json")
+PHASES = ("app_init", "backend_init", "audio_engine_init", "activate", "ui_build", "win_present")
+
+
+def _child():
+    """
+    Runs inside the virtual display: stub the session, then start the app.
+    """
+    sys.path.insert(0, REPO_ROOT)
+    import app_startup  # noqa: F401  (first import: starts the clock and import timer)
+    import tidal_backend
+
+    tidal_backend.TidalBackend.try_load_session = lambda self, sync_favorites=True: False
+    import main
+
+    main.setup_logging()
+    main.TidalApp().run(None)
+
+
+def _run_once(timeout, use_xvfb, keep_home):
+    work = tempfile.mkdtemp(prefix="hiresti-bench-")
+    trace = os.path.join(work, "trace.json")
+    env = dict(os.environ)
+    env["HIRESTI_STARTUP_TRACE"] = trace
+    env["HIRESTI_STARTUP_EXIT_AFTER_FIRST_FRAME"] = "1"
+    if not keep_home:
+        env["HOME"] = work
+        env["XDG_CACHE_HOME"] = os.path.join(work, ".cache")
+        env["XDG_CONFIG_HOME"] = os.path.join(work, ".config")
+    cmd = [sys.executable, os.path.abspath(__file__), "--child"]
+    if use_xvfb:
+        cmd = ["xvfb-run", "-a", "-s", "-screen 0 1600x1000x24"] + cmd
+    started = time.monotonic()
+    try:
+        proc = subprocess.run(cmd, env=env, cwd=REPO_ROOT, timeout=timeout, capture_output=True, text=True)
+        with open(trace, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError, subprocess.TimeoutExpired) as e:
+        raise RuntimeError(f"startup run failed: {e}") from e
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+    if "first_frame" not in data.get("marks", {}):
+        raise RuntimeError(f"no first frame recorded (exit {proc.returncode}):\n{proc.stderr[-2000:]}")
+    data["wall_sec"] = time.monotonic() - started
+    return data
+
+
+def summarize(traces):
+    """
+    Median milliseconds of the first-frame mark, the import mark and each phase.
+    """
+
+    def median_ms(values):
+        values = [v for v in values if v is not None]
+        return round(statistics.median(values) * 1000.0, 1) if values else None
+
+    out = {
+        "runs": len(traces),
+        "first_frame_ms": median_ms([t["marks"].get("first_frame") for t in traces]),
+        "imports_ms": median_ms([t["marks"].get("imports") for t in traces]),
+    }
+    for name in PHASES:
+        out[f"{name}_ms"] = median_ms(
+            [sum(s["duration"] for s in t.get("spans", []) if s["name"] == name) for t in traces]
+        )
+    return out
+
+
+def evaluate(summary, baseline=None, tolerance=0.2, budget_ms=None):
+    """
+    List of regression messages (empty when within limits).
+    """
+    problems = []
+    current = summary.get("first_frame_ms")
+    if current is None:
+        return ["no first-frame measurement"]
+    if budget_ms is not None and current > budget_ms:
+        problems.append(f"first frame {current:.0f}ms exceeds budget {budget_ms:.0f}ms")
+    base = (baseline or {}).get("first_frame_ms")
+    if base and current > base * (1.0 + tolerance):
+        problems.append(f"first frame {current:.0f}ms regressed >{tolerance:.0%} over baseline {base:.0f}ms")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression (default 0.2)")
+    parser.add_argument("--budget-ms", type=float, default=None, help="absolute first-frame budget")
+    parser.add_argument("--no-xvfb", action="store_true", help="use the current display")
+    parser.add_argument("--keep-home", action="store_true", help="use the real HOME (warm caches/settings)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child()
+        return 0
+
+    use_xvfb = not args.no_xvfb
+    if use_xvfb and shutil.which("xvfb-run") is None:
+        print("xvfb-run not found; install xvfb or pass --no-xvfb", file=sys.stderr)
+        return 2
+
+    traces = []
+    for i in range(max(1, args.runs)):
+        trace = _run_once(args.timeout, use_xvfb, args.keep_home)
+        print(f"run {i + 1}: first frame {trace['marks']['first_frame'] * 1000.0:.0f}ms")
+        traces.append(trace)
+    summary = summarize(traces)
+    print(json.dumps(summary, indent=1))
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=1)
+            f.write("\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    baseline = None
+    try:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        print(f"no baseline at {args.baseline}; only --budget-ms is checked")
+    problems = evaluate(summary, baseline, args.tolerance, args.budget_ms)
+    for msg in problems:
+        print(f"REGRESSION: {msg}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,289 @@
+"""
+Offline stand-in for a logged-in tidalapi session.
+
+FakeTidalSession serves a generated library (artists, albums, tracks,
+playlists) through the subset of the tidalapi surface TidalBackend uses:
+favorites paging, search, home, artist/playlist/track lookups and playlist
+edits. Every request sleeps for the configured latency (plus jitter) and
+fails with a 503 at the configured rate, and is counted per endpoint, so
+backend code paths can be benchmarked without an account or network.
+
+    session = FakeTidalSession(library_size=10000, latency_ms=40, failure_rate=0.01)
+    backend = attach(TidalBackend(), session)
+"""
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+
+import requests
+
+# Share of artists without their own picture (exercises the artwork fallback).
+NO_PICTURE_RATE = 0.3
+TRACKS_PER_ALBUM = 10
+ALBUMS_PER_ARTIST = 4
+WORDS = (
+    "blue", "night", "river", "gold", "echo", "glass", "summer", "north", "velvet", "static",
+    "paper", "ocean", "silver", "fire", "garden", "neon", "winter", "shadow", "signal", "bloom",
+)
+
+
+class FakeTidalError(requests.HTTPError):
+    pass
+
+
+class FakeArtist:
+    def __init__(self, session, aid, name, picture):
+        self._session = session
+        self.id = aid
+        self.name = name
+        self.picture = picture
+
+    def get_albums(self):
+        self._session._request("artist_albums")
+        return list(self._session._albums_by_artist.get(self.id, []))
+
+
+class FakeAlbum:
+    def __init__(self, aid, name, artist, cover):
+        self.id = aid
+        self.name = name
+        self.artist = artist
+        self.artists = [artist]
+        self.cover = cover
+
+
+class FakeTrack:
+    def __init__(self, session, tid, name, album, duration):
+        self._session = session
+        self.id = tid
+        self.name = name
+        self.album = album
+        self.artist = album.artist
+        self.artists = [album.artist]
+        self.duration = duration
+
+    def lyrics(self):
+        self._session._request("lyrics")
+        if self.id % 3 == 0:
+            raise requests.HTTPError("404 Client Error: Not Found")
+        return type("Lyrics", (), {"subtitles": f"[00:01.00] {self.name}\n", "text": self.name})()
+
+    def get_url(self):
+        self._session._request("stream_url")
+        return f"https://fake.tidal.local/stream/{self.id}.flac"
+
+
+class FakePlaylist:
+    def __init__(self, session, pid, name, track_ids=()):
+        self._session = session
+        self.id = pid
+        self.name = name
+        self.description = ""
+        self._track_ids = list(track_ids)
+        self._id_set = set(self._track_ids)
+
+    @property
+    def num_tracks(self):
+        return len(self._track_ids)
+
+    def tracks(self, limit=None, offset=0):
+        self._session._request("playlist_tracks")
+        ids = self._track_ids[offset:] if limit is None else self._track_ids[offset : offset + limit]
+        tracks = self._session._tracks
+        return [tracks[i] for i in ids if i in tracks]
+
+    def add(self, media_ids, allow_duplicates=False, position=-1, limit=100):
+        self._session._request("playlist_add")
+        for mid in media_ids:
+            mid = int(mid)
+            if allow_duplicates or mid not in self._id_set:
+                self._track_ids.append(mid)
+                self._id_set.add(mid)
+        return []
+
+
+class _Page:
+    def __init__(self, session, endpoint, items):
+        self._session = session
+        self._endpoint = endpoint
+        self._items = items
+
+    def __call__(self, limit=None, offset=0):
+        self._session._request(self._endpoint)
+        offset = max(0, int(offset or 0))
+        end = len(self._items) if limit is None else offset + int(limit)
+        return self._items[offset:end]
+
+
+class FakeFavorites:
+    def __init__(self, session, artists, albums, tracks):
+        self.artists = _Page(session, "favorite_artists", artists)
+        self.albums = _Page(session, "favorite_albums", albums)
+        self.tracks = _Page(session, "favorite_tracks", tracks)
+
+
+class FakeUser:
+    def __init__(self, session, favorites, playlists):
+        self._session = session
+        self.id = 1
+        self.favorites = favorites
+        self._playlists = playlists
+
+    def playlists(self, limit=None, offset=0):
+        self._session._request("user_playlists")
+        return self._playlists[offset:] if limit is None else self._playlists[offset : offset + limit]
+
+    def create_playlist(self, title, description, parent_id="root"):
+        self._session._request("playlist_create")
+        pl = FakePlaylist(self._session, f"fake-pl-{len(self._playlists) + 1}", title)
+        pl.description = description
+        self._playlists.append(pl)
+        self._session._playlists[pl.id] = pl
+        return pl
+
+
+class _Category:
+    def __init__(self, title, items):
+        self.title = title
+        self.items = items
+
+
+class FakeTidalSession:
+    """
+    library_size is the number of favorite tracks; artists and albums scale
+    with it (one album per TRACKS_PER_ALBUM tracks). Generation is seeded,
+    so equal arguments give an identical library.
+    """
+
+    def __init__(self, library_size=1000, latency_ms=0.0, jitter_ms=0.0, failure_rate=0.0, seed=0):
+        self.latency_sec = max(0.0, float(latency_ms)) / 1000.0
+        self.jitter_sec = max(0.0, float(jitter_ms)) / 1000.0
+        self.failure_rate = max(0.0, min(1.0, float(failure_rate)))
+        self.calls = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._build(max(1, int(library_size)))
+
+    def _build(self, n_tracks):
+        rng = random.Random(self._rng.random())
+        n_albums = max(1, n_tracks // TRACKS_PER_ALBUM)
+        n_artists = max(1, n_albums // ALBUMS_PER_ARTIST)
+
+        def name(words):
+            return " ".join(rng.choice(WORDS) for _ in range(words)).title()
+
+        def image_id():
+            return str(uuid.UUID(int=rng.getrandbits(128)))
+
+        self._artists = {}
+        for i in range(1, n_artists + 1):
+            picture = None if rng.random() < NO_PICTURE_RATE else image_id()
+            self._artists[i] = FakeArtist(self, i, f"{name(2)} {i}", picture)
+        self._albums = {}
+        self._albums_by_artist = {}
+        for i in range(1, n_albums + 1):
+            artist = self._artists[rng.randint(1, n_artists)]
+            album = FakeAlbum(i, f"{name(3)} {i}", artist, image_id())
+            self._albums[i] = album
+            self._albums_by_artist.setdefault(artist.id, []).append(album)
+        self._tracks = {}
+        for i in range(1, n_tracks + 1):
+            album = self._albums[min(n_albums, (i - 1) // TRACKS_PER_ALBUM + 1)]
+            self._tracks[i] = FakeTrack(self, i, f"{name(2)} {i}", album, rng.randint(90, 420))
+
+        tracks = list(self._tracks.values())
+        self._playlists = {}
+        playlists = []
+        for i in range(1, 21):
+            ids = rng.sample(sorted(self._tracks), min(len(tracks), 200))
+            pl = FakePlaylist(self, f"fake-pl-{i}", f"{name(2)} Playlist", ids)
+            self._playlists[pl.id] = pl
+            playlists.append(pl)
+        self._search_index = {}
+        for kind, objs in (("artists", self._artists), ("albums", self._albums), ("tracks", self._tracks)):
+            index = self._search_index[kind] = {}
+            for oid, obj in objs.items():
+                for w in obj.name.lower().split():
+                    index.setdefault(w, set()).add(oid)
+        favorites = FakeFavorites(self, list(self._artists.values()), list(self._albums.values()), tracks)
+        self.user = FakeUser(self, favorites, playlists)
+        self._home = [
+            _Category("Mixes for you", list(self._albums.values())[:12]),
+            _Category("Suggested new albums", list(self._albums.values())[-12:]),
+            _Category("Because you listened", tracks[:12]),
+            _Category("Popular playlists", playlists[:8]),
+            _Category("Spotlight", list(self._artists.values())[:12]),
+        ]
+
+    def _request(self, endpoint):
+        with self._lock:
+            self.calls[endpoint] += 1
+            delay = self.latency_sec + (self._rng.random() * self.jitter_sec if self.jitter_sec else 0.0)
+            fail = self.failure_rate and self._rng.random() < self.failure_rate
+        if delay:
+            time.sleep(delay)
+        if fail:
+            raise FakeTidalError(f"503 Server Error: Service Unavailable ({endpoint})")
+
+    # tidalapi.Session surface used by TidalBackend
+    def check_login(self):
+        return True
+
+    def search(self, query, limit=50, models=None):
+        # Items whose name contains every query word, like a server-side index
+        # (a linear scan would make the fake, not the backend, dominate timings).
+        self._request("search")
+        words = str(query or "").lower().split()
+        out = {}
+        for kind, objs in (("artists", self._artists), ("albums", self._albums), ("tracks", self._tracks)):
+            index = self._search_index[kind]
+            ids = set(index.get(words[0], ())) if words else set()
+            for w in words[1:]:
+                ids &= index.get(w, set())
+            out[kind] = [objs[i] for i in sorted(ids)[: int(limit)]]
+        return out
+
+    def home(self):
+        self._request("home")
+        return type("Home", (), {"categories": self._home})()
+
+    def artist(self, artist_id):
+        self._request("artist")
+        return self._artists[int(artist_id)]
+
+    def album(self, album_id):
+        self._request("album")
+        return self._albums[int(album_id)]
+
+    def track(self, track_id):
+        self._request("track")
+        return self._tracks[int(track_id)]
+
+    def playlist(self, playlist_id):
+        self._request("playlist")
+        return self._playlists.get(str(playlist_id))
+
+    # helpers for benchmarks
+    def artists(self):
+        return list(self._artists.values())
+
+    def tracks(self):
+        return list(self._tracks.values())
+
+    def playlists(self):
+        return list(self._playlists.values())
+
+    def reset_calls(self):
+        with self._lock:
+            self.calls.clear()
+
+
+def attach(backend, session):
+    """
+    Point a TidalBackend at the fake session as a logged-in user.
+    """
+    backend.session = session
+    backend.user = session.user
+    return backend
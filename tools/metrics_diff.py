@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Compare two metrics dumps (HIRESTI_METRICS_DUMP / SIGUSR1 / "Export JSON"),
+e.g. from the previous and the current release on the same machine.
+
+    python tools/metrics_diff.py old.json new.json
+    python tools/metrics_diff.py old.json new.json --match tidal_api --tolerance 0.25
+
+Prints p50/p95 per timing and cache hit ratios side by side. Exits 1 when a
+p95 present in both dumps regresses by more than --tolerance (relative).
+"""
+import argparse
+import json
+import sys
+
+
+def _load(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _ms(v):
+    return "-" if v is None else f"{v * 1000.0:.2f}"
+
+
+def _delta(old, new):
+    if not old or new is None:
+        return None
+    return (new - old) / old
+
+
+def compare(old, new, match="", tolerance=0.2, min_count=5):
+    """
+    Returns (report lines, regressed histogram keys).
+    """
+    lines = [f"{'timing':<48} {'p50 old':>9} {'p50 new':>9} {'p95 old':>9} {'p95 new':>9} {'p95 d':>7}"]
+    regressed = []
+    old_h = old.get("histograms") or {}
+    new_h = new.get("histograms") or {}
+    for key in sorted(set(old_h) | set(new_h)):
+        if match and match not in key:
+            continue
+        a = old_h.get(key) or {}
+        b = new_h.get(key) or {}
+        d = _delta(a.get("p95"), b.get("p95"))
+        enough = min(a.get("count", 0), b.get("count", 0)) >= min_count
+        flag = ""
+        if d is not None and enough and d > tolerance:
+            regressed.append(key)
+            flag = " !"
+        lines.append(
+            f"{key:<48} {_ms(a.get('p50')):>9} {_ms(b.get('p50')):>9} {_ms(a.get('p95')):>9} "
+            f"{_ms(b.get('p95')):>9} {'-' if d is None else f'{d * 100.0:+.0f}%':>7}{flag}"
+        )
+    old_c = old.get("cache_hit_ratio") or {}
+    new_c = new.get("cache_hit_ratio") or {}
+    if old_c or new_c:
+        lines.append("")
+        lines.append(f"{'cache hit ratio':<48} {'old':>9} {'new':>9}")
+        for cache in sorted(set(old_c) | set(new_c)):
+            ratios = [(d.get(cache) or {}).get("ratio") for d in (old_c, new_c)]
+            lines.append(f"{cache:<48} " + " ".join("-".rjust(9) if r is None else f"{r * 100.0:8.1f}%" for r in ratios))
+    return lines, regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--match", default="", help="only timings whose key contains this")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative p95 growth")
+    parser.add_argument("--min-count", type=int, default=5, help="ignore timings with fewer samples")
+    args = parser.parse_args(argv)
+
+    old = _load(args.old)
+    new = _load(args.new)
+    print(f"old: {old.get('app_version') or '-'}  new: {new.get('app_version') or '-'}")
+    lines, regressed = compare(old, new, match=args.match, tolerance=args.tolerance, min_count=args.min_count)
+    print("\n".join(lines))
+    if regressed:
+        print(f"\n{len(regressed)} timing(s) regressed beyond {args.tolerance * 100.0:.0f}% at p95")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,10 +5,6 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 from gi.repository import Gtk, Adw, Pango
 
-from visualizer import SpectrumVisualizer
-from visualizer_gpu import SpectrumVisualizerGPU
-from visualizer_glarea import SpectrumVisualizerGLArea
-from background_viz import BackgroundVisualizer
 import ui_config
 
 logger = logging.getLogger(__name__)
@@ -246,21 +242,9 @@ def build_body(app, container):
     app.viz_switcher.set_stack(app.viz_stack)
     app.viz_stack.connect("notify::visible-child-name", app.on_viz_page_changed)
 
-    try:
-        app.viz = SpectrumVisualizerGLArea()
-        app._viz_backend_key = "gl"
-        logger.info("Visualizer backend selected: GLArea")
-    except Exception as e_gl:
-        logger.warning("GLArea visualizer unavailable, falling back: %s", e_gl)
-        try:
-            app.viz = SpectrumVisualizerGPU()
-            app._viz_backend_key = "gpu"
-            logger.info("Visualizer backend selected: Snapshot GPU fallback")
-        except Exception as e_gpu:
-            logger.warning("Snapshot GPU visualizer unavailable, falling back: %s", e_gpu)
-            app.viz = SpectrumVisualizer()
-            app._viz_backend_key = "cairo"
-            logger.info("Visualizer backend selected: Cairo fallback")
+    # GLArea first, then Snapshot GPU, then Cairo; only the backend that is built gets imported.
+    app.viz, app._viz_backend_key = app._build_visualizer_for_backend("gl")
+    logger.info("Visualizer backend selected: %s", app._viz_backend_key)
     app.viz.set_num_bars(32)
     app.viz.set_valign(Gtk.Align.FILL)
     app.viz_stack.add_titled(app.viz, "spectrum", "Spectrum")
@@ -328,9 +312,9 @@ def build_body(app, container):
     app.lyrics_ctrl_box.append(app.lyrics_font_dd)
 
     app.lyrics_tab_root = Gtk.Overlay()
-    app.bg_viz = BackgroundVisualizer()
-    app.lyrics_tab_root.set_child(app.bg_viz)
-    app.lyrics_motion_dd = Gtk.DropDown(model=Gtk.StringList.new(app.bg_viz.get_motion_mode_names()))
+    # The lyrics background (app.bg_viz) and its motion modes are filled in by
+    # app._ensure_bg_viz() the first time the Lyrics page is shown.
+    app.lyrics_motion_dd = Gtk.DropDown(model=Gtk.StringList.new([]))
     app.lyrics_motion_dd.add_css_class("viz-theme-dd")
     app.lyrics_motion_dd.add_css_class("lyrics-motion-dd")
     app.lyrics_motion_dd.set_valign(Gtk.Align.CENTER)
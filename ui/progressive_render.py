@@ -0,0 +1,227 @@
+import logging
+import time
+from collections import deque
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+from gi.repository import GLib
+
+logger = logging.getLogger(__name__)
+
+# Share of one display frame spent building widgets; the rest is left for
+# layout, snapshot and input handling.
+FRAME_BUDGET_SHARE = 0.4
+DEFAULT_FRAME_INTERVAL_MS = 1000.0 / 60.0
+MIN_BUDGET_MS = 2.0
+MIN_CHUNK = 1
+MAX_CHUNK = 96
+
+
+def next_render_token(app, attr="_home_render_token"):
+    token = int(getattr(app, attr, 0) or 0) + 1
+    setattr(app, attr, token)
+    return token
+
+
+def cancel_renders(app, attrs=("_home_render_token", "_grid_render_token")):
+    for attr in attrs:
+        next_render_token(app, attr)
+
+
+def viewport_distance(widget, viewport):
+    """
+    Vertical distance in px between widget and the visible area of viewport.
+    Returns 0 when they overlap or when layout is not known yet.
+    """
+    try:
+        ok, rect = widget.compute_bounds(viewport)
+    except Exception:
+        return 0
+    if not ok:
+        return 0
+    top = float(rect.get_y())
+    bottom = top + float(rect.get_height())
+    height = float(viewport.get_height() or 0)
+    if bottom < 0.0:
+        return int(-bottom)
+    if height > 0.0 and top > height:
+        return int(top - height)
+    return 0
+
+
+def _frame_budget_ms(frame_clock):
+    interval_ms = DEFAULT_FRAME_INTERVAL_MS
+    if frame_clock is not None:
+        try:
+            interval_us, _presentation = frame_clock.get_refresh_info(frame_clock.get_frame_time())
+            if interval_us and interval_us > 0:
+                interval_ms = float(interval_us) / 1000.0
+        except Exception:
+            pass
+    return max(MIN_BUDGET_MS, interval_ms * FRAME_BUDGET_SHARE)
+
+
+class ProgressiveRenderer:
+    """
+    Build widgets for a list of items across display frames.
+
+    Runs from the widget's Gdk.FrameClock tick, times every chunk against a
+    share of the refresh interval and resizes the next chunk from the measured
+    per-item cost. Pending items can be reordered with a priority key so cards
+    inside the viewport are built first. Rendering stops as soon as is_current
+    returns False (render token superseded or view left).
+    """
+
+    def __init__(
+        self,
+        widget,
+        items,
+        build_item,
+        is_current=None,
+        priority=None,
+        on_done=None,
+        initial_chunk=4,
+        name="grid",
+    ):
+        self._widget = widget
+        self._pending = deque(items or [])
+        self._build_item = build_item
+        self._is_current = is_current
+        self._priority = priority
+        self._on_done = on_done
+        self._chunk = max(MIN_CHUNK, min(MAX_CHUNK, int(initial_chunk or MIN_CHUNK)))
+        self._item_ms = None
+        self._name = name
+        self._tick_id = 0
+        self._done = False
+        self._frames = 0
+        self._built = 0
+        self._busy_ms = 0.0
+        self._started_at = 0.0
+        self._needs_reprioritize = priority is not None
+
+    @property
+    def done(self):
+        return self._done
+
+    @property
+    def pending(self):
+        return len(self._pending)
+
+    def start(self):
+        if self._done:
+            return self
+        if not self._pending:
+            self._finish(cancelled=False)
+            return self
+        self._started_at = time.perf_counter()
+        try:
+            # Tick callbacks only fire while the widget is mapped, so a view
+            # that gets hidden mid-render stops consuming frames on its own.
+            self._tick_id = self._widget.add_tick_callback(self._on_tick)
+        except Exception:
+            logger.debug("Progressive render (%s): no frame clock, using idle fallback", self._name)
+            GLib.idle_add(self._on_idle)
+        return self
+
+    def cancel(self):
+        if not self._done:
+            self._finish(cancelled=True)
+
+    def request_reprioritize(self):
+        """
+        Re-sort pending items before the next chunk. Cheap enough for scroll
+        handlers: the sort runs at most once per frame, from the tick.
+        """
+        if self._priority is not None and not self._done:
+            self._needs_reprioritize = True
+
+    def reprioritize(self):
+        if self._priority is None or self._done or len(self._pending) < 2:
+            return
+        try:
+            self._pending = deque(sorted(self._pending, key=self._priority))
+        except Exception:
+            logger.debug("Progressive render (%s): priority sort failed", self._name, exc_info=True)
+        self._needs_reprioritize = False
+
+    def _on_idle(self):
+        return self._on_tick(self._widget, None) == GLib.SOURCE_CONTINUE
+
+    def _on_tick(self, _widget, frame_clock):
+        if self._done:
+            return GLib.SOURCE_REMOVE
+        if self._is_current is not None and not self._is_current():
+            # Returning SOURCE_REMOVE drops the tick callback; don't remove it twice.
+            self._tick_id = 0
+            self._finish(cancelled=True)
+            return GLib.SOURCE_REMOVE
+        if self._needs_reprioritize:
+            self.reprioritize()
+
+        budget_ms = _frame_budget_ms(frame_clock)
+        t0 = time.perf_counter()
+        built = 0
+        elapsed_ms = 0.0
+        while self._pending and built < self._chunk:
+            item = self._pending.popleft()
+            try:
+                self._build_item(item)
+            except Exception:
+                logger.exception("Progressive render (%s): item build failed", self._name)
+            built += 1
+            elapsed_ms = (time.perf_counter() - t0) * 1000.0
+            if elapsed_ms >= budget_ms:
+                break
+
+        self._frames += 1
+        self._built += built
+        self._busy_ms += elapsed_ms
+        self._adapt(built, elapsed_ms, budget_ms)
+        if self._frames == 1 and self._priority is not None:
+            # First layout pass gives real widget positions for viewport checks.
+            self._needs_reprioritize = True
+
+        if not self._pending:
+            self._tick_id = 0
+            self._finish(cancelled=False)
+            return GLib.SOURCE_REMOVE
+        return GLib.SOURCE_CONTINUE
+
+    def _adapt(self, built, elapsed_ms, budget_ms):
+        if built <= 0:
+            return
+        cost = elapsed_ms / built
+        self._item_ms = cost if self._item_ms is None else (self._item_ms * 0.7) + (cost * 0.3)
+        if self._item_ms <= 0.0:
+            target = self._chunk * 2
+        else:
+            target = int(budget_ms / self._item_ms)
+        self._chunk = max(MIN_CHUNK, min(MAX_CHUNK, target))
+
+    def _finish(self, cancelled):
+        self._done = True
+        if self._tick_id:
+            try:
+                self._widget.remove_tick_callback(self._tick_id)
+            except Exception:
+                pass
+            self._tick_id = 0
+        total_ms = (time.perf_counter() - self._started_at) * 1000.0 if self._started_at else 0.0
+        logger.debug(
+            "Progressive render (%s) %s: built=%s frames=%s busy=%.1fms wall=%.1fms last_chunk=%s",
+            self._name,
+            "cancelled" if cancelled else "done",
+            self._built,
+            self._frames,
+            self._busy_ms,
+            total_ms,
+            self._chunk,
+        )
+        self._pending.clear()
+        if self._on_done is not None:
+            try:
+                self._on_done(cancelled)
+            except Exception:
+                logger.exception("Progressive render (%s): on_done failed", self._name)
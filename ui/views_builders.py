@@ -412,9 +412,11 @@ def build_settings_page(app):
     app.network_status_label = Gtk.Label(label="NET IDLE", xalign=1, css_classes=["diag-chip", "status-idle"])
     app.decoder_status_label = Gtk.Label(label="DEC IDLE", xalign=1, css_classes=["diag-chip", "status-idle"])
     app.events_btn = Gtk.Button(label="Events", css_classes=["flat"])
+    app.metrics_btn = Gtk.Button(label="Metrics", css_classes=["flat"])
     row_diag.append(app.network_status_label)
     row_diag.append(app.decoder_status_label)
     row_diag.append(app.events_btn)
+    row_diag.append(app.metrics_btn)
     group_diag.append(row_diag)
     settings_vbox.append(group_diag)
 
@@ -435,6 +437,32 @@ def build_settings_page(app):
     pop_box.append(sw)
     app._diag_pop.set_child(pop_box)
     app.events_btn.connect("clicked", app.show_diag_events)
+
+    app._metrics_pop = Gtk.Popover()
+    app._metrics_pop.set_parent(app.metrics_btn)
+    metrics_box = Gtk.Box(
+        orientation=Gtk.Orientation.VERTICAL,
+        spacing=8,
+        margin_top=10,
+        margin_bottom=10,
+        margin_start=10,
+        margin_end=10,
+    )
+    metrics_head = Gtk.Box(spacing=8)
+    metrics_head.append(Gtk.Label(label="Performance Metrics", xalign=0, hexpand=True, css_classes=["settings-label"]))
+    metrics_refresh_btn = Gtk.Button(label="Refresh", css_classes=["flat"])
+    metrics_refresh_btn.connect("clicked", app.show_metrics)
+    metrics_head.append(metrics_refresh_btn)
+    metrics_export_btn = Gtk.Button(label="Export JSON", css_classes=["flat"])
+    metrics_export_btn.connect("clicked", app.on_export_metrics_clicked)
+    metrics_head.append(metrics_export_btn)
+    metrics_box.append(metrics_head)
+    metrics_sw = Gtk.ScrolledWindow(min_content_height=320, min_content_width=640)
+    app._metrics_text = Gtk.TextView(editable=False, cursor_visible=False, monospace=True)
+    metrics_sw.set_child(app._metrics_text)
+    metrics_box.append(metrics_sw)
+    app._metrics_pop.set_child(metrics_box)
+    app.metrics_btn.connect("clicked", app.show_metrics)
     app.right_stack.add_named(settings_scroll, "settings")
 
 
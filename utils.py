@@ -3,17 +3,25 @@ import requests
 import hashlib
 import logging
 import time
+import math
 import cairo
 from pathlib import Path
-from threading import Thread
 from gi.repository import GLib, GdkPixbuf, Gdk
 
+import app_metrics
+import app_ui_queue
+from app_executor import LANE_CPU
+from app_lazy import lazy_module
+
+app_async = lazy_module("app_async")
+
 logger = logging.getLogger(__name__)
 _TIDAL_IMAGE_HEADERS = {
     "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
     "Referer": "https://listen.tidal.com/",
     "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
 }
+_COLLAGE_FETCH_WORKERS = 4
 
 
 def prune_image_cache(cache_dir, max_bytes=300 * 1024 * 1024, max_age_days=30):
@@ -102,6 +110,15 @@ def load_img(widget, url_provider, cache_dir, size=84):
     - Gtk.Picture: 使用 Texture，自适应 (适合大图)。
     - Gtk.Image: 使用 set_pixel_size 强力锁死尺寸 (适合图标/封面)。
     """
+    async def _source():
+        if callable(url_provider):
+            return await app_async.call(url_provider)
+        return url_provider
+
+    _start_load_img(widget, _source, cache_dir, size)
+
+
+def _start_load_img(widget, source, cache_dir, size):
     # 预设尺寸请求 (作为保底)
     widget.set_size_request(size, size)
     
@@ -109,109 +126,91 @@ def load_img(widget, url_provider, cache_dir, size=84):
     if hasattr(widget, 'set_paintable'): widget.set_paintable(None)
     elif hasattr(widget, 'set_from_pixbuf'): widget.set_from_pixbuf(None)
     
-    def fetch():
+    app_async.run(_load_img_async(widget, source, cache_dir, size))
+
+
+async def _load_img_async(widget, source, cache_dir, size):
+    """
+    Resolve the image source, download it on the network lane and decode it
+    on the cpu lane; the result is posted back to the widget. Hundreds of
+    pending covers are cheap tasks here, not threads.
+    """
+    try:
+        u = await source()
+        if not u:
+            logger.debug("load_img: empty image source (widget=%s, size=%s)", type(widget).__name__, size)
+            return
+        logger.debug("load_img: start (widget=%s, size=%s, source=%s)", type(widget).__name__, size, u)
+        widget._target_url = u
+        f_path = await ensure_image_local_path_async(u, cache_dir)
+        if not f_path:
+            return
+        await app_async.call(_apply_img_file, widget, u, f_path, size, lane=LANE_CPU)
+    except Exception as e:
+        logger.warning("load_img: unexpected error: %s", e)
+
+
+def _apply_img_file(widget, u, f_path, size):
+    # 判断控件类型
+    w_type = type(widget).__name__
+    classes = set(widget.get_css_classes()) if hasattr(widget, "get_css_classes") else set()
+    is_avatar = "circular-avatar" in classes
+    is_album_cover = "album-cover-img" in classes
+    is_playback_art = "playback-art" in classes
+    is_header_art = "header-art" in classes
+    
+    # --- 情况 A: Gtk.Picture (用于详情页大图) ---
+    if w_type == 'Picture':
         try:
-            u = url_provider() if callable(url_provider) else url_provider
-            if not u:
-                logger.debug("load_img: empty image source (widget=%s, size=%s)", type(widget).__name__, size)
-                return
-            logger.debug("load_img: start (widget=%s, size=%s, source=%s)", type(widget).__name__, size, u)
-            
-            widget._target_url = u
-            f_path = None
-            if isinstance(u, str) and os.path.exists(u):
-                # Local file path (e.g. generated playlist collage cover)
-                f_path = u
-            else:
-                f_name = hashlib.md5(str(u).encode()).hexdigest()
-                f_path = os.path.join(cache_dir, f_name)
-            
-            # 下载
-            if not os.path.exists(f_path):
-                try:
-                    req_kwargs = {"timeout": 10}
-                    if isinstance(u, str) and "resources.tidal.com/" in u:
-                        req_kwargs["headers"] = _TIDAL_IMAGE_HEADERS
-                    r = requests.get(u, **req_kwargs)
-                    r.raise_for_status()
-                    with open(f_path, 'wb') as f:
-                        f.write(r.content)
-                except requests.RequestException as e:
-                    # Retry once with browser-like headers for CDN/proxy edge cases.
-                    try:
-                        retry_kwargs = {"timeout": 10, "headers": _TIDAL_IMAGE_HEADERS}
-                        r = requests.get(u, **retry_kwargs)
-                        r.raise_for_status()
-                        with open(f_path, 'wb') as f:
-                            f.write(r.content)
-                    except requests.RequestException:
-                        logger.warning("load_img: download failed (url=%s): %s", u, e)
-                        return
-
-            # 判断控件类型
-            w_type = type(widget).__name__
-            classes = set(widget.get_css_classes()) if hasattr(widget, "get_css_classes") else set()
-            is_avatar = "circular-avatar" in classes
-            is_album_cover = "album-cover-img" in classes
-            is_playback_art = "playback-art" in classes
-            is_header_art = "header-art" in classes
-            
-            # --- 情况 A: Gtk.Picture (用于详情页大图) ---
-            if w_type == 'Picture':
-                try:
-                    pb = GdkPixbuf.Pixbuf.new_from_file(f_path)
-                    scaled_pb = pb.scale_simple(size, size, GdkPixbuf.InterpType.BILINEAR) if pb else None
-                    render_pb = scaled_pb or pb
-                    if render_pb:
-                        if is_avatar:
-                            render_pb = _rounded_pixbuf(render_pb, size // 2)
-                        elif is_playback_art:
-                            render_pb = _rounded_pixbuf(render_pb, 12)
-                        elif is_header_art:
-                            render_pb = _rounded_pixbuf(render_pb, 14)
-                        elif is_album_cover:
-                            render_pb = _rounded_pixbuf(render_pb, 10)
-                    texture = Gdk.Texture.new_for_pixbuf(render_pb)
-                    def apply_pic():
-                        if hasattr(widget, '_target_url') and widget._target_url == u:
-                            widget.set_size_request(size, size)
-                            widget.set_paintable(texture)
-                            logger.debug("load_img: applied picture (source=%s)", u)
-                    GLib.idle_add(apply_pic)
-                except Exception as e:
-                    logger.warning("load_img: failed to apply picture texture from %s: %s", f_path, e)
-
-            # --- 情况 B: Gtk.Image (用于播放栏/列表) ---
-            else:
-                try:
-                    pb = GdkPixbuf.Pixbuf.new_from_file(f_path)
-                    if pb:
-                        # 直接按目标尺寸缩放，避免大图先闪一下再回落。
-                        scaled = pb.scale_simple(size, size, GdkPixbuf.InterpType.BILINEAR)
-                        if scaled:
-                            if is_avatar:
-                                scaled = _rounded_pixbuf(scaled, size // 2)
-                            elif is_playback_art:
-                                scaled = _rounded_pixbuf(scaled, 12)
-                            elif is_header_art:
-                                scaled = _rounded_pixbuf(scaled, 14)
-                            elif is_album_cover:
-                                scaled = _rounded_pixbuf(scaled, 10)
-                        
-                        def apply_img():
-                            if hasattr(widget, '_target_url') and widget._target_url == u:
-                                # 强制锁定逻辑显示尺寸
-                                widget.set_pixel_size(size) 
-                                widget.set_from_pixbuf(scaled)
-                                logger.debug("load_img: applied image (source=%s)", u)
-                        GLib.idle_add(apply_img)
-                except Exception as e:
-                    logger.warning("load_img: failed to apply image pixbuf from %s: %s", f_path, e)
+            pb = GdkPixbuf.Pixbuf.new_from_file(f_path)
+            scaled_pb = pb.scale_simple(size, size, GdkPixbuf.InterpType.BILINEAR) if pb else None
+            render_pb = scaled_pb or pb
+            if render_pb:
+                if is_avatar:
+                    render_pb = _rounded_pixbuf(render_pb, size // 2)
+                elif is_playback_art:
+                    render_pb = _rounded_pixbuf(render_pb, 12)
+                elif is_header_art:
+                    render_pb = _rounded_pixbuf(render_pb, 14)
+                elif is_album_cover:
+                    render_pb = _rounded_pixbuf(render_pb, 10)
+            texture = Gdk.Texture.new_for_pixbuf(render_pb)
+            def apply_pic():
+                if hasattr(widget, '_target_url') and widget._target_url == u:
+                    widget.set_size_request(size, size)
+                    widget.set_paintable(texture)
+                    logger.debug("load_img: applied picture (source=%s)", u)
+            app_ui_queue.post(apply_pic, key=("load_img", id(widget)))
+        except Exception as e:
+            logger.warning("load_img: failed to apply picture texture from %s: %s", f_path, e)
 
+    # --- 情况 B: Gtk.Image (用于播放栏/列表) ---
+    else:
+        try:
+            pb = GdkPixbuf.Pixbuf.new_from_file(f_path)
+            if pb:
+                # 直接按目标尺寸缩放，避免大图先闪一下再回落。
+                scaled = pb.scale_simple(size, size, GdkPixbuf.InterpType.BILINEAR)
+                if scaled:
+                    if is_avatar:
+                        scaled = _rounded_pixbuf(scaled, size // 2)
+                    elif is_playback_art:
+                        scaled = _rounded_pixbuf(scaled, 12)
+                    elif is_header_art:
+                        scaled = _rounded_pixbuf(scaled, 14)
+                    elif is_album_cover:
+                        scaled = _rounded_pixbuf(scaled, 10)
+                
+                def apply_img():
+                    if hasattr(widget, '_target_url') and widget._target_url == u:
+                        # 强制锁定逻辑显示尺寸
+                        widget.set_pixel_size(size) 
+                        widget.set_from_pixbuf(scaled)
+                        logger.debug("load_img: applied image (source=%s)", u)
+                app_ui_queue.post(apply_img, key=("load_img", id(widget)))
         except Exception as e:
-            logger.warning("load_img: unexpected error: %s", e)
-            
-    Thread(target=fetch, daemon=True).start()
+            logger.warning("load_img: failed to apply image pixbuf from %s: %s", f_path, e)
+
 
 def set_pointer_cursor(widget, enable):
     try:
@@ -231,7 +230,7 @@ def set_resize_cursor(widget, enable):
         logger.debug("Failed to set resize cursor: %s", e)
 
 
-def _ensure_image_local_path(image_ref, cache_dir):
+def ensure_image_local_path(image_ref, cache_dir):
     if not image_ref:
         return None
     if isinstance(image_ref, str) and os.path.exists(image_ref):
@@ -242,21 +241,65 @@ def _ensure_image_local_path(image_ref, cache_dir):
     os.makedirs(cache_dir, exist_ok=True)
     f_name = hashlib.md5(image_ref.encode()).hexdigest()
     f_path = os.path.join(cache_dir, f_name)
-    if os.path.exists(f_path):
+    cover_hit = os.path.exists(f_path)
+    app_metrics.cache_lookup("covers", cover_hit)
+    if cover_hit:
         return f_path
 
+    req_kwargs = {"timeout": 10}
+    if "resources.tidal.com/" in image_ref:
+        req_kwargs["headers"] = _TIDAL_IMAGE_HEADERS
     try:
-        req_kwargs = {"timeout": 10}
-        if isinstance(image_ref, str) and "resources.tidal.com/" in image_ref:
-            req_kwargs["headers"] = _TIDAL_IMAGE_HEADERS
-        r = requests.get(image_ref, **req_kwargs)
-        r.raise_for_status()
-        with open(f_path, "wb") as f:
-            f.write(r.content)
-        return f_path
+        _download_file(image_ref, f_path, req_kwargs)
     except requests.RequestException as e:
-        logger.debug("Failed to fetch collage source image: %s", e)
-        return None
+        # Retry once with browser-like headers for CDN/proxy edge cases.
+        try:
+            _download_file(image_ref, f_path, {"timeout": 10, "headers": _TIDAL_IMAGE_HEADERS})
+        except requests.RequestException:
+            logger.warning("Image download failed (url=%s): %s", image_ref, e)
+            return None
+    return f_path
+
+
+def _download_file(url, f_path, req_kwargs):
+    r = requests.get(url, **req_kwargs)
+    r.raise_for_status()
+    with open(f_path, "wb") as f:
+        f.write(r.content)
+
+
+async def ensure_image_local_path_async(image_ref, cache_dir, timeout=15.0):
+    return await app_async.call(ensure_image_local_path, image_ref, cache_dir, timeout=timeout)
+
+
+async def fetch_images_async(image_refs, cache_dir, limit=8, timeout=15.0):
+    """
+    Local paths for many image refs (None for failures), at most `limit`
+    downloads in flight. Run it on the app_async bridge.
+    """
+    results = await app_async.get_bridge().gather_limited(
+        [ensure_image_local_path_async(ref, cache_dir, timeout) for ref in image_refs or []], limit=limit
+    )
+    return [r if isinstance(r, str) else None for r in results]
+
+
+def _load_cover_fill_pixbuf(path, w, h):
+    """
+    Decode an image already scaled to cover a w x h cell, so large covers are
+    never decoded at full resolution (JPEG decodes straight to the reduced size).
+    """
+    fmt, src_w, src_h = GdkPixbuf.Pixbuf.get_file_info(path)
+    if fmt is None or src_w <= 0 or src_h <= 0:
+        return GdkPixbuf.Pixbuf.new_from_file(path)
+    scale = max(float(w) / float(src_w), float(h) / float(src_h))
+    if scale >= 1.0:
+        return GdkPixbuf.Pixbuf.new_from_file(path)
+    return GdkPixbuf.Pixbuf.new_from_file_at_scale(
+        path,
+        max(w, int(math.ceil(src_w * scale))),
+        max(h, int(math.ceil(src_h * scale))),
+        False,
+    )
 
 
 def _paint_cover_fill(cr, pb, x, y, w, h):
@@ -268,7 +311,10 @@ def _paint_cover_fill(cr, pb, x, y, w, h):
         scale = max(float(w) / float(src_w), float(h) / float(src_h))
         scaled_w = max(1, int(src_w * scale))
         scaled_h = max(1, int(src_h * scale))
-        scaled = pb.scale_simple(scaled_w, scaled_h, GdkPixbuf.InterpType.BILINEAR)
+        if (scaled_w, scaled_h) == (src_w, src_h):
+            scaled = pb
+        else:
+            scaled = pb.scale_simple(scaled_w, scaled_h, GdkPixbuf.InterpType.BILINEAR)
         if scaled is None:
             return
         off_x = x - int((scaled_w - w) / 2)
@@ -280,7 +326,7 @@ def _paint_cover_fill(cr, pb, x, y, w, h):
         logger.debug("Failed to paint collage cell: %s", e)
 
 
-def generate_auto_collage_cover(
+async def generate_auto_collage_cover_async(
     image_refs,
     image_cache_dir,
     collage_cache_dir,
@@ -296,6 +342,8 @@ def generate_auto_collage_cover(
     - 3 covers: top split + bottom full
     - 4+ covers: 2x2 grid
     Returns local collage image path or None.
+    Sources are fetched through fetch_images_async() and composited on the
+    cpu lane; await it on the app_async bridge (load_collage_img() does).
     """
     if not image_refs:
         return None
@@ -317,7 +365,7 @@ def generate_auto_collage_cover(
         return None
 
     if len(unique_refs) == 1:
-        return _ensure_image_local_path(unique_refs[0], image_cache_dir)
+        return await ensure_image_local_path_async(unique_refs[0], image_cache_dir)
 
     os.makedirs(collage_cache_dir, exist_ok=True)
     digest = hashlib.md5(
@@ -327,15 +375,15 @@ def generate_auto_collage_cover(
     if os.path.exists(out_path):
         return out_path
 
-    paths = []
-    for ref in unique_refs:
-        p = _ensure_image_local_path(ref, image_cache_dir)
-        if p:
-            paths.append(p)
+    fetched = await fetch_images_async(unique_refs, image_cache_dir, limit=_COLLAGE_FETCH_WORKERS)
+    paths = [p for p in fetched if p]
 
     if not paths:
         return None
+    return await app_async.call(_compose_collage, paths, out_path, size, overlay_alpha, overlay_style, lane=LANE_CPU)
+
 
+def _compose_collage(paths, out_path, size, overlay_alpha, overlay_style):
     surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, size, size)
     cr = cairo.Context(surface)
     cr.set_source_rgba(0.18, 0.18, 0.18, 1.0)
@@ -371,10 +419,10 @@ def generate_auto_collage_cover(
 
     for idx, path in enumerate(paths[:n]):
         try:
-            pb = GdkPixbuf.Pixbuf.new_from_file(path)
+            x, y, w, h = slots[idx]
+            pb = _load_cover_fill_pixbuf(path, w, h)
             if pb is None:
                 continue
-            x, y, w, h = slots[idx]
             _paint_cover_fill(cr, pb, x, y, w, h)
         except Exception as e:
             logger.debug("Failed to load collage source %s: %s", path, e)
@@ -421,13 +469,56 @@ def generate_auto_collage_cover(
             cr.fill()
 
     try:
-        surface.write_to_png(out_path)
+        # Other loaders may race on the same key; never expose a partial PNG.
+        temp_path = f"{out_path}.{os.getpid()}.{id(surface)}.tmp"
+        surface.write_to_png(temp_path)
+        os.replace(temp_path, out_path)
         return out_path
     except Exception as e:
         logger.debug("Failed to write collage cover: %s", e)
         return None
 
 
+def load_collage_img(
+    widget,
+    image_refs,
+    cache_dir,
+    collage_cache_dir,
+    size=84,
+    fallback_icon="audio-x-generic-symbolic",
+    **collage_kwargs,
+):
+    """
+    generate_auto_collage_cover_async() + load_img(): sources are fetched
+    concurrently on the bridge and composited on the cpu lane, then applied
+    like any other cover. Shows fallback_icon when no collage can be built.
+    """
+    refs = [ref for ref in list(image_refs or []) if ref]
+
+    def _apply_fallback():
+        if fallback_icon and getattr(widget, "_target_url", None) is None:
+            widget.set_pixel_size(size)
+            widget.set_from_icon_name(fallback_icon)
+        return False
+
+    if not refs:
+        _apply_fallback()
+        return
+
+    async def _source():
+        path = await generate_auto_collage_cover_async(
+            refs,
+            image_cache_dir=cache_dir,
+            collage_cache_dir=collage_cache_dir,
+            **collage_kwargs,
+        )
+        if not path:
+            GLib.idle_add(_apply_fallback)
+        return path
+
+    _start_load_img(widget, _source, cache_dir, size)
+
+
 def _audio_cache_file(cache_dir, track_id, quality_key):
     if not cache_dir or track_id is None:
         return None
@@ -456,7 +547,9 @@ def cache_audio_from_url(cache_dir, track_id, quality_key, stream_url, timeout=2
     target = _audio_cache_file(cache_dir, track_id, quality_key)
     if not target:
         return None
-    if os.path.exists(target):
+    hit = os.path.exists(target)
+    app_metrics.cache_lookup("audio", hit)
+    if hit:
         try:
             os.utime(target, None)
         except OSError:
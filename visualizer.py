@@ -5,7 +5,7 @@ import cairo
 import math
 import logging
 import os
-from rust_viz import RustVizCore
+from rust_viz import DEFAULT_SPECTRUM_LAYOUT, RustVizCore, fold_log_bins, log_spectrum_layout
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +13,9 @@ class SpectrumVisualizer(Gtk.DrawingArea):
     """
     HiresTI 高灵敏度频谱可视化组件 (已修复 NameError)
     """
+    # Effects drawn from log-frequency bins.
+    LOG_BIN_EFFECTS = ("Pro Bars", "Pro Line", "Pro Fall", "Spiral")
+
     def __init__(self):
         super().__init__()
         self.set_draw_func(self._draw_callback, None)
@@ -297,6 +300,7 @@ class SpectrumVisualizer(Gtk.DrawingArea):
         self.bass_level = 0.0
         self.phase = 0.0
         self._rust_core = RustVizCore()
+        self._log_input = False
         self._rust_bars_rgba_enabled = str(os.getenv("HIRESTI_RUST_BARS_RGBA", "1") or "1").strip().lower() in ("1", "true", "yes", "on")
         self._rust_bars_renderer = None
         self._bars_color_cache_key = None
@@ -382,8 +386,23 @@ class SpectrumVisualizer(Gtk.DrawingArea):
         if effect_name in self.effects:
             self.effect_name = effect_name
             self._refresh_effect_cache()
+            if effect_name != "Pro Fall":
+                self.pro_heat_history = []
             self.queue_draw()
 
+    @classmethod
+    def spectrum_layout_for(cls, effect_name, num_bars):
+        if effect_name in cls.LOG_BIN_EFFECTS:
+            return log_spectrum_layout(num_bars)
+        return DEFAULT_SPECTRUM_LAYOUT
+
+    def get_spectrum_layout(self):
+        return self.spectrum_layout_for(self.effect_name, self.num_bars)
+
+    def set_spectrum_input_layout(self, layout):
+        # Layout the engine actually delivers; log bands need no re-binning.
+        self._log_input = bool(layout) and layout[1] == "log"
+
     def set_profile(self, profile_name):
         if profile_name in self.profiles:
             self.profile_name = profile_name
@@ -475,10 +494,11 @@ class SpectrumVisualizer(Gtk.DrawingArea):
         if len(self.heat_history) > 800:
             self.heat_history = self.heat_history[-800:]
         # Pre-binned history for Pro Analyzer Waterfall (avoids heavy per-draw binning).
-        pro_rows = max(4, min(self.num_bars, 64))
-        self.pro_heat_history.append(self._build_log_bins(self.current_heights, pro_rows))
-        if len(self.pro_heat_history) > 900:
-            self.pro_heat_history = self.pro_heat_history[-900:]
+        if self.effect_name == "Pro Fall":
+            pro_rows = max(4, min(self.num_bars, 64))
+            self.pro_heat_history.append(self._build_log_bins(self.current_heights, pro_rows))
+            if len(self.pro_heat_history) > 900:
+                self.pro_heat_history = self.pro_heat_history[-900:]
         if changed:
             self.queue_draw()
         return True
@@ -1424,6 +1444,8 @@ class SpectrumVisualizer(Gtk.DrawingArea):
             cr.fill()
 
     def _build_log_bins(self, values, out_count):
+        if self._log_input:
+            return fold_log_bins(values, out_count)
         if self._rust_core.available:
             out = self._rust_core.build_log_bins(values, out_count)
             if out is not None:
@@ -7,7 +7,7 @@ import os
 import logging
 import ctypes
 from collections import deque
-from rust_viz import RustVizCore
+from rust_viz import DEFAULT_SPECTRUM_LAYOUT, RustVizCore, fold_log_bins, log_spectrum_layout
 
 logger = logging.getLogger(__name__)
 try:
@@ -902,6 +902,7 @@ class SpectrumVisualizerGLArea(Gtk.GLArea):
         self._refresh_profile_cache()
         self._refresh_effect_cache()
         self._rust_core = RustVizCore()
+        self._log_input = False
         self._rust_processor = self._build_rust_processor()
         self._rust_state = self._build_rust_state()
 
@@ -1003,6 +1004,15 @@ class SpectrumVisualizerGLArea(Gtk.GLArea):
                 self._water_dirty = True
             self.queue_render()
 
+    def get_spectrum_layout(self):
+        # Only the waterfall (Pro Fall) is drawn from log-frequency bins.
+        if self.effect_name == "Pro Fall":
+            return log_spectrum_layout(self.num_bars)
+        return DEFAULT_SPECTRUM_LAYOUT
+
+    def set_spectrum_input_layout(self, layout):
+        self._log_input = bool(layout) and layout[1] == "log"
+
     def set_profile(self, profile_name):
         if profile_name in self.profiles:
             self.profile_name = profile_name
@@ -1078,7 +1088,9 @@ class SpectrumVisualizerGLArea(Gtk.GLArea):
         self._display_target_heights = chosen
         if self._rust_state is not None:
             self._rust_state.set_target(chosen)
-        self._push_waterfall_column(chosen)
+        # The texture is only drawn by the waterfall modes (cleared when Pro Fall is selected).
+        if self._effect_mode in (4, 13):
+            self._push_waterfall_column(chosen)
 
     def _build_log_bins_py(self, values, out_count):
         in_count = len(values)
@@ -1107,7 +1119,9 @@ class SpectrumVisualizerGLArea(Gtk.GLArea):
         if not vals:
             return
         bins = None
-        if self._rust_core.available:
+        if self._log_input:
+            bins = fold_log_bins(vals, self._water_h)
+        elif self._rust_core.available:
             bins = self._rust_core.build_log_bins(vals, self._water_h)
         if bins is None:
             bins = self._build_log_bins_py(vals, self._water_h)
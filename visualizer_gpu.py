@@ -6,7 +6,7 @@ import math
 import logging
 from copy import deepcopy
 from visualizer import SpectrumVisualizer
-from rust_viz import RustVizCore
+from rust_viz import RustVizCore, fold_log_bins
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +76,7 @@ class SpectrumVisualizerGPU(Gtk.Widget):
         self._logged_python_fallback = False
         self._logged_rust_bins = False
         self._logged_python_bins = False
+        self._log_input = False
         self._cairo_renderer.set_num_bars(self.num_bars)
         self._active = False
         self._anim_source = None
@@ -129,6 +130,14 @@ class SpectrumVisualizerGPU(Gtk.Widget):
             self.profile_name = profile_name
             self.queue_draw()
 
+    def get_spectrum_layout(self):
+        # Log-bin effects are all drawn by the Cairo renderer.
+        return SpectrumVisualizer.spectrum_layout_for(self.effect_name, self.num_bars)
+
+    def set_spectrum_input_layout(self, layout):
+        self._log_input = bool(layout) and layout[1] == "log"
+        self._cairo_renderer.set_spectrum_input_layout(layout)
+
     def set_num_bars(self, count):
         try:
             n = int(count)
@@ -343,6 +352,8 @@ class SpectrumVisualizerGPU(Gtk.Widget):
         )
 
     def _build_log_bins(self, values, out_count):
+        if self._log_input:
+            return fold_log_bins(values, out_count)
         if self._rust_core.available:
             out = self._rust_core.build_log_bins(values, out_count)
             if out is not None: